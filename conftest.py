@@ -74,6 +74,9 @@ def pytest_addoption(parser):
     parser.addoption(
         KAGGLE_OPT, action="store_true", help="Kaggle tests will run if enabled."
     )
+    parser.addoption(
+        BENCHMARKS_OPT, action="store_true", help="Benchmarks will run if enabled."
+    )
 
 
 def print_session_id():
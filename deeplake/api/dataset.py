@@ -39,6 +39,7 @@ from deeplake.hooks import (
 from deeplake.constants import (
     DEFAULT_MEMORY_CACHE_SIZE,
     DEFAULT_LOCAL_CACHE_SIZE,
+    DEFAULT_SHARED_CACHE_SIZE,
     DEFAULT_READONLY,
     DATASET_META_FILENAME,
     DATASET_LOCK_FILENAME,
@@ -99,6 +100,8 @@ class dataset:
         check_integrity: bool = True,
         lock_enabled: Optional[bool] = True,
         lock_timeout: Optional[int] = 0,
+        cache_eviction_policy: Optional[str] = None,
+        shared_cache_size: int = DEFAULT_SHARED_CACHE_SIZE,
     ):
         """Returns a :class:`~deeplake.core.dataset.Dataset` object referencing either a new or existing dataset.
 
@@ -134,6 +137,15 @@ class dataset:
             public (bool): Defines if the dataset will have public access. Applicable only if Deep Lake cloud storage is used and a new Dataset is being created. Defaults to ``True``.
             memory_cache_size (int): The size of the memory cache to be used in MB.
             local_cache_size (int): The size of the local filesystem cache to be used in MB.
+            cache_eviction_policy (str, optional): Which items the caches evict when they are full. One of ``"lru"`` (least recently used),
+                ``"lfu"`` (least frequently used), ``"2q"`` (scan resistant, keeps items that are read repeatedly over items read once
+                during a pass over the dataset) and ``"gdsf"`` (size aware, keeps small items such as metadata over large chunks).
+                Defaults to ``"lru"``.
+            shared_cache_size (int): The size of the persistent chunk cache shared by all processes on the machine, in MB. Chunks read by one process,
+                e.g. a data loader worker or an earlier training run, are read from the local disk instead of the dataset storage by all the others.
+                Only chunks of commits are cached, as chunks of the head of a branch can be rewritten by other processes.
+                The cache is stored in ~/.activeloop/shared_cache, which can be changed by setting the ``SHARED_CACHE_PREFIX`` environment variable.
+                Defaults to 0, i.e. no shared cache.
             creds (dict, str, optional): The string ``ENV`` or a dictionary containing credentials used to access the dataset at the path.
                 - If 'aws_access_key_id', 'aws_secret_access_key', 'aws_session_token' are present, these take precedence over credentials present in the environment or in credentials file. Currently only works with s3 paths.
                 - It supports 'aws_access_key_id', 'aws_secret_access_key', 'aws_session_token', 'endpoint_url', 'aws_region', 'profile_name' as keys.
@@ -220,6 +232,8 @@ class dataset:
                 token=token,
                 memory_cache_size=memory_cache_size,
                 local_cache_size=local_cache_size,
+                cache_eviction_policy=cache_eviction_policy,
+                shared_cache_size=shared_cache_size,
             )
 
             feature_report_path(path, "dataset", {"Overwrite": overwrite}, token=token)
@@ -361,6 +375,7 @@ class dataset:
         lock_enabled: Optional[bool] = True,
         lock_timeout: Optional[int] = 0,
         verbose: bool = True,
+        cache_eviction_policy: Optional[str] = None,
     ) -> Dataset:
         """Creates an empty dataset
 
@@ -375,6 +390,10 @@ class dataset:
             public (bool): Defines if the dataset will have public access. Applicable only if Deep Lake cloud storage is used and a new Dataset is being created. Defaults to ``False``.
             memory_cache_size (int): The size of the memory cache to be used in MB.
             local_cache_size (int): The size of the local filesystem cache to be used in MB.
+            cache_eviction_policy (str, optional): Which items the caches evict when they are full. One of ``"lru"`` (least recently used),
+                ``"lfu"`` (least frequently used), ``"2q"`` (scan resistant, keeps items that are read repeatedly over items read once
+                during a pass over the dataset) and ``"gdsf"`` (size aware, keeps small items such as metadata over large chunks).
+                Defaults to ``"lru"``.
             creds (dict, str, optional): The string ``ENV`` or a dictionary containing credentials used to access the dataset at the path.
                 - If 'aws_access_key_id', 'aws_secret_access_key', 'aws_session_token' are present, these take precedence over credentials present in the environment or in credentials file. Currently only works with s3 paths.
                 - It supports 'aws_access_key_id', 'aws_secret_access_key', 'aws_session_token', 'endpoint_url', 'aws_region', 'profile_name' as keys.
@@ -422,6 +441,7 @@ class dataset:
                 token=token,
                 memory_cache_size=memory_cache_size,
                 local_cache_size=local_cache_size,
+                cache_eviction_policy=cache_eviction_policy,
             )
 
             feature_report_path(
@@ -480,6 +500,8 @@ class dataset:
         check_integrity: bool = True,
         lock_timeout: Optional[int] = 0,
         lock_enabled: Optional[bool] = True,
+        cache_eviction_policy: Optional[str] = None,
+        shared_cache_size: int = DEFAULT_SHARED_CACHE_SIZE,
     ) -> Dataset:
         """Loads an existing dataset
 
@@ -512,6 +534,15 @@ class dataset:
                 Datasets stored on Deep Lake cloud that your account does not have write access to will automatically open in read mode.
             memory_cache_size (int): The size of the memory cache to be used in MB.
             local_cache_size (int): The size of the local filesystem cache to be used in MB.
+            cache_eviction_policy (str, optional): Which items the caches evict when they are full. One of ``"lru"`` (least recently used),
+                ``"lfu"`` (least frequently used), ``"2q"`` (scan resistant, keeps items that are read repeatedly over items read once
+                during a pass over the dataset) and ``"gdsf"`` (size aware, keeps small items such as metadata over large chunks).
+                Defaults to ``"lru"``.
+            shared_cache_size (int): The size of the persistent chunk cache shared by all processes on the machine, in MB. Chunks read by one process,
+                e.g. a data loader worker or an earlier training run, are read from the local disk instead of the dataset storage by all the others.
+                Only chunks of commits are cached, as chunks of the head of a branch can be rewritten by other processes.
+                The cache is stored in ~/.activeloop/shared_cache, which can be changed by setting the ``SHARED_CACHE_PREFIX`` environment variable.
+                Defaults to 0, i.e. no shared cache.
             creds (dict, str, optional): The string ``ENV`` or a dictionary containing credentials used to access the dataset at the path.
                 - If 'aws_access_key_id', 'aws_secret_access_key', 'aws_session_token' are present, these take precedence over credentials present in the environment or in credentials file. Currently only works with s3 paths.
                 - It supports 'aws_access_key_id', 'aws_secret_access_key', 'aws_session_token', 'endpoint_url', 'aws_region', 'profile_name' as keys.
@@ -591,6 +622,8 @@ class dataset:
                 token=token,
                 memory_cache_size=memory_cache_size,
                 local_cache_size=local_cache_size,
+                cache_eviction_policy=cache_eviction_policy,
+                shared_cache_size=shared_cache_size,
             )
             feature_report_path(
                 path,
@@ -3,7 +3,9 @@ import sys
 import numpy as np
 import pathlib
 import pytest
+from unittest.mock import patch
 import deeplake
+from deeplake.core.chunk_engine import ChunkEngine
 from deeplake.core.dataset import Dataset
 from deeplake.core.tensor import Tensor
 from deeplake.tests.common import (
@@ -45,7 +47,7 @@ from deeplake.util.path import convert_string_to_pathlib_if_needed, verify_datas
 from deeplake.util.testing import assert_array_equal
 from deeplake.util.pretty_print import summary_tensor, summary_dataset
 from deeplake.util.shape_interval import ShapeInterval
-from deeplake.constants import GDRIVE_OPT, MB
+from deeplake.constants import GDRIVE_OPT, KB, MB
 from deeplake.client.config import REPORTING_CONFIG_FILE_PATH
 
 from click.testing import CliRunner
@@ -782,6 +784,79 @@ def test_index_range(memory_ds):
         memory_ds[[0, 1, 2, 3, 4, 5]]
 
 
+@pytest.mark.parametrize("compression", [None, "lz4"])
+@pytest.mark.parametrize("dynamic", [False, True])
+def test_numpy_batched_read(memory_ds, compression, dynamic):
+    with memory_ds as ds:
+        ds.create_tensor(
+            "x", dtype="int32", sample_compression=compression, max_chunk_size=2 * KB
+        )
+        ds.x.extend(
+            [
+                np.full((4, 5 + (i % 3 if dynamic else 0)), i, dtype="int32")
+                for i in range(200)
+            ]
+        )
+    enc = ds.x.chunk_engine.chunk_id_encoder
+    assert len(enc.array) > 2
+
+    idx = [150, 3, 3, 77, 199, 0, 120, 76]
+    for sub_index in [(), (slice(1, 3), 2), ([0, 3],)]:
+        expected = [ds.x[(i,) + sub_index].numpy() for i in idx]
+        with patch.object(
+            ChunkEngine,
+            "get_chunk_info",
+            autospec=True,
+            side_effect=ChunkEngine.get_chunk_info,
+        ) as get_chunk_info:
+            result = ds.x[(idx,) + sub_index].numpy(aslist=dynamic)
+        # one lookup per chunk instead of one per sample
+        num_chunks = len(set(np.searchsorted(enc.array[:, 1], idx)))
+        assert get_chunk_info.call_count == num_chunks < len(idx)
+        assert len(result) == len(idx)
+        for r, e in zip(result, expected):
+            np.testing.assert_array_equal(r, e)
+
+    for r, e in zip(ds.x[5:150:7].numpy(aslist=True), ds.x.numpy(aslist=True)[5:150:7]):
+        np.testing.assert_array_equal(r, e)
+
+
+def test_numpy_no_copy(local_ds_generator):
+    with local_ds_generator() as ds:
+        ds.create_tensor("emb", dtype="float32", max_chunk_size=4 * KB)
+        ds.create_tensor("labels", htype="class_label")
+        emb = np.random.rand(100, 32).astype("float32")
+        ds.emb.extend(emb)
+        ds.labels.extend(np.arange(100, dtype="uint32"))
+        # samples of chunks that are being written to are copied
+        assert ds.emb[2:5].numpy(copy=False).flags.writeable
+
+    ds = local_ds_generator()
+    for tensor, expected in [(ds.emb, emb), (ds.labels, np.arange(100)[:, None])]:
+        view = tensor[2:5].numpy(copy=False)
+        np.testing.assert_array_equal(view, expected[2:5])
+        assert not view.flags.writeable
+        with pytest.raises(ValueError):
+            view[0] = 0
+        sample = tensor[3].numpy(copy=False)
+        np.testing.assert_array_equal(sample, expected[3])
+        assert np.shares_memory(view, sample)
+        for r, e in zip(tensor[2:5].numpy(aslist=True, copy=False), expected[2:5]):
+            np.testing.assert_array_equal(r, e)
+
+        # views stay valid after the chunks are evicted
+        tensor.chunk_engine._sample_cache.clear()
+        ds.storage.clear_cache()
+        np.testing.assert_array_equal(view, expected[2:5])
+        assert not np.shares_memory(view, tensor[2:5].numpy(copy=False))
+
+        # samples of different chunks are copied
+        arr = tensor[[0, 99]].numpy(copy=False)
+        np.testing.assert_array_equal(arr, expected[[0, 99]])
+        assert arr.flags.writeable
+    np.testing.assert_array_equal(ds.emb[2:5, 3:6].numpy(copy=False), emb[2:5, 3:6])
+
+
 @pytest.mark.parametrize("convert_to_pathlib", [True, False])
 def test_empty_dataset(convert_to_pathlib):
     with CliRunner().isolated_filesystem():
@@ -2656,6 +2731,95 @@ def test_shapes(memory_ds):
         np.testing.assert_array_equal(ds.abc[1::2].shapes(), np.array([[5, 6], [0, 0]]))
 
 
+@pytest.mark.parametrize("create_shape_tensor", [True, False])
+def test_shapes_batched(memory_ds, create_shape_tensor):
+    with memory_ds as ds:
+        ds.create_tensor(
+            "abc",
+            create_shape_tensor=create_shape_tensor,
+            max_chunk_size=2 * KB,
+            tiling_threshold=2 * KB,
+        )
+        ds.abc.extend([np.ones((i % 5 + 1, 30), dtype=np.uint8) for i in range(100)])
+        ds.abc.append(np.ones((1000, 30), dtype=np.uint8))  # tiled
+        ds.abc.extend([np.ones((2, i + 1), dtype=np.uint8) for i in range(10)])
+    assert ds.abc.chunk_engine.num_chunks > 5
+    assert 100 in ds.abc.chunk_engine.tile_encoder
+
+    expected = [ds.abc[i].shape for i in range(len(ds.abc))]
+    np.testing.assert_array_equal(ds.abc.shapes(), expected)
+    np.testing.assert_array_equal(ds.abc[::-3].shapes(), expected[::-3])
+    np.testing.assert_array_equal(
+        ds.abc[[105, 3, 100]].shapes(), [expected[i] for i in (105, 3, 100)]
+    )
+
+
+def test_shape_index(local_ds):
+    with local_ds as ds:
+        ds.create_tensor(
+            "abc",
+            create_shape_tensor=False,
+            max_chunk_size=2 * KB,
+            tiling_threshold=2 * KB,
+        )
+        ds.abc.extend([np.ones((i % 5 + 1, 30), dtype=np.uint8) for i in range(100)])
+        ds.abc.append(np.ones((1000, 30), dtype=np.uint8))  # tiled
+        ds.abc[3] = np.ones((7, 30), dtype=np.uint8)
+        ds.abc.pop(10)
+        ds.commit()
+        ds.abc.append(np.ones((2, 30), dtype=np.uint8))
+    expected = [ds.abc[i].numpy().shape for i in range(len(ds.abc))]
+
+    ds = deeplake.load(local_ds.path)
+    engine = ds.abc.chunk_engine
+    shape_index = engine.shape_index
+    assert shape_index is not None
+    np.testing.assert_array_equal(
+        shape_index.sizes_many([0, 3, 99]), [30, 7 * 30, 1000 * 30]
+    )
+    with patch.object(engine, "get_chunk_from_chunk_id") as get_chunk:
+        np.testing.assert_array_equal(ds.abc.shapes(), expected)
+        np.testing.assert_array_equal(ds.abc[::-3].shapes(), expected[::-3])
+        assert ds.abc[3].shape == (7, 30)
+        assert ds.abc[99].shape == (1000, 30)
+        get_chunk.assert_not_called()
+
+    ds.checkout(ds.commits[0]["commit"])
+    assert len(ds.abc.chunk_engine.shape_index.shapes_many([0])) == 1
+    np.testing.assert_array_equal(ds.abc.shapes(), expected[:-1])
+
+    # the index is built from the headers added to the chunks, without reading them back
+    ds.checkout("main")
+    with patch.object(ChunkEngine, "_read_sample_shapes_and_sizes") as read:
+        ds.abc.extend([np.ones((4, 30), dtype=np.uint8)] * 2)
+        ds.abc.append(np.ones((1000, 30), dtype=np.uint8))  # tiled
+        read.assert_not_called()
+    expected += [(4, 30), (4, 30), (1000, 30)]
+    np.testing.assert_array_equal(
+        ds.abc.chunk_engine.shape_index.shapes_many(range(len(expected))), expected
+    )
+    hidden = ds._tensors(include_hidden=True)["_abc_id"]
+    assert not hidden.chunk_engine._maintains_shape_index
+
+    # tensors that samples were added to without maintaining the index, rebuild it when their shapes are read
+    with patch.object(ChunkEngine, "_extend_shape_index"):
+        ds.abc.append(np.ones((3, 30), dtype=np.uint8))
+    assert ds.abc.chunk_engine.shape_index is None
+    np.testing.assert_array_equal(ds.abc.shapes(), expected + [(3, 30)])
+    assert ds.abc.chunk_engine.shape_index is not None
+    ds.abc.pop()
+    np.testing.assert_array_equal(
+        ds.abc.chunk_engine.shape_index.shapes_many(range(len(expected))), expected
+    )
+
+    # as do tensors created without one
+    ds.abc.chunk_engine._delete_shape_index()
+    ds = deeplake.load(local_ds.path, read_only=True)
+    assert ds.abc.chunk_engine.shape_index is None
+    np.testing.assert_array_equal(ds.abc.shapes(), expected)
+    assert ds.abc.chunk_engine.shape_index is not None
+
+
 def test_shapes_sequence(memory_ds):
     with memory_ds as ds:
         ds.create_tensor("abc", htype="sequence")
@@ -1,7 +1,10 @@
 import pytest
 import numpy as np
+import deeplake
 
-from deeplake.constants import MB
+from unittest.mock import patch
+from deeplake.constants import KB, MB
+from deeplake.core.encode_pool import EncodePool
 
 compressions_paremetrized = pytest.mark.parametrize(
     "compression",
@@ -212,3 +215,41 @@ def test_tiled_indexing(memory_ds):
         np.testing.assert_array_equal(
             ds.abc[:, [3, 4, 5], [6, 7, 8]], arr[:, [3, 4, 5], [6, 7, 8]]
         )
+
+
+@pytest.mark.parametrize("compression", [None, "png", "lz4"])
+def test_tiles_parallel(local_ds, monkeypatch, compression):
+    arr = np.random.randint(0, 255, (1003, 999, 3), dtype=np.uint8)
+    monkeypatch.setattr(deeplake.constants, "ENCODE_WORKERS", 2)
+    with patch.object(
+        EncodePool, "submit", autospec=True, side_effect=EncodePool.submit
+    ) as submit:
+        with local_ds as ds:
+            ds.create_tensor(
+                "abc",
+                dtype="uint8",
+                sample_compression=compression,
+                max_chunk_size=256 * KB,
+                tiling_threshold=256 * KB,
+            )
+            ds.abc.append(arr)
+    num_tiles = len(ds.abc.chunk_engine.chunk_id_encoder[0])
+    assert num_tiles > 4
+    assert submit.call_count == (num_tiles if compression else 0)
+
+    monkeypatch.setattr(deeplake.constants, "TILE_READ_MAX_BYTES_IN_FLIGHT", 1 * MB)
+    ds = local_ds
+    for workers in (0, 4):
+        monkeypatch.setattr(deeplake.constants, "TILE_READ_NUM_WORKERS", workers)
+        ds.storage.clear_cache()
+        np.testing.assert_array_equal(ds.abc[0].numpy(), arr)
+        ds.storage.clear_cache()
+        np.testing.assert_array_equal(
+            ds.abc[0, 250:800, 7:-5].numpy(), arr[250:800, 7:-5]
+        )
+        np.testing.assert_array_equal(ds.abc[0, -1, 3:600].numpy(), arr[-1, 3:600])
+
+    ds.abc[0, 100:900, 500:] = np.zeros((800, 499, 3), dtype=np.uint8)
+    arr[100:900, 500:] = 0
+    ds.storage.clear_cache()
+    np.testing.assert_array_equal(ds.abc.numpy()[0], arr)
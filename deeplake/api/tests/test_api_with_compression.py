@@ -8,12 +8,18 @@ from deeplake.util.exceptions import (
     UnsupportedCompressionError,
 )
 import pytest
+from unittest.mock import patch
 from deeplake.core.tensor import Tensor
 from deeplake.tests.common import TENSOR_KEY, assert_images_close
 import numpy as np
 
 import deeplake
 from deeplake.core.dataset import Dataset
+from deeplake.core.chunk_engine import ChunkEngine
+from deeplake.core.compression import compress_array, decompress_array
+from deeplake.core.decode_pool import DecodePool
+from deeplake.util.exceptions import DecodePoolError
+from deeplake.core.encode_pool import EncodePool, EncodeWindow
 
 
 def _populate_compressed_samples(tensor: Tensor, cat_path, flower_path, count=1):
@@ -347,3 +353,166 @@ def test_forced_htypes(
 
     for sample in rgb_png:
         assert len(sample.shape) == 3
+
+
+@pytest.mark.parametrize("processes", [False, True])
+def test_parallel_decode(local_ds, monkeypatch, processes):
+    arrs = [
+        np.random.randint(0, 255, (20 + i % 5, 30, 3), dtype="uint8") for i in range(20)
+    ]
+    with local_ds as ds:
+        ds.create_tensor("png", htype="image", sample_compression="png")
+        ds.create_tensor("lz4", dtype="uint8", sample_compression="lz4")
+        ds.png.extend(arrs)
+        ds.lz4.extend(arrs)
+    if processes:
+        monkeypatch.setattr("deeplake.core.decode_pool._PYTHON_IMAGE_DECODERS", {"png"})
+    monkeypatch.setattr(deeplake.constants, "DECODE_WORKERS", 4)
+    idx = [19, 0, 5, 5, 11]
+    with patch.object(
+        DecodePool, "submit", autospec=True, side_effect=DecodePool.submit
+    ) as submit:
+        for tensor in ("png", "lz4"):
+            samples = ds[tensor][idx].numpy(aslist=True)
+            assert len(samples) == len(idx)
+            for i, sample in zip(idx, samples):
+                np.testing.assert_array_equal(sample, arrs[i])
+            np.testing.assert_array_equal(
+                ds[tensor][3:8, 5].numpy(), np.stack([a[5] for a in arrs[3:8]])
+            )
+    # sample 5 is decoded twice by the first read, then served from the decoded sample cache
+    assert submit.call_count == 2 * (len(idx) + 4)
+
+
+def test_decode_pool_errors(local_ds, monkeypatch):
+    arrs = [np.random.randint(0, 255, (20, 30, 3), dtype="uint8") for i in range(4)]
+    with local_ds as ds:
+        ds.create_tensor("png", htype="image", sample_compression="png")
+        ds.png.extend(arrs)
+    monkeypatch.setattr("deeplake.core.decode_pool._PYTHON_IMAGE_DECODERS", {"png"})
+    monkeypatch.setattr(deeplake.constants, "DECODE_WORKERS", 2)
+
+    # daemonic processes, like torch DataLoader workers, can not start a process pool
+    pool = DecodePool(2)
+    with patch("multiprocessing.current_process") as current_process:
+        current_process.return_value.daemon = True
+        job = ds.png.chunk_engine.get_chunks_for_sample(0)[0].decode_job(0)
+        np.testing.assert_array_equal(pool.submit(job).result(), arrs[0])
+    assert pool._processes is None and pool._threads is not None
+    pool.shutdown()
+
+    # failures of the pool are raised, not taken for corrupt samples
+    with patch.object(
+        DecodePool, "_get_executor", side_effect=RuntimeError("no executor")
+    ):
+        with pytest.raises(DecodePoolError):
+            ds.png[[0, 1, 2]].numpy(aslist=True)
+
+
+@pytest.mark.parametrize("processes", [False, True])
+def test_parallel_encode(local_ds, monkeypatch, processes):
+    arrs = [
+        np.random.randint(0, 255, (20 + i % 5, 30, 3), dtype="uint8") for i in range(20)
+    ]
+    if processes:
+        monkeypatch.setattr("deeplake.core.decode_pool._PYTHON_IMAGE_DECODERS", {"png"})
+    monkeypatch.setattr(deeplake.constants, "ENCODE_WORKERS", 2)
+    monkeypatch.setattr(deeplake.constants, "ENCODE_MAX_PENDING_SAMPLES", 4)
+    with patch.object(
+        EncodePool, "submit", autospec=True, side_effect=EncodePool.submit
+    ) as submit, patch.object(
+        EncodePool, "submit_bytes", autospec=True, side_effect=EncodePool.submit_bytes
+    ) as submit_bytes:
+        with local_ds as ds:
+            ds.create_tensor("png", htype="image", sample_compression="png")
+            ds.create_tensor(
+                "lz4", dtype="uint8", chunk_compression="lz4", max_chunk_size=8 * KB
+            )
+            ds.png.extend(arrs)
+            ds.png.extend(arrs[:3])
+            ds.lz4.extend(arrs)
+            ds.lz4.extend(arrs[:3])
+    assert submit.call_count == len(arrs) + 3
+    # every chunk but the last one is compressed in the background
+    assert submit_bytes.call_count == ds.lz4.chunk_engine.num_chunks - 1 > 0
+
+    ds = deeplake.load(ds.path)
+    for tensor in ("png", "lz4"):
+        samples = ds[tensor].numpy(aslist=True)
+        for sample, arr in zip(samples, arrs + arrs[:3]):
+            np.testing.assert_array_equal(sample, arr)
+    assert ds.png[3].tobytes() == compress_array(arrs[3], "png")
+
+
+def test_encode_window():
+    arrs = [np.full((4, 4, 3), i, dtype="uint8") for i in range(10)]
+    pool = EncodePool(2)
+    window = EncodeWindow(
+        pool,
+        arrs,
+        lambda arr: (arr, "png") if arr[0, 0, 0] % 3 else None,
+        lambda job, buffer: buffer,
+        max_pending=3,
+    )
+    remaining = list(arrs)
+    written = []
+    while remaining:
+        ready = window.ready(remaining)
+        # samples past the writer are compressed at most `max_pending` at a time
+        assert 0 < len(ready) and len(ready) + len(window._pending) <= 3
+        written += ready
+        remaining = remaining[len(ready) :]
+    pool.shutdown()
+    for arr, sample in zip(arrs, written):
+        if arr[0, 0, 0] % 3:
+            assert sample == compress_array(arr, "png")
+        else:
+            assert sample is arr
+
+
+def test_decoded_sample_cache(memory_ds):
+    arrs = [np.random.randint(0, 255, (10, 10, 3), dtype="uint8") for _ in range(20)]
+    labels = np.arange(200, dtype="int32").reshape(100, 2)
+    with memory_ds as ds:
+        ds.create_tensor("png", htype="image", sample_compression="png")
+        ds.create_tensor(
+            "labels", dtype="int32", chunk_compression="lz4", max_chunk_size=100
+        )
+        ds.png.extend(arrs)
+        ds.labels.extend(labels)
+    assert ds.labels.chunk_engine.num_chunks > 2
+
+    with patch(
+        "deeplake.core.chunk.sample_compressed_chunk.decompress_array",
+        side_effect=decompress_array,
+    ) as decompress:
+        for _ in range(2):
+            for i in (3, 7, 3):
+                np.testing.assert_array_equal(ds.png[i].numpy(), arrs[i])
+            for sample, i in zip(ds.png[[7, 3, 9]].numpy(aslist=True), (7, 3, 9)):
+                np.testing.assert_array_equal(sample, arrs[i])
+    assert decompress.call_count == 3
+
+    # samples handed out are copies of the cached ones
+    ds.png[3].numpy()[:] = 0
+    np.testing.assert_array_equal(ds.png[3].numpy(), arrs[3])
+
+    # chunks of fixed shape tensors are decoded once, however the reads jump between them
+    engine = ds.labels.chunk_engine
+    with patch.object(
+        ChunkEngine,
+        "get_chunk_from_chunk_id",
+        autospec=True,
+        side_effect=ChunkEngine.get_chunk_from_chunk_id,
+    ) as get_chunk:
+        for i in (0, 99, 1, 98, 2, 97):
+            np.testing.assert_array_equal(ds.labels[i].numpy(), labels[i])
+    assert get_chunk.call_count == 2
+    assert engine._sample_cache.hits > 0
+
+    # writes invalidate the cache
+    with ds:
+        ds.png[7] = arrs[0]
+        ds.labels[99] = [-1, -1]
+    np.testing.assert_array_equal(ds.png[7].numpy(), arrs[0])
+    np.testing.assert_array_equal(ds.labels[99].numpy(), [-1, -1])
@@ -40,6 +40,67 @@ MIN_SECOND_CACHE_SIZE = 160 * MB
 # without MB multiplication, meant for the dataset API that takes cache size in MBs
 DEFAULT_MEMORY_CACHE_SIZE = 256
 DEFAULT_LOCAL_CACHE_SIZE = 0
+DEFAULT_SHARED_CACHE_SIZE = 0
+
+# write-behind flushing of the last cache layer to the underlying storage, see `LRUCache`
+ASYNC_FLUSH_ENABLED = False
+ASYNC_FLUSH_NUM_WORKERS = 16
+ASYNC_FLUSH_MAX_IN_FLIGHT_SIZE = 256 * MB
+
+# number of concurrent requests used by remote and local providers for batched reads
+STORAGE_BATCH_READ_WORKERS = 32
+
+# minimum number of connections kept open by each client of the S3 client pool, see `S3ClientPool`
+S3_MAX_POOL_CONNECTIONS = 64
+
+# read-ahead of chunks for sequential reads of a tensor, see `ChunkPrefetcher`. Set to 0 to disable.
+CHUNK_PREFETCH_BYTES_AHEAD = 64 * MB
+CHUNK_PREFETCH_NUM_WORKERS = 8
+# whether chunks of datasets on the local filesystem are read ahead as well
+CHUNK_PREFETCH_LOCAL = False
+
+# eviction policy of the cache layers ("lru", "lfu", "2q" or "gdsf"), see `LRUCache`
+DEFAULT_CACHE_EVICTION_POLICY = "lru"
+# whether metadata, encoders and other objects registered with the cache are protected from eviction
+PIN_DEEPLAKE_OBJECTS_IN_CACHE = False
+
+# number of most recent latency samples per operation used for the percentiles reported by `Dataset.storage_stats`
+STORAGE_STATS_LATENCY_SAMPLES = 10000
+
+# if set, files at least this large are memory mapped instead of read by `LocalProvider.get_view`, e.g. when reading
+# chunks. Every mapping keeps a file descriptor open while the chunk is cached, so this is disabled by default.
+# Not used on Windows, where mapped files can not be replaced.
+LOCAL_MMAP_MIN_SIZE = None
+
+# when reading some of the samples of a chunk without fetching the whole chunk, byte ranges that are at most this many
+# bytes apart are fetched with a single request, see `PartialReader.prefetch`
+PARTIAL_READ_COALESCE_GAP = 256 * KB
+
+# granularity of the reads of partially read chunks. Bytes missing from the already read parts of a chunk are fetched in
+# whole pages of this many bytes, aligned to multiples of it, so that reading nearby samples one by one (e.g. `ds[i]` in a
+# loop) needs a request per page instead of per sample. 0 fetches exactly the requested bytes, see `PartialReader`
+PARTIAL_READ_PAGE_SIZE = 0
+
+# number of workers decoding compressed samples in parallel in `Tensor.numpy` and pytorch / tensorflow streaming,
+# see `DecodePool`. Threads are used for codecs that release the GIL (e.g. jpeg, png), processes otherwise.
+# Set to 0 to decode on the calling thread.
+DECODE_WORKERS = 0
+
+# number of workers compressing samples of sample compressed tensors, and full chunks of chunk compressed tensors, in
+# parallel in `Tensor.extend`, see `EncodePool`. Set to 0 to compress on the calling thread.
+ENCODE_WORKERS = 0
+# maximum number of samples compressed ahead of the chunk being filled when `ENCODE_WORKERS` is set, see `EncodeWindow`
+ENCODE_MAX_PENDING_SAMPLES = 64
+
+# number of threads decoding the tiles of a tiled sample concurrently while the next tiles are fetched, see `read_tiles`.
+# Set to 0 to read tiles one by one.
+TILE_READ_NUM_WORKERS = 8
+# maximum number of bytes of tiles fetched or decoded at once when reading a tiled sample
+TILE_READ_MAX_BYTES_IN_FLIGHT = 256 * MB
+
+# maximum number of bytes of decoded samples kept in memory by each tensor, so that reading the same samples again does
+# not decode them again, see `DecodedSampleCache`. Set to 0 to disable.
+DECODED_SAMPLE_CACHE_SIZE = 64 * MB
 
 # maximum allowable size before `large_ok` must be passed to dataset delete methods
 DELETE_SAFETY_SIZE = 1 * GB
@@ -72,6 +133,7 @@ ENCODED_CREDS_FOLDER = "creds_index"
 ENCODED_CHUNK_NAMES_FOLDER = "chunks_index"
 ENCODED_SEQUENCE_NAMES_FOLDER = "sequence_index"
 ENCODED_PAD_NAMES_FOLDER = "pad_index"
+ENCODED_SHAPES_FOLDER = "shapes_index"
 
 # unsharded naming will help with backwards compatibility
 UNSHARDED_ENCODER_FILENAME = "unsharded"
@@ -122,10 +184,18 @@ S3_PATH_OPT = "--s3-path"
 GDRIVE_PATH_OPT = "--gdrive-path"
 KEEP_STORAGE_OPT = "--keep-storage"
 KAGGLE_OPT = "--kaggle"
+BENCHMARKS_OPT = "--benchmarks"
 
 
 EMERGENCY_STORAGE_PATH = "/tmp/emergency_storage"
 LOCAL_CACHE_PREFIX = "~/.activeloop/cache"
+# persistent chunk cache shared by all processes on the machine, see `DiskCache`. Can be moved with the SHARED_CACHE_PREFIX
+# environment variable. Each process evicts chunks when the cache grows over the size it was given.
+SHARED_CACHE_PREFIX = "~/.activeloop/shared_cache"
+# seconds between writes of the access times of the objects read from the shared cache to its index, see `DiskCache`
+SHARED_CACHE_ACCESS_UPDATE_INTERVAL = 1
+# size of the shared cache used by the PyTorch data loader when `use_local_cache` is True
+PYTORCH_LOCAL_CACHE_SIZE = 32 * GB
 DOWNLOAD_MANAGED_PATH_SUFFIX = "__local-managed-entry__"
 
 # used to identify the first commit so its data will not be in similar directory structure to the rest
@@ -202,6 +272,9 @@ TRANSFORM_RECHUNK_AVG_SIZE_BOUND = 0.1
 TIME_INTERVAL_FOR_CUDA_MEMORY_CLEANING = 10 * 60
 
 MAX_TENSORS_IN_SHUFFLE_BUFFER = 32000
+# whether ds.pytorch(shuffle=True) stores samples in the preallocated arrays of `ArrayShuffleBuffer` instead of a list,
+# `MAX_TENSORS_IN_SHUFFLE_BUFFER` does not apply to it
+USE_ARRAY_SHUFFLE_BUFFER = False
 
 # Transform cache sizes
 DEFAULT_TRANSFORM_SAMPLE_CACHE_SIZE = 16
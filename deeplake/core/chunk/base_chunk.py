@@ -1,7 +1,7 @@
 from abc import abstractmethod
 import struct
 import numpy as np
-from typing import List, Optional, Tuple, Union
+from typing import List, Optional, Sequence, Tuple, Union
 import warnings
 
 import deeplake
@@ -42,8 +42,10 @@ from deeplake.util.exceptions import (
     ReadSampleFromChunkError,
     TensorInvalidSampleShapeError,
     EmptyTensorError,
+    DecodePoolError,
 )
 from deeplake.core.polygon import Polygons
+from concurrent.futures import BrokenExecutor
 from functools import reduce, wraps
 from operator import mul
 
@@ -120,6 +122,10 @@ class BaseChunk(DeepLakeMemoryObject):
         self.write_initialization_done = False
         self.id: Optional[str] = None
         self.key: Optional[str] = None
+        # Set by the chunk engine while extending a tensor, to collect the samples registered to the headers.
+        self.registered_samples: Optional[
+            List[Tuple[Optional[int], Optional[Tuple[int, ...]], int]]
+        ] = None
 
     @property
     def is_fixed_shape(self):
@@ -153,6 +159,17 @@ class BaseChunk(DeepLakeMemoryObject):
     def is_partially_read_chunk(self):
         return isinstance(self.data_bytes, PartialReader)
 
+    def prefetch_samples(self, local_indices: Sequence[int]):
+        """If only the header of the chunk has been read, fetches the bytes of the given samples with as few range requests
+        as possible. Does nothing otherwise."""
+        if not isinstance(self.data_bytes, PartialReader):
+            return
+        bps = self.byte_positions_encoder
+        if bps.is_empty():
+            return
+        start_bytes, end_bytes = bps.byte_ranges_many(local_indices)
+        self.data_bytes.prefetch(list(zip(start_bytes.tolist(), end_bytes.tolist())))
+
     @property
     def data_bytes(self) -> Union[bytearray, bytes, memoryview, PartialReader]:
         return self._data_bytes
@@ -437,6 +454,7 @@ class BaseChunk(DeepLakeMemoryObject):
         incoming_num_bytes: Optional[int],
         sample_shape: Tuple[int],
         num_samples: int = 1,
+        tile: bool = False,
     ):
         """Registers a single sample to this chunk's header. A chunk should NOT exist without headers.
 
@@ -444,6 +462,7 @@ class BaseChunk(DeepLakeMemoryObject):
             incoming_num_bytes (int): The length of the buffer that was used to
             sample_shape (Tuple[int]): Every sample that `num_samples` symbolizes is considered to have `sample_shape`.
             num_samples (int): Number of incoming samples.
+            tile (bool): Whether the sample is a tile of a larger sample.
 
         Raises:
             ValueError: If `incoming_num_bytes` is not divisible by `num_samples`.
@@ -458,6 +477,10 @@ class BaseChunk(DeepLakeMemoryObject):
                 padding = self.byte_positions_encoder.num_samples - num_samples
                 self._fill_empty_shapes(sample_shape, padding)
             self.shapes_encoder.register_samples(sample_shape, num_samples)
+        if self.registered_samples is not None and not tile:
+            self.registered_samples.append(
+                (incoming_num_bytes, sample_shape, num_samples)
+            )
 
     def register_in_meta_and_headers(
         self,
@@ -538,7 +561,7 @@ class BaseChunk(DeepLakeMemoryObject):
     def write_tile(self, sample: SampleTiles):
         data, tile_shape = sample.yield_tile()
         self.data_bytes = data
-        self.register_sample_to_headers(None, tile_shape)
+        self.register_sample_to_headers(None, tile_shape, tile=True)
         if sample.is_first_write:
             self.tensor_meta.update_shape_interval(sample.sample_shape)  # type: ignore
             if self._update_tensor_meta_length:
@@ -625,7 +648,7 @@ def catch_chunk_read_error(fn):
     def wrapper(self, *args, **kwargs):
         try:
             return fn(self, *args, **kwargs)
-        except EmptyTensorError:
+        except (EmptyTensorError, DecodePoolError, BrokenExecutor):
             raise
         except Exception as e:
             raise ReadSampleFromChunkError(self.key) from e
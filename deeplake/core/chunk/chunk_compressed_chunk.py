@@ -1,4 +1,5 @@
 import numpy as np
+from concurrent.futures import Future
 from typing import List, Optional
 from deeplake.core.compression import (
     compress_bytes,
@@ -6,6 +7,7 @@ from deeplake.core.compression import (
     decompress_bytes,
     decompress_multiple,
 )
+from deeplake.core.encode_pool import EncodePool
 from deeplake.core.fast_forwarding import ffw_chunk
 from deeplake.core.meta.encode.shape import ShapeEncoder
 from deeplake.core.serialize import bytes_to_text, check_sample_shape
@@ -35,6 +37,7 @@ class ChunkCompressedChunk(BaseChunk):
             self.decompressed_samples = decompress_multiple(self._data_bytes, shapes)
         self._changed = False
         self._compression_ratio = 0.5
+        self._compression_future: Optional[Future] = None
 
     def extend_if_has_space(self, incoming_samples: List[InputSample], update_tensor_meta: bool = True, lengths: Optional[List[int]] = None) -> float:  # type: ignore
         self.prepare_for_write()
@@ -537,6 +540,7 @@ class ChunkCompressedChunk(BaseChunk):
         self._changed = True
 
     def pop_multiple(self, num_samples):
+        self._discard_background_compression()
         if self.is_byte_compression:
             total_samples = self.num_samples
             self.decompressed_bytes = self.decompressed_bytes[
@@ -565,8 +569,34 @@ class ChunkCompressedChunk(BaseChunk):
                 self.decompressed_samples, self.compression
             )
 
+    def compress_in_background(self, pool: EncodePool):
+        """Starts compressing the data of the chunk in ``pool``, so that it is ready by the time the chunk is written.
+        Called by the writer once the chunk is full."""
+        if not self._changed:
+            return
+        if self.is_byte_compression:
+            decompressed_bytes = self.decompressed_bytes
+            assert decompressed_bytes is not None
+            future = pool.submit_bytes(bytes(decompressed_bytes), self.compression)
+        else:
+            decompressed_samples = self.decompressed_samples
+            assert decompressed_samples is not None
+            future = pool.submit_multiple(list(decompressed_samples), self.compression)
+        self._compression_future = future
+        self._changed = False
+
+    def _discard_background_compression(self):
+        """Drops the result of :meth:`compress_in_background` before the chunk is modified."""
+        if self._compression_future is not None:
+            self._compression_future.cancel()
+            self._compression_future = None
+            self._changed = True
+
     @property
     def data_bytes(self):
+        if self._compression_future is not None:
+            self._data_bytes = self._compression_future.result()
+            self._compression_future = None
         if self._changed:
             self._compress()
             self._changed = False
@@ -593,6 +623,7 @@ class ChunkCompressedChunk(BaseChunk):
         )
 
     def prepare_for_write(self):
+        self._discard_background_compression()
         ffw_chunk(self)
         self.is_dirty = True
 
@@ -1,7 +1,9 @@
 import os
 import struct
-from typing import List, Optional, Union
+import numpy as np
+from typing import List, Optional, Sequence, Union
 from deeplake.core.compression import decompress_array, decompress_bytes
+from deeplake.core.decode_pool import DecodeJob, get_decode_pool
 from deeplake.core.sample import Sample  # type: ignore
 from deeplake.core.serialize import (
     check_sample_shape,
@@ -92,17 +94,7 @@ class SampleCompressedChunk(BaseChunk):
                 buffer = buffer[sb:eb]
         if not decompress:
             return bytes(buffer) if copy else buffer
-        if not is_tile and self.is_fixed_shape:
-            shape = tuple(self.tensor_meta.min_shape)
-        else:
-            try:
-                shape = self.shapes_encoder[local_index]
-            except IndexError as e:
-                if not bps_empty:
-                    self.num_dims = self.num_dims or len(self.tensor_meta.max_shape)
-                    shape = (0,) * self.num_dims
-                else:
-                    raise e
+        shape = self._get_sample_shape(local_index, is_tile)
 
         nframes = shape[0]
         if self.is_text_like:
@@ -141,13 +133,76 @@ class SampleCompressedChunk(BaseChunk):
 
         if squeeze:
             sample = sample.squeeze(0)
+        return self._cast_sample(sample, cast, copy)
 
+    def _get_sample_shape(self, local_index: int, is_tile: bool = False):
+        if not is_tile and self.is_fixed_shape:
+            return tuple(self.tensor_meta.min_shape)
+        try:
+            return self.shapes_encoder[local_index]
+        except IndexError as e:
+            if not self.byte_positions_encoder.is_empty():
+                self.num_dims = self.num_dims or len(self.tensor_meta.max_shape)
+                return (0,) * self.num_dims
+            raise e
+
+    def _cast_sample(self, sample, cast: bool = True, copy: bool = False):
         if cast and sample.dtype != self.dtype:
             sample = sample.astype(self.dtype)
         elif copy and not sample.flags["WRITEABLE"]:
             sample = sample.copy()
         return sample
 
+    @property
+    def can_decode_in_pool(self) -> bool:
+        """Whether the samples of the chunk can be decoded by a :class:`DecodePool`, see :meth:`decode_job`."""
+        return not (
+            self.is_text_like
+            or self.is_video_compression
+            or self.htype == "polygon"
+            or self.byte_positions_encoder.is_empty()
+        )
+
+    def decode_job(self, local_index: int) -> Optional[DecodeJob]:
+        """Returns the arguments of :func:`decompress_array` for the sample at ``local_index``, to decode it in a
+        :class:`DecodePool`, or ``None`` if it has to be read with :meth:`read_sample`.
+        The decoded sample should be passed to :meth:`finish_decoded_sample`."""
+        self.check_empty_before_read()
+        if self._get_partial_sample_tile() is not None:
+            return None
+        sb, eb = self.byte_positions_encoder[local_index]
+        shape = self._get_sample_shape(local_index)
+        return self.memoryview_data[sb:eb], shape, self.dtype, self.compression
+
+    def finish_decoded_sample(self, sample, cast: bool = True):
+        """Casts a sample decoded from a :meth:`decode_job` like :meth:`read_sample` does."""
+        return self._cast_sample(sample, cast)
+
+    @catch_chunk_read_error
+    def read_samples(
+        self, local_indices: Sequence[int], cast: bool = True
+    ) -> List[np.ndarray]:
+        """Reads multiple samples, decoding them in parallel if ``deeplake.constants.DECODE_WORKERS`` is set.
+
+        Args:
+            local_indices (Sequence[int]): Indices of the samples in the chunk.
+            cast (bool): Whether to cast the samples to the dtype of the tensor, as in :meth:`read_sample`.
+
+        Returns:
+            List[np.ndarray]: The samples, in the order of ``local_indices``.
+        """
+        pool = get_decode_pool()
+        if pool is None or len(local_indices) < 2 or not self.can_decode_in_pool:
+            return [self.read_sample(i, cast=cast) for i in local_indices]
+        jobs = [self.decode_job(i) for i in local_indices]
+        futures = [None if job is None else pool.submit(job) for job in jobs]
+        return [
+            self.read_sample(i, cast=cast)
+            if future is None
+            else self.finish_decoded_sample(future.result(), cast)
+            for i, future in zip(local_indices, futures)
+        ]
+
     def update_sample(self, local_index: int, sample: InputSample):
         self.prepare_for_write()
         serialized_sample, shape = self.serialize_sample(
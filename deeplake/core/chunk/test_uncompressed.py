@@ -100,6 +100,31 @@ def test_read_write_numpy():
         data_in = data_in[num_samples:]
 
 
+def test_read_write_list_of_arrays():
+    tensor_meta = create_tensor_meta()
+    common_args["tensor_meta"] = tensor_meta
+    dtype = tensor_meta.dtype
+    data_in = [np.random.rand(100, 100).astype(dtype) for _ in range(30)]
+    data_in.append(np.random.rand(50, 100).astype(dtype))
+    data_in.append(np.random.rand(100, 100).astype("float32"))
+    chunk = UncompressedChunk(**common_args)
+    num_samples = int(chunk.extend_if_has_space(data_in))
+    # written together, with a single row in each encoder
+    assert num_samples == common_args["min_chunk_size"] // data_in[0].nbytes
+    assert len(chunk.shapes_encoder.array) == len(chunk.byte_positions_encoder.array)
+    assert len(chunk.shapes_encoder.array) == 1
+    for i in range(num_samples):
+        np.testing.assert_array_equal(chunk.read_sample(i), data_in[i])
+
+    data_in = data_in[num_samples:]
+    while data_in:
+        chunk = UncompressedChunk(**common_args)
+        num_samples = int(chunk.extend_if_has_space(data_in))
+        for i in range(num_samples):
+            np.testing.assert_array_equal(chunk.read_sample(i), data_in[i])
+        data_in = data_in[num_samples:]
+
+
 def test_read_write_numpy_big():
     tensor_meta = create_tensor_meta()
     common_args["tensor_meta"] = tensor_meta
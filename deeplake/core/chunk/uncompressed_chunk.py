@@ -32,8 +32,53 @@ class UncompressedChunk(BaseChunk):
                 return self._extend_if_has_space_numpy(
                     incoming_samples, update_tensor_meta
                 )
+        block = self._stack_numpy_samples(incoming_samples)
+        if block is not None:
+            return self._extend_if_has_space_numpy(block, update_tensor_meta)
         return self._extend_if_has_space_list(incoming_samples, update_tensor_meta)
 
+    def _stack_numpy_samples(
+        self, incoming_samples: List[InputSample]
+    ) -> Optional[np.ndarray]:
+        """Stacks the leading samples that fit in the chunk into a single array, if they are numeric arrays of the same
+        shape and of the dtype of the tensor, so that they can be written with :meth:`_extend_if_has_space_numpy`.
+
+        Returns:
+            Optional[np.ndarray]: The stacked samples, or None if the samples have to be written one by one.
+        """
+        if not incoming_samples or self.tensor_meta.is_link:
+            return None
+        elem = incoming_samples[0]
+        if (
+            not isinstance(elem, np.ndarray)
+            or elem.dtype != self.dtype
+            or elem.dtype == object
+            or not elem.ndim
+            or not elem.nbytes
+            or 0 <= self.tiling_threshold < elem.nbytes
+        ):
+            return None
+        num_samples = min(
+            len(incoming_samples),
+            (self.min_chunk_size - self.num_data_bytes) // elem.nbytes,
+        )
+        if num_samples < 2:
+            return None
+        shape, dtype = elem.shape, elem.dtype
+        arrays: List[np.ndarray] = [elem]
+        for i in range(1, num_samples):
+            sample = incoming_samples[i]
+            if (
+                not isinstance(sample, np.ndarray)
+                or sample.shape != shape
+                or sample.dtype != dtype
+            ):
+                break
+            arrays.append(sample)
+        if len(arrays) < 2:
+            return None
+        return np.stack(arrays)
+
     def _extend_if_has_space_text(
         self,
         incoming_samples,
@@ -136,7 +181,8 @@ class UncompressedChunk(BaseChunk):
                         self.htype,
                     )
             samples = samples.astype(chunk_dtype)
-        self._data_bytes += samples.tobytes()  # type: ignore
+        # appends the bytes of the samples without an intermediate bytes object
+        self._data_bytes += np.ascontiguousarray(samples).data  # type: ignore
         self.register_in_meta_and_headers(
             samples[0].nbytes,
             shape,
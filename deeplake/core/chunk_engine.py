@@ -1,4 +1,5 @@
 from collections import OrderedDict
+from functools import partial
 from deeplake.client.log import logger
 import deeplake
 import numpy as np
@@ -7,6 +8,7 @@ from typing import (
     Any,
     Callable,
     Dict,
+    Iterator,
     Optional,
     Sequence,
     Union,
@@ -17,7 +19,11 @@ from deeplake.api.info import Info
 from deeplake.core.link_creds import LinkCreds
 from deeplake.core.linked_sample import LinkedSample
 from deeplake.core.meta.encode.base_encoder import LAST_SEEN_INDEX_COLUMN
-from deeplake.core.serialize import HEADER_SIZE_BYTES, text_to_bytes
+from deeplake.core.serialize import (
+    HEADER_SIZE_BYTES,
+    deserialize_chunk,
+    text_to_bytes,
+)
 from deeplake.core.tensor_link import (
     cast_to_type,
     extend_downsample,
@@ -25,17 +31,23 @@ from deeplake.core.tensor_link import (
 )
 from deeplake.core.version_control.commit_diff import CommitDiff
 from deeplake.core.partial_reader import PartialReader
+from deeplake.core.sample_cache import DecodedSampleCache
+from deeplake.core.encode_pool import EncodeJob, EncodeWindow, get_encode_pool
+from deeplake.util.compression import get_compression_ratio
 from deeplake.core.version_control.commit_node import CommitNode  # type: ignore
 from deeplake.core.version_control.commit_chunk_map import CommitChunkMap  # type: ignore
 from typing import Any, Dict, List, Optional, Sequence, Union, Callable
 from deeplake.core.meta.encode.tile import TileEncoder
 from deeplake.core.storage.provider import StorageProvider
-from deeplake.core.storage import S3Provider, GCSProvider, AzureProvider
-from deeplake.core.tiling.deserialize import (
-    combine_chunks,
-    translate_slices,
-    coalesce_tiles,
+from deeplake.core.storage import (
+    S3Provider,
+    GCSProvider,
+    AzureProvider,
+    MemoryProvider,
+    LocalProvider,
 )
+from deeplake.core.storage.prefetcher import ChunkPrefetcher
+from deeplake.core.tiling.deserialize import read_tiles, translate_slices
 from deeplake.core.tiling.serialize import break_into_tiles
 from deeplake.core.polygon import Polygons
 from deeplake.util.casting import get_empty_text_like_sample, intelligent_cast
@@ -62,6 +74,9 @@ from deeplake.core.index.index import Index, IndexEntry
 from deeplake.core.meta.encode.chunk_id import CHUNK_ID_COLUMN, ChunkIdEncoder
 from deeplake.core.meta.encode.sequence import SequenceEncoder
 from deeplake.core.meta.encode.pad import PadEncoder
+from deeplake.core.meta.encode.shape import ShapeEncoder
+from deeplake.core.meta.encode.shape_index import ShapeIndex
+from deeplake.core.meta.encode.byte_positions import BytePositionsEncoder
 from deeplake.core.meta.tensor_meta import TensorMeta
 from deeplake.core.storage.lru_cache import LRUCache
 from deeplake.util.casting import get_dtype, get_htype
@@ -76,6 +91,7 @@ from deeplake.util.keys import (
     get_chunk_id_encoder_key,
     get_sequence_encoder_key,
     get_pad_encoder_key,
+    get_tensor_shape_index_key,
     get_tensor_commit_diff_key,
     get_tensor_meta_key,
     get_chunk_key,
@@ -196,6 +212,15 @@ class ChunkEngine:
         self._pad_encoder: Optional[PadEncoder] = None
         self._pad_encoder_commit_id: Optional[str] = None
 
+        self._shape_index: Optional[ShapeIndex] = None
+        self._shape_index_commit_id: Optional[str] = None
+        self._shape_index_build_failed: Optional[
+            Tuple[str, Tuple[int, int, int]]
+        ] = None
+        # samples registered to chunk headers during an extend, see `_extend_shape_index`
+        self._registered_samples: Optional[list] = None
+        self._logged_chunks: List[BaseChunk] = []
+
         self._tile_encoder: Optional[TileEncoder] = None
         self._tile_encoder_commit_id: Optional[str] = None
 
@@ -211,6 +236,9 @@ class ChunkEngine:
         self._info: Optional[Info] = None
         self._info_commit_id: Optional[str] = None
 
+        self._prefetcher: Optional[ChunkPrefetcher] = None
+        self._last_read_row: Optional[int] = None
+
         self._all_chunk_engines: Optional[Dict[str, ChunkEngine]] = None
         self._is_temp_label_tensor: bool = False
         self._hash_label_map: Dict[int, str] = OrderedDict()
@@ -237,8 +265,9 @@ class ChunkEngine:
         self._numpy_extend_optimization_enabled = numpy_extend_optimization_enabled
 
         self.cache_enabled = True
-        self.cached_data: Optional[np.ndarray] = None
-        self.cache_range: range = range(0)
+        self._sample_cache = DecodedSampleCache(
+            deeplake.constants.DECODED_SAMPLE_CACHE_SIZE
+        )
 
         self._chunk_args = None
         self._num_samples_per_chunk: Optional[int] = None
@@ -259,7 +288,11 @@ class ChunkEngine:
         if self.cache_enabled:
             tensor_meta = self.tensor_meta
             return (
-                self.chunk_class == UncompressedChunk
+                (
+                    self.chunk_class == UncompressedChunk
+                    or self.chunk_class == ChunkCompressedChunk
+                    and get_compression_type(self.chunk_compression) == BYTE_COMPRESSION
+                )
                 and tensor_meta.htype not in ["text", "json", "list", "polygon"]
                 and tensor_meta.max_shape
                 and (tensor_meta.max_shape == tensor_meta.min_shape)
@@ -567,7 +600,31 @@ class ChunkEngine:
         self.active_appended_chunk = chunk
         return chunk
 
+    @property
+    def prefetcher(self) -> Optional[ChunkPrefetcher]:
+        """The prefetcher that reads chunks ahead of sequential reads of this tensor.
+        ``None`` if read-ahead is disabled or the tensor is stored in memory. Tensors on the local filesystem are only
+        read ahead if ``deeplake.constants.CHUNK_PREFETCH_LOCAL`` is set."""
+        if (
+            self._prefetcher is None
+            and deeplake.constants.CHUNK_PREFETCH_BYTES_AHEAD > 0
+            and not isinstance(self.base_storage, MemoryProvider)
+            and (
+                deeplake.constants.CHUNK_PREFETCH_LOCAL
+                or not isinstance(self.base_storage, LocalProvider)
+            )
+        ):
+            self._prefetcher = ChunkPrefetcher(
+                self.cache,
+                max_bytes_ahead=deeplake.constants.CHUNK_PREFETCH_BYTES_AHEAD,
+                num_workers=deeplake.constants.CHUNK_PREFETCH_NUM_WORKERS,
+                chunk_size_estimate=self.max_chunk_size,
+            )
+        return self._prefetcher
+
     def get_chunk(self, chunk_key: str, partial_chunk_bytes=0) -> BaseChunk:
+        if self._prefetcher is not None:
+            self._prefetcher.on_read(chunk_key)
         chunk = self.cache.get_deeplake_object(
             chunk_key,
             self.chunk_class,
@@ -668,6 +725,9 @@ class ChunkEngine:
         return FIRST_COMMIT_ID, key
 
     def _write_initialization(self):
+        if self._prefetcher is not None:
+            self._prefetcher.cancel()
+        self._sample_cache.clear()
         ffw_chunk_id_encoder(self.chunk_id_encoder)
 
     def _convert_to_list(self, samples):
@@ -827,18 +887,29 @@ class ChunkEngine:
         ):
             # Note: in the future we can get rid of this conversion of sample compressed chunks too by predicting the compression ratio.
             samples = list(samples)
+        encode_window = None
+        if self.chunk_class == SampleCompressedChunk:
+            encode_window = self._sample_encode_window(samples)
+            if encode_window is not None:
+                # compressed samples are swapped in place
+                samples = list(samples)
         current_chunk_full = False
         while len(samples) > 0:
             if current_chunk_full:
                 num_samples_added = 0
                 current_chunk_full = False
             else:
+                # with an encode window, only the samples that are compressed already are handed to the chunk
+                chunk_samples = (
+                    samples if encode_window is None else encode_window.ready(samples)
+                )
                 num_samples_added = current_chunk.extend_if_has_space(
-                    samples, update_tensor_meta=update_tensor_meta, **extra_args  # type: ignore
+                    chunk_samples, update_tensor_meta=update_tensor_meta, **extra_args  # type: ignore
                 )  # type: ignore
                 if register_creds:
                     self.register_new_creds(num_samples_added, samples)
             if num_samples_added == 0:
+                self._compress_chunk_in_background(current_chunk)
                 current_chunk = self._create_new_chunk(
                     register and start_chunk_row is not None, row=start_chunk_row
                 )
@@ -878,7 +949,7 @@ class ChunkEngine:
                 num_samples_added = 0
                 samples = list(samples)
             else:
-                current_chunk_full = True
+                current_chunk_full = num_samples_added < len(chunk_samples)
                 num_samples_added, samples, lengths = self._handle_one_or_more_samples(
                     enc,
                     register,
@@ -929,6 +1000,62 @@ class ChunkEngine:
         if not register:
             return updated_chunks, tiles
 
+    def _sample_encode_window(self, samples: List) -> Optional[EncodeWindow]:
+        """Returns a window compressing the array samples of a sample compressed tensor in the encode pool ahead of the
+        chunks being filled, or ``None`` if parallel encoding is disabled. Compressed samples are handed to the chunks
+        as :class:`Sample` objects holding the compressed bytes. Samples that are going to be tiled are left as they are.
+        See ``deeplake.constants.ENCODE_WORKERS``."""
+        pool = get_encode_pool()
+        tensor_meta = self.tensor_meta
+        if (
+            pool is None
+            or tensor_meta.is_link
+            or self.is_text_like
+            or self.is_video
+            or tensor_meta.htype == "polygon"
+        ):
+            return None
+        compression = self.compression
+        dtype, htype = tensor_meta.dtype, tensor_meta.htype
+        min_chunk_size = self.min_chunk_size
+        ratio = get_compression_ratio(compression)
+
+        def make_job(sample) -> Optional[EncodeJob]:
+            if (
+                isinstance(sample, np.ndarray)
+                and sample.dtype != object
+                and sample.size
+                and sample.nbytes * ratio <= min_chunk_size
+            ):
+                return intelligent_cast(sample, dtype, htype), compression
+            return None
+
+        def make_sample(job: EncodeJob, buffer: bytes) -> Optional[Sample]:
+            if len(buffer) > min_chunk_size:
+                # tiled by the chunk
+                return None
+            sample = Sample(
+                buffer=buffer, compression=compression, shape=job[0].shape, dtype=dtype
+            )
+            sample.htype = htype
+            return sample
+
+        return EncodeWindow(
+            pool,
+            samples,
+            make_job,
+            make_sample,
+            deeplake.constants.ENCODE_MAX_PENDING_SAMPLES,
+        )
+
+    def _compress_chunk_in_background(self, chunk: BaseChunk):
+        """Starts compressing a full chunk of a chunk compressed tensor in the encode pool, if it is enabled, while the
+        next chunk is filled. See ``deeplake.constants.ENCODE_WORKERS``."""
+        if isinstance(chunk, ChunkCompressedChunk):
+            pool = get_encode_pool()
+            if pool is not None:
+                chunk.compress_in_background(pool)
+
     def _handle_one_or_more_samples(
         self,
         enc: ChunkIdEncoder,
@@ -1010,9 +1137,12 @@ class ChunkEngine:
         samples, verified_samples = self._sanitize_samples(
             samples, pg_callback=pg_callback
         )
+        start_chunk = self.last_appended_chunk(allow_copy=False)
+        if start_chunk is not None:
+            self._log_registered_samples(start_chunk)
         self._samples_to_chunks(
             samples,
-            start_chunk=self.last_appended_chunk(allow_copy=False),
+            start_chunk=start_chunk,
             register=True,
             progressbar=progressbar,
             update_commit_diff=update_commit_diff,
@@ -1073,9 +1203,19 @@ class ChunkEngine:
                         )
 
             else:
-                verified_samples = (
-                    self._extend(samples, progressbar, pg_callback=pg_callback)
-                    or samples
+                num_samples_before = self.tensor_meta.length
+                shape_index = self._shape_index_for_write()
+                if shape_index is not None:
+                    self._registered_samples = []
+                try:
+                    verified_samples = (
+                        self._extend(samples, progressbar, pg_callback=pg_callback)
+                        or samples
+                    )
+                finally:
+                    registered_samples = self._stop_logging_registered_samples()
+                self._extend_shape_index(
+                    shape_index, num_samples_before, registered_samples
                 )
                 if link_callback:
                     if not isinstance(verified_samples, np.ndarray):
@@ -1111,6 +1251,7 @@ class ChunkEngine:
         chunk.key = chunk_key
         chunk.id = chunk_id
         chunk._update_tensor_meta_length = register
+        self._log_registered_samples(chunk)
         if self.active_appended_chunk is not None:
             self.write_chunk_to_storage(self.active_appended_chunk)
         self.active_appended_chunk = chunk
@@ -1155,6 +1296,8 @@ class ChunkEngine:
         except KeyError:
             pass
 
+        self._delete_shape_index()
+
         self.tensor_meta.length = 0
         self.tensor_meta.min_shape = []
         self.tensor_meta.max_shape = []
@@ -1193,13 +1336,14 @@ class ChunkEngine:
             [v.value for v in index.values[1:]], sample_shape, tile_shape  # type: ignore
         )
         required_tile_ids = ordered_tile_ids[tiles_index]
-        tiles = np.vectorize(
-            lambda chunk_id: self.get_chunk_from_chunk_id(
-                chunk_id, copy=True
-            ).read_sample(0, is_tile=True),
-            otypes=[object],
-        )(required_tile_ids)
-        current_sample = coalesce_tiles(tiles, tile_shape, None, self.tensor_meta.dtype)
+        current_sample = read_tiles(
+            required_tile_ids,
+            partial(self._get_tile_chunks, copy=True),
+            sample_shape,
+            tile_shape,
+            self.tensor_meta.dtype,
+            tuple(s.start for s in tiles_index),
+        )
         new_sample = current_sample
         new_sample[sample_index] = sample
         new_tiles = break_into_tiles(
@@ -1306,15 +1450,25 @@ class ChunkEngine:
         cmap = self.commit_chunk_map
         if cmap is not None:
             cmap = CommitChunkMap.frombuffer(cmap.tobytes())
+        shape_index = None
         try:
             self.check_link_ready()
+            shape_index = self._shape_index_for_write()
             (self._sequence_update if self.is_sequence else self._update)(  # type: ignore
                 index,
                 samples,
                 operator,
                 link_callback=link_callback,
             )
+            if shape_index is not None:
+                self._update_shape_index(
+                    shape_index, list(index.values[0].indices(self.num_samples))
+                )
+                self._stamp_shape_index(shape_index)
         except Exception as e:
+            if shape_index is not None:
+                # samples may have been updated partially
+                self._delete_shape_index()
             if cmap is not None:
                 key = get_tensor_commit_chunk_map_key(self.key, self.commit_id)
                 self.meta_cache[key] = cmap
@@ -1564,7 +1718,6 @@ class ChunkEngine:
     ):
         """Update data at `index` with `samples`."""
         self._write_initialization()
-        self.cached_data = None
         initial_autoflush = self.cache.autoflush
         self.cache.autoflush = False
         try:
@@ -1678,6 +1831,9 @@ class ChunkEngine:
         self,
         global_sample_index: int,
     ) -> Tuple[int, ...]:
+        shape_index = self.shape_index
+        if shape_index is not None:
+            return tuple(map(int, shape_index.shapes[global_sample_index]))
         enc = self.chunk_id_encoder
         if self._is_tiled_sample(global_sample_index):
             return self.tile_encoder.get_sample_shape(global_sample_index)
@@ -1685,14 +1841,114 @@ class ChunkEngine:
         if self.is_video:
             chunk_id = enc[global_sample_index][0]
             chunk = self.get_video_chunk(chunk_id)[0]
+            shapes_encoder = chunk.shapes_encoder
         else:
-            chunk_id, _, worst_case_header_size = self.get_chunk_info(
-                global_sample_index, fetch_chunks=False
+            shapes_encoder = self._get_shapes_encoder(global_sample_index)
+        return tuple(map(int, shapes_encoder[local_sample_index]))
+
+    def _get_shapes_encoder(self, global_sample_index: int) -> ShapeEncoder:
+        """Returns the shape encoder of the chunk containing the given sample, see :meth:`_get_header_encoders`."""
+        return self._get_header_encoders(global_sample_index)[0]
+
+    def _get_header_encoders(
+        self, global_sample_index: int
+    ) -> Tuple[ShapeEncoder, BytePositionsEncoder]:
+        """Returns the shape and byte positions encoders of the chunk containing the given sample, reading only the
+        header of the chunk if it is not in the cache and the storage supports partial reads.
+
+        Chunks of chunk compressed tensors are otherwise read in full and decompressed, so their header is parsed
+        without loading the chunk.
+        """
+        chunk_id, row, worst_case_header_size = self.get_chunk_info(
+            global_sample_index, fetch_chunks=False
+        )
+        if (
+            self.chunk_class == ChunkCompressedChunk
+            and self.base_storage.supports_partial_reads
+        ):
+            chunk_key = next(self._chunk_keys_for_rows([row]))
+            if (
+                chunk_key not in self.cache.lru_sizes
+                and chunk_key not in self.cache.deeplake_objects
+            ):
+                header = self.cache.get_bytes(
+                    chunk_key, 0, self._worst_case_header_size(row)
+                )
+                _, shapes, byte_positions, _ = deserialize_chunk(header, partial=True)
+                return ShapeEncoder(shapes), BytePositionsEncoder(byte_positions)
+        chunk = self.get_chunk_from_chunk_id(
+            chunk_id, partial_chunk_bytes=worst_case_header_size
+        )
+        return chunk.shapes_encoder, chunk.byte_positions_encoder
+
+    def _read_sample_shapes_batched(
+        self, global_sample_indices: np.ndarray
+    ) -> Optional[np.ndarray]:
+        """Reads the shapes of many samples, looking up the shape encoder of each chunk once for all of its samples.
+
+        Returns:
+            Optional[np.ndarray]: The shape of each sample in its rows, or None if the samples do not all have the same
+            number of dimensions.
+        """
+        shape_index = self._shape_index_for_read(len(global_sample_indices))
+        if shape_index is not None:
+            return shape_index.shapes_many(global_sample_indices)
+        shapes_and_sizes = self._read_sample_shapes_and_sizes(global_sample_indices)
+        return None if shapes_and_sizes is None else shapes_and_sizes[0]
+
+    def _read_sample_shapes_and_sizes(
+        self, global_sample_indices: np.ndarray
+    ) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """Reads the shapes and sizes in bytes of many samples from the headers of their chunks, see
+        :class:`ShapeIndex`.
+
+        Returns:
+            Optional[Tuple[np.ndarray, np.ndarray]]: The shape of each sample in its rows and the size of each sample,
+            or None if the samples do not all have the same number of dimensions.
+        """
+        tile_encoder = self.tile_encoder
+        tiled = np.zeros(len(global_sample_indices), dtype=bool)
+        if tile_encoder.entries:
+            tiled = np.isin(
+                global_sample_indices,
+                np.fromiter(tile_encoder.entries, dtype=np.int64),
             )
-            chunk = self.get_chunk_from_chunk_id(
-                chunk_id, partial_chunk_bytes=worst_case_header_size
+        parts = []
+        positions = np.flatnonzero(~tiled)
+        for group_positions, local_indices in self._group_samples_by_chunk(
+            global_sample_indices[positions]
+        ):
+            group_positions = positions[group_positions]
+            shapes_encoder, byte_positions_encoder = self._get_header_encoders(
+                int(global_sample_indices[group_positions[0]])
             )
-        return tuple(map(int, chunk.shapes_encoder[local_sample_index]))
+            shapes = shapes_encoder.shapes_many(local_indices)
+            if byte_positions_encoder.num_samples:
+                start_bytes, end_bytes = byte_positions_encoder.byte_ranges_many(
+                    local_indices
+                )
+                sizes = end_bytes - start_bytes
+            else:
+                # chunks compressed as images do not have byte positions
+                sizes = self._uncompressed_nbytes(shapes)
+            parts.append((group_positions, shapes, sizes))
+        for position in np.flatnonzero(tiled):
+            shape = tile_encoder.get_sample_shape(int(global_sample_indices[position]))
+            shapes = np.array([shape])
+            parts.append(([position], shapes, self._uncompressed_nbytes(shapes)))
+
+        ndims = {shapes.shape[1] for _, shapes, _ in parts}
+        if len(ndims) != 1:
+            return None
+        sample_shapes = np.zeros((len(global_sample_indices), ndims.pop()), np.int64)
+        sample_sizes = np.zeros(len(global_sample_indices), np.int64)
+        for group_positions, shapes, sizes in parts:
+            sample_shapes[group_positions] = shapes
+            sample_sizes[group_positions] = sizes
+        return sample_shapes, sample_sizes
+
+    def _uncompressed_nbytes(self, shapes: np.ndarray) -> np.ndarray:
+        return np.prod(shapes, axis=1) * np.dtype(self.tensor_meta.dtype).itemsize
 
     @property
     def is_fixed_shape(self):
@@ -1770,6 +2026,7 @@ class ChunkEngine:
         use_data_cache: bool = True,
         fetch_chunks: bool = False,
         pad_tensor: bool = False,
+        copy: bool = True,
     ) -> Union[np.ndarray, List[np.ndarray]]:
         """Reads samples from chunks and returns as a numpy array. If `aslist=True`, returns a sequence of numpy arrays.
 
@@ -1782,6 +2039,8 @@ class ChunkEngine:
                 - The tensor is ChunkCompressed
                 - The chunk which is being accessed has more than 128 samples.
             pad_tensor (bool): If True, any index out of bounds will not throw an error, but instead will return an empty sample.
+            copy (bool): If False, consecutive samples of a single chunk of a fixed shape tensor are returned as a read-only
+                view of the chunk buffer instead of a copy. See :meth:`_read_samples_view`. Defaults to True.
 
         Raises:
             DynamicTensorNumpyError: If shapes of the samples being read are not all the same.
@@ -1794,8 +2053,12 @@ class ChunkEngine:
         """
         self.check_link_ready()
         fetch_chunks = fetch_chunks or self._get_full_chunk(index)
-        return (self._sequence_numpy if self.is_sequence else self._numpy)(
-            index, aslist, use_data_cache, fetch_chunks, pad_tensor
+        if self.is_sequence:
+            return self._sequence_numpy(
+                index, aslist, use_data_cache, fetch_chunks, pad_tensor
+            )
+        return self._numpy(
+            index, aslist, use_data_cache, fetch_chunks, pad_tensor, copy=copy
         )
 
     def get_video_sample(self, global_sample_index, index, decompress=True):
@@ -1814,6 +2077,91 @@ class ChunkEngine:
             return sample[tuple(entry.value for entry in index.values[2:])]
         return sample
 
+    def _reads_full_chunks(self, fetch_chunks: bool) -> bool:
+        """Whether samples are read from full chunks, as opposed to reading the header of chunks first and paging in
+        the bytes of the samples, see :class:`PartialReader`."""
+        return (
+            fetch_chunks
+            or self.chunk_class == ChunkCompressedChunk
+            or not self.base_storage.supports_partial_reads
+        )
+
+    def _chunk_keys_for_rows(self, rows: Iterable) -> Iterator[str]:
+        """Yields the keys of the chunks at the given rows of the chunk id encoder."""
+        enc_array = self.chunk_id_encoder.array
+        for row in rows:
+            chunk_name = ChunkIdEncoder.name_from_id(enc_array[row][CHUNK_ID_COLUMN])
+            chunk_commit_id, tkey = self.get_chunk_commit(chunk_name)
+            yield get_chunk_key(tkey, chunk_name, chunk_commit_id)
+
+    def _start_prefetch(self, index: Index, fetch_chunks: bool):
+        """Starts reading ahead the chunks of the samples in ``index``.
+
+        If a single sample is read, read-ahead starts only when the previous read was from the preceding chunk,
+        i.e. the tensor is being read sample by sample in order. It then continues along the following chunks
+        until a chunk is read out of order.
+        """
+        if (
+            self.is_video
+            or not self._reads_full_chunks(fetch_chunks)
+            or self.prefetcher is None
+        ):
+            return
+        prefetcher = self.prefetcher
+        num_samples = self.num_samples
+        last_seen = self.chunk_id_encoder.array[:, LAST_SEEN_INDEX_COLUMN]
+        entry = index.values[0]
+        if entry.subscriptable():
+            indices = np.fromiter(entry.indices(num_samples), dtype=np.int64)
+            indices = indices[indices < num_samples]
+            first_rows = np.searchsorted(last_seen, indices)
+            # tiled samples span all rows up to the last one with the same last seen index
+            last_rows = np.maximum(
+                np.searchsorted(last_seen, indices, side="right"), first_rows + 1
+            )
+            if len(first_rows) == 0 or last_rows[-1] - first_rows[0] < 2:
+                return
+            rows = chain.from_iterable(map(range, first_rows, last_rows))
+            prefetcher.start(self._chunk_keys_for_rows(rows))
+        else:
+            global_sample_index = next(entry.indices(num_samples))
+            if global_sample_index >= num_samples:
+                return
+            row = int(np.searchsorted(last_seen, global_sample_index))
+            last_row = self._last_read_row
+            self._last_read_row = row
+            if not prefetcher.active and last_row is not None and row == last_row + 1:
+                prefetcher.start(self._chunk_keys_for_rows(range(row, len(last_seen))))
+
+    def _prefetch_sample_ranges(self, index: Index, fetch_chunks: bool):
+        """Fetches the bytes of the samples in ``index`` that are read from partially read chunks.
+        The byte ranges of the samples in each chunk are merged into as few range requests as possible,
+        see :meth:`PartialReader.prefetch`.
+        """
+        entry = index.values[0]
+        if (
+            self.is_video
+            or not entry.subscriptable()
+            or self._reads_full_chunks(fetch_chunks)
+        ):
+            return
+        num_samples = self.num_samples
+        indices = np.fromiter(entry.indices(num_samples), dtype=np.int64)
+        indices = np.sort(indices[indices < num_samples])
+        if len(indices) < 2:
+            return
+        for positions, local_indices in self._group_samples_by_chunk(indices):
+            global_sample_index = int(indices[positions[0]])
+            if len(positions) < 2 or self._is_tiled_sample(global_sample_index):
+                continue
+            chunk_id, _, header_size = self.get_chunk_info(
+                global_sample_index, fetch_chunks
+            )
+            chunk = self.get_chunk_from_chunk_id(
+                chunk_id, partial_chunk_bytes=header_size
+            )
+            chunk.prefetch_samples(local_indices.tolist())
+
     def get_chunk_info(self, global_sample_index, fetch_chunks):
         """Returns the chunk_id, row and worst case header size of chunk containing the given sample."""
         enc = self.chunk_id_encoder
@@ -1821,36 +2169,37 @@ class ChunkEngine:
         chunk_id, row = out[0][0], out[0][1]
 
         worst_case_header_size = 0
-        num_samples_in_chunk = -1
-        if (
-            not fetch_chunks
-            and self.chunk_class != ChunkCompressedChunk
-            and isinstance(self.base_storage, (S3Provider, GCSProvider, AzureProvider))
-        ):
-            prev = int(enc.array[row - 1][LAST_SEEN_INDEX_COLUMN]) if row > 0 else -1
-            num_samples_in_chunk = int(enc.array[row][LAST_SEEN_INDEX_COLUMN]) - prev
-            worst_case_header_size += HEADER_SIZE_BYTES + 10  # 10 for version
-            ENTRY_SIZE = 4
-            if self.tensor_meta.max_shape == self.tensor_meta.min_shape:
-                num_shape_entries = 1 * (len(self.tensor_meta.min_shape) + 1)
-                if self.is_text_like:
-                    num_bytes_entries = num_samples_in_chunk * 3
-                elif self.sample_compression is None:
-                    num_bytes_entries = 1 * 3
-                else:
-                    num_bytes_entries = num_samples_in_chunk * 3
-            else:
-                num_shape_entries = num_samples_in_chunk * (
-                    1 + len(self.tensor_meta.max_shape)
-                )
-                num_bytes_entries = num_samples_in_chunk * 3
-            bytes_enc_size = num_bytes_entries * ENTRY_SIZE
-            shape_enc_size = num_shape_entries * ENTRY_SIZE
-            worst_case_header_size += shape_enc_size
-            worst_case_header_size += bytes_enc_size
+        if not self._reads_full_chunks(fetch_chunks):
+            worst_case_header_size = self._worst_case_header_size(row)
 
         return chunk_id, row, worst_case_header_size
 
+    def _worst_case_header_size(self, row: int) -> int:
+        """Returns an upper bound of the size of the header of the chunk at the given row of the chunk id encoder."""
+        enc = self.chunk_id_encoder
+        prev = int(enc.array[row - 1][LAST_SEEN_INDEX_COLUMN]) if row > 0 else -1
+        num_samples_in_chunk = int(enc.array[row][LAST_SEEN_INDEX_COLUMN]) - prev
+        worst_case_header_size = HEADER_SIZE_BYTES + 10  # 10 for version
+        ENTRY_SIZE = 4
+        if self.tensor_meta.max_shape == self.tensor_meta.min_shape:
+            num_shape_entries = 1 * (len(self.tensor_meta.min_shape) + 1)
+            if self.is_text_like:
+                num_bytes_entries = num_samples_in_chunk * 3
+            elif self.sample_compression is None:
+                num_bytes_entries = 1 * 3
+            else:
+                num_bytes_entries = num_samples_in_chunk * 3
+        else:
+            num_shape_entries = num_samples_in_chunk * (
+                1 + len(self.tensor_meta.max_shape)
+            )
+            num_bytes_entries = num_samples_in_chunk * 3
+        bytes_enc_size = num_bytes_entries * ENTRY_SIZE
+        shape_enc_size = num_shape_entries * ENTRY_SIZE
+        worst_case_header_size += shape_enc_size
+        worst_case_header_size += bytes_enc_size
+        return worst_case_header_size
+
     def get_basic_sample(
         self,
         global_sample_index,
@@ -1864,18 +2213,28 @@ class ChunkEngine:
             global_sample_index, fetch_chunks
         )
         local_sample_index = enc.translate_index_relative_to_chunks(global_sample_index)
-        chunk = self.get_chunk_from_chunk_id(
-            chunk_id, partial_chunk_bytes=worst_case_header_size
-        )
-        decompress = decompress or (
-            isinstance(chunk, ChunkCompressedChunk) or len(index) > 1
-        )
-        ret = chunk.read_sample(
-            local_sample_index,
-            cast=self.tensor_meta.htype != "dicom",
-            is_tile=is_tile,
-            decompress=decompress,
-        )
+        cache_key = None
+        ret = None
+        if (decompress or len(index) > 1) and not is_tile and self._caches_samples:
+            cache_key = (self.get_chunk_key_for_id(chunk_id), local_sample_index)
+            ret = self._sample_cache.get(cache_key)
+        if ret is None:
+            chunk = self.get_chunk_from_chunk_id(
+                chunk_id, partial_chunk_bytes=worst_case_header_size
+            )
+            decompress = decompress or (
+                isinstance(chunk, ChunkCompressedChunk) or len(index) > 1
+            )
+            ret = chunk.read_sample(
+                local_sample_index,
+                cast=self.tensor_meta.htype != "dicom",
+                is_tile=is_tile,
+                decompress=decompress,
+            )
+            if cache_key is not None and isinstance(ret, np.ndarray):
+                self._sample_cache.put(cache_key, ret.copy())
+        else:
+            ret = ret.copy()
         if len(index) > 1:
             ret = ret[tuple(entry.value for entry in index.values[1:])]
         return ret
@@ -1892,31 +2251,75 @@ class ChunkEngine:
         )
 
     def get_full_tiled_sample(self, global_sample_index, fetch_chunks=False):
-        chunks = self.get_chunks_for_sample(global_sample_index)
-        return combine_chunks(chunks, global_sample_index, self.tile_encoder)
+        return self._read_tiles(global_sample_index)
 
     def get_partial_tiled_sample(self, global_sample_index, index, fetch_chunks=False):
         tile_enc = self.tile_encoder
-        chunk_ids = self.chunk_id_encoder[global_sample_index]
-        sample_shape = tile_enc.get_sample_shape(global_sample_index)
-        tile_shape = tile_enc.get_tile_shape(global_sample_index)
-        ordered_tile_ids = np.array(chunk_ids).reshape(
-            tile_enc.get_tile_layout_shape(global_sample_index)
-        )
         tiles_index, sample_index = translate_slices(
-            [v.value for v in index.values[1:]], sample_shape, tile_shape  # type: ignore
+            [v.value for v in index.values[1:]],  # type: ignore
+            tile_enc.get_sample_shape(global_sample_index),
+            tile_enc.get_tile_shape(global_sample_index),
         )
-        required_tile_ids = ordered_tile_ids[tiles_index]
-        tiles = np.vectorize(
-            lambda chunk_id: self.get_chunk_from_chunk_id(chunk_id).read_sample(
-                0, is_tile=True
-            ),
-            otypes=[object],
-        )(required_tile_ids)
-        sample = coalesce_tiles(tiles, tile_shape, None, self.tensor_meta.dtype)
+        sample = self._read_tiles(global_sample_index, tiles_index)
         sample = sample[sample_index]
         return sample
 
+    def _read_tiles(
+        self, global_sample_index: int, tiles_index: Optional[Tuple[slice, ...]] = None
+    ) -> np.ndarray:
+        """Reads the tiles of a tiled sample in ``tiles_index`` (all of them if ``None``) and assembles them.
+        Tiles are fetched and decoded concurrently, see :func:`read_tiles`."""
+        tile_enc = self.tile_encoder
+        sample_shape = tile_enc.get_sample_shape(global_sample_index)
+        ordered_tile_ids = np.array(self.chunk_id_encoder[global_sample_index]).reshape(
+            tile_enc.get_tile_layout_shape(global_sample_index)
+        )
+        first_tile = None
+        if tiles_index is not None:
+            ordered_tile_ids = ordered_tile_ids[tiles_index]
+            first_tile = tuple(s.start for s in tiles_index)
+        return read_tiles(
+            ordered_tile_ids,
+            self._get_tile_chunks,
+            sample_shape,
+            tile_enc.get_tile_shape(global_sample_index),
+            self.tensor_meta.dtype,
+            first_tile,
+        )
+
+    def _get_tile_chunks(self, chunk_ids, copy: bool = False) -> List[BaseChunk]:
+        """Gets the chunks of the given tiles. Chunks that are not in the cache are fetched from storage concurrently,
+        see :meth:`LRUCache.get_items`."""
+        if copy or len(chunk_ids) < 2:
+            return [
+                self.get_chunk_from_chunk_id(chunk_id, copy) for chunk_id in chunk_ids
+            ]
+        cache = self.cache
+        keys = [self.get_chunk_key_for_id(chunk_id) for chunk_id in chunk_ids]
+        missing = [
+            key
+            for key in keys
+            if key not in cache.deeplake_objects and key not in cache.lru_sizes
+        ]
+        try:
+            fetched = cache.get_items(missing) if missing else {}
+        except Exception as e:
+            raise GetChunkError(missing[0]) from e
+        chunks = []
+        for chunk_id, key in zip(chunk_ids, keys):
+            try:
+                if key in fetched and key not in cache.lru_sizes:
+                    # too large to be kept in the cache
+                    chunk = self.chunk_class.frombuffer(fetched[key], self.chunk_args)
+                else:
+                    chunk = self.get_chunk(key)
+                chunk.key = key
+                chunk.id = chunk_id
+            except Exception as e:
+                raise GetChunkError(key) from e
+            chunks.append(chunk)
+        return chunks
+
     def get_single_sample(
         self,
         global_sample_index,
@@ -1951,6 +2354,249 @@ class ChunkEngine:
 
         return sample
 
+    @property
+    def _caches_samples(self) -> bool:
+        """Whether samples decoded one by one are kept in the decoded sample cache. Samples of uncompressed chunks are
+        not, as reading them does not decode anything."""
+        return (
+            self._sample_cache.max_bytes > 0
+            and self.chunk_class != UncompressedChunk
+            and not self.is_text_like
+            and not self.is_video
+            and not self.tensor_meta.is_link
+            and self.tensor_meta.htype != "polygon"
+        )
+
+    def _can_read_batched(self, index: Index) -> bool:
+        """Whether the samples in ``index`` can be read chunk by chunk by :meth:`_read_samples_batched`."""
+        return (
+            index.values[0].subscriptable()
+            and not self.is_video
+            and not self.tensor_meta.is_link
+        )
+
+    def _read_samples_batched(
+        self,
+        index: Index,
+        aslist: bool,
+        fetch_chunks: bool = False,
+        pad_tensor: bool = False,
+    ) -> Union[np.ndarray, List]:
+        """Reads the samples in ``index`` grouping them by chunk, so that each chunk is looked up and loaded only once.
+
+        The chunk of every sample is found with a single ``np.searchsorted`` over the chunk id encoder. The samples of a
+        fully loaded, uncompressed chunk of a fixed shape tensor are decoded together with a single ``np.frombuffer``.
+        Tiled samples and out of bounds samples (with ``pad_tensor``) are read one by one with :meth:`get_single_sample`.
+
+        Returns:
+            Union[np.ndarray, List]: The samples in the order of ``index``. A single array if all of them were decoded
+            together and ``aslist`` is False, otherwise a list.
+        """
+        num_samples = self.num_samples
+        indices = np.fromiter(index.values[0].indices(num_samples), dtype=np.int64)
+        sub_index = tuple(entry.value for entry in index.values[1:])
+        single = indices >= (
+            min(num_samples, self.tensor_length) if pad_tensor else num_samples
+        )
+        tile_entries = self.tile_encoder.entries
+        if tile_entries:
+            single |= np.isin(indices, np.fromiter(tile_entries, dtype=np.int64))
+
+        parts: List = []
+        positions = np.flatnonzero(~single)
+        for group_positions, local_indices in self._group_samples_by_chunk(
+            indices[positions]
+        ):
+            group_positions = positions[group_positions]
+            parts.append(
+                (
+                    group_positions,
+                    self._read_samples_from_chunk(
+                        indices[group_positions],
+                        local_indices,
+                        sub_index,
+                        fetch_chunks,
+                    ),
+                )
+            )
+        for position in np.flatnonzero(single):
+            global_sample_index = int(indices[position])
+            sample = self._get_single_sample_with_context(
+                global_sample_index, index, fetch_chunks, pad_tensor
+            )
+            parts.append(([position], [sample]))
+
+        if not aslist and parts and all(isinstance(s, np.ndarray) for _, s in parts):
+            sample_shapes = {s.shape[1:] for _, s in parts}
+            if len(sample_shapes) == 1:
+                stacked = np.empty(
+                    (len(indices),) + sample_shapes.pop(), dtype=parts[0][1].dtype
+                )
+                for group_positions, group_samples in parts:
+                    stacked[group_positions] = group_samples
+                return stacked
+
+        sample_list: List[Any] = [None] * len(indices)
+        for group_positions, group_samples in parts:
+            for position, sample in zip(group_positions, group_samples):
+                sample_list[position] = sample
+        return sample_list
+
+    def _group_samples_by_chunk(
+        self, global_sample_indices: np.ndarray
+    ) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        """Groups non tiled samples by the chunk they belong to, using a single binary search over the chunk id encoder.
+
+        Yields:
+            Tuple[np.ndarray, np.ndarray]: Positions in ``global_sample_indices`` of the samples of a chunk, and the indices
+            of those samples relative to the chunk.
+        """
+        if not len(global_sample_indices):
+            return
+        rows, local_sample_indices = self.chunk_id_encoder.translate_many(
+            global_sample_indices
+        )
+        order = np.argsort(rows, kind="stable")
+        row_starts = np.flatnonzero(np.diff(rows[order], prepend=-1))
+        for positions in np.split(order, row_starts[1:]):
+            yield positions, local_sample_indices[positions]
+
+    def _read_samples_from_chunk(
+        self,
+        global_sample_indices: np.ndarray,
+        local_sample_indices: np.ndarray,
+        sub_index: tuple,
+        fetch_chunks: bool,
+    ) -> Union[np.ndarray, List]:
+        """Reads the given samples, which all belong to the same chunk.
+
+        Returns:
+            Union[np.ndarray, List]: The samples stacked in an array, if they could be decoded together, otherwise a list.
+        """
+        first_index = int(global_sample_indices[0])
+        chunk_id, _, header_size = self.get_chunk_info(first_index, fetch_chunks)
+        if self._caches_samples:
+            samples = self._read_samples_from_chunk_cached(
+                chunk_id, header_size, global_sample_indices, local_sample_indices
+            )
+            return [s[sub_index] for s in samples] if sub_index else samples
+
+        chunk = self._get_chunk_for_read(chunk_id, header_size, first_index)
+        if (
+            isinstance(chunk, UncompressedChunk)
+            and chunk.is_fixed_shape
+            and self.tensor_meta.htype != "polygon"
+            and not isinstance(chunk.data_bytes, PartialReader)
+            and all(isinstance(v, (int, slice)) for v in sub_index)
+        ):
+            chunk.check_empty_before_read()
+            shape = tuple(self.tensor_meta.min_shape)
+            try:
+                num_samples = chunk.num_samples
+                data = np.frombuffer(
+                    chunk.memoryview_data,
+                    dtype=chunk.dtype,
+                    count=num_samples * int(np.prod(shape)),
+                )
+                samples = data.reshape((num_samples,) + shape)[local_sample_indices]
+            except Exception as e:
+                raise ReadSampleFromChunkError(chunk.key, first_index, self.name) from e
+            return samples[(slice(None),) + sub_index] if sub_index else samples
+
+        samples = self._decode_samples(
+            chunk, global_sample_indices, local_sample_indices
+        )
+        return [s[sub_index] for s in samples] if sub_index else samples
+
+    def _get_chunk_for_read(
+        self, chunk_id, header_size: int, global_sample_index: int
+    ) -> BaseChunk:
+        try:
+            return self.get_chunk_from_chunk_id(
+                chunk_id, partial_chunk_bytes=header_size
+            )
+        except GetChunkError as e:
+            raise GetChunkError(e.chunk_key, global_sample_index, self.name) from e
+
+    def _decode_samples(
+        self,
+        chunk: BaseChunk,
+        global_sample_indices: np.ndarray,
+        local_sample_indices: np.ndarray,
+    ) -> List:
+        """Reads the given samples of ``chunk`` one by one, or in parallel for sample compressed chunks."""
+        cast = self.tensor_meta.htype != "dicom"
+        if isinstance(chunk, SampleCompressedChunk):
+            # decodes the samples in parallel, see `deeplake.constants.DECODE_WORKERS`
+            try:
+                return chunk.read_samples(local_sample_indices.tolist(), cast=cast)
+            except ReadSampleFromChunkError:
+                # read them one by one below to report which sample could not be read
+                pass
+
+        samples = []
+        for global_sample_index, local_sample_index in zip(
+            global_sample_indices.tolist(), local_sample_indices.tolist()
+        ):
+            try:
+                samples.append(chunk.read_sample(local_sample_index, cast=cast))
+            except ReadSampleFromChunkError as e:
+                raise ReadSampleFromChunkError(
+                    e.chunk_key, global_sample_index, self.name
+                ) from e
+        return samples
+
+    def _read_samples_from_chunk_cached(
+        self,
+        chunk_id,
+        header_size: int,
+        global_sample_indices: np.ndarray,
+        local_sample_indices: np.ndarray,
+    ) -> List:
+        """Reads the given samples of a chunk, decoding only the ones that are not in the decoded sample cache.
+        The chunk is not loaded at all if all of them are."""
+        chunk_key = self.get_chunk_key_for_id(chunk_id)
+        local_indices = local_sample_indices.tolist()
+        samples = [self._sample_cache.get((chunk_key, i)) for i in local_indices]
+        missing = [position for position, s in enumerate(samples) if s is None]
+        for position, sample in enumerate(samples):
+            if sample is not None:
+                samples[position] = sample.copy()
+        if missing:
+            chunk = self._get_chunk_for_read(
+                chunk_id, header_size, int(global_sample_indices[missing[0]])
+            )
+            decoded = self._decode_samples(
+                chunk, global_sample_indices[missing], local_sample_indices[missing]
+            )
+            for position, sample in zip(missing, decoded):
+                samples[position] = sample
+                if isinstance(sample, np.ndarray):
+                    self._sample_cache.put(
+                        (chunk_key, local_indices[position]), sample.copy()
+                    )
+        return samples
+
+    def _get_single_sample_with_context(
+        self, global_sample_index, index, fetch_chunks=False, pad_tensor=False
+    ):
+        """Calls :meth:`get_single_sample`, adding the sample index and tensor name to the errors raised."""
+        try:
+            return self.get_single_sample(
+                global_sample_index,
+                index,
+                fetch_chunks=fetch_chunks,
+                pad_tensor=pad_tensor,
+            )
+        except GetChunkError as e:
+            raise GetChunkError(e.chunk_key, global_sample_index, self.name) from e
+        except ReadSampleFromChunkError as e:
+            raise ReadSampleFromChunkError(
+                e.chunk_key, global_sample_index, self.name
+            ) from e
+        except GetDataFromLinkError as e:
+            raise GetDataFromLinkError(e.link, global_sample_index, self.name) from e
+
     def _numpy(
         self,
         index: Index,
@@ -1958,6 +2604,7 @@ class ChunkEngine:
         use_data_cache: bool = True,
         fetch_chunks: bool = False,
         pad_tensor: bool = False,
+        copy: bool = True,
     ) -> Union[np.ndarray, List[np.ndarray]]:
         """Reads samples from chunks and returns as a numpy array. If `aslist=True`, returns a sequence of numpy arrays.
 
@@ -1970,6 +2617,7 @@ class ChunkEngine:
                 - The tensor is ChunkCompressed
                 - The chunk which is being accessed has more than 128 samples.
             pad_tensor (bool): If True, any index out of bounds will not throw an error, but instead will return an empty sample.
+            copy (bool): If False, the samples are returned as a read-only view of the chunk buffer when possible. Defaults to True.
 
         Raises:
             DynamicTensorNumpyError: If shapes of the samples being read are not all the same.
@@ -1985,36 +2633,39 @@ class ChunkEngine:
         ispolygon = self.tensor_meta.htype == "polygon"
         if ispolygon:
             aslist = True
-        if use_data_cache and self.is_data_cachable:
+        self._start_prefetch(index, fetch_chunks or self.is_data_cachable)
+        view: Optional[np.ndarray] = None
+        if not copy and not ispolygon:
+            view = self._read_samples_view(index, use_data_cache, fetch_chunks)
+        samples: Union[np.ndarray, List[Any]]
+        if view is not None:
+            if aslist and index.values[0].subscriptable():
+                samples = list(view)
+            else:
+                samples = view
+        elif use_data_cache and self.is_data_cachable:
             samples = self.numpy_from_data_cache(index, length, aslist, pad_tensor)
         else:
-            samples = []
-            for global_sample_index in index.values[0].indices(length):
-                try:
-                    sample = self.get_single_sample(
-                        global_sample_index,
-                        index,
-                        fetch_chunks=fetch_chunks,
-                        pad_tensor=pad_tensor,
+            self._prefetch_sample_ranges(index, fetch_chunks)
+            if self._can_read_batched(index):
+                samples = self._read_samples_batched(
+                    index, aslist, fetch_chunks=fetch_chunks, pad_tensor=pad_tensor
+                )
+            else:
+                samples = [
+                    self._get_single_sample_with_context(
+                        global_sample_index, index, fetch_chunks, pad_tensor
+                    )
+                    for global_sample_index in index.values[0].indices(length)
+                ]
+            if isinstance(samples, list):
+                for sample in samples:
+                    check_sample_shape(
+                        sample.shape, last_shape, self.key, index, aslist
                     )
-                except GetChunkError as e:
-                    raise GetChunkError(
-                        e.chunk_key, global_sample_index, self.name
-                    ) from e
-                except ReadSampleFromChunkError as e:
-                    raise ReadSampleFromChunkError(
-                        e.chunk_key, global_sample_index, self.name
-                    ) from e
-                except GetDataFromLinkError as e:
-                    raise GetDataFromLinkError(
-                        e.link, global_sample_index, self.name
-                    ) from e
-
-                check_sample_shape(sample.shape, last_shape, self.key, index, aslist)
-                last_shape = sample.shape
+                    last_shape = sample.shape
                 if ispolygon:
-                    sample = [p.__array__() for p in sample]
-                samples.append(sample)
+                    samples = [[p.__array__() for p in sample] for sample in samples]
         if aslist and all(map(np.isscalar, samples)):
             samples = list(arr.item() for arr in samples)
 
@@ -2023,51 +2674,157 @@ class ChunkEngine:
 
         if aslist:
             return samples
+        if isinstance(samples, np.ndarray) and (
+            index.values[0].subscriptable() or not (copy or samples.flags.writeable)
+        ):
+            # a new array from `_read_samples_batched`, or a view from `_read_samples_view`, no need to copy
+            return samples
         return np.array(samples)
 
+    def _read_samples_view(
+        self, index: Index, use_data_cache: bool, fetch_chunks: bool
+    ) -> Optional[np.ndarray]:
+        """Returns the samples in ``index`` as a read-only view of the buffer of their chunk, without copying them.
+
+        Only possible for consecutive, non tiled samples of a single chunk of a fixed shape tensor, whose chunk is either
+        uncompressed and immutable (i.e. read from storage and not modified since), or decoded in the decoded sample
+        cache. Sub indices must be integers or slices. The view keeps the buffer alive, so it stays valid after the chunk
+        is evicted from the caches.
+
+        Returns:
+            Optional[np.ndarray]: The view, with a leading axis over the samples even if ``index`` selects a single one, or
+            None if the samples can not be read without copying them.
+        """
+        tensor_meta = self.tensor_meta
+        entry = index.values[0].value
+        sub_index = tuple(entry.value for entry in index.values[1:])
+        if (
+            not tensor_meta.max_shape
+            or tensor_meta.max_shape != tensor_meta.min_shape
+            or tensor_meta.is_link
+            or self.is_text_like
+            or self.is_video
+            or not all(isinstance(v, (int, slice)) for v in sub_index)
+        ):
+            return None
+
+        num_samples = self.num_samples
+        if isinstance(entry, int):
+            first = entry if entry >= 0 else entry + num_samples
+            stop = first + 1
+        elif isinstance(entry, slice) and (entry.step or 1) == 1:
+            first, stop, _ = entry.indices(num_samples)
+        else:
+            return None
+        if not 0 <= first < stop <= num_samples:
+            return None
+        enc = self.chunk_id_encoder
+        if enc.translate_index(first) != enc.translate_index(stop - 1):
+            return None
+        if any(first <= i < stop for i in self.tile_encoder.entries):
+            return None
+
+        if use_data_cache and self.is_data_cachable:
+            chunk_samples, chunk_range = self._get_decoded_chunk(first)
+            start = chunk_range.start
+        elif self.chunk_class == UncompressedChunk:
+            chunk_id, _, header_size = self.get_chunk_info(first, fetch_chunks)
+            chunk = self._get_chunk_for_read(chunk_id, header_size, first)
+            data_bytes = chunk.data_bytes
+            if isinstance(data_bytes, PartialReader):
+                # only the header was read, the view needs the data of the whole chunk
+                data_bytes = memoryview(data_bytes.get_all_bytes())[
+                    chunk.header_bytes :
+                ]
+                chunk.data_bytes = data_bytes
+            if isinstance(data_bytes, bytearray) or (
+                isinstance(data_bytes, memoryview) and not data_bytes.readonly
+            ):
+                # the chunk is being written to
+                return None
+            chunk.check_empty_before_read()
+            shape = tuple(tensor_meta.min_shape)
+            chunk_num_samples = chunk.num_samples
+            try:
+                chunk_samples = np.frombuffer(
+                    chunk.memoryview_data,
+                    dtype=chunk.dtype,
+                    count=chunk_num_samples * int(np.prod(shape)),
+                ).reshape((chunk_num_samples,) + shape)
+            except Exception as e:
+                raise ReadSampleFromChunkError(chunk.key, first, self.name) from e
+            start = first - enc.translate_index_relative_to_chunks(first)
+        else:
+            return None
+
+        samples = chunk_samples[(slice(first - start, stop - start),) + sub_index]
+        samples.flags.writeable = False
+        return samples
+
     def numpy_from_data_cache(self, index, length, aslist, pad_tensor=False):
         samples = []
-        enc = self.chunk_id_encoder
+        sub_index = tuple(entry.value for entry in index.values[1:])
+        chunk_samples: Optional[np.ndarray] = None
+        chunk_range = range(0)
         for global_sample_index in index.values[0].indices(length):
             if pad_tensor and global_sample_index >= self.tensor_length:
                 sample = self.get_empty_sample()
                 try:
-                    sample = sample[tuple(entry.value for entry in index.values[1:])]
+                    sample = sample[sub_index]
                 except IndexError:
                     pass
             else:
-                if (
-                    self.cached_data is None
-                    or global_sample_index not in self.cache_range
-                ):
-                    row = enc.__getitem__(global_sample_index, True)[0][1]
-                    chunks = self.get_chunks_for_sample(global_sample_index)
-                    assert len(chunks) == 1
-
-                    chunk_arr = self.chunk_id_encoder.array
-
-                    chunk = chunks[0]
-                    first_sample = int(0 if row == 0 else chunk_arr[row - 1][1] + 1)
-                    last_sample = int(self.chunk_id_encoder.array[row][1])
-                    num_samples = last_sample - first_sample + 1
-                    full_shape = (num_samples,) + tuple(self.tensor_meta.max_shape)
-                    dtype = self.tensor_meta.dtype
-
-                    data_bytes = bytearray(chunk.data_bytes)
-                    self.cached_data = np.frombuffer(data_bytes, dtype).reshape(
-                        full_shape
+                if global_sample_index not in chunk_range:
+                    chunk_samples, chunk_range = self._get_decoded_chunk(
+                        global_sample_index
                     )
-                    self.cache_range = range(first_sample, last_sample + 1)
-
-                sample = self.cached_data[global_sample_index - self.cache_range.start]  # type: ignore
+                sample = chunk_samples[global_sample_index - chunk_range.start]  # type: ignore
 
                 # need to copy if aslist otherwise user might modify the returned data
                 # if not aslist, we already do np.array(samples) while formatting which copies
                 sample = sample.copy() if aslist else sample
-                sample = sample[tuple(entry.value for entry in index.values[1:])]
+                sample = sample[sub_index]
             samples.append(sample)
         return samples
 
+    def _get_decoded_chunk(self, global_sample_index: int) -> Tuple[np.ndarray, range]:
+        """Returns all the samples of the chunk containing the given sample as a single array, along with the range of
+        global sample indices they correspond to. Only for tensors that are :attr:`is_data_cachable`.
+        Decoded chunks are kept in the decoded sample cache, so that reading back and forth between a few chunks does
+        not decode them again.
+        """
+        enc = self.chunk_id_encoder
+        row = enc.translate_index(global_sample_index)
+        chunk_arr = enc.array
+        first_sample = int(0 if row == 0 else chunk_arr[row - 1][1] + 1)
+        last_sample = int(chunk_arr[row][1])
+        chunk_range = range(first_sample, last_sample + 1)
+        chunk_id = chunk_arr[row][CHUNK_ID_COLUMN]
+        cache_key = (self.get_chunk_key_for_id(chunk_id), None)
+        chunk_samples = self._sample_cache.get(cache_key)
+        # the last chunk may have grown since it was cached
+        if chunk_samples is None or len(chunk_samples) != len(chunk_range):
+            chunk = self.get_chunk_from_chunk_id(chunk_id)
+            data_bytes: Union[bytes, bytearray, memoryview]
+            if isinstance(chunk, ChunkCompressedChunk):
+                assert chunk.decompressed_bytes is not None
+                data_bytes = chunk.decompressed_bytes
+            else:
+                # the chunk is read in full by `get_chunk`
+                assert not isinstance(chunk.data_bytes, PartialReader)
+                data_bytes = chunk.data_bytes
+            if isinstance(data_bytes, bytearray) or (
+                isinstance(data_bytes, memoryview) and not data_bytes.readonly
+            ):
+                # a bytearray can not be resized by later writes to the chunk while an array refers to it
+                data_bytes = bytes(data_bytes)
+            full_shape = (len(chunk_range),) + tuple(self.tensor_meta.max_shape)
+            chunk_samples = np.frombuffer(data_bytes, self.tensor_meta.dtype).reshape(
+                full_shape
+            )
+            self._sample_cache.put(cache_key, chunk_samples)
+        return chunk_samples, chunk_range
+
     def get_chunks_for_sample(
         self,
         global_sample_index: int,
@@ -2174,7 +2931,6 @@ class ChunkEngine:
                 f"Index {global_sample_index} is out of range for tensor of length {self.tensor_meta.length}"
             )
 
-        self.cached_data = None
         initial_autoflush = self.cache.autoflush
         self.cache.autoflush = False
 
@@ -2183,6 +2939,9 @@ class ChunkEngine:
             link_callback(global_sample_index)
 
         self.commit_diff.pop(global_sample_index, sample_id)
+        shape_index = self._shape_index_for_write()
+        if shape_index is not None:
+            shape_index.pop(global_sample_index)
         if self.is_sequence:
             # pop in reverse order else indices get shifted
             for idx in reversed(range(*self.sequence_encoder[global_sample_index])):
@@ -2191,6 +2950,7 @@ class ChunkEngine:
         else:
             self.pop_item(global_sample_index)
         self.pad_encoder.pop(global_sample_index)
+        self._stamp_shape_index(shape_index)
         self.cache.autoflush = initial_autoflush
         self.cache.maybe_flush()
 
@@ -2332,6 +3092,277 @@ class ChunkEngine:
             self.meta_cache.register_deeplake_object(key, enc)
         return self._pad_encoder
 
+    @property
+    def _maintains_shape_index(self) -> bool:
+        """Whether the shapes of the samples are kept in a :class:`ShapeIndex`. Text, link, video and sequence tensors
+        do not read their shapes from chunk headers, and hidden tensors are never read in bulk, so they do not have one.
+        """
+        tensor_meta = self.tensor_meta
+        return not (
+            tensor_meta.hidden
+            or tensor_meta.is_link
+            or self.is_text_like
+            or self.is_video
+            or self.is_sequence
+        )
+
+    def _shape_index_fingerprint(self) -> Tuple[int, int, int]:
+        """Length of the tensor, number of rows of its chunk id encoder and id of its last chunk. Samples added or
+        removed without updating the shape index, e.g. by transforms, change at least one of them.
+        """
+        if not self.chunk_id_encoder_exists:
+            return self.tensor_meta.length, 0, 0
+        encoded = self.chunk_id_encoder._encoded
+        last_chunk_id = int(encoded[-1, 0]) if len(encoded) else 0
+        return self.tensor_meta.length, len(encoded), last_chunk_id
+
+    def _load_shape_index(self) -> Optional[ShapeIndex]:
+        commit_id = self.commit_id
+        if self._shape_index_commit_id != commit_id:
+            key = get_tensor_shape_index_key(self.key, commit_id)
+            try:
+                shape_index = self.meta_cache.get_deeplake_object(key, ShapeIndex)
+                self.meta_cache.register_deeplake_object(key, shape_index)
+            except KeyError:
+                shape_index = None
+            self._shape_index = shape_index
+            self._shape_index_commit_id = commit_id
+        return self._shape_index
+
+    @property
+    def shape_index(self) -> Optional[ShapeIndex]:
+        """Gets the shape index from cache, if the tensor has one and it is up to date with the tensor.
+
+        Returns:
+            Optional[ShapeIndex]: The shapes and sizes of all the samples of the tensor, or None if the tensor was created
+                with an older version of deeplake, or samples were added to it by code that does not maintain the index,
+                e.g. transforms.
+        """
+        if not self._maintains_shape_index:
+            return None
+        shape_index = self._load_shape_index()
+        if (
+            shape_index is None
+            or shape_index.fingerprint != self._shape_index_fingerprint()
+        ):
+            return None
+        return shape_index
+
+    def _shape_index_for_read(self, num_samples: int) -> Optional[ShapeIndex]:
+        """Returns the shape index of the tensor for reading the shapes or sizes of ``num_samples`` samples.
+
+        A missing or out of date index is rebuilt from the headers of all the chunks if at least half of the samples of
+        the tensor are read, since their headers would be read anyway.
+        """
+        shape_index = self.shape_index
+        if shape_index is not None or not self._maintains_shape_index:
+            return shape_index
+        length = self.tensor_meta.length
+        if not length or 2 * num_samples < length:
+            return None
+        return self._build_shape_index()
+
+    def _build_shape_index(self) -> Optional[ShapeIndex]:
+        """Builds the shape index of the tensor from the headers of its chunks. The index is stored unless the dataset is
+        read only, in which case it is only kept in memory.
+        """
+        commit_id = self.commit_id
+        fingerprint = self._shape_index_fingerprint()
+        if self._shape_index_build_failed == (commit_id, fingerprint):
+            return None
+        try:
+            shapes_and_sizes = self._read_sample_shapes_and_sizes(
+                np.arange(self.tensor_meta.length, dtype=np.int64)
+            )
+        except (ValueError, IndexError):
+            shapes_and_sizes = None
+        if shapes_and_sizes is None:
+            # samples with different numbers of dimensions, or without shapes in the chunk headers
+            self._shape_index_build_failed = (commit_id, fingerprint)
+            return None
+        shape_index = ShapeIndex()
+        shape_index.extend(*shapes_and_sizes)
+        shape_index.fingerprint = fingerprint
+        key = get_tensor_shape_index_key(self.key, commit_id)
+        try:
+            self.meta_cache[key] = shape_index
+            self.meta_cache.register_deeplake_object(key, shape_index)
+        except ReadOnlyModeError:
+            pass
+        self._shape_index = shape_index
+        self._shape_index_commit_id = commit_id
+        return shape_index
+
+    def _shape_index_for_write(self) -> Optional[ShapeIndex]:
+        """Returns the shape index to update along with the samples of the tensor, creating it if the tensor is empty.
+
+        An index that is out of date is deleted, it is rebuilt the next time many samples are read.
+        """
+        if not self._maintains_shape_index:
+            return None
+        shape_index = self._load_shape_index()
+        fingerprint = self._shape_index_fingerprint()
+        if shape_index is not None:
+            if shape_index.fingerprint == fingerprint:
+                return shape_index
+            self._delete_shape_index()
+        if fingerprint[0]:
+            return None
+        key = get_tensor_shape_index_key(self.key, self.commit_id)
+        shape_index = ShapeIndex()
+        shape_index.fingerprint = fingerprint
+        try:
+            self.meta_cache[key] = shape_index
+        except ReadOnlyModeError:
+            return None
+        self.meta_cache.register_deeplake_object(key, shape_index)
+        self._shape_index = shape_index
+        self._shape_index_commit_id = self.commit_id
+        return shape_index
+
+    def _stamp_shape_index(self, shape_index: Optional[ShapeIndex]):
+        """Marks ``shape_index`` as up to date with the tensor, unless it was deleted while updating it."""
+        if shape_index is not None and shape_index is self._shape_index:
+            shape_index.fingerprint = self._shape_index_fingerprint()
+            shape_index.is_dirty = True
+
+    def _delete_shape_index(self):
+        key = get_tensor_shape_index_key(self.key, self.commit_id)
+        self.meta_cache.remove_deeplake_object(key)
+        try:
+            del self.meta_cache[key]
+        except KeyError:
+            pass
+        self._shape_index = None
+        self._shape_index_commit_id = self.commit_id
+
+    def _log_registered_samples(self, chunk: BaseChunk):
+        """Makes ``chunk`` log the samples registered to its headers while the tensor is extended."""
+        if self._registered_samples is not None:
+            chunk.registered_samples = self._registered_samples
+            self._logged_chunks.append(chunk)
+
+    def _stop_logging_registered_samples(self) -> Optional[list]:
+        registered_samples = self._registered_samples
+        for chunk in self._logged_chunks:
+            chunk.registered_samples = None
+        self._logged_chunks = []
+        self._registered_samples = None
+        return registered_samples
+
+    def _registered_shapes_and_sizes(
+        self, registered_samples: list, start: int, stop: int
+    ) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """Shapes and sizes of the samples ``start`` to ``stop``, from the samples registered to the chunk headers while
+        they were appended and the tile encoder. Returns None if they do not account for all the samples.
+        """
+        num_samples = stop - start
+        tiled = (
+            sorted(idx for idx in self.tile_encoder.entries if idx >= start)
+            if self.tile_encoder_exists
+            else []
+        )
+        if len(registered_samples) == 1 and not tiled:
+            sample_nbytes, shape, count = registered_samples[0]
+            if shape is None or count != num_samples:
+                return None
+            sample_shapes = np.array([shape] * count, dtype=np.int64)
+            if sample_nbytes is None:
+                return sample_shapes, self._uncompressed_nbytes(sample_shapes)
+            return sample_shapes, np.full(count, sample_nbytes, dtype=np.int64)
+        shapes: Optional[np.ndarray] = None
+        nbytes: Optional[np.ndarray] = None
+        if registered_samples:
+            group_nbytes, group_shapes, group_counts = zip(*registered_samples)
+            if any(shape is None for shape in group_shapes):
+                return None
+            if len({len(shape) for shape in group_shapes}) != 1:
+                return None
+            unique_shapes = np.array(group_shapes, dtype=np.int64)
+            unknown = np.array([n is None for n in group_nbytes])
+            unique_nbytes = np.array(
+                [0 if n is None else n for n in group_nbytes], dtype=np.int64
+            )
+            if unknown.any():
+                # chunks compressed as images do not have byte positions
+                unique_nbytes[unknown] = self._uncompressed_nbytes(
+                    unique_shapes[unknown]
+                )
+            counts = np.array(group_counts, dtype=np.int64)
+            shapes = np.repeat(unique_shapes, counts, axis=0)
+            nbytes = np.repeat(unique_nbytes, counts)
+        if not tiled:
+            if shapes is None or nbytes is None or len(shapes) != num_samples:
+                return None
+            return shapes, nbytes
+        if (0 if shapes is None else len(shapes)) + len(tiled) != num_samples:
+            return None
+        tile_shapes = np.array(
+            [self.tile_encoder.get_sample_shape(idx) for idx in tiled], dtype=np.int64
+        )
+        if shapes is not None and tile_shapes.shape[1] != shapes.shape[1]:
+            return None
+        is_tiled = np.zeros(num_samples, dtype=bool)
+        is_tiled[np.array(tiled, dtype=np.int64) - start] = True
+        all_shapes = np.zeros((num_samples, tile_shapes.shape[1]), dtype=np.int64)
+        all_nbytes = np.zeros(num_samples, dtype=np.int64)
+        all_shapes[is_tiled] = tile_shapes
+        all_nbytes[is_tiled] = self._uncompressed_nbytes(tile_shapes)
+        if shapes is not None:
+            all_shapes[~is_tiled] = shapes
+            all_nbytes[~is_tiled] = nbytes
+        return all_shapes, all_nbytes
+
+    def _extend_shape_index(
+        self,
+        shape_index: Optional[ShapeIndex],
+        start: int,
+        registered_samples: Optional[list],
+    ):
+        """Adds the samples appended to the tensor from ``start`` on to ``shape_index``, using the shapes and sizes
+        registered to the chunk headers while they were appended."""
+        stop = self.tensor_meta.length
+        if shape_index is None or registered_samples is None:
+            return
+        if stop != start:
+            shapes_and_sizes = self._registered_shapes_and_sizes(
+                registered_samples, start, stop
+            )
+            try:
+                if shapes_and_sizes is None:
+                    raise ValueError("Samples could not be added to the shape index.")
+                shape_index.extend(*shapes_and_sizes)
+            except ValueError:
+                # samples with different numbers of dimensions, or without shapes in the chunk headers (e.g. empty
+                # samples of a tensor without any samples yet), are read one by one
+                self._delete_shape_index()
+                return
+        self._stamp_shape_index(shape_index)
+
+    def _update_shape_index(
+        self, shape_index: Optional[ShapeIndex], global_sample_indices: Sequence[int]
+    ):
+        """Updates the entries of the given samples in ``shape_index`` after they were updated in the tensor."""
+        if shape_index is None or not len(global_sample_indices):
+            return
+        indices = np.unique(np.asarray(global_sample_indices, dtype=np.int64))
+        try:
+            shapes_and_sizes = self._read_sample_shapes_and_sizes(indices)
+            if shapes_and_sizes is None:
+                raise ValueError("Samples have different numbers of dimensions.")
+            for index, shape, nbytes in zip(indices, *shapes_and_sizes):
+                shape_index.update(int(index), tuple(map(int, shape)), int(nbytes))
+        except (ValueError, IndexError):
+            self._delete_shape_index()
+
+    def sample_nbytes(self, global_sample_indices) -> Optional[np.ndarray]:
+        """Returns the number of bytes the given samples take in their chunks, looked up in the shape index of the
+        tensor, or None if the tensor does not have a shape index."""
+        shape_index = self._shape_index_for_read(len(global_sample_indices))
+        if shape_index is None:
+            return None
+        return shape_index.sizes_many(global_sample_indices)
+
     def _sequence_numpy(
         self,
         index: Index,
@@ -2580,12 +3611,49 @@ class ChunkEngine:
             )
         return shape
 
+    def _populate_sample_shapes_batched(
+        self,
+        sample_shapes: np.ndarray,
+        index_0: IndexEntry,
+        sample_indices: List[int],
+        sample_shape_provider: Optional[Callable] = None,
+        batched_sample_shape_provider: Optional[Callable] = None,
+    ) -> bool:
+        """Fills ``sample_shapes`` with the shapes of all the samples at once, if possible.
+
+        Returns:
+            bool: Whether ``sample_shapes`` was filled.
+        """
+        shapes = None
+        if sample_shape_provider or batched_sample_shape_provider:
+            # the shapes can be read from the sample shape tensor instead of building the index
+            shape_index = self.shape_index
+        else:
+            shape_index = self._shape_index_for_read(len(sample_indices))
+        if shape_index is not None:
+            shapes = shape_index.shapes_many(sample_indices)
+        elif batched_sample_shape_provider:
+            try:
+                shapes = batched_sample_shape_provider(index_0)
+            except (IndexError, DynamicTensorNumpyError):
+                # sample shape tensor is not populated yet, or has samples of different dimensionality
+                pass
+        elif not (sample_shape_provider or self.tensor_meta.is_link or self.is_video):
+            shapes = self._read_sample_shapes_batched(
+                np.asarray(sample_indices, dtype=np.int64)
+            )
+        if isinstance(shapes, np.ndarray) and shapes.shape == sample_shapes.shape:
+            sample_shapes[:] = shapes
+            return True
+        return False
+
     def _populate_sample_shapes(
         self,
         sample_shapes: np.ndarray,
         index: Index,
         sample_shape_provider: Optional[Callable] = None,
         flatten: bool = False,
+        batched_sample_shape_provider: Optional[Callable] = None,
     ):
         index_0, sample_index = index.values[0], index.values[1:]
         sample_indices = list(
@@ -2593,6 +3661,20 @@ class ChunkEngine:
         )
         num_samples = len(sample_indices)
 
+        if (
+            num_samples
+            and not flatten
+            and self.tensor_meta.htype not in ("text", "json")
+            and self._populate_sample_shapes_batched(
+                sample_shapes,
+                index_0,
+                sample_indices,
+                sample_shape_provider,
+                batched_sample_shape_provider,
+            )
+        ):
+            return sample_shapes, []
+
         sample_ndim = self.ndim() - 1
 
         bad_shapes = []
@@ -2676,6 +3758,7 @@ class ChunkEngine:
         sample_shape_provider: Optional[Callable] = None,
         pad_tensor: bool = False,
         convert_bad_to_list: bool = True,
+        batched_sample_shape_provider: Optional[Callable] = None,
     ):
         if len(index) > 1:
             raise IndexError("`.shapes` only accepts indexing on the primary axis.")
@@ -2707,6 +3790,7 @@ class ChunkEngine:
                 index,
                 sample_shape_provider,
                 flatten=True if self.is_sequence else False,
+                batched_sample_shape_provider=batched_sample_shape_provider,
             )
             # convert to list if grayscale images were stored as (H, W) instead of (H, W, 1)
             if bad_shapes and convert_bad_to_list:
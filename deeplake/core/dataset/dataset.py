@@ -52,6 +52,7 @@ from deeplake.core.lock import lock_dataset, unlock_dataset, Lock
 from deeplake.core.meta.dataset_meta import DatasetMeta
 from deeplake.core.storage import (
     LRUCache,
+    SharedCache,
     S3Provider,
     GCSProvider,
     MemoryProvider,
@@ -69,7 +70,7 @@ from deeplake.htype import (
 from deeplake.integrations import dataset_to_tensorflow
 from deeplake.util.bugout_reporter import deeplake_reporter, feature_report_path
 from deeplake.util.dataset import try_flushing
-from deeplake.util.cache_chain import generate_chain
+from deeplake.util.cache_chain import generate_chain, get_cache_chain_stats
 from deeplake.util.hash import hash_inputs
 from deeplake.util.htype import parse_complex_htype
 from deeplake.util.link import save_link_creds
@@ -130,6 +131,7 @@ from deeplake.util.version_control import (
     delete_branch,
     commit,
     current_commit_has_change,
+    get_committed_ids,
     load_meta,
     warn_node_checkout,
     load_version_info,
@@ -1374,6 +1376,15 @@ class Dataset:
         version_state["full_tensors"] = {}
         version_state["tensor_names"] = {}
         self.__dict__["version_state"] = version_state
+        self._update_shared_cache_commits()
+
+    def _update_shared_cache_commits(self):
+        """Lets the shared chunk cache, if any, cache the chunks of the commits that can no longer be modified."""
+        storage = self.storage
+        while isinstance(storage, LRUCache):
+            if isinstance(storage, SharedCache):
+                storage.committed_ids = get_committed_ids(self.version_state)
+            storage = storage.next_storage
 
     def _load_link_creds(self):
         if self.link_creds is not None:
@@ -1595,6 +1606,7 @@ class Dataset:
             self._lock()
         finally:
             self.storage.autoflush = self._initial_autoflush.pop()
+        self._update_shared_cache_commits()
         self._info = None
         self._ds_diff = None
         [f() for f in list(self._commit_hooks.values())]
@@ -1998,6 +2010,12 @@ class Dataset:
         transform_kwargs: Optional[Dict[str, Any]] = None,
         decode_method: Optional[Dict[str, str]] = None,
         cache_size: int = 32 * MB,
+        stream_batches: bool = False,
+        resume_state: Optional[Dict[str, Any]] = None,
+        bucket_by: Optional[str] = None,
+        bucket_boundaries: Optional[Sequence[int]] = None,
+        shuffle_pool_size: int = 1,
+        seed: Optional[int] = None,
         *args,
         **kwargs,
     ):
@@ -2019,7 +2037,7 @@ class Dataset:
                 Read torch.utils.data.DataLoader docs for more details.
             shuffle (bool): If ``True``, the data loader will shuffle the data indices. Default value is False. Details about how Deep Lake shuffles data can be found at `Shuffling in ds.pytorch() <https://docs.activeloop.ai/how-it-works/shuffling-in-ds.pytorch>`_
             buffer_size (int): The size of the buffer used to shuffle the data in MBs. Defaults to 2048 MB. Increasing the buffer_size will increase the extent of shuffling.
-            use_local_cache (bool): If ``True``, the data loader will use a local cache to store data. The default cache location is ~/.activeloop/cache, but it can be changed by setting the ``LOCAL_CACHE_PREFIX`` environment variable. This is useful when the dataset can fit on the machine and we don't want to fetch the data multiple times for each iteration. Default value is ``False``
+            use_local_cache (bool): If ``True``, the data loader will use a local cache to store data. The cache is shared by all the workers and all the runs on the machine, only keeps chunks of commits, as chunks of the head of a branch can be rewritten by other processes, and is limited to ``deeplake.constants.PYTORCH_LOCAL_CACHE_SIZE`` bytes. The default cache location is ~/.activeloop/shared_cache, but it can be changed by setting the ``SHARED_CACHE_PREFIX`` environment variable. This is useful when the dataset can fit on the machine and we don't want to fetch the data multiple times for each iteration. Default value is ``False``
             progressbar (bool): If ``True``, tqdm will be wrapped around the returned dataloader. Default value is True.
             return_index (bool): If ``True``, the returned dataloader will have a key "index" that contains the index of the sample(s) in the original dataset. Default value is True.
             pad_tensors (bool): If ``True``, shorter tensors will be padded to the length of the longest tensor. Default value is False.
@@ -2033,12 +2051,35 @@ class Dataset:
                     :'pil': Returns samples as PIL images. Especially useful when transformation use torchvision transforms, that
                             require PIL images as input. Only supported for tensors with ``sample_compression='jpeg'`` or ``'png'``.
             cache_size (int): The size of the cache per tensor in MBs. Defaults to max(maximum chunk size of tensor, 32 MB).
+            stream_batches (bool): If ``True``, the samples of each tensor are read chunk by chunk and stacked into batches
+                by the workers, instead of being read one by one and collated by ``collate_fn``. Much faster for tensors
+                with small samples, such as labels, bounding boxes or embeddings. ``transform`` and ``collate_fn`` are
+                then applied to whole batches (``collate_fn`` defaults to converting them to torch tensors), and samples
+                of a tensor that do not have the same shape are returned as lists. With ``shuffle=True``, chunks and the
+                samples within each chunk are shuffled, ``buffer_size`` is not used. Default value is ``False``.
+            resume_state (Dict[str, Any], Optional): State returned by ``state_dict()`` of a dataloader previously
+                returned by this method, for example saved with a model checkpoint. The iteration resumes from the epoch
+                and batch of the state, with the same shuffling order, and the chunks of the samples already consumed
+                are not read. Other arguments must be the same as when the state was saved. Defaults to ``None``.
+            bucket_by (str, Optional): Name of a tensor with samples of varying shapes, such as tokens or audio. If set,
+                each batch is made of samples of the same bucket of sizes (number of elements of their sample of this
+                tensor), so that less padding is needed. Sizes are read from the shapes of the tensor, the samples are
+                not decoded. With ``shuffle=True``, the samples are shuffled within the buckets and ``buffer_size`` is
+                not used. Defaults to ``None``.
+            bucket_boundaries (Sequence[int], Optional): Sorted upper bounds (exclusive) of the sizes of the buckets,
+                the last bucket has no upper bound. Defaults to 10 buckets with about as many samples each.
+            shuffle_pool_size (int): With ``shuffle=True``, number of chunks whose samples are mixed at a time. Chunks are
+                still read once each, as long as ``shuffle_pool_size`` chunks of every tensor fit in ``cache_size``.
+                Larger values shuffle better at the cost of memory. Default value is 1.
+            seed (int, Optional): Seed of the shuffling. Iterations over dataloaders created with the same seed and
+                arguments return the samples in the same order. Defaults to the seed of ``resume_state`` if given, else
+                to a random seed.
 
         ..
             # noqa: DAR101
 
         Returns:
-            A torch.utils.data.DataLoader object.
+            A torch.utils.data.DataLoader object, with a ``state_dict()`` method returning the state of the iteration.
 
         Raises:
             EmptyTensorError: If one or more tensors being passed to pytorch are empty.
@@ -2064,6 +2105,10 @@ class Dataset:
                 "return_index": return_index,
                 "pad_tensors": pad_tensors,
                 "decode_method": decode_method,
+                "stream_batches": stream_batches,
+                "resume_state": resume_state is not None,
+                "bucket_by": bucket_by,
+                "shuffle_pool_size": shuffle_pool_size,
             },
         )
 
@@ -2087,6 +2132,12 @@ class Dataset:
             pad_tensors=pad_tensors,
             decode_method=decode_method,
             cache_size=cache_size,
+            stream_batches=stream_batches,
+            resume_state=resume_state,
+            bucket_by=bucket_by,
+            bucket_boundaries=bucket_boundaries,
+            shuffle_pool_size=shuffle_pool_size,
+            seed=seed,
             **kwargs,
         )
 
@@ -2471,6 +2522,44 @@ class Dataset:
         if hasattr(self.storage, "clear_cache"):
             self.storage.clear_cache()
 
+    def storage_stats(self, reset: bool = False) -> Dict[str, Dict[str, Any]]:
+        """Returns statistics of the cache layers and the underlying storage of the dataset, e.g. to tune
+        ``memory_cache_size`` and ``local_cache_size``.
+
+        Example:
+
+            >>> for epoch in range(num_epochs):
+            ...     for batch in ds.pytorch():
+            ...         ...
+            ...     stats = ds.storage_stats(reset=True)
+            ...     print(stats["memory_cache"]["hit_rate"], stats["storage"]["latency"]["read"]["p99_ms"])
+
+        Each cache layer (``memory_cache``, ``local_cache``) reports:
+
+        - ``hits`` and ``misses``: Reads served from the layer and reads that had to go to the next layer.
+        - ``hit_rate``: ``hits / (hits + misses)``.
+        - ``evictions``: Number of items evicted from the layer.
+        - ``prefetched``: Chunks fetched ahead of the reader and put in the layer, see :class:`ChunkPrefetcher`. Reading them
+          counts as hits.
+        - ``bytes_in`` and ``bytes_out``: Bytes read from and written to the next layer.
+        - ``cache_size`` and ``cache_used``: Capacity and current usage of the layer in bytes.
+
+        The underlying storage (``storage``) reports ``reads``, ``writes``, ``bytes_read`` and ``bytes_written``.
+
+        All entries also have a ``latency`` entry with the count and mean / p50 / p90 / p99 / max duration in milliseconds
+        of the reads from and writes to the next layer.
+
+        Note:
+            Requests made by dataloader worker processes are counted in the workers, not in the dataset passed to the dataloader.
+
+        Args:
+            reset (bool): If ``True``, the statistics are reset after they are returned, e.g. at the end of every epoch.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Statistics of each layer, from the memory cache to the underlying storage.
+        """
+        return get_cache_chain_stats(self.storage, reset=reset)
+
     def size_approx(self):
         """Estimates the size in bytes of the dataset.
         Includes only content, so will generally return an under-estimate.
@@ -0,0 +1,172 @@
+import multiprocessing
+import os
+import threading
+from collections import deque
+from concurrent.futures import (
+    BrokenExecutor,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from typing import Any, Deque, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import deeplake
+from deeplake.compression import (
+    BYTE_COMPRESSION,
+    IMAGE_COMPRESSION,
+    get_compression_type,
+)
+from deeplake.core.compression import decompress_array
+from deeplake.util.exceptions import DecodePoolError
+
+# (buffer, shape, dtype, compression), the arguments of `decompress_array`
+DecodeJob = Tuple[Any, Optional[Tuple[int, ...]], Optional[str], Optional[str]]
+
+# image compressions that are not decoded by PIL
+_PYTHON_IMAGE_DECODERS = {"apng", "dcm"}
+
+
+def releases_gil(compression: Optional[str]) -> bool:
+    """Whether samples of the given compression are decoded by native code that releases the GIL while decoding,
+    so that decoding them in threads uses multiple cores."""
+    try:
+        compression_type = get_compression_type(compression)
+    except KeyError:
+        return False
+    if compression_type == BYTE_COMPRESSION:
+        return True
+    return (
+        compression_type == IMAGE_COMPRESSION
+        and compression not in _PYTHON_IMAGE_DECODERS
+    )
+
+
+class DecodePool:
+    """Decodes compressed samples on multiple cores.
+
+    Samples of compressions whose decoders release the GIL (images decoded by PIL, byte compressions) are decoded in
+    threads. Other samples are decoded in worker processes, which receive a copy of the compressed bytes, except in
+    daemonic processes such as the workers of a torch DataLoader, which can not start processes and decode all samples
+    in threads. Pools are created lazily and are not inherited by forked processes.
+
+    Failures of the pool itself are raised as :class:`DecodePoolError` or ``BrokenExecutor``, so that they are not
+    mistaken for corrupt samples.
+    """
+
+    thread_name_prefix = "deeplake_decode"
+
+    def __init__(self, num_workers: int):
+        """Initializes the DecodePool.
+
+        Args:
+            num_workers (int): Number of threads, and of processes, used for decoding.
+
+        Raises:
+            ValueError: If ``num_workers`` is not positive.
+        """
+        if num_workers <= 0:
+            raise ValueError(f"`num_workers` must be > 0. Got: {num_workers}")
+        self.num_workers = num_workers
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self):
+        self._pid = os.getpid()
+        self._threads: Optional[ThreadPoolExecutor] = None
+        self._processes: Optional[ProcessPoolExecutor] = None
+
+    def _get_executor(self, threads: bool) -> Executor:
+        with self._lock:
+            if self._pid != os.getpid():
+                self._reset()
+            if threads:
+                if self._threads is None:
+                    self._threads = ThreadPoolExecutor(
+                        max_workers=self.num_workers,
+                        thread_name_prefix=self.thread_name_prefix,
+                    )
+                return self._threads
+            if self._processes is None:
+                self._processes = ProcessPoolExecutor(max_workers=self.num_workers)
+            return self._processes
+
+    def submit(self, job: DecodeJob) -> Future:
+        """Starts decoding a sample.
+
+        Args:
+            job (DecodeJob): ``(buffer, shape, dtype, compression)`` tuple, with the same meaning as the arguments of
+                :func:`decompress_array`.
+
+        Returns:
+            Future: Resolves to the decoded array, or raises :class:`SampleDecompressionError`.
+        """
+        buffer, shape, dtype, compression = job
+        # daemonic processes are not allowed to have children
+        threads = releases_gil(compression) or multiprocessing.current_process().daemon
+        if not threads and not isinstance(buffer, bytes):
+            buffer = bytes(buffer)
+        try:
+            return self._get_executor(threads).submit(
+                decompress_array, buffer, shape, dtype, compression
+            )
+        except BrokenExecutor:
+            raise
+        except Exception as e:
+            raise DecodePoolError(str(e)) from e
+
+    def decode(self, jobs: Sequence[DecodeJob]) -> List:
+        """Decodes all the samples concurrently and returns them in the order of ``jobs``.
+
+        Raises:
+            SampleDecompressionError: If any of the samples can not be decoded.
+        """
+        futures = [self.submit(job) for job in jobs]
+        return [future.result() for future in futures]
+
+    def submit_ahead(
+        self, jobs: Iterable[Optional[DecodeJob]], lookahead: Optional[int] = None
+    ) -> Iterator[Optional[Future]]:
+        """Decodes the samples of a lazy sequence of jobs, keeping up to ``lookahead`` of them in flight.
+
+        Args:
+            jobs (Iterable[Optional[DecodeJob]]): Samples to decode. ``None`` marks samples that are decoded by the caller.
+            lookahead (int, optional): Maximum number of samples decoded ahead of the consumer. Defaults to twice the
+                number of workers.
+
+        Yields:
+            Optional[Future]: The future of each job, in order, or ``None`` for ``None`` jobs.
+        """
+        lookahead = lookahead or 2 * self.num_workers
+        pending: Deque[Optional[Future]] = deque()
+        for job in jobs:
+            pending.append(None if job is None else self.submit(job))
+            if len(pending) >= lookahead:
+                yield pending.popleft()
+        while pending:
+            yield pending.popleft()
+
+    def shutdown(self):
+        """Stops the worker threads and processes."""
+        with self._lock:
+            for executor in (self._threads, self._processes):
+                if executor is not None:
+                    executor.shutdown(wait=False)
+            self._reset()
+
+
+_decode_pool: Optional[DecodePool] = None
+
+
+def get_decode_pool() -> Optional[DecodePool]:
+    """Returns the shared decode pool, or ``None`` if parallel decoding is disabled.
+    See ``deeplake.constants.DECODE_WORKERS``."""
+    global _decode_pool
+    num_workers = deeplake.constants.DECODE_WORKERS
+    if num_workers <= 0:
+        return None
+    if _decode_pool is None or _decode_pool.num_workers != num_workers:
+        if _decode_pool is not None:
+            _decode_pool.shutdown()
+        _decode_pool = DecodePool(num_workers)
+    return _decode_pool
@@ -0,0 +1,137 @@
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+import deeplake
+from deeplake.core.compression import compress_array, compress_bytes, compress_multiple
+from deeplake.core.decode_pool import DecodePool, releases_gil
+
+# (array, compression), the arguments of `compress_array`
+EncodeJob = Tuple[np.ndarray, Optional[str]]
+
+
+class EncodePool(DecodePool):
+    """Compresses samples and chunks on multiple cores, while the writer keeps filling chunks.
+
+    Like :class:`DecodePool`, compressions whose encoders release the GIL are run in threads, and the others in worker
+    processes, which receive a copy of the data.
+    """
+
+    thread_name_prefix = "deeplake_encode"
+
+    def _submit(self, compression: Optional[str], fn, *args) -> Future:
+        return self._get_executor(releases_gil(compression)).submit(fn, *args)
+
+    def submit(self, job: EncodeJob) -> Future:  # type: ignore
+        """Starts compressing a sample.
+
+        Args:
+            job (EncodeJob): ``(array, compression)`` tuple, with the same meaning as the arguments of
+                :func:`compress_array`.
+
+        Returns:
+            Future: Resolves to the compressed bytes, or raises the error of :func:`compress_array`.
+        """
+        array, compression = job
+        return self._submit(compression, compress_array, array, compression)
+
+    def submit_bytes(self, buffer: bytes, compression: Optional[str]) -> Future:
+        """Starts compressing the data of a chunk of a byte compressed tensor. See :func:`compress_bytes`."""
+        return self._submit(compression, compress_bytes, buffer, compression)
+
+    def submit_multiple(
+        self, arrays: List[np.ndarray], compression: Optional[str]
+    ) -> Future:
+        """Starts compressing the samples of a chunk of an image compressed tensor. See :func:`compress_multiple`."""
+        return self._submit(compression, compress_multiple, arrays, compression)
+
+    def encode(self, jobs: Sequence[EncodeJob]) -> List[bytes]:
+        """Compresses all the samples concurrently and returns them in the order of ``jobs``."""
+        futures = [self.submit(job) for job in jobs]
+        return [future.result() for future in futures]
+
+
+class EncodeWindow:
+    """Compresses the samples of an extend in an :class:`EncodePool` a bounded number of samples ahead of the writer.
+
+    The writer passes the samples it still has to write, always a suffix of ``samples``, to :meth:`ready`. It returns
+    the leading samples whose compression has finished, so that they can be put in the current chunk while the pool
+    compresses the samples that follow. At most ``max_pending`` samples past the writer are compressed or held in
+    compressed form at any time.
+    """
+
+    def __init__(
+        self,
+        pool: EncodePool,
+        samples: Sequence,
+        make_job: Callable[[Any], Optional[EncodeJob]],
+        make_sample: Callable[[EncodeJob, bytes], Any],
+        max_pending: int,
+    ):
+        """Initializes the EncodeWindow.
+
+        Args:
+            pool (EncodePool): The pool the samples are compressed in.
+            samples (Sequence): All the samples being written.
+            make_job (Callable): Returns the job compressing a sample, or ``None`` if the sample is left to the chunk.
+            make_sample (Callable): Returns what is written in place of a sample, given its job and compressed bytes,
+                or ``None`` to write the sample as it is.
+            max_pending (int): Maximum number of samples scheduled ahead of the writer.
+        """
+        self.pool = pool
+        self.samples = samples
+        self.make_job = make_job
+        self.make_sample = make_sample
+        self.max_pending = max(1, max_pending)
+        self._next = 0
+        self._pending: Dict[int, Tuple[EncodeJob, Future]] = {}
+
+    def ready(self, remaining: List) -> List:
+        """Returns the leading samples of ``remaining`` that are ready to be written, at least one.
+        Compressed samples are replaced in ``remaining`` as well, see ``make_sample``.
+
+        Args:
+            remaining (List): The samples that are still to be written, a suffix of ``samples``.
+
+        Returns:
+            List: A prefix of ``remaining``.
+        """
+        offset = len(self.samples) - len(remaining)
+        end = min(len(self.samples), offset + self.max_pending)
+        while self._next < end:
+            job = self.make_job(self.samples[self._next])
+            if job is not None:
+                self._pending[self._next] = (job, self.pool.submit(job))
+            self._next += 1
+
+        num_ready = 0
+        for i in range(offset, self._next):
+            entry = self._pending.get(i)
+            if entry is not None:
+                job, future = entry
+                if num_ready and not future.done():
+                    break
+                del self._pending[i]
+                sample = self.make_sample(job, future.result())
+                if sample is not None:
+                    remaining[i - offset] = sample
+            num_ready += 1
+        return remaining if num_ready == len(remaining) else remaining[:num_ready]
+
+
+_encode_pool: Optional[EncodePool] = None
+
+
+def get_encode_pool() -> Optional[EncodePool]:
+    """Returns the shared encode pool, or ``None`` if parallel encoding is disabled.
+    See ``deeplake.constants.ENCODE_WORKERS``."""
+    global _encode_pool
+    num_workers = deeplake.constants.ENCODE_WORKERS
+    if num_workers <= 0:
+        return None
+    if _encode_pool is None or _encode_pool.num_workers != num_workers:
+        if _encode_pool is not None:
+            _encode_pool.shutdown()
+        _encode_pool = EncodePool(num_workers)
+    return _encode_pool
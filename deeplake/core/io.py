@@ -1,6 +1,7 @@
 from abc import abstractmethod, ABC
-from random import shuffle
-from typing import Dict, Iterator, List, Optional, Sequence, Union
+from random import Random, shuffle
+from concurrent.futures import BrokenExecutor, Future
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Set, Union
 from itertools import cycle
 from copy import copy
 from warnings import warn
@@ -11,16 +12,19 @@ import numpy as np
 
 from deeplake.constants import MB
 from deeplake.core.chunk.base_chunk import BaseChunk
+from deeplake.core.chunk.sample_compressed_chunk import SampleCompressedChunk
+from deeplake.core.chunk.uncompressed_chunk import UncompressedChunk
 from deeplake.core.chunk_engine import ChunkEngine
+from deeplake.core.decode_pool import get_decode_pool
 from deeplake.core.linked_chunk_engine import LinkedChunkEngine
 from deeplake.core.meta.encode.base_encoder import LAST_SEEN_INDEX_COLUMN
 from deeplake.core.meta.encode.chunk_id import CHUNK_ID_COLUMN, ChunkIdEncoder
 from deeplake.core.meta.tensor_meta import TensorMeta
+from deeplake.core.partial_reader import PartialReader
 from deeplake.core.storage import (
     LRUCache,
     MemoryProvider,
     StorageProvider,
-    LocalProvider,
 )
 from deeplake.core.tiling.deserialize import combine_chunks
 from deeplake.integrations.pytorch.common import (
@@ -30,15 +34,58 @@ from deeplake.integrations.pytorch.common import (
     convert_sample_to_data,
     validate_decode_method,
 )
-from deeplake.util.exceptions import DatasetUnsupportedPytorch, ReadSampleFromChunkError
+from deeplake.util.exceptions import (
+    DatasetUnsupportedPytorch,
+    DecodePoolError,
+    ReadSampleFromChunkError,
+)
 from deeplake.util.keys import get_chunk_key, get_tensor_meta_key
 from deeplake.util.remove_cache import get_base_storage
 from deeplake.util.storage import get_pytorch_local_storage
+from deeplake.util.version_control import get_committed_ids
 from PIL import Image  # type: ignore
 
+# errors of the decode pool, raised instead of skipping the samples as corrupt
+POOL_ERRORS = (DecodePoolError, BrokenExecutor)
+
 
 ChunkEngineMap = Dict[str, ChunkEngine]
 CachesMap = Dict[str, LRUCache]
+# samples of a tensor, stacked in an array if they have the same shape and dtype
+Column = Union[np.ndarray, List[Any]]
+
+
+def _stack(samples: List[Any]) -> Column:
+    if samples and all(isinstance(s, np.ndarray) for s in samples):
+        first = samples[0]
+        if all(s.shape == first.shape and s.dtype == first.dtype for s in samples):
+            return np.stack(samples)
+    return samples
+
+
+def _samples_to_columns(samples: List[Dict[str, Any]]) -> Dict[str, Column]:
+    if not samples:
+        return {"index": np.empty((0, 1), dtype=np.int64)}
+    return {key: _stack([s[key] for s in samples]) for key in samples[0]}
+
+
+def _concat_columns(parts: List[Dict[str, Column]]) -> Dict[str, Column]:
+    if len(parts) == 1:
+        return parts[0]
+    columns: Dict[str, Column] = {}
+    for key in parts[0]:
+        values = [part[key] for part in parts]
+        if all(isinstance(v, np.ndarray) for v in values) and (
+            len({(v.shape[1:], v.dtype) for v in values}) == 1  # type: ignore
+        ):
+            columns[key] = np.concatenate(values)
+        else:
+            columns[key] = [sample for v in values for sample in v]
+    return columns
+
+
+def _slice_columns(columns: Dict[str, Column], start: int, stop: int):
+    return {key: value[start:stop] for key, value in columns.items()}
 
 
 class IOBlock:
@@ -82,14 +129,36 @@ class Schedule:
     def __init__(self, blocks: List[IOBlock]) -> None:
         self._blocks: List[IOBlock] = blocks
 
-    def shuffle(self) -> None:
+    def shuffle(self, seed: Optional[Union[int, str]] = None) -> None:
         r"""
         Shuffle IOBlocks in the schedule as well as each IOBlock
-        """
-        shuffle(self._blocks)
 
+        Args:
+            seed(int or str, optional) seed of the shuffle, random if not set
+        """
+        if seed is None:
+            shuffle(self._blocks)
+            for block in self._blocks:
+                block.shuffle()
+            return
+        rng = Random(seed)
+        rng.shuffle(self._blocks)
         for block in self._blocks:
-            block.shuffle()
+            rng.shuffle(block.indices())
+
+    def skip(self, num_samples: int) -> "Schedule":
+        """Returns a schedule without the first ``num_samples`` samples of this one. Blocks whose samples are all
+        skipped are dropped, so that their chunks are not read."""
+        blocks: List[IOBlock] = []
+        for block in self:
+            if num_samples >= len(block):
+                num_samples -= len(block)
+                continue
+            if num_samples:
+                block = IOBlock(block.chunks(), block.indices()[num_samples:])
+                num_samples = 0
+            blocks.append(block)
+        return Schedule(blocks)
 
     def __iter__(self):
         return iter(self._blocks)
@@ -182,6 +251,245 @@ class ShufflingSchedulerWrapper(Scheduler):
         return schedules
 
 
+class ChunkPoolSchedule(Schedule):
+    """Schedule that reads up to ``pool_size`` blocks at once, and draws each sample uniformly at random from the
+    samples left in them. When a block runs out of samples, the next block (in shuffled order) joins the pool.
+
+    Every chunk is still read once and from start to end of its block, as long as the chunks of ``pool_size`` blocks
+    fit in the caches of the chunk engines, while samples are mixed across ``pool_size`` chunks instead of one.
+    """
+
+    def __init__(
+        self, blocks: List[IOBlock], pool_size: int = 1, seed: Optional[int] = None
+    ) -> None:
+        super().__init__(blocks)
+        if pool_size < 1:
+            raise ValueError(f"`pool_size` must be >= 1. Got: {pool_size}")
+        self.pool_size = pool_size
+        self.rng = Random(seed)
+        self._order: Optional[List[IOBlock]] = None
+        self._mean_candidates = 0.0
+
+    def shuffle(self, seed: Optional[Union[int, str]] = None) -> None:
+        r"""
+        Shuffle IOBlocks in the schedule as well as each IOBlock, and interleave the samples of the blocks in the pool.
+        The blocks of the schedule are left in their original order, so that the result only depends on ``seed``.
+
+        Args:
+            seed(int or str, optional) reseeds the random number generator of the schedule before shuffling
+        """
+        if seed is not None:
+            self.rng.seed(seed)
+        blocks = [
+            IOBlock(block.chunks(), list(block.indices())) for block in self._blocks
+        ]
+        self.rng.shuffle(blocks)
+        for block in blocks:
+            self.rng.shuffle(block.indices())
+        self._order = self._interleave(blocks)
+
+    def _interleave(self, blocks: List[IOBlock]) -> List[IOBlock]:
+        order: List[IOBlock] = []
+        pool: List[IOBlock] = []
+        positions: List[int] = []
+        remaining: List[int] = []
+        pending = iter(blocks)
+        total_candidates = 0
+        num_draws = 0
+        while True:
+            while len(pool) < self.pool_size:
+                block = next(pending, None)
+                if block is None:
+                    break
+                if len(block):
+                    pool.append(block)
+                    positions.append(0)
+                    remaining.append(len(block))
+            if not pool:
+                break
+            num_candidates = sum(remaining)
+            r = self.rng.randrange(num_candidates)
+            i = 0
+            while r >= remaining[i]:
+                r -= remaining[i]
+                i += 1
+            block = pool[i]
+            idx = block.indices()[positions[i]]
+            if order and order[-1].chunks() is block.chunks():
+                # consecutive samples of the same block are read together
+                order[-1].indices().append(idx)
+            else:
+                order.append(IOBlock(block.chunks(), [idx]))
+            positions[i] += 1
+            remaining[i] -= 1
+            total_candidates += num_candidates
+            num_draws += 1
+            if not remaining[i]:
+                del pool[i], positions[i], remaining[i]
+        self._mean_candidates = total_candidates / num_draws if num_draws else 0.0
+        return order
+
+    def mixing(self) -> Dict[str, float]:
+        """Reports how well the last :meth:`shuffle` mixed the samples.
+
+        Returns:
+            Dict[str, float]: ``pool_size``, the ``mean_candidates`` each sample was drawn from, and ``mixing``, the
+            ratio of ``mean_candidates`` to the mean of a global shuffle of the schedule (1.0). Shuffling one block at a
+            time gives about ``pool_size`` times less than shuffling ``pool_size`` blocks together.
+        """
+        num_samples = len(self)
+        global_candidates = (num_samples + 1) / 2
+        return {
+            "pool_size": self.pool_size,
+            "mean_candidates": self._mean_candidates,
+            "mixing": self._mean_candidates / global_candidates if num_samples else 1.0,
+        }
+
+    def __iter__(self):
+        return iter(self._blocks if self._order is None else self._order)
+
+
+class ChunkPoolShufflingScheduler(Scheduler):
+    """Shuffles the schedules of another scheduler, mixing the samples of ``pool_size`` chunks at a time.
+    See :class:`ChunkPoolSchedule`."""
+
+    def __init__(
+        self, other: Scheduler, pool_size: int = 1, seed: Optional[int] = None
+    ) -> None:
+        super().__init__()
+        self.other: Scheduler = other
+        self.pool_size = pool_size
+        self.seed = seed
+
+    @classmethod
+    def from_memory_budget(
+        cls,
+        other: Scheduler,
+        memory_budget: int,
+        chunk_size: int,
+        seed: Optional[int] = None,
+    ) -> "ChunkPoolShufflingScheduler":
+        """Creates a scheduler that mixes as many chunks of at most ``chunk_size`` bytes as fit in ``memory_budget``."""
+        return cls(other, max(1, memory_budget // max(chunk_size, 1)), seed)
+
+    def schedule(self, jobs: List[IOBlock]) -> List[Schedule]:
+        schedules: List[Schedule] = []
+        for i, schedule in enumerate(self.other.schedule(jobs)):
+            seed = None if self.seed is None else self.seed + i
+            pool_schedule = ChunkPoolSchedule(list(schedule), self.pool_size, seed)
+            pool_schedule.shuffle()
+            schedules.append(pool_schedule)
+        return schedules
+
+
+class BucketSchedule(Schedule):
+    """Schedule that reads the samples of another schedule in batches of ``batch_size`` samples of the same bucket.
+
+    The samples are taken in the order of the other schedule and put in the batch of their bucket, which is read as
+    soon as it is full, so that chunks are still read in about the same order. The last batches of the buckets are read
+    at the end, in the order of the buckets. Shuffling the other schedule shuffles the samples within each bucket.
+    """
+
+    def __init__(
+        self, other: Schedule, buckets: Dict[int, int], batch_size: int
+    ) -> None:
+        super().__init__(other._blocks)
+        self.other = other
+        self.buckets = buckets
+        self.batch_size = batch_size
+        self._order: Optional[List[IOBlock]] = None
+
+    def shuffle(self, seed: Optional[Union[int, str]] = None) -> None:
+        r"""
+        Shuffle the other schedule, and group its samples in batches again
+
+        Args:
+            seed(int or str, optional) seed of the shuffle of the other schedule
+        """
+        self.other.shuffle(seed)
+        self._order = None
+
+    @staticmethod
+    def _append(order: List[IOBlock], chunks: List[List[Optional[str]]], idx: int):
+        if order and order[-1].chunks() is chunks:
+            # consecutive samples of the same block are read together
+            order[-1].indices().append(idx)
+        else:
+            order.append(IOBlock(chunks, [idx]))
+
+    def _group(self) -> List[IOBlock]:
+        order: List[IOBlock] = []
+        pending: Dict[int, List[Any]] = {}
+        for block in self.other:
+            chunks = block.chunks()
+            for idx in block.indices():
+                bucket = self.buckets.get(idx, 0)
+                batch = pending.setdefault(bucket, [])
+                batch.append((chunks, idx))
+                if len(batch) == self.batch_size:
+                    for sample in batch:
+                        self._append(order, *sample)
+                    del pending[bucket]
+        for bucket in sorted(pending):
+            for sample in pending[bucket]:
+                self._append(order, *sample)
+        return order
+
+    def __iter__(self):
+        if self._order is None:
+            self._order = self._group()
+        return iter(self._order)
+
+
+class BucketingScheduler(Scheduler):
+    """Groups the samples of the schedules of another scheduler in batches of samples of similar size.
+    See :class:`BucketSchedule`.
+
+    Args:
+        other(Scheduler) scheduler whose schedules are grouped
+        sizes(Dict[int, int]) size of each sample, by global sample index, see :meth:`SampleStreaming.sample_sizes`
+        batch_size(int) number of samples per batch
+        boundaries(Sequence[int], optional) sorted upper bounds (exclusive) of the sizes of the buckets, a sample of
+            size ``s`` is in the bucket of the first boundary greater than ``s``, or in the last bucket. Defaults to the
+            deciles of ``sizes``.
+    """
+
+    def __init__(
+        self,
+        other: Scheduler,
+        sizes: Dict[int, int],
+        batch_size: int,
+        boundaries: Optional[Sequence[int]] = None,
+    ) -> None:
+        super().__init__()
+        if boundaries is None:
+            boundaries = self.default_boundaries(sizes)
+        if list(boundaries) != sorted(boundaries):
+            raise ValueError(f"`boundaries` must be sorted. Got: {boundaries}")
+        self.other: Scheduler = other
+        self.batch_size = batch_size
+        self.boundaries = list(boundaries)
+        indices = np.fromiter(sizes.keys(), dtype=np.int64, count=len(sizes))
+        values = np.fromiter(sizes.values(), dtype=np.int64, count=len(sizes))
+        bucket_ids = np.searchsorted(self.boundaries, values, side="right")
+        self.buckets: Dict[int, int] = dict(zip(indices.tolist(), bucket_ids.tolist()))
+
+    @staticmethod
+    def default_boundaries(sizes: Dict[int, int], num_buckets: int = 10) -> List[int]:
+        """Returns the boundaries of ``num_buckets`` buckets with about as many samples each."""
+        if not sizes:
+            return []
+        values = np.fromiter(sizes.values(), dtype=np.int64, count=len(sizes))
+        quantiles = np.quantile(values, np.linspace(0, 1, num_buckets + 1)[1:-1])
+        return sorted(set(int(q) + 1 for q in quantiles))
+
+    def schedule(self, jobs: List[IOBlock]) -> List[Schedule]:
+        return [
+            BucketSchedule(schedule, self.buckets, self.batch_size)
+            for schedule in self.other.schedule(jobs)
+        ]
+
+
 class DistributedScheduler(Scheduler):
     """Scheduler arrange IOBlocks between multiple processes and ensure equal
     distribution for each. Initial `List[IOBlock]` order is preserved.
@@ -279,9 +587,13 @@ class SampleStreaming(Streaming):
         super().__init__()
 
         self.dataset = dataset
-        self.local_storage: Optional[LocalProvider] = (
+        self.local_storage: Optional[StorageProvider] = (
             get_pytorch_local_storage(dataset) if use_local_cache else None
         )
+        # only chunks of commits that can no longer be modified are kept in the local storage
+        self.committed_ids: Set[str] = (
+            get_committed_ids(dataset.version_state) if use_local_cache else set()
+        )
         self.cache_size = cache_size
 
         # TODO: copy all meta/info to local_storage
@@ -347,24 +659,113 @@ class SampleStreaming(Streaming):
         self._group_index_length = group_index_length
 
     def read(self, schedule: Schedule) -> Iterator:
-        for block in schedule._blocks:
+        for block in schedule:
             yield from self.stream(block)
 
+    def _fetch_block_chunks(self, block: IOBlock):
+        """Fetches the chunks of all tensors in ``block`` concurrently and puts them in the chunk engine caches."""
+        caches: Dict[str, LRUCache] = {}
+        for keyid, engine in enumerate(self.chunk_engines.values()):
+            c_names = block.chunk_names(keyid)
+            # tiled samples may not fit in the cache together
+            if len(c_names) != 1 or c_names[0] is None:
+                continue
+            c_name = c_names[0]
+            commit_id, tkey = engine.get_chunk_commit(c_name)
+            c_key = get_chunk_key(tkey, c_name, commit_id)
+            cache = engine.cache
+            if c_key not in cache.lru_sizes and c_key not in cache.deeplake_objects:
+                caches[c_key] = cache
+        if len(caches) <= 1:
+            return
+        try:
+            fetched = self.storage.get_items(list(caches))
+        except Exception:
+            # errors are raised with context when the chunk is read
+            return
+        for c_key, value in fetched.items():
+            cache = caches[c_key]
+            if len(value) <= cache.cache_size:
+                cache._insert_in_cache(c_key, value)
+
+    def _get_chunk(self, key: str, engine: ChunkEngine, c_name: str) -> BaseChunk:
+        commit_id, tkey = engine.get_chunk_commit(c_name)
+        c_key = get_chunk_key(tkey, c_name, commit_id)
+        if self.local_caches is None or commit_id not in self.committed_ids:
+            return engine.get_chunk(c_key)
+        local_cache = self.local_caches[key]
+        if c_key in local_cache:
+            return local_cache.get_deeplake_object(c_key, engine.chunk_class, meta=engine.chunk_args)  # type: ignore
+        chunk = engine.get_chunk(c_key)
+        local_cache[c_key] = chunk
+
+        # send data to actual storage
+        local_cache._forward(c_key)
+        return chunk
+
+    def _decode_ahead(self, block: IOBlock) -> Dict[str, Iterator[Optional[Future]]]:
+        """Starts decoding the samples of ``block`` in the decode pool, for the sample compressed tensors that are decoded
+        to arrays and whose samples in the block are all in one chunk. See ``deeplake.constants.DECODE_WORKERS``.
+
+        Returns:
+            Dict[str, Iterator[Optional[Future]]]: For each of these tensors, the futures of the decoded samples in the
+            order of the block indices, or ``None`` for samples that have to be read with ``read_sample_from_chunk``.
+        """
+        pool = get_decode_pool()
+        if pool is None:
+            return {}
+        decoded = {}
+        for keyid, (key, engine) in enumerate(self.chunk_engines.items()):
+            if (
+                key in self.raw_tensors
+                or key in self.pil_compressed_tensors
+                or engine.chunk_class is not SampleCompressedChunk
+            ):
+                continue
+            c_names = block.chunk_names(keyid)
+            if len(c_names) != 1 or c_names[0] is None:
+                continue
+            try:
+                chunk = self._get_chunk(key, engine, c_names[0])
+            except Exception:
+                # errors are raised with context when the samples are read
+                continue
+            if chunk.can_decode_in_pool:  # type: ignore
+                decoded[key] = pool.submit_ahead(
+                    self._decode_jobs(engine, chunk, block.indices())  # type: ignore
+                )
+        return decoded
+
+    @staticmethod
+    def _decode_jobs(
+        engine: ChunkEngine, chunk: SampleCompressedChunk, indices: List[int]
+    ):
+        enc = engine.chunk_id_encoder
+        for idx in indices:
+            try:
+                yield chunk.decode_job(enc.translate_index_relative_to_chunks(idx))
+            except Exception:
+                # read with `read_sample_from_chunk`, which raises the error with context
+                yield None
+
     def stream(self, block: IOBlock):
         htype_dict, ndim_dict, tensor_info_dict = (
             self.htype_dict,
             self.ndim_dict,
             self.tensor_info_dict,
         )
+        if self.local_caches is None:
+            self._fetch_block_chunks(block)
+        decoded = self._decode_ahead(block)
         for idx in block.indices():
             sample = dict()
             valid_sample_flag = True
+            futures = {key: next(it) for key, it in decoded.items()}
 
             for keyid, (key, engine) in enumerate(self.chunk_engines.items()):
                 rel_key = key[self._group_index_length :]
                 decompress = key not in self.raw_tensors
                 to_pil = key in self.pil_compressed_tensors
-                chunk_class = engine.chunk_class
                 try:
                     chunks: List[BaseChunk] = []
                     c_names = block.chunk_names(keyid)
@@ -372,27 +773,17 @@ class SampleStreaming(Streaming):
                         sample[rel_key] = engine.get_empty_sample()
                         continue
                     for c_name in c_names:
-                        commit_id, tkey = engine.get_chunk_commit(c_name)
-                        c_key = get_chunk_key(
-                            tkey,
-                            c_name,  # type: ignore
-                            commit_id,
-                        )
-                        if self.local_caches is not None:
-                            local_cache = self.local_caches[key]
-
-                            if c_key in local_cache:
-                                chunk = local_cache.get_deeplake_object(c_key, chunk_class, meta=engine.chunk_args)  # type: ignore
-                            else:
-                                chunk = engine.get_chunk(c_key)
-                                local_cache[c_key] = chunk
-
-                                # send data to actual storage
-                                local_cache._forward(c_key)
-                        else:
-                            chunk = engine.get_chunk(c_key)
+                        chunk = self._get_chunk(key, engine, c_name)  # type: ignore
                         chunks.append(chunk)
-                    if len(chunks) == 1:
+                    future = futures.get(key)
+                    if future is not None:
+                        try:
+                            data = chunk.finish_decoded_sample(future.result())  # type: ignore
+                        except POOL_ERRORS:
+                            raise
+                        except Exception as e:
+                            raise ReadSampleFromChunkError(chunk.key) from e
+                    elif len(chunks) == 1:
                         data = engine.read_sample_from_chunk(
                             idx, chunk, decompress=decompress, to_pil=to_pil
                         )
@@ -425,6 +816,149 @@ class SampleStreaming(Streaming):
                     )
                 yield sample
 
+    def read_batches(
+        self, schedule: Schedule, batch_size: int, drop_last: bool = False
+    ) -> Iterator[Dict[str, Column]]:
+        r"""
+        Args:
+            schedule(Schedule) schedule of IOBlocks to stream
+            batch_size(int) number of samples per batch
+            drop_last(bool) whether to drop the last batch if it has less than ``batch_size`` samples
+        Returns:
+            generator over the batches of the schedule, see :meth:`stream_columns`. Batches may span multiple blocks.
+        """
+        parts: List[Dict[str, Column]] = []
+        num_pending = 0
+        for block in schedule:
+            columns = self.stream_columns(block)
+            num_samples = len(columns["index"])
+            if not num_samples:
+                continue
+            parts.append(columns)
+            num_pending += num_samples
+            if num_pending < batch_size:
+                continue
+            columns = _concat_columns(parts)
+            num_full = num_pending - num_pending % batch_size
+            for start in range(0, num_full, batch_size):
+                yield _slice_columns(columns, start, start + batch_size)
+            num_pending -= num_full
+            parts = (
+                [_slice_columns(columns, num_full, num_full + num_pending)]
+                if num_pending
+                else []
+            )
+        if num_pending and not drop_last:
+            yield _concat_columns(parts)
+
+    def stream_columns(self, block: IOBlock) -> Dict[str, Column]:
+        """Reads all the samples of ``block`` tensor by tensor, instead of building a dict per sample like :meth:`stream`.
+
+        The samples of each tensor are read from its chunk at once: uncompressed chunks of fixed shape tensors with a
+        single ``np.frombuffer``, sample compressed chunks in the decode pool (see ``deeplake.constants.DECODE_WORKERS``).
+        Blocks with corrupt samples, and tensors that are converted to data dicts, are read with :meth:`stream`.
+
+        Returns:
+            Dict[str, Column]: The samples of each tensor, stacked into a single array if they have the same shape, and
+            the ``(num_samples, 1)`` array of their indices under "index".
+        """
+        if self.data_tensors:
+            return _samples_to_columns(list(self.stream(block)))
+        if self.local_caches is None:
+            self._fetch_block_chunks(block)
+        indices = block.indices()
+        columns: Dict[str, Column] = {}
+        try:
+            for keyid, (key, engine) in enumerate(self.chunk_engines.items()):
+                columns[key[self._group_index_length :]] = self._read_block_samples(
+                    key, engine, block.chunk_names(keyid), indices
+                )
+        except ReadSampleFromChunkError:
+            # skips the corrupt samples with a warning
+            return _samples_to_columns(list(self.stream(block)))
+        columns["index"] = np.array(indices, dtype=np.int64).reshape(-1, 1)
+        return columns
+
+    def _read_block_samples(
+        self,
+        key: str,
+        engine: ChunkEngine,
+        c_names: List[Optional[str]],
+        indices: List[int],
+    ) -> Column:
+        if c_names == [None]:
+            return _stack([engine.get_empty_sample() for _ in indices])
+        decompress = key not in self.raw_tensors
+        to_pil = key in self.pil_compressed_tensors
+        if len(c_names) > 1:
+            if not decompress:
+                raise NotImplementedError(
+                    "`tobytes=True` is not supported by tiled samples as it can cause recompression."
+                )
+            chunks = [self._get_chunk(key, engine, c_name) for c_name in c_names]  # type: ignore
+            samples = [
+                combine_chunks(chunks, idx, engine.tile_encoder) for idx in indices
+            ]
+            return [Image.fromarray(s) for s in samples] if to_pil else _stack(samples)
+
+        chunk = self._get_chunk(key, engine, c_names[0])  # type: ignore
+        meta = engine.tensor_meta
+        if decompress and not to_pil and not meta.is_link and not engine.is_video:
+            _, local_indices = engine.chunk_id_encoder.translate_many(indices)
+            if (
+                isinstance(chunk, UncompressedChunk)
+                and chunk.is_fixed_shape
+                and meta.htype != "polygon"
+                and not isinstance(chunk.data_bytes, PartialReader)
+            ):
+                try:
+                    chunk.check_empty_before_read()
+                    shape = tuple(meta.min_shape)
+                    data = np.frombuffer(
+                        chunk.memoryview_data,
+                        dtype=chunk.dtype,
+                        count=chunk.num_samples * int(np.prod(shape)),
+                    )
+                    # fancy indexing copies the samples out of the chunk
+                    return data.reshape((chunk.num_samples,) + shape)[local_indices]
+                except Exception as e:
+                    raise ReadSampleFromChunkError(chunk.key) from e
+            if isinstance(chunk, SampleCompressedChunk) and not engine.is_text_like:
+                try:
+                    return _stack(
+                        chunk.read_samples(
+                            local_indices.tolist(), cast=meta.htype != "dicom"
+                        )
+                    )
+                except POOL_ERRORS:
+                    # failures of the decode pool are not corrupt samples
+                    raise
+                except Exception as e:
+                    raise ReadSampleFromChunkError(chunk.key) from e
+
+        read_samples: List[Any] = []
+        for idx in indices:
+            sample = engine.read_sample_from_chunk(
+                idx, chunk, decompress=decompress, to_pil=to_pil
+            )
+            if sample is None:
+                raise ReadSampleFromChunkError(chunk.key)
+            read_samples.append(sample)
+        return _stack(read_samples)
+
+    def max_chunks_in_cache(self) -> int:
+        """Number of chunks of every tensor that fit in the caches of the chunk engines at once, at least 1."""
+        return max(
+            1,
+            min(
+                (
+                    engine.cache.cache_size // max(engine.max_chunk_size, 1)
+                    for engine in self.chunk_engines.values()
+                ),
+                default=1,
+            ),
+        )
+
     def _get_block_for_single_sample(self, idx):
         chunks = []
         for engine in self.chunk_engines.values():
@@ -578,3 +1112,20 @@ class SampleStreaming(Streaming):
 
     def _get_dataset_indices(self):
         return self.dataset.index.values[0].indices(self._get_dataset_length())
+
+    def sample_sizes(self, tensor: str) -> Dict[int, int]:
+        """Returns the number of elements of each sample of ``tensor``, by global sample index. The sizes are computed from
+        the shapes in the shape index of the tensor, or in the chunk headers if it does not have one, the samples are not
+        read."""
+        view = self.dataset[tensor]
+        indices = list(view.index.values[0].indices(view.num_samples))
+        shape_index = view.chunk_engine._shape_index_for_read(len(indices))
+        if shape_index is not None and indices:
+            sizes = np.prod(shape_index.shapes_many(indices), axis=1).tolist()
+        else:
+            shapes = view.shapes()
+            if isinstance(shapes, np.ndarray) and shapes.ndim == 2:
+                sizes = np.prod(shapes, axis=1).tolist()
+            else:
+                sizes = [int(np.prod(shape)) for shape in shapes]
+        return dict(zip(indices, sizes))
@@ -1,6 +1,6 @@
 import deeplake
 from abc import ABC
-from typing import Any, Sequence, Optional
+from typing import Any, Callable, Dict, Sequence, Optional, Tuple
 from deeplake.constants import ENCODING_DTYPE
 import numpy as np
 
@@ -12,6 +12,8 @@ LAST_SEEN_INDEX_COLUMN = -1
 
 class Encoder(ABC):
     last_row = 0
+    _is_dirty = False
+    _derived_from: Optional[np.ndarray] = None
 
     def is_index_in_last_row(self, arr, index) -> bool:
         """Checks if `index` is in the self.last_row of of encoder."""
@@ -84,6 +86,58 @@ class Encoder(ABC):
         self.version = deeplake.__version__
         self.is_dirty = True
 
+    @property
+    def is_dirty(self) -> bool:
+        return self._is_dirty
+
+    @is_dirty.setter
+    def is_dirty(self, value: bool):
+        # everything that modifies `_encoded` in place marks the encoder as dirty
+        if value:
+            self._derived_from = None
+        self._is_dirty = value
+
+    def _get_derived(self, name: str, derive: Callable[[np.ndarray], Any]) -> Any:
+        """Returns an array derived from `self._encoded`, computing it only if `self._encoded` has been replaced or
+        modified since it was last computed.
+
+        Args:
+            name (str): Name of the derived array.
+            derive (Callable): Computes the derived array from `self._encoded`.
+
+        Returns:
+            Any: The derived array.
+        """
+        encoded = self._encoded
+        if self._derived_from is not encoded:
+            self._derived: Dict[str, Any] = {}
+            self._derived_from = encoded
+        try:
+            return self._derived[name]
+        except KeyError:
+            value = self._derived[name] = derive(encoded)
+            return value
+
+    @property
+    def _last_seen_indices(self) -> np.ndarray:
+        """Contiguous copy of the `LAST_SEEN_INDEX_COLUMN` of `self._encoded`."""
+        return self._get_derived(
+            "last_seen",
+            lambda encoded: encoded[:, LAST_SEEN_INDEX_COLUMN].astype(np.int64),
+        )
+
+    @property
+    def _row_first_indices(self) -> np.ndarray:
+        """Index of the first sample of each row of `self._encoded`."""
+
+        def derive(_):
+            first = np.empty(len(self._last_seen_indices), dtype=np.int64)
+            first[:1] = 0
+            first[1:] = self._last_seen_indices[:-1] + 1
+            return first
+
+        return self._get_derived("row_first", derive)
+
     @property
     def array(self):
         return self._encoded
@@ -129,8 +183,6 @@ class Encoder(ABC):
             int: The index of the corresponding row inside the encoded state.
         """
 
-        # TODO: optimize this (should accept an optional argument for starting point, instead of random binsearch)
-
         if len(self._encoded) == 0:
             raise IndexError(
                 f"Index {local_sample_index} is out of bounds for an empty encoder."
@@ -141,13 +193,37 @@ class Encoder(ABC):
 
         row_index = self.check_last_row(local_sample_index)
         if row_index is None:
-            row_index = np.searchsorted(
-                self._encoded[:, LAST_SEEN_INDEX_COLUMN], local_sample_index
+            row_index = int(
+                np.searchsorted(self._last_seen_indices, local_sample_index)
             )
             self.last_row = row_index
 
         return row_index  # type: ignore
 
+    def translate_many(self, local_sample_indices) -> Tuple[np.ndarray, np.ndarray]:
+        """Vectorized version of :meth:`translate_index`. Finds the rows of many samples with a single binary search.
+
+        Args:
+            local_sample_indices (array_like): Indices of the samples. Negative indices count from the end.
+
+        Raises:
+            IndexError: If any of the indices is out of bounds.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: The index of the row of each sample inside the encoded state, and the index of
+                each sample relative to the first sample of its row.
+        """
+        indices = np.asarray(local_sample_indices, dtype=np.int64).reshape(-1)
+        num_samples = self.num_samples
+        if len(indices) and indices.min() < 0:
+            indices = np.where(indices < 0, indices + num_samples, indices)
+        if len(indices) and (indices.min() < 0 or indices.max() >= num_samples):
+            raise IndexError(
+                f"Indices out of bounds for an encoder with {num_samples} samples."
+            )
+        rows = np.searchsorted(self._last_seen_indices, indices)
+        return rows, indices - self._row_first_indices[rows]
+
     def register_samples(self, item: Any, num_samples: int, row: Optional[int] = None):
         """Register `num_samples` as `item`. Combines when the `self._combine_condition` returns True.
         This method adds data to `self._encoded` without decoding.
@@ -1,6 +1,6 @@
 from deeplake.core.meta.encode.base_encoder import Encoder, LAST_SEEN_INDEX_COLUMN
 
-from typing import Optional, Sequence
+from typing import Optional, Sequence, Tuple
 import numpy as np
 
 
@@ -84,6 +84,21 @@ class BytePositionsEncoder(Encoder):
         end_byte = start_byte + row_num_bytes
         return int(start_byte), int(end_byte)
 
+    def byte_ranges_many(self, local_sample_indices) -> Tuple[np.ndarray, np.ndarray]:
+        """Vectorized version of `self[index]`. Returns the byte ranges of many samples at once.
+
+        Args:
+            local_sample_indices (array_like): Indices of the samples.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: The start and end byte of each sample.
+        """
+        rows, row_offsets = self.translate_many(local_sample_indices)
+        encoded = self._encoded[rows].astype(np.int64)
+        num_bytes = encoded[:, NUM_BYTES_COLUMN]
+        start_bytes = encoded[:, START_BYTE_COLUMN] + row_offsets * num_bytes
+        return start_bytes, start_bytes + num_bytes
+
     def pop(self, index: Optional[int] = None):
         if index is None:
             index = self.get_last_index_for_pop()
@@ -99,3 +114,4 @@ class BytePositionsEncoder(Encoder):
         # after subtracting 1, the row is now empty
         if num_samples_in_row == 1:
             self._encoded = np.delete(self._encoded, row, axis=0)
+        self.is_dirty = True
@@ -9,6 +9,18 @@ class ShapeEncoder(Encoder):
     def _derive_value(self, row: np.ndarray, *_) -> Tuple:  # type: ignore
         return tuple(row[:LAST_SEEN_INDEX_COLUMN])
 
+    def shapes_many(self, local_sample_indices) -> np.ndarray:
+        """Returns the shapes of many samples at once.
+
+        Args:
+            local_sample_indices (array_like): Indices of the samples.
+
+        Returns:
+            np.ndarray: 2D array with the shape of each sample in its rows.
+        """
+        rows, _ = self.translate_many(local_sample_indices)
+        return self._encoded[rows, :LAST_SEEN_INDEX_COLUMN]
+
     @property
     def dimensionality(self) -> int:
         return len(self[0])
@@ -0,0 +1,181 @@
+from deeplake.core.meta.encode.base_encoder import Encoder, LAST_SEEN_INDEX_COLUMN
+from deeplake.core.meta.encode.shape import ShapeEncoder
+from deeplake.core.storage.deeplake_memory_object import DeepLakeMemoryObject
+from deeplake.core.serialize import serialize_shape_index, deserialize_shape_index
+from typing import Optional, Tuple
+import numpy as np
+import deeplake
+
+
+class SampleSizeEncoder(Encoder):
+    """Run length encoded number of bytes of each sample."""
+
+    def __init__(self, encoded=None):
+        super().__init__(encoded, dtype=np.uint64)
+
+    def _derive_value(self, row: np.ndarray, *_) -> int:  # type: ignore
+        return int(row[0])
+
+    def sizes_many(self, local_sample_indices) -> np.ndarray:
+        """Returns the number of bytes of many samples at once."""
+        rows, _ = self.translate_many(local_sample_indices)
+        return self._encoded[rows, 0]
+
+    def _combine_condition(self, nbytes: int, compare_row_index: int = -1) -> bool:
+        return int(nbytes) == int(self._encoded[compare_row_index, 0])
+
+    def _make_decomposable(self, nbytes: int, compare_row_index: int = -1):
+        return (nbytes,)
+
+
+def _append_rows(encoder: Encoder, rows: np.ndarray):
+    """Appends ``rows`` to the encoded array of ``encoder``. The array is a view of a buffer that grows geometrically,
+    so that appending a few rows at a time does not copy the whole array each time.
+    """
+    encoded = encoder._encoded
+    num_rows = len(encoded)
+    buffer = getattr(encoder, "_buffer", None)
+    if (
+        buffer is None
+        or encoded.base is not buffer
+        or encoded.ctypes.data != buffer.ctypes.data
+        or len(buffer) < num_rows + len(rows)
+    ):
+        buffer = np.empty(
+            (max(2 * (num_rows + len(rows)), 16), rows.shape[1]), dtype=encoder.dtype
+        )
+        if num_rows:
+            buffer[:num_rows] = encoded
+        encoder._buffer = buffer  # type: ignore
+    buffer[num_rows : num_rows + len(rows)] = rows
+    encoder._encoded = buffer[: num_rows + len(rows)]
+
+
+def _register_many(encoder: Encoder, values: np.ndarray):
+    """Registers consecutive samples at the end of ``encoder``, one row of ``values`` per sample.
+    Runs of equal values are combined with a single pass instead of a call to `register_samples` per sample.
+    """
+    if not len(values):
+        return
+    encoded = encoder._encoded
+    if len(values) == 1:
+        # single appends are the common case, avoid the vectorized pass
+        value = np.asarray(values[0]).tolist()
+        num_samples = encoder.num_samples
+        if len(encoded) and encoded[-1, :LAST_SEEN_INDEX_COLUMN].tolist() == value:
+            encoded[-1, LAST_SEEN_INDEX_COLUMN] = num_samples
+        else:
+            _append_rows(
+                encoder, np.array([value + [num_samples]], dtype=encoder.dtype)
+            )
+        encoder.is_dirty = True
+        return
+    values = values.astype(encoder.dtype)
+    changes = np.ones(len(values), dtype=bool)
+    changes[1:] = np.any(values[1:] != values[:-1], axis=1)
+    starts = np.flatnonzero(changes)
+    last_seen = np.append(starts[1:], len(values)) - 1 + encoder.num_samples
+    rows = np.concatenate(
+        [values[starts], last_seen.astype(encoder.dtype)[:, None]], axis=1
+    )
+    if len(encoded) and np.array_equal(
+        encoded[-1, :LAST_SEEN_INDEX_COLUMN], rows[0, :LAST_SEEN_INDEX_COLUMN]
+    ):
+        # the first run continues the last row
+        encoded[-1, LAST_SEEN_INDEX_COLUMN] = rows[0, LAST_SEEN_INDEX_COLUMN]
+        rows = rows[1:]
+    if len(rows):
+        _append_rows(encoder, rows)
+    encoder.is_dirty = True
+
+
+class ShapeIndex(DeepLakeMemoryObject):
+    """Shapes and sizes in bytes of all the samples of a tensor, stored next to the chunk id encoder so that they can be
+    looked up without reading any chunk headers.
+
+    Both are run length encoded like the encoders in chunk headers, so tensors with fixed shape samples only need a
+    single row. Sizes are the number of bytes of the samples in their chunks (before chunk compression). Tiled samples
+    record their uncompressed size.
+
+    The index also records a fingerprint of the tensor it was last updated with (see
+    :meth:`ChunkEngine._shape_index_fingerprint`), so that an index that was not updated along with the tensor, e.g.
+    by a transform, is detected and rebuilt.
+    """
+
+    def __init__(self):
+        self.shapes = ShapeEncoder()
+        self.sizes = SampleSizeEncoder()
+        self.version = deeplake.__version__
+        self.fingerprint: Optional[Tuple[int, int, int]] = None
+        self.is_dirty = False
+
+    @property
+    def num_samples(self) -> int:
+        return self.shapes.num_samples
+
+    @property
+    def ndim(self) -> int:
+        return self.shapes._encoded.shape[1] - 1
+
+    def extend(self, shapes: np.ndarray, sizes: np.ndarray):
+        """Registers new samples at the end of the index.
+
+        Args:
+            shapes (np.ndarray): 2D array with the shape of each sample in its rows.
+            sizes (np.ndarray): Number of bytes of each sample.
+
+        Raises:
+            ValueError: If the samples do not have as many dimensions as the samples already in the index.
+        """
+        if self.num_samples and shapes.shape[1] != self.ndim:
+            raise ValueError(
+                f"Expected samples with {self.ndim} dimensions, got {shapes.shape[1]}."
+            )
+        _register_many(self.shapes, shapes)
+        _register_many(self.sizes, np.asarray(sizes).reshape(-1, 1))
+        self.is_dirty = True
+
+    def update(self, global_sample_index: int, shape: Tuple[int, ...], nbytes: int):
+        if len(shape) != self.ndim:
+            raise ValueError(
+                f"Expected a sample with {self.ndim} dimensions, got {len(shape)}."
+            )
+        self.shapes[global_sample_index] = tuple(shape)
+        self.sizes[global_sample_index] = int(nbytes)
+        self.is_dirty = True
+
+    def pop(self, global_sample_index: int):
+        self.shapes.pop(global_sample_index)
+        self.sizes.pop(global_sample_index)
+        self.is_dirty = True
+
+    def shapes_many(self, global_sample_indices) -> np.ndarray:
+        return self.shapes.shapes_many(global_sample_indices).astype(np.int64)
+
+    def sizes_many(self, global_sample_indices) -> np.ndarray:
+        return self.sizes.sizes_many(global_sample_indices).astype(np.int64)
+
+    def tobytes(self) -> bytes:
+        return serialize_shape_index(
+            self.version,
+            self.shapes._encoded,
+            self.sizes._encoded,
+            self.fingerprint,
+        )
+
+    @classmethod
+    def frombuffer(cls, buffer: bytes):
+        instance = cls()
+        if not buffer:
+            return instance
+        version, shapes, sizes, fingerprint = deserialize_shape_index(buffer)
+        instance.shapes = ShapeEncoder(shapes)
+        instance.sizes = SampleSizeEncoder(sizes)
+        instance.version = version
+        instance.fingerprint = fingerprint
+        instance.is_dirty = False
+        return instance
+
+    @property
+    def nbytes(self):
+        return self.shapes.nbytes + self.sizes.nbytes
@@ -82,3 +82,24 @@ def test_alternate():
     np.testing.assert_array_equal(enc._encoded[:, 0], [7, 3] * 50)
     np.testing.assert_array_equal(np.diff(enc._encoded[:, 1]), [7, 3] * 49 + [7])
     np.testing.assert_array_equal(enc._encoded[:, 2], np.arange(100))
+
+
+def test_byte_ranges_many():
+    enc = BytePositionsEncoder()
+    enc.register_samples(8, 100)
+    enc.register_samples(1, 1000)
+    enc.register_samples(16, 32)
+
+    indices = [1131, 0, 99, 100, 1099, 1100, 5, 1130]
+    start_bytes, end_bytes = enc.byte_ranges_many(indices)
+    assert list(zip(start_bytes.tolist(), end_bytes.tolist())) == [
+        enc[i] for i in indices
+    ]
+
+    enc[100] = 4
+    enc.pop()
+    indices = list(range(enc.num_samples))
+    start_bytes, end_bytes = enc.byte_ranges_many(indices)
+    assert list(zip(start_bytes.tolist(), end_bytes.tolist())) == [
+        enc[i] for i in indices
+    ]
@@ -87,3 +87,26 @@ def test_ids():
     out_id = ChunkIdEncoder.id_from_name(name)
 
     assert id == out_id
+
+
+def test_translate_many():
+    enc = ChunkIdEncoder()
+    for num_samples in (10, 1, 5):
+        enc.generate_chunk_id()
+        enc.register_samples(num_samples)
+
+    rows, local_indices = enc.translate_many([15, 0, 10, 11, 9, 12])
+    assert rows.tolist() == [2, 0, 1, 2, 0, 2]
+    assert local_indices.tolist() == [4, 0, 0, 0, 9, 1]
+    _, local_indices = enc.translate_many(range(enc.num_samples))
+    assert local_indices.tolist() == [
+        enc.translate_index_relative_to_chunks(i) for i in range(enc.num_samples)
+    ]
+
+    enc.pop()
+    enc.generate_chunk_id()
+    enc.register_samples(3)
+    assert enc.translate_many([14, 17])[0].tolist() == [2, 3]
+
+    with pytest.raises(IndexError):
+        enc.translate_many([enc.num_samples])
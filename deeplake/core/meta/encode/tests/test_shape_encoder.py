@@ -150,3 +150,27 @@ def test_failures():
         enc[101] = (1, 1)
 
     assert enc.num_samples == 100
+
+
+def test_shapes_many():
+    enc = ShapeEncoder()
+    enc.register_samples((28, 28, 3), 10)
+    enc.register_samples((30, 28, 3), 5)
+    enc.register_samples((28, 28, 4), 1)
+
+    indices = [15, 0, 9, 10, 14, -1, 3]
+    np.testing.assert_array_equal(enc.shapes_many(indices), [enc[i] for i in indices])
+    assert enc.shapes_many([]).shape == (0, 3)
+
+    # derived arrays are recomputed after the encoder is modified
+    enc[3] = (1, 2, 3)
+    enc.register_samples((5, 5, 5), 2)
+    indices = list(range(enc.num_samples))
+    np.testing.assert_array_equal(enc.shapes_many(indices), [enc[i] for i in indices])
+    enc.pop()
+    rows, local_indices = enc.translate_many([16, 4])
+    assert rows.tolist() == [5, 2]
+    assert local_indices.tolist() == [0, 0]
+
+    with pytest.raises(IndexError):
+        enc.shapes_many([enc.num_samples])
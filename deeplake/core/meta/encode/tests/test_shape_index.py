@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+from deeplake.core.meta.encode.shape_index import ShapeIndex
+from .common import assert_encoded
+
+
+def test_extend_combines_runs():
+    index = ShapeIndex()
+    index.extend(np.array([[2, 3], [2, 3], [4, 5]]), np.array([6, 6, 20]))
+    index.extend(np.array([[4, 5], [2, 3]]), np.array([20, 6]))
+
+    assert index.num_samples == 5
+    assert_encoded(index.shapes, [[2, 3, 1], [4, 5, 3], [2, 3, 4]])
+    np.testing.assert_array_equal(index.sizes._encoded, [[6, 1], [20, 3], [6, 4]])
+    np.testing.assert_array_equal(
+        index.shapes_many([4, 0, 2]), [[2, 3], [2, 3], [4, 5]]
+    )
+    np.testing.assert_array_equal(index.sizes_many([4, 0, 2]), [6, 6, 20])
+
+    with pytest.raises(ValueError):
+        index.extend(np.array([[1, 2, 3]]), np.array([6]))
+
+
+def test_update_pop():
+    index = ShapeIndex()
+    index.extend(np.array([[2, 3]] * 4), np.array([6] * 4))
+    index.update(1, (5, 5), 25)
+    assert index.shapes[1] == (5, 5)
+    assert index.sizes[1] == 25
+    assert index.shapes[2] == (2, 3)
+
+    index.pop(1)
+    assert index.num_samples == 3
+    np.testing.assert_array_equal(index.shapes_many([0, 1, 2]), [[2, 3]] * 3)
+    np.testing.assert_array_equal(index.sizes_many([0, 1, 2]), [6] * 3)
+
+
+def test_serialize():
+    index = ShapeIndex()
+    assert ShapeIndex.frombuffer(index.tobytes()).num_samples == 0
+
+    shapes = np.random.randint(0, 100, (1000, 3))
+    sizes = np.random.randint(0, 1 << 40, 1000)
+    index.extend(shapes, sizes)
+    loaded = ShapeIndex.frombuffer(bytes(index.tobytes()))
+    assert not loaded.is_dirty
+    np.testing.assert_array_equal(loaded.shapes_many(np.arange(1000)), shapes)
+    np.testing.assert_array_equal(loaded.sizes_many(np.arange(1000)), sizes)
+    assert loaded.fingerprint is None
+
+    index.fingerprint = (1000, 3, 1 << 63)
+    assert ShapeIndex.frombuffer(index.tobytes()).fingerprint == (1000, 3, 1 << 63)
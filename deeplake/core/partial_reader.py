@@ -1,7 +1,46 @@
-from typing import Dict, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import deeplake
+
+
+def coalesce_ranges(
+    ranges: Sequence[Tuple[int, int]], max_gap: int
+) -> List[Tuple[int, int]]:
+    """Merges byte ranges that overlap or are at most ``max_gap`` bytes apart.
+
+    Args:
+        ranges (Sequence[Tuple[int, int]]): ``(start, stop)`` byte ranges, in any order.
+        max_gap (int): Maximum number of unneeded bytes read between two ranges to merge them.
+
+    Returns:
+        List[Tuple[int, int]]: Sorted, non overlapping ranges covering all of ``ranges``.
+    """
+    merged: List[Tuple[int, int]] = []
+    for start, stop in sorted(ranges):
+        if merged and start - merged[-1][1] <= max_gap:
+            if stop > merged[-1][1]:
+                merged[-1] = (merged[-1][0], stop)
+        else:
+            merged.append((start, stop))
+    return merged
+
+
+def align_range(start: int, stop: int, page_size: int) -> Tuple[int, int]:
+    """Extends the byte range ``(start, stop)`` to the boundaries of the pages of ``page_size`` bytes it overlaps.
+    Ranges are left as they are if ``page_size`` is 0."""
+    if page_size <= 0:
+        return start, stop
+    return start - start % page_size, -(-stop // page_size) * page_size
 
 
 class PartialReader:
+    """Data of a chunk that is read lazily from storage.
+
+    Only the header of the chunk is read when the chunk is loaded, and the bytes of the samples are fetched when they are
+    sliced. Fetches are rounded up to pages of ``deeplake.constants.PARTIAL_READ_PAGE_SIZE`` bytes, and fetched bytes are
+    kept, so that samples next to each other are read with a single request.
+    """
+
     def __init__(self, cache, path: str, header_offset: int):
         self.cache = cache
         self.path = path
@@ -14,12 +53,57 @@ class PartialReader:
         step = slice_.step
         assert start is not None and stop is not None
         assert step is None or step == 1
-        slice_tuple = (start, stop)
-        if slice_tuple not in self.data_fetched:
-            self.data_fetched[slice_tuple] = memoryview(
-                self.cache.get_bytes(self.path, start, stop)
+        view = self._find(start, stop)
+        if view is None:
+            page_start, page_stop = align_range(
+                start, stop, deeplake.constants.PARTIAL_READ_PAGE_SIZE
+            )
+            value = self._store(
+                page_start, self.cache.get_bytes(self.path, page_start, page_stop)
             )
-        return self.data_fetched[slice_tuple]
+            view = value[start - page_start : stop - page_start]
+        return view
+
+    def _store(self, start: int, value) -> memoryview:
+        # the last page of the chunk may be shorter than requested
+        view = self.data_fetched[(start, start + len(value))] = memoryview(value)
+        return view
+
+    def _find(self, start: int, stop: int) -> Optional[memoryview]:
+        """Returns the bytes from ``start`` to ``stop`` if they are covered by a single fetched range."""
+        view = self.data_fetched.get((start, stop))
+        if view is not None:
+            return view
+        for (s, e), view in self.data_fetched.items():
+            if s <= start and stop <= e:
+                return view[start - s : stop - s]
+        return None
+
+    def prefetch(self, ranges: Sequence[Tuple[int, int]]):
+        """Fetches the given ranges of the chunk data, so that slicing them later does not need a request each.
+
+        Ranges are rounded up to pages like in :meth:`__getitem__`. Ranges less than
+        ``deeplake.constants.PARTIAL_READ_COALESCE_GAP`` bytes apart are merged into one request,
+        and the requests are issued as a single batch, see :meth:`StorageProvider.get_bytes_many`.
+
+        Args:
+            ranges (Sequence[Tuple[int, int]]): ``(start, stop)`` byte ranges relative to the start of the chunk data.
+        """
+        offset = self.header_offset
+        page_size = deeplake.constants.PARTIAL_READ_PAGE_SIZE
+        needed = [
+            align_range(start + offset, stop + offset, page_size)
+            for start, stop in ranges
+            if stop > start and self._find(start + offset, stop + offset) is None
+        ]
+        if not needed:
+            return
+        merged = coalesce_ranges(needed, deeplake.constants.PARTIAL_READ_COALESCE_GAP)
+        values = self.cache.get_bytes_many(
+            [(self.path, start, stop) for start, stop in merged]
+        )
+        for (start, _), value in zip(merged, values):
+            self._store(start, value)
 
     def get_all_bytes(self) -> bytes:
         return self.cache.next_storage[self.path]
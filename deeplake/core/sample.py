@@ -55,7 +55,7 @@ class Sample:
         buffer: Optional[Union[bytes, memoryview]] = None,
         compression: Optional[str] = None,
         verify: bool = False,
-        shape: Optional[Tuple[int]] = None,
+        shape: Optional[Tuple[int, ...]] = None,
         dtype: Optional[str] = None,
         creds: Optional[Dict] = None,
         storage: Optional[StorageProvider] = None,
@@ -0,0 +1,80 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+import numpy as np
+
+
+class DecodedSampleCache:
+    """Least recently used cache of decoded samples, bounded by the number of bytes of the arrays it holds.
+
+    Used by :class:`ChunkEngine` to avoid decoding the same samples again when they are read more than once, e.g. when
+    iterating over a view that jumps back and forth between chunks. Keys are ``(chunk_key, local_index)`` tuples for
+    samples decoded one by one, and ``(chunk_key, None)`` for all the samples of a chunk of a fixed shape tensor decoded
+    at once into a single array.
+
+    The cache does not know when chunks are modified, it has to be cleared by the writer.
+    """
+
+    def __init__(self, max_bytes: int):
+        """Initializes the DecodedSampleCache.
+
+        Args:
+            max_bytes (int): Maximum number of bytes of the arrays kept in the cache. Set to 0 to disable the cache.
+
+        Raises:
+            ValueError: If ``max_bytes`` is negative.
+        """
+        if max_bytes < 0:
+            raise ValueError(f"`max_bytes` must be >= 0. Got: {max_bytes}")
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: Dict[Hashable, np.ndarray] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[np.ndarray]:
+        """Returns the array at ``key``, or None if it is not in the cache."""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+            else:
+                self._entries.move_to_end(key)  # type: ignore
+                self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: np.ndarray):
+        """Stores the array at ``key``, evicting the least recently used arrays if the cache is full.
+        Arrays larger than the cache are not stored."""
+        nbytes = value.nbytes
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.nbytes -= old.nbytes
+            if nbytes > self.max_bytes:
+                return
+            self._entries[key] = value
+            self.nbytes += nbytes
+            while self.nbytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)  # type: ignore
+                self.nbytes -= evicted.nbytes
+
+    def clear(self):
+        """Removes all the arrays from the cache."""
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {"max_bytes": self.max_bytes}
+
+    def __setstate__(self, state: Dict[str, Any]):
+        self.__init__(state["max_bytes"])  # type: ignore
@@ -16,7 +16,7 @@ from deeplake.util.exceptions import TensorInvalidSampleShapeError
 from deeplake.util.casting import intelligent_cast
 from deeplake.util.json import HubJsonDecoder, HubJsonEncoder, validate_json_object
 from deeplake.core.sample import Sample, SampleValue  # type: ignore
-from deeplake.core.compression import compress_array, compress_bytes
+from deeplake.core.compression import compress_array, compress_bytes, decompress_bytes
 from typing import Optional, Sequence, Union, Tuple
 import deeplake
 import numpy as np
@@ -26,6 +26,7 @@ from urllib.request import Request, urlopen
 
 BaseTypes = Union[np.ndarray, list, int, float, bool, np.integer, np.floating, np.bool_]
 HEADER_SIZE_BYTES = 13
+SHAPE_INDEX_FINGERPRINT_FLAG = 0x80
 
 
 def infer_header_num_bytes(
@@ -433,6 +434,69 @@ def deserialize_sequence_or_creds_encoder(
     return version, enc
 
 
+def serialize_shape_index(
+    version: str,
+    shapes: np.ndarray,
+    sizes: np.ndarray,
+    fingerprint: Optional[Tuple[int, int, int]] = None,
+) -> bytes:
+    """Serializes the encoded shapes and sizes of a tensor's shape index. The arrays are stored column by column, which
+    compresses well since runs of similar shapes and sizes are next to each other, and lz4 compressed.
+
+    The fingerprint of the tensor the index was last updated with is stored after the header. Its presence is flagged by
+    the highest bit of the version length byte, so that indices written without one can still be read.
+    """
+    len_version = len(version)
+    header = struct.pack("<III", len(shapes), shapes.shape[1], len(sizes))
+    if fingerprint is not None:
+        len_version |= SHAPE_INDEX_FINGERPRINT_FLAG
+        header += struct.pack("<QQQ", *fingerprint)
+    body = shapes.T.astype(np.uint32).tobytes() + sizes.T.astype(np.uint64).tobytes()
+    return (
+        len_version.to_bytes(1, "little")
+        + version.encode("ascii")
+        + header
+        + compress_bytes(body, "lz4")
+    )
+
+
+def deserialize_shape_index(
+    byts: Union[bytes, memoryview]
+) -> Tuple[str, np.ndarray, np.ndarray, Optional[Tuple[int, int, int]]]:
+    """Deserializes the output of :func:`serialize_shape_index`.
+
+    Returns:
+        Tuple of: deeplake version used to create the index, encoded shapes, encoded sizes and the fingerprint of the
+        tensor the index was last updated with, if any.
+    """
+    byts = memoryview(byts)
+    has_fingerprint = bool(byts[0] & SHAPE_INDEX_FINGERPRINT_FLAG)
+    len_version = byts[0] & ~SHAPE_INDEX_FINGERPRINT_FLAG
+    version = str(byts[1 : 1 + len_version], "ascii")
+    offset = 1 + len_version
+    num_shape_rows, num_shape_columns, num_size_rows = struct.unpack(
+        "<III", byts[offset : offset + 12]
+    )
+    offset += 12
+    fingerprint = None
+    if has_fingerprint:
+        fingerprint = struct.unpack("<QQQ", byts[offset : offset + 24])
+        offset += 24
+    body = decompress_bytes(byts[offset:], "lz4")
+    shapes_nbytes = num_shape_rows * num_shape_columns * 4
+    shapes = (
+        np.frombuffer(body[:shapes_nbytes], dtype=np.uint32)
+        .reshape(num_shape_columns, num_shape_rows)
+        .T.copy()
+    )
+    sizes = (
+        np.frombuffer(body[shapes_nbytes:], dtype=np.uint64)
+        .reshape(2, num_size_rows)
+        .T.copy()
+    )
+    return version, shapes, sizes, fingerprint
+
+
 def check_sample_shape(shape, num_dims):
     if shape is not None and len(shape) != num_dims:
         raise TensorInvalidSampleShapeError(shape, num_dims)
@@ -5,5 +5,6 @@ from deeplake.core.storage.google_drive import GDriveProvider
 from deeplake.core.storage.memory import MemoryProvider
 from deeplake.core.storage.local import LocalProvider
 from deeplake.core.storage.lru_cache import LRUCache
+from deeplake.core.storage.disk_cache import DiskCache, SharedCache
 from deeplake.core.storage.gcs import GCSProvider
 from deeplake.core.storage.azure import AzureProvider
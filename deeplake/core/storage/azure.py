@@ -4,6 +4,7 @@ import logging
 from typing import Dict, Optional, Tuple
 from datetime import datetime, timedelta, timezone
 
+from deeplake.constants import STORAGE_BATCH_READ_WORKERS
 from deeplake.core.storage.provider import StorageProvider
 from deeplake.client.client import DeepLakeBackendClient
 from deeplake.util.exceptions import PathNotEmptyException
@@ -28,6 +29,9 @@ except ImportError:
 
 
 class AzureProvider(StorageProvider):
+    batch_read_workers = STORAGE_BATCH_READ_WORKERS
+    supports_partial_reads = True
+
     def __init__(self, root: str, creds: Dict = {}, token: Optional[str] = None):
         if not _AZURE_PACKAGES_INSTALLED:
             raise ImportError(
@@ -0,0 +1,433 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional, Set
+
+import deeplake
+from deeplake.core.storage.lru_cache import LRUCache, obj_to_bytes
+from deeplake.core.storage.provider import StorageProvider
+from deeplake.util.keys import get_chunk_key_commit_id, is_chunk_key
+
+
+class DiskCache(StorageProvider):
+    """Size capped cache on the local disk that persists across runs and can be shared by multiple processes.
+
+    Objects are stored in files named after a hash of ``namespace`` and their key, and an index of all objects along with
+    their size and last access time is kept in an sqlite database in the cache directory. Files are written and evicted
+    while holding the write lock of the database, so any number of processes on the same machine can use the same
+    directory concurrently. Once the objects in the cache take more than ``cache_size`` bytes, the least recently read
+    ones are evicted, whichever process and namespace they belong to. So that reads do not take the write lock, the
+    access times of the objects read by a process are written to the index in batches, at most every
+    ``deeplake.constants.SHARED_CACHE_ACCESS_UPDATE_INTERVAL`` seconds, and before the process evicts objects.
+
+    The cache directory should be on a local filesystem, as file locks are not reliable on network filesystems.
+    """
+
+    INDEX_FILENAME = "index.db"
+
+    def __init__(self, root: str, cache_size: int, namespace: str = ""):
+        """Initializes the DiskCache.
+
+        Args:
+            root (str): Directory of the cache. Created if it does not exist.
+            cache_size (int): Maximum number of bytes stored in the cache directory, by all namespaces.
+            namespace (str): Keys of different namespaces, e.g. of different datasets, refer to different objects.
+
+        Raises:
+            ValueError: If ``cache_size`` is negative.
+        """
+        if cache_size < 0:
+            raise ValueError(f"`cache_size` must be >= 0. Got: {cache_size}")
+        self.root = os.path.expanduser(root)
+        self.cache_size = cache_size
+        self.namespace = namespace
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid = os.getpid()
+        self._lock = threading.RLock()
+        # access times of the objects read since they were last written to the index, by digest
+        self._access_times: Dict[str, float] = {}
+        self._access_times_written = time.time()
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        # sqlite connections can not be used across a fork
+        if self._conn is None or self._pid != os.getpid():
+            os.makedirs(self.root, exist_ok=True)
+            conn = sqlite3.connect(
+                os.path.join(self.root, self.INDEX_FILENAME),
+                timeout=60,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries (digest TEXT PRIMARY KEY, namespace TEXT, key TEXT, "
+                "size INTEGER, last_access REAL)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS entries_last_access ON entries (last_access)"
+            )
+            self._conn = conn
+            self._pid = os.getpid()
+        return self._conn
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Holds the write lock of the index, shared by all processes, for the duration of the context."""
+        with self._lock:
+            conn = self.conn
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    def _digest(self, path: str) -> str:
+        return hashlib.sha256(f"{self.namespace}\0{path}".encode("utf-8")).hexdigest()
+
+    def _file(self, digest: str) -> str:
+        return os.path.join(self.root, digest[:2], digest)
+
+    def _read(self, path: str, start_byte: Optional[int], end_byte: Optional[int]):
+        digest = self._digest(path)
+        try:
+            with open(self._file(digest), "rb") as f:
+                if start_byte:
+                    f.seek(start_byte)
+                if end_byte is None:
+                    value = f.read()
+                else:
+                    value = f.read(max(end_byte - (start_byte or 0), 0))
+        except FileNotFoundError:
+            raise KeyError(path)
+        now = time.time()
+        with self._lock:
+            self._access_times[digest] = now
+            if (
+                now - self._access_times_written
+                >= deeplake.constants.SHARED_CACHE_ACCESS_UPDATE_INTERVAL
+            ):
+                with self._transaction() as conn:
+                    self._write_access_times(conn)
+        return value
+
+    def _write_access_times(self, conn: sqlite3.Connection):
+        """Writes the access times of the objects read by this process to the index. Runs inside a write transaction."""
+        if self._access_times:
+            conn.executemany(
+                "UPDATE entries SET last_access = MAX(last_access, ?) WHERE digest = ?",
+                [(t, digest) for digest, t in self._access_times.items()],
+            )
+            self._access_times = {}
+        self._access_times_written = time.time()
+
+    def __getitem__(self, path: str):
+        """Gets the object present at the path.
+
+        Args:
+            path (str): The key of the object in the namespace of the cache.
+
+        Returns:
+            bytes: The bytes of the object present at the path.
+
+        Raises:
+            KeyError: If an object is not found at the path.
+        """
+        return self._read(path, None, None)
+
+    def get_bytes(
+        self,
+        path: str,
+        start_byte: Optional[int] = None,
+        end_byte: Optional[int] = None,
+    ):
+        """Gets the object present at the path within the given byte range, without reading the rest of the file."""
+        return self._read(path, start_byte, end_byte)
+
+    def __contains__(self, path) -> bool:
+        return os.path.exists(self._file(self._digest(path)))
+
+    def __setitem__(self, path: str, value):
+        """Stores the object at the path, evicting the least recently read objects if the cache is full.
+        Objects larger than the cache are not stored.
+
+        Args:
+            path (str): The key of the object in the namespace of the cache.
+            value (bytes): The object.
+
+        Raises:
+            ReadOnlyError: If the provider is in read-only mode.
+        """
+        self.check_readonly()
+        value = obj_to_bytes(value)
+        size = len(value)
+        if size > self.cache_size:
+            self.discard(path)
+            return
+        digest = self._digest(path)
+        file = self._file(digest)
+        os.makedirs(os.path.dirname(file), exist_ok=True)
+        tmp = f"{file}.{uuid.uuid4().hex}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(value)
+        replaced = False
+        try:
+            with self._transaction() as conn:
+                os.replace(tmp, file)
+                replaced = True
+                conn.execute(
+                    "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)",
+                    (digest, self.namespace, path, size, time.time()),
+                )
+                self._write_access_times(conn)
+                self._evict(conn, exclude=digest)
+        except BaseException:
+            if replaced:
+                # the row of the new file was rolled back
+                self._remove_file(digest)
+            elif os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+
+    def _evict(self, conn: sqlite3.Connection, exclude: str):
+        """Removes the least recently read objects until the cache fits in ``cache_size``. Runs inside a write transaction."""
+        used = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if used <= self.cache_size:
+            return
+        victims = []
+        for digest, size in conn.execute(
+            "SELECT digest, size FROM entries ORDER BY last_access"
+        ):
+            if used <= self.cache_size:
+                break
+            if digest != exclude:
+                victims.append((digest,))
+                used -= size
+        conn.executemany("DELETE FROM entries WHERE digest = ?", victims)
+        for (digest,) in victims:
+            self._remove_file(digest)
+        self.stats.increment("evictions", len(victims))
+
+    def _remove_file(self, digest: str):
+        try:
+            os.remove(self._file(digest))
+        except FileNotFoundError:
+            pass
+
+    def discard(self, path: str) -> bool:
+        """Removes the object at the path from the cache, if it is there.
+
+        Returns:
+            bool: Whether there was an object at the path.
+        """
+        digest = self._digest(path)
+        with self._transaction() as conn:
+            deleted = conn.execute(
+                "DELETE FROM entries WHERE digest = ?", (digest,)
+            ).rowcount
+            self._remove_file(digest)
+        return deleted > 0
+
+    def __delitem__(self, path: str):
+        """Removes the object at the path from the cache.
+
+        Raises:
+            KeyError: If an object is not found at the path.
+            ReadOnlyError: If the provider is in read-only mode.
+        """
+        self.check_readonly()
+        if not self.discard(path):
+            raise KeyError(path)
+
+    def _all_keys(self) -> Set[str]:
+        """Returns the keys of all the objects of this namespace in the cache."""
+        rows = self.conn.execute(
+            "SELECT key FROM entries WHERE namespace = ?", (self.namespace,)
+        )
+        return {key for (key,) in rows}
+
+    def __iter__(self):
+        yield from self._all_keys()
+
+    def __len__(self):
+        return self.conn.execute(
+            "SELECT COUNT(*) FROM entries WHERE namespace = ?", (self.namespace,)
+        ).fetchone()[0]
+
+    @property
+    def cache_used(self) -> int:
+        """Number of bytes stored in the cache directory, by all namespaces."""
+        return self.conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM entries"
+        ).fetchone()[0]
+
+    def get_object_size(self, path: str) -> int:
+        try:
+            return os.path.getsize(self._file(self._digest(path)))
+        except FileNotFoundError:
+            raise KeyError(path)
+
+    def clear(self, prefix=""):
+        """Removes the objects of this namespace whose keys start with ``prefix`` from the cache.
+        Objects of other namespaces are not affected."""
+        self.check_readonly()
+        with self._transaction() as conn:
+            digests = [
+                digest
+                for digest, key in conn.execute(
+                    "SELECT digest, key FROM entries WHERE namespace = ?",
+                    (self.namespace,),
+                )
+                if key.startswith(prefix)
+            ]
+            conn.executemany(
+                "DELETE FROM entries WHERE digest = ?", [(d,) for d in digests]
+            )
+            for digest in digests:
+                self._remove_file(digest)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {
+            "root": self.root,
+            "cache_size": self.cache_size,
+            "namespace": self.namespace,
+            "read_only": self.read_only,
+        }
+
+    def __setstate__(self, state: Dict[str, Any]):
+        self.__init__(state["root"], state["cache_size"], state["namespace"])  # type: ignore
+        self.read_only = state["read_only"]
+
+
+class SharedCache(LRUCache):
+    """Cache layer that keeps the chunks read from ``next_storage`` in a :class:`DiskCache`.
+
+    Unlike the other cache layers, this layer does not track what is in the cache in memory, so that chunks cached by
+    one process are found by every other process using the same cache directory, including later runs.
+    Only chunks of the commits in :attr:`committed_ids` are cached. Their keys (see :func:`get_chunk_key`) include the
+    commit they belong to, and these commits can no longer be modified, so a cached chunk can not be rewritten by another
+    process. Chunks of the head commits of branches are always read from ``next_storage``. Writes go straight to
+    ``next_storage`` and drop the written chunk from the cache.
+    """
+
+    def __init__(
+        self,
+        cache_storage: DiskCache,
+        next_storage: StorageProvider,
+        use_async: bool = False,
+    ):
+        """Initializes the SharedCache.
+
+        Args:
+            cache_storage (DiskCache): The disk cache the chunks are kept in. Its namespace should identify the dataset.
+            next_storage (StorageProvider): The storage the chunks are read from, and written to.
+            use_async (bool): If True, writes to next_storage happen in the background. See :class:`LRUCache` for details.
+        """
+        super().__init__(
+            cache_storage, next_storage, cache_storage.cache_size, use_async=use_async
+        )
+        self.cache_storage: DiskCache = cache_storage
+        # ids of the commits whose chunks are cached, see `get_committed_ids`. Set by the dataset.
+        self.committed_ids: Set[str] = set()
+
+    @property
+    def cache_used(self) -> int:
+        return self.cache_storage.cache_used
+
+    @cache_used.setter
+    def cache_used(self, value: int):
+        # the size of the cache is kept in the index of the disk cache
+        pass
+
+    def _is_cached(self, path: str) -> bool:
+        """Whether the object at path is kept in the disk cache."""
+        return (
+            is_chunk_key(path) and get_chunk_key_commit_id(path) in self.committed_ids
+        )
+
+    def _get_cached(
+        self,
+        path: str,
+        start_byte: Optional[int] = None,
+        end_byte: Optional[int] = None,
+    ):
+        """Returns the bytes of the chunk at path from the disk cache, or None if it is not there."""
+        if path in self.deeplake_objects or not self._is_cached(path):
+            return None
+        try:
+            value = self.cache_storage.get_bytes(path, start_byte, end_byte)
+        except KeyError:
+            return None
+        self.stats.increment("hits")
+        return value
+
+    def _get_item(self, path: str, view: bool = False):
+        value = self._get_cached(path)
+        if value is None:
+            value = super()._get_item(path, view)
+        return value
+
+    def get_bytes(
+        self,
+        path: str,
+        start_byte: Optional[int] = None,
+        end_byte: Optional[int] = None,
+    ):
+        value = self._get_cached(path, start_byte, end_byte)
+        if value is None:
+            value = super().get_bytes(path, start_byte, end_byte)
+        return value
+
+    def _has_full_bytes_in_cache(self, path: str) -> bool:
+        return self._is_cached(path) and path in self.cache_storage
+
+    def get_items(self, paths):
+        paths = list(dict.fromkeys(paths))
+        result = {}
+        for path in paths:
+            value = self._get_cached(path)
+            if value is not None:
+                result[path] = value
+        missing = [path for path in paths if path not in result]
+        if missing:
+            result.update(super().get_items(missing))
+        return {path: result[path] for path in paths}
+
+    def __setitem__(self, path: str, value):
+        """Writes the value to next_storage and drops the chunk at path from the disk cache.
+
+        Raises:
+            ReadOnlyError: If the provider is in read-only mode.
+        """
+        self.check_readonly()
+        if path in self.deeplake_objects:
+            self.deeplake_objects[path].is_dirty = False
+        if self._is_cached(path):
+            self.cache_storage.discard(path)
+        self._forward_value(path, value)
+        self.maybe_flush()
+
+    def __delitem__(self, path: str):
+        if self._is_cached(path):
+            self.check_readonly()
+            self.cache_storage.discard(path)
+        super().__delitem__(path)
+
+    def _insert_in_cache(self, path: str, value):
+        if self._is_cached(path):
+            self.cache_storage[path] = value
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = super().__getstate__()
+        state["committed_ids"] = self.committed_ids
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]):
+        super().__setstate__(state)
+        self.committed_ids = state["committed_ids"]
@@ -0,0 +1,315 @@
+import heapq
+from abc import ABC, abstractmethod
+from collections import OrderedDict, defaultdict
+from itertools import count
+from typing import Dict, Iterator, List, Optional, Set, Tuple, Type
+
+
+class EvictionPolicy(ABC):
+    """Decides the order in which an :class:`LRUCache` evicts its keys.
+
+    The cache notifies the policy whenever a key is inserted, read, evicted or removed, and asks it for the next key to evict
+    when it runs out of space. Pinned keys are never chosen for eviction.
+
+    To add a new policy, create a subclass, implement the abstract methods below and add it to ``EVICTION_POLICIES``.
+    """
+
+    def __init__(self, cache_size: int):
+        """Initializes the policy.
+
+        Args:
+            cache_size (int): Size of the cache in bytes.
+        """
+        self.cache_size = cache_size
+        self.pinned: Set[str] = set()
+
+    @abstractmethod
+    def on_insert(self, key: str, size: int):
+        """Called when a value of ``size`` bytes is written at ``key``. ``key`` may already be in the cache."""
+
+    @abstractmethod
+    def on_access(self, key: str):
+        """Called when ``key`` is read from the cache."""
+
+    @abstractmethod
+    def on_remove(self, key: str):
+        """Called when ``key`` is deleted from the cache."""
+
+    def on_evict(self, key: str):
+        """Called when ``key`` is evicted from the cache."""
+        self.on_remove(key)
+
+    @abstractmethod
+    def _eviction_order(self) -> Iterator[str]:
+        """Iterates over the keys in the cache, starting from the one that should be evicted first."""
+
+    @abstractmethod
+    def clear(self):
+        """Forgets all keys."""
+
+    def victim(self) -> Optional[str]:
+        """Returns the key that should be evicted next, or ``None`` if all keys are pinned."""
+        for key in self._eviction_order():
+            if key not in self.pinned:
+                return key
+        return None
+
+    def pin(self, key: str):
+        """Prevents ``key`` from being evicted."""
+        self.pinned.add(key)
+
+    def unpin(self, key: str):
+        """Allows ``key`` to be evicted again."""
+        self.pinned.discard(key)
+
+
+class LRUPolicy(EvictionPolicy):
+    """Evicts the least recently used key."""
+
+    def __init__(self, cache_size: int):
+        super().__init__(cache_size)
+        self._order: Dict[str, None] = OrderedDict()
+
+    def on_insert(self, key: str, size: int):
+        # size updates of keys already in the cache do not count as a use
+        if key not in self._order:
+            self._order[key] = None
+
+    def on_access(self, key: str):
+        if key in self._order:
+            self._order.move_to_end(key)  # type: ignore
+
+    def on_remove(self, key: str):
+        self._order.pop(key, None)
+
+    def _eviction_order(self) -> Iterator[str]:
+        return iter(self._order)
+
+    def clear(self):
+        self._order.clear()
+
+
+class LFUPolicy(EvictionPolicy):
+    """Evicts the least frequently used key. Ties are broken by evicting the least recently used key."""
+
+    def __init__(self, cache_size: int):
+        super().__init__(cache_size)
+        self._freq: Dict[str, int] = {}
+        self._buckets: Dict[int, Dict[str, None]] = defaultdict(OrderedDict)
+        # lowest frequency of the keys in the cache, 0 if it is empty
+        self._min_freq = 0
+
+    def _move(self, key: str, freq: int):
+        old = self._freq.get(key)
+        if old is None:
+            self._min_freq = freq
+        else:
+            bucket = self._buckets[old]
+            del bucket[key]
+            if not bucket:
+                del self._buckets[old]
+                if old == self._min_freq:
+                    self._min_freq = freq
+        self._freq[key] = freq
+        self._buckets[freq][key] = None
+
+    def on_insert(self, key: str, size: int):
+        self._move(key, self._freq.get(key, 0) + 1)
+
+    def on_access(self, key: str):
+        freq = self._freq.get(key)
+        if freq is not None:
+            self._move(key, freq + 1)
+
+    def on_remove(self, key: str):
+        freq = self._freq.pop(key, None)
+        if freq is not None:
+            bucket = self._buckets[freq]
+            del bucket[key]
+            if not bucket:
+                del self._buckets[freq]
+                if freq == self._min_freq:
+                    self._min_freq = min(self._buckets, default=0)
+
+    def _eviction_order(self) -> Iterator[str]:
+        if not self._buckets:
+            return
+        yield from self._buckets[self._min_freq]
+        # only reached if all the keys of the lowest frequency are pinned
+        for freq in sorted(self._buckets):
+            if freq != self._min_freq:
+                yield from self._buckets[freq]
+
+    def clear(self):
+        self._freq.clear()
+        self._buckets.clear()
+        self._min_freq = 0
+
+
+class TwoQueuePolicy(EvictionPolicy):
+    """Scan resistant 2Q policy.
+
+    Keys enter a FIFO queue (``A1in``) when inserted. Reads while a key is in ``A1in`` do not count, as a sequential scan reads
+    a chunk many times in a row. Keys evicted from ``A1in`` are remembered in a ghost queue (``A1out``), and a key that is
+    inserted again while remembered is put in an LRU queue (``Am``). ``A1in`` is evicted first once it holds more than
+    ``in_fraction`` of the cache, so a one pass scan over large chunks can not push frequently reused keys out of ``Am``.
+    """
+
+    def __init__(
+        self, cache_size: int, in_fraction: float = 0.25, ghost_entries: int = 1024
+    ):
+        """Initializes the policy.
+
+        Args:
+            cache_size (int): Size of the cache in bytes.
+            in_fraction (float): Fraction of the cache that keys seen once can hold before they are evicted first.
+            ghost_entries (int): Number of evicted keys remembered.
+        """
+        super().__init__(cache_size)
+        self.in_fraction = in_fraction
+        self.ghost_entries = ghost_entries
+        self._a1in: Dict[str, int] = OrderedDict()
+        self._a1in_bytes = 0
+        self._am: Dict[str, None] = OrderedDict()
+        self._a1out: Dict[str, None] = OrderedDict()
+
+    def on_insert(self, key: str, size: int):
+        if key in self._a1in:
+            self._a1in_bytes += size - self._a1in[key]
+            self._a1in[key] = size
+        elif key in self._am:
+            self._am.move_to_end(key)  # type: ignore
+        elif key in self._a1out:
+            del self._a1out[key]
+            self._am[key] = None
+        else:
+            self._a1in[key] = size
+            self._a1in_bytes += size
+
+    def on_access(self, key: str):
+        if key in self._am:
+            self._am.move_to_end(key)  # type: ignore
+
+    def on_remove(self, key: str):
+        size = self._a1in.pop(key, None)
+        if size is not None:
+            self._a1in_bytes -= size
+        else:
+            self._am.pop(key, None)
+
+    def on_evict(self, key: str):
+        if key in self._a1in:
+            self._a1out[key] = None
+            if len(self._a1out) > self.ghost_entries:
+                self._a1out.popitem(last=False)  # type: ignore
+        self.on_remove(key)
+
+    def _eviction_order(self) -> Iterator[str]:
+        if self._a1in_bytes > self.in_fraction * self.cache_size or not self._am:
+            yield from self._a1in
+            yield from self._am
+        else:
+            yield from self._am
+            yield from self._a1in
+
+    def clear(self):
+        self._a1in.clear()
+        self._a1in_bytes = 0
+        self._am.clear()
+        self._a1out.clear()
+
+
+class GDSFPolicy(EvictionPolicy):
+    """Size aware Greedy-Dual-Size-Frequency policy.
+
+    Each key has the priority ``L + frequency / size`` and the key with the lowest priority is evicted. ``L`` is raised to the
+    priority of every evicted key, so that keys which are not read anymore age out. Small, frequently read objects such as
+    metadata are kept over large chunks that are read once.
+    """
+
+    def __init__(self, cache_size: int):
+        super().__init__(cache_size)
+        self._age = 0.0
+        self._freq: Dict[str, int] = {}
+        self._size: Dict[str, int] = {}
+        self._priority: Dict[str, Tuple[float, int]] = {}
+        self._heap: List[Tuple[float, int, str]] = []
+        self._counter = count()
+
+    def _push(self, key: str):
+        entry = (
+            self._age + self._freq[key] / max(self._size[key], 1),
+            next(self._counter),
+        )
+        self._priority[key] = entry
+        heap = self._heap
+        heapq.heappush(heap, (*entry, key))
+        # stale entries are left in the heap, rebuild it once they dominate
+        if len(heap) > 2 * len(self._priority) + 64:
+            self._heap = [(*v, k) for k, v in self._priority.items()]
+            heapq.heapify(self._heap)
+
+    def _is_current(self, item: Tuple[float, int, str]) -> bool:
+        return self._priority.get(item[2]) == item[:2]
+
+    def on_insert(self, key: str, size: int):
+        self._freq[key] = self._freq.get(key, 0) + 1
+        self._size[key] = size
+        self._push(key)
+
+    def on_access(self, key: str):
+        if key in self._freq:
+            self._freq[key] += 1
+            self._push(key)
+
+    def on_remove(self, key: str):
+        self._freq.pop(key, None)
+        self._size.pop(key, None)
+        self._priority.pop(key, None)
+
+    def on_evict(self, key: str):
+        entry = self._priority.get(key)
+        if entry is not None:
+            self._age = entry[0]
+        self.on_remove(key)
+
+    def _eviction_order(self) -> Iterator[str]:
+        heap = self._heap
+        while heap and not self._is_current(heap[0]):
+            heapq.heappop(heap)
+        if not heap:
+            return
+        yield heap[0][2]
+        # only reached if the first key is pinned
+        for item in sorted(heap)[1:]:
+            if self._is_current(item):
+                yield item[2]
+
+    def clear(self):
+        self._freq.clear()
+        self._size.clear()
+        self._priority.clear()
+        self._heap.clear()
+
+
+EVICTION_POLICIES: Dict[str, Type[EvictionPolicy]] = {
+    "lru": LRUPolicy,
+    "lfu": LFUPolicy,
+    "2q": TwoQueuePolicy,
+    "gdsf": GDSFPolicy,
+}
+
+
+def get_eviction_policy(name: str, cache_size: int) -> EvictionPolicy:
+    """Creates the eviction policy with the given name for a cache of ``cache_size`` bytes.
+
+    Raises:
+        ValueError: If there is no policy with the given name.
+    """
+    try:
+        policy_class = EVICTION_POLICIES[name.lower()]
+    except KeyError:
+        raise ValueError(
+            f"Unknown cache eviction policy '{name}'. Supported policies: {list(EVICTION_POLICIES)}"
+        )
+    return policy_class(cache_size)
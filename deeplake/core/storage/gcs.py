@@ -23,6 +23,7 @@ except ImportError:
     _GOOGLE_PACKAGES_INSTALLED = False
 
 
+from deeplake.constants import STORAGE_BATCH_READ_WORKERS
 from deeplake.core.storage.provider import StorageProvider
 from deeplake.util.exceptions import (
     GCSDefaultCredsNotFoundError,
@@ -229,6 +230,9 @@ class GCloudCredentials:
 class GCSProvider(StorageProvider):
     """Provider class for using GC storage."""
 
+    batch_read_workers = STORAGE_BATCH_READ_WORKERS
+    supports_partial_reads = True
+
     def __init__(
         self,
         root: str,
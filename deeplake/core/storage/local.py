@@ -1,9 +1,14 @@
+import mmap
 import os
 import pathlib
 import posixpath
 import shutil
-from typing import Optional, Set
+import threading
+import uuid
+import weakref
+from typing import Dict, Optional, Set
 
+import deeplake
 from deeplake.core.storage.provider import StorageProvider
 from deeplake.util.exceptions import (
     DirectoryAtPathException,
@@ -12,6 +17,37 @@ from deeplake.util.exceptions import (
 )
 
 
+def _mmap_min_size() -> Optional[int]:
+    if os.name == "nt":
+        return None
+    return deeplake.constants.LOCAL_MMAP_MIN_SIZE
+
+
+# number of live mappings of each file mapped by `LocalProvider.get_view`
+_mapped_files: Dict[str, int] = {}
+_mapped_files_lock = threading.Lock()
+
+
+def _map_file(file, full_path: str) -> mmap.mmap:
+    mm = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    with _mapped_files_lock:
+        _mapped_files[full_path] = _mapped_files.get(full_path, 0) + 1
+    weakref.finalize(mm, _unmap_file, full_path)
+    return mm
+
+
+def _unmap_file(full_path: str):
+    with _mapped_files_lock:
+        count = _mapped_files.pop(full_path, 0) - 1
+        if count > 0:
+            _mapped_files[full_path] = count
+
+
+def _is_file_mapped(full_path: str) -> bool:
+    with _mapped_files_lock:
+        return full_path in _mapped_files
+
+
 class LocalProvider(StorageProvider):
     """Provider class for using the local filesystem."""
 
@@ -75,6 +111,35 @@ class LocalProvider(StorageProvider):
         except FileNotFoundError:
             raise KeyError(path)
 
+    def get_view(self, path: str):
+        """Gets the object present at the path. If ``deeplake.constants.LOCAL_MMAP_MIN_SIZE`` is set, files of at least
+        that many bytes are memory mapped and returned as a read-only memoryview, so that they are not copied into memory.
+
+        Args:
+            path (str): The path relative to the root of the provider.
+
+        Returns:
+            bytes or memoryview: The bytes of the object present at the path.
+
+        Raises:
+            KeyError: If an object is not found at the path.
+            DirectoryAtPathException: If a directory is found at the path.
+        """
+        min_size = _mmap_min_size()
+        if min_size is None:
+            return self[path]
+        try:
+            full_path = self._check_is_file(path)
+            with open(full_path, "rb") as file:
+                size = os.fstat(file.fileno()).st_size
+                if size == 0 or size < min_size:
+                    return file.read()
+                return memoryview(_map_file(file, full_path))
+        except DirectoryAtPathException:
+            raise
+        except FileNotFoundError:
+            raise KeyError(path)
+
     def __setitem__(self, path: str, value: bytes):
         """Sets the object present at the path with the value
 
@@ -99,8 +164,20 @@ class LocalProvider(StorageProvider):
             raise FileAtPathException(directory)
         if not os.path.exists(directory):
             os.makedirs(directory, exist_ok=True)
-        with open(full_path, "wb") as file:
-            file.write(value)
+        if _is_file_mapped(full_path):
+            # truncating a file that is memory mapped by `get_view` would break the mapping, replace the file instead
+            tmp_path = f"{full_path}.{uuid.uuid4().hex}.tmp"
+            try:
+                with open(tmp_path, "wb") as file:
+                    file.write(value)
+                os.replace(tmp_path, full_path)
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+        else:
+            with open(full_path, "wb") as file:
+                file.write(value)
         if self.files is not None:
             self.files.add(path)
 
@@ -1,11 +1,20 @@
+import mmap
 import sys
+import time
 from collections import OrderedDict
+from deeplake.constants import (
+    ASYNC_FLUSH_MAX_IN_FLIGHT_SIZE,
+    ASYNC_FLUSH_NUM_WORKERS,
+    DEFAULT_CACHE_EVICTION_POLICY,
+)
 from deeplake.core.partial_reader import PartialReader
 from deeplake.core.storage.deeplake_memory_object import DeepLakeMemoryObject
+from deeplake.core.storage.eviction import EvictionPolicy, get_eviction_policy
 from deeplake.core.chunk.base_chunk import BaseChunk
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, List, Optional, Sequence, Union
 
-from deeplake.core.storage.provider import StorageProvider
+from deeplake.core.storage.provider import ByteRange, StorageProvider
+from deeplake.core.storage.write_behind import WriteBehindUploader
 
 
 def _get_nbytes(obj: Union[bytes, memoryview, DeepLakeMemoryObject]):
@@ -14,6 +23,11 @@ def _get_nbytes(obj: Union[bytes, memoryview, DeepLakeMemoryObject]):
     return len(obj)
 
 
+def _is_mapped(obj) -> bool:
+    """Whether ``obj`` is a view of a memory mapped file, see :meth:`LocalProvider.get_view`."""
+    return isinstance(obj, memoryview) and isinstance(obj.obj, mmap.mmap)
+
+
 def obj_to_bytes(obj):
     if isinstance(obj, DeepLakeMemoryObject):
         obj = obj.tobytes()
@@ -23,13 +37,18 @@ def obj_to_bytes(obj):
 
 
 class LRUCache(StorageProvider):
-    """LRU Cache that uses StorageProvider for caching"""
+    """Cache that uses StorageProvider for caching. Evicts the least recently used items by default, see ``eviction_policy``."""
 
     def __init__(
         self,
         cache_storage: StorageProvider,
         next_storage: Optional[StorageProvider],
         cache_size: int,
+        use_async: bool = False,
+        async_max_in_flight_bytes: int = ASYNC_FLUSH_MAX_IN_FLIGHT_SIZE,
+        async_num_workers: int = ASYNC_FLUSH_NUM_WORKERS,
+        eviction_policy: str = DEFAULT_CACHE_EVICTION_POLICY,
+        pin_deeplake_objects: bool = False,
     ):
         """Initializes the LRUCache. It can be chained with other LRUCache objects to create multilayer caches.
 
@@ -43,13 +62,33 @@ class LRUCache(StorageProvider):
             cache_size (int): The total space that can be used from the cache_storage in bytes.
                 This number may be less than the actual space available on the cache_storage.
                 Setting it to a higher value than actually available space may lead to unexpected behaviors.
+            use_async (bool): If True, dirty items are written to next_storage in the background (write-behind) when they are
+                evicted or flushed, instead of blocking on every write. :meth:`flush` waits for all pending writes and raises the first error encountered.
+                Only applies if next_storage is a base provider, i.e. to the last layer of a chained cache.
+            async_max_in_flight_bytes (int): Maximum number of bytes that can be pending in the background at any time when ``use_async`` is True.
+                Evictions block once this budget is exhausted.
+            async_num_workers (int): Number of threads writing to next_storage when ``use_async`` is True.
+            eviction_policy (str): Decides which items are evicted when the cache is full. One of:
+
+                - ``"lru"``: Least recently used.
+                - ``"lfu"``: Least frequently used.
+                - ``"2q"``: Scan resistant. Items read again after being evicted are protected from one pass scans.
+                - ``"gdsf"``: Size aware. Prefers keeping small, frequently read items over large ones.
+            pin_deeplake_objects (bool): If True, items registered with :meth:`register_deeplake_object` (e.g. tensor metadata and encoders)
+                are never evicted.
+
+        Raises:
+            ValueError: If ``eviction_policy`` is not supported.
         """
         self.next_storage = next_storage
         self.cache_storage = cache_storage
         self.cache_size = cache_size
 
-        # tracks keys in lru order, stores size of value, only keys present in this exist in cache
+        # stores size of value, only keys present in this exist in cache. The eviction order is tracked by the policy.
         self.lru_sizes: OrderedDict[str, int] = OrderedDict()
+        self.eviction_policy = eviction_policy
+        self.pin_deeplake_objects = pin_deeplake_objects
+        self._policy: EvictionPolicy = get_eviction_policy(eviction_policy, cache_size)
 
         self.dirty_keys: Dict[str, None] = (
             OrderedDict() if sys.version_info < (3, 7) else {}  # type: ignore
@@ -57,25 +96,58 @@ class LRUCache(StorageProvider):
 
         self.cache_used = 0
         self.deeplake_objects: Dict[str, DeepLakeMemoryObject] = {}
-        # TODO: BRING THIS BACK AFTER ASYNC IS FIXED
-        # self.use_async = (
-        #     next_storage.async_supported()
-        #     if next_storage
-        #     else False and sys.version_info >= (3, 7) and sys.platform != "win32"
-        # )
-        self.use_async = False
+
+        self.async_max_in_flight_bytes = async_max_in_flight_bytes
+        self.async_num_workers = async_num_workers
+        self.use_async = use_async
+        self._uploader: Optional[WriteBehindUploader] = None
+        self._init_uploader()
+
+    def _init_uploader(self):
+        # an LRUCache is not thread safe, so only the last layer of a chain writes in the background
+        if (
+            self.use_async
+            and self.next_storage is not None
+            and not isinstance(self.next_storage, LRUCache)
+        ):
+            self._uploader = WriteBehindUploader(
+                self.next_storage,
+                num_workers=self.async_num_workers,
+                max_in_flight_bytes=self.async_max_in_flight_bytes,
+                on_write=self._record_write,
+            )
+        else:
+            self._uploader = None
+
+    def _get_pending(self, path: str):
+        """Returns the value at path if it is yet to be written to next_storage in the background, else None."""
+        if self._uploader is None:
+            return None
+        return self._uploader.get(path)
+
+    def _holds(self, path: str) -> bool:
+        """Whether the value at path is held by this layer, including values that are yet to be written to next_storage."""
+        return (
+            path in self.lru_sizes
+            or path in self.deeplake_objects
+            or self._get_pending(path) is not None
+        )
 
     def register_deeplake_object(self, path: str, obj: DeepLakeMemoryObject):
         """Registers a new object in the cache."""
         self.deeplake_objects[path] = obj
+        if self.pin_deeplake_objects:
+            self._policy.pin(path)
 
     def clear_deeplake_objects(self):
         """Removes all DeepLakeMemoryObjects from the cache."""
         self.deeplake_objects.clear()
+        self._policy.pinned.clear()
 
     def remove_deeplake_object(self, path: str):
         """Removes a DeepLakeMemoryObject from the cache."""
         self.deeplake_objects.pop(path, None)
+        self._policy.unpin(path)
 
     def update_used_cache_for_path(self, path: str, new_size: int):
         if new_size < 0:
@@ -85,6 +157,7 @@ class LRUCache(StorageProvider):
             self.cache_used -= old_size
         self.cache_used += new_size
         self.lru_sizes[path] = new_size
+        self._policy.on_insert(path, new_size)
 
     def flush(self):
         """Writes data from cache_storage to next_storage. Only the dirty keys are written.
@@ -93,26 +166,26 @@ class LRUCache(StorageProvider):
         self.check_readonly()
         initial_autoflush = self.autoflush
         self.autoflush = False
-        for path, obj in self.deeplake_objects.items():
-            if obj.is_dirty:
-                self[path] = obj
-                obj.is_dirty = False
-
-        if self.dirty_keys:
-            if hasattr(self.next_storage, "set_items") and self.use_async:
-                d = {
-                    key: obj_to_bytes(self.cache_storage[key])
-                    for key in self.dirty_keys
-                }
-                self.next_storage.set_items(d)
-                self.dirty_keys.clear()
-            else:
+        try:
+            for path, obj in self.deeplake_objects.items():
+                if obj.is_dirty:
+                    self[path] = obj
+                    obj.is_dirty = False
+
+            if self._uploader is not None:
+                self._uploader.retry_failed()
+
+            if self.dirty_keys:
                 for key in self.dirty_keys.copy():
                     self._forward(key)
                 if self.next_storage is not None:
                     self.next_storage.flush()
 
-        self.autoflush = initial_autoflush
+            if self._uploader is not None:
+                # barrier, raises the first error encountered by the background writes
+                self._uploader.wait()
+        finally:
+            self.autoflush = initial_autoflush
 
     def get_deeplake_object(
         self,
@@ -140,10 +213,12 @@ class LRUCache(StorageProvider):
         Returns:
             An instance of `expected_class` populated with the data.
         """
-        if partial_bytes != 0:
+        if (
+            partial_bytes != 0
+            and path not in self.lru_sizes
+            and path not in self.deeplake_objects
+        ):
             assert issubclass(expected_class, BaseChunk)
-            if path in self.lru_sizes:
-                return self[path]
             buff = self.get_bytes(path, 0, partial_bytes)
             obj = expected_class.frombuffer(buff, meta, partial=True)
             obj.data_bytes = PartialReader(self, path, header_offset=obj.header_bytes)
@@ -161,6 +236,8 @@ class LRUCache(StorageProvider):
                 raise ValueError(
                     "Expected class should be subclass of BaseChunk when url is True."
                 )
+        elif issubclass(expected_class, BaseChunk):
+            item = self.get_view(path)
         else:
             item = self[path]
 
@@ -172,11 +249,13 @@ class LRUCache(StorageProvider):
             return item
 
         if isinstance(item, (bytes, memoryview)):
-            obj = (
-                expected_class.frombuffer(item)
-                if meta is None
-                else expected_class.frombuffer(item, meta)
-            )
+            if _is_mapped(item):
+                # mapped files are read-only and are replaced rather than modified, so the chunk can share their memory
+                obj = expected_class.frombuffer(item, meta, copy=False)
+            elif meta is None:
+                obj = expected_class.frombuffer(item)
+            else:
+                obj = expected_class.frombuffer(item, meta)
 
             if obj.nbytes <= self.cache_size:
                 self._insert_in_cache(path, obj)
@@ -198,17 +277,48 @@ class LRUCache(StorageProvider):
         Returns:
             bytes: The bytes of the object present at the path.
         """
+        return self._get_item(path)
+
+    def get_view(self, path: str):
+        """Same as :meth:`__getitem__`, but reads with :meth:`StorageProvider.get_view` from cache_storage and next_storage.
+        The object may be returned as a memoryview of a memory mapped file.
+
+        Args:
+            path (str): The path relative to the root of the underlying storage.
+
+        Raises:
+            KeyError: if an object is not found at the path.
+
+        Returns:
+            The object present at the path.
+        """
+        return self._get_item(path, view=True)
+
+    def _get_item(self, path: str, view: bool = False):
         if path in self.deeplake_objects:
+            self.stats.increment("hits")
             if path in self.lru_sizes:
-                self.lru_sizes.move_to_end(path)  # refresh position for LRU
+                self._policy.on_access(path)
             return self.deeplake_objects[path]
         elif path in self.lru_sizes:
-            self.lru_sizes.move_to_end(path)  # refresh position for LRU
+            self.stats.increment("hits")
+            self._policy.on_access(path)
+            if view:
+                return self.cache_storage.get_view(path)
             return self.cache_storage[path]
         else:
             if self.next_storage is not None:
-                # fetch from storage, may throw KeyError
-                result = self.next_storage[path]
+                result = self._get_pending(path)
+                if result is None:
+                    # fetch from storage, may throw KeyError
+                    start = time.perf_counter()
+                    if view:
+                        result = self.next_storage.get_view(path)
+                    else:
+                        result = self.next_storage[path]
+                    self._record_read(start, _get_nbytes(result))
+                else:
+                    self.stats.increment("hits")
 
                 if _get_nbytes(result) <= self.cache_size:  # insert in cache if it fits
                     self._insert_in_cache(path, result)
@@ -236,21 +346,112 @@ class LRUCache(StorageProvider):
             KeyError: If an object is not found at the path.
         """
         if path in self.deeplake_objects:
+            self.stats.increment("hits")
             if path in self.lru_sizes:
-                self.lru_sizes.move_to_end(path)  # refresh position for LRU
+                self._policy.on_access(path)
             return self.deeplake_objects[path].tobytes()[start_byte:end_byte]
-        # if it is a partially read chunk in the cache, to get new bytes, we need to look at actual storage and not the cache
-        elif path in self.lru_sizes and not (
-            isinstance(self.cache_storage[path], BaseChunk)
-            and self.cache_storage[path].is_partially_read_chunk
-        ):
-            self.lru_sizes.move_to_end(path)  # refresh position for LRU
+        elif self._has_full_bytes_in_cache(path):
+            self.stats.increment("hits")
+            self._policy.on_access(path)
             return self.cache_storage[path][start_byte:end_byte]
         else:
             if self.next_storage is not None:
-                return self.next_storage.get_bytes(path, start_byte, end_byte)
+                pending = self._get_pending(path)
+                if pending is not None:
+                    self.stats.increment("hits")
+                    return pending[start_byte:end_byte]
+                start = time.perf_counter()
+                result = self.next_storage.get_bytes(path, start_byte, end_byte)
+                self._record_read(start, len(result))
+                return result
             raise KeyError(path)
 
+    def _has_full_bytes_in_cache(self, path: str) -> bool:
+        # if it is a partially read chunk in the cache, to get new bytes, we need to look at actual storage and not the cache
+        return path in self.lru_sizes and not (
+            isinstance(self.cache_storage[path], BaseChunk)
+            and self.cache_storage[path].is_partially_read_chunk
+        )
+
+    def get_items(self, paths: Sequence[str]) -> Dict[str, Any]:
+        """Gets the objects present at multiple paths. Paths present in the cache are served from cache_storage,
+        the rest are fetched from next_storage as a single batch and stored in cache_storage (if possible).
+
+        Args:
+            paths (Sequence[str]): The paths relative to the root of the underlying storage.
+
+        Returns:
+            Dict[str, Any]: Mapping from each path to the object present at it.
+
+        Raises:
+            KeyError: If an object is not found at any of the paths.
+        """
+        paths = list(dict.fromkeys(paths))
+        result: Dict[str, Any] = {}
+        missing = []
+        for path in paths:
+            if path in self.deeplake_objects or path in self.lru_sizes:
+                result[path] = self[path]
+                continue
+            pending = self._get_pending(path)
+            if pending is not None:
+                self.stats.increment("hits")
+                result[path] = pending
+            else:
+                missing.append(path)
+
+        if missing:
+            if self.next_storage is None:
+                raise KeyError(missing[0])
+            # fetch from storage, may throw KeyError
+            start = time.perf_counter()
+            fetched = self.next_storage.get_items(missing)
+            self._record_read(
+                start, sum(_get_nbytes(v) for v in fetched.values()), len(missing)
+            )
+            for path in missing:
+                value = fetched[path]
+                if _get_nbytes(value) <= self.cache_size:  # insert in cache if it fits
+                    self._insert_in_cache(path, value)
+                result[path] = value
+        return {path: result[path] for path in paths}
+
+    def get_bytes_many(self, ranges: Sequence[ByteRange]) -> List[bytes]:
+        """Gets multiple byte ranges. Ranges of paths present in the cache are served from cache_storage,
+        the rest are fetched from next_storage as a single batch. Partial reads are not stored in the cache.
+
+        Args:
+            ranges (Sequence[Tuple[str, Optional[int], Optional[int]]]): ``(path, start_byte, end_byte)`` tuples.
+
+        Returns:
+            List[bytes]: The bytes for each range, in the same order as ``ranges``.
+
+        Raises:
+            KeyError: If an object is not found at any of the paths.
+        """
+        result: List[Any] = [None] * len(ranges)
+        missing = []
+        for i, (path, start_byte, end_byte) in enumerate(ranges):
+            if path in self.deeplake_objects or self._has_full_bytes_in_cache(path):
+                result[i] = self.get_bytes(path, start_byte, end_byte)
+                continue
+            pending = self._get_pending(path)
+            if pending is not None:
+                self.stats.increment("hits")
+                result[i] = pending[start_byte:end_byte]
+            else:
+                missing.append(i)
+
+        if missing:
+            if self.next_storage is None:
+                raise KeyError(ranges[missing[0]][0])
+            start = time.perf_counter()
+            fetched = self.next_storage.get_bytes_many([ranges[i] for i in missing])
+            self._record_read(start, sum(map(len, fetched)), len(missing))
+            for i, value in zip(missing, fetched):
+                result[i] = value
+        return result
+
     def __setitem__(self, path: str, value: Union[bytes, DeepLakeMemoryObject]):
         """Puts the item in the cache_storage (if possible), else writes to next_storage.
 
@@ -273,6 +474,7 @@ class LRUCache(StorageProvider):
             self._insert_in_cache(path, value)
             self.dirty_keys[path] = None
         else:  # larger than cache, directly send to next layer
+            self._policy.on_remove(path)
             self._forward_value(path, value)
 
         self.maybe_flush()
@@ -295,12 +497,12 @@ class LRUCache(StorageProvider):
             deleted_from_cache = True
 
         if path in self.lru_sizes:
-            size = self.lru_sizes.pop(path)
-            self.cache_used -= size
-            del self.cache_storage[path]
-            self.dirty_keys.pop(path, None)
+            self._remove_from_cache(path)
             deleted_from_cache = True
 
+        if self._uploader is not None:
+            self._uploader.discard(path)
+
         try:
             if self.next_storage is not None:
                 del self.next_storage[path]
@@ -318,11 +520,14 @@ class LRUCache(StorageProvider):
         self.clear_cache_without_flush()
 
     def clear_cache_without_flush(self):
+        if self._uploader is not None:
+            self._uploader.clear()
         self.cache_used = 0
         self.lru_sizes.clear()
+        self._policy.clear()
         self.dirty_keys.clear()
         self.cache_storage.clear()
-        self.deeplake_objects.clear()
+        self.clear_deeplake_objects()
         if self.next_storage is not None and hasattr(self.next_storage, "clear_cache"):
             self.next_storage.clear_cache()
 
@@ -331,6 +536,8 @@ class LRUCache(StorageProvider):
         This is an IRREVERSIBLE operation. Data once deleted can not be recovered.
         """
         self.check_readonly()
+        if self._uploader is not None:
+            self._uploader.clear()
         if prefix:
             rm = [path for path in self.deeplake_objects if path.startswith(prefix)]
             for path in rm:
@@ -339,13 +546,15 @@ class LRUCache(StorageProvider):
             rm = [path for path in self.lru_sizes if path.startswith(prefix)]
             for path in rm:
                 size = self.lru_sizes.pop(path)
+                self._policy.on_remove(path)
                 self.cache_used -= size
                 self.dirty_keys.pop(path, None)
         else:
             self.cache_used = 0
             self.lru_sizes.clear()
+            self._policy.clear()
             self.dirty_keys.clear()
-            self.deeplake_objects.clear()
+            self.clear_deeplake_objects()
 
         self.cache_storage.clear(prefix=prefix)
         if self.next_storage is not None:
@@ -382,10 +591,32 @@ class LRUCache(StorageProvider):
         if self.next_storage is not None:
             self.dirty_keys.pop(path, None)
 
+            if self._uploader is not None:
+                # serialize now, the object may still be modified after it leaves the cache
+                self._uploader.submit(path, obj_to_bytes(value))
+                return
             if isinstance(value, DeepLakeMemoryObject):
-                self.next_storage[path] = value.tobytes()
-            else:
-                self.next_storage[path] = value
+                value = value.tobytes()
+            start = time.perf_counter()
+            self.next_storage[path] = value
+            self._record_write(len(value), time.perf_counter() - start)
+
+    def _record_read(self, start: float, nbytes: int, num_items: int = 1):
+        """Records a read of ``num_items`` items from the next storage, that started at ``start``."""
+        seconds = time.perf_counter() - start
+        self.stats.record("read", seconds, misses=num_items, bytes_in=nbytes)
+        next_storage = self.next_storage
+        if next_storage is not None and not isinstance(next_storage, LRUCache):
+            next_storage.stats.record(
+                "read", seconds, reads=num_items, bytes_read=nbytes
+            )
+
+    def _record_write(self, nbytes: int, seconds: float):
+        """Records a write to the next storage. Called from the uploader threads when writing in the background."""
+        self.stats.record("write", seconds, bytes_out=nbytes)
+        next_storage = self.next_storage
+        if next_storage is not None and not isinstance(next_storage, LRUCache):
+            next_storage.stats.record("write", seconds, writes=1, bytes_written=nbytes)
 
     def _free_up_space(self, extra_size: int):
         """Helper function that frees up space the requred space in cache.
@@ -395,15 +626,41 @@ class LRUCache(StorageProvider):
             extra_size (int): the space that needs is required in bytes.
         """
         while self.cache_used > 0 and extra_size + self.cache_used > self.cache_size:
-            self._pop_from_cache()
+            if not self._pop_from_cache():
+                # everything left in the cache is pinned
+                break
+
+    def _pop_from_cache(self) -> bool:
+        """Helper function that evicts the key, value pair chosen by the eviction policy from the cache.
 
-    def _pop_from_cache(self):
-        """Helper function that pops the least recently used key, value pair from the cache"""
-        key, itemsize = self.lru_sizes.popitem(last=False)
+        Returns:
+            bool: False if there was nothing that could be evicted.
+        """
+        key = self._policy.victim()
+        if key is None:
+            return False
+        self._policy.on_evict(key)
+        itemsize = self.lru_sizes.pop(key, None)
+        if itemsize is None:
+            # already removed from the cache without notifying the policy
+            return True
         if key in self.dirty_keys:
             self._forward(key)
         del self.cache_storage[key]
         self.cache_used -= itemsize
+        self.stats.increment("evictions")
+        return True
+
+    def _remove_from_cache(self, path: str):
+        """Helper function that drops the value at path from the cache, without writing it to the next storage."""
+        size = self.lru_sizes.pop(path)
+        self._policy.on_remove(path)
+        self.cache_used -= size
+        self.dirty_keys.pop(path, None)
+        try:
+            del self.cache_storage[path]
+        except KeyError:
+            pass
 
     def _insert_in_cache(self, path: str, value: Union[bytes, DeepLakeMemoryObject]):
         """Helper function that adds a key value pair to the cache.
@@ -431,6 +688,8 @@ class LRUCache(StorageProvider):
         if self.next_storage is not None:
             key_set = self.next_storage._all_keys()  # type: ignore
         key_set = set().union(key_set, self.cache_storage._all_keys())
+        if self._uploader is not None:
+            key_set.update(self._uploader.keys())
         for path, obj in self.deeplake_objects.items():
             if obj.is_dirty:
                 key_set.add(path)
@@ -452,6 +711,10 @@ class LRUCache(StorageProvider):
             "cache_storage": self.cache_storage,
             "cache_size": self.cache_size,
             "use_async": self.use_async,
+            "async_max_in_flight_bytes": self.async_max_in_flight_bytes,
+            "async_num_workers": self.async_num_workers,
+            "eviction_policy": self.eviction_policy,
+            "pin_deeplake_objects": self.pin_deeplake_objects,
         }
 
     def __setstate__(self, state: Dict[str, Any]):
@@ -471,6 +734,16 @@ class LRUCache(StorageProvider):
         self.cache_storage = state["cache_storage"]
         self.cache_size = state["cache_size"]
         self.use_async = state["use_async"]
+        self.async_max_in_flight_bytes = state.get(
+            "async_max_in_flight_bytes", ASYNC_FLUSH_MAX_IN_FLIGHT_SIZE
+        )
+        self.async_num_workers = state.get("async_num_workers", ASYNC_FLUSH_NUM_WORKERS)
+        self._init_uploader()
+        self.eviction_policy = state.get(
+            "eviction_policy", DEFAULT_CACHE_EVICTION_POLICY
+        )
+        self.pin_deeplake_objects = state.get("pin_deeplake_objects", False)
+        self._policy = get_eviction_policy(self.eviction_policy, self.cache_size)
         self.lru_sizes = OrderedDict()
         self.dirty_keys = OrderedDict()
         self.cache_used = 0
@@ -480,6 +753,10 @@ class LRUCache(StorageProvider):
         if key in self.deeplake_objects:
             return self.deeplake_objects[key].nbytes
 
+        pending = self._get_pending(key)
+        if pending is not None:
+            return len(pending)
+
         try:
             return self.cache_storage.get_object_size(key)
         except KeyError:
@@ -0,0 +1,276 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+
+from deeplake.core.storage.disk_cache import SharedCache
+from deeplake.core.storage.lru_cache import LRUCache
+from deeplake.core.storage.provider import StorageProvider
+
+
+def _get_fetch_storage(cache: LRUCache) -> StorageProvider:
+    """Returns the storage chunks are fetched from, i.e. the base storage of the cache chain, or the shared cache in front of it."""
+    storage: StorageProvider = cache
+    while isinstance(storage, LRUCache) and not isinstance(storage, SharedCache):
+        storage = storage.next_storage  # type: ignore
+    return storage
+
+
+_prefetch_executor: Optional[ThreadPoolExecutor] = None
+_prefetch_executor_key: Optional[Tuple[int, int]] = None
+_prefetch_executor_lock = threading.Lock()
+
+
+def get_prefetch_executor(num_workers: int) -> ThreadPoolExecutor:
+    """Returns the threads shared by all the prefetchers of the process to fetch chunks."""
+    global _prefetch_executor, _prefetch_executor_key
+    key = (os.getpid(), num_workers)
+    with _prefetch_executor_lock:
+        if _prefetch_executor_key != key:
+            # threads are not inherited by forked processes
+            if _prefetch_executor is not None and _prefetch_executor_key[0] == key[0]:  # type: ignore
+                _prefetch_executor.shutdown(wait=False)
+            _prefetch_executor = ThreadPoolExecutor(
+                max_workers=num_workers, thread_name_prefix="deeplake_prefetch"
+            )
+            _prefetch_executor_key = key
+        assert _prefetch_executor is not None
+        return _prefetch_executor
+
+
+class ChunkPrefetcher:
+    """Reads chunks ahead of a sequential reader and deposits them in an :class:`LRUCache`.
+
+    The reader announces the chunk keys it is going to read with :meth:`start` and calls :meth:`on_read` right before
+    reading each of them from the cache. The prefetcher keeps up to ``max_bytes_ahead`` bytes of upcoming chunks in flight
+    (or fetched but not yet read), downloading them from the base storage of the cache chain in background threads
+    shared by all the prefetchers of the process, see :func:`get_prefetch_executor`.
+    If the chain has a :class:`SharedCache`, the chunks are fetched through it, so that they are kept in the shared cache.
+    A fetched chunk is put in the cache only when it is read, so that prefetched chunks can not evict each other.
+
+    Reading a chunk that is not among the upcoming chunks is treated as random access and cancels the prefetching.
+    """
+
+    def __init__(
+        self,
+        cache: LRUCache,
+        max_bytes_ahead: int,
+        num_workers: int,
+        chunk_size_estimate: int,
+    ):
+        """Initializes the ChunkPrefetcher.
+
+        Args:
+            cache (LRUCache): The cache the chunks are read from and deposited in.
+            max_bytes_ahead (int): Maximum number of bytes fetched ahead of the reader. Capped at half the cache size.
+            num_workers (int): Number of threads used for fetching. The threads are shared with other prefetchers
+                that use the same number of threads.
+            chunk_size_estimate (int): Number of bytes reserved for a chunk that is still being fetched.
+
+        Raises:
+            ValueError: If ``num_workers`` is not positive.
+        """
+        if num_workers <= 0:
+            raise ValueError(f"`num_workers` must be > 0. Got: {num_workers}")
+        self.cache = cache
+        self.storage = _get_fetch_storage(cache)
+        self.max_bytes_ahead = max_bytes_ahead
+        self.num_workers = num_workers
+        self.chunk_size_estimate = chunk_size_estimate
+
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+        self._plan: Optional[Iterator[str]] = None
+        self._next_key: Optional[str] = None
+        self._window: OrderedDict[str, Future] = OrderedDict()
+        self._last_key: Optional[str] = None
+        self.reset_stats()
+
+    def reset_stats(self):
+        """Resets the hit / miss counters."""
+        self.hits = 0
+        self.misses = 0
+        self.cancellations = 0
+        self.bytes_fetched = 0
+        self.bytes_wasted = 0
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Counters describing how well the prefetcher keeps ahead of the reader.
+
+        - ``hits``: Chunks that were fetched, or were being fetched, by the time they were read.
+        - ``misses``: Chunks that the reader got to before the prefetcher, or whose fetch failed.
+        - ``cancellations``: Number of times the prefetching was cancelled because of random access.
+        - ``bytes_fetched``: Number of bytes fetched ahead of the reader that were read.
+        - ``bytes_wasted``: Number of bytes fetched ahead of the reader that were never read.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "cancellations": self.cancellations,
+            "bytes_fetched": self.bytes_fetched,
+            "bytes_wasted": self.bytes_wasted,
+        }
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Returns the configuration of the prefetcher, for pickling. Chunks being fetched are dropped."""
+        return {
+            "cache": self.cache,
+            "max_bytes_ahead": self.max_bytes_ahead,
+            "num_workers": self.num_workers,
+            "chunk_size_estimate": self.chunk_size_estimate,
+        }
+
+    def __setstate__(self, state: Dict[str, Any]):
+        self.__init__(**state)  # type: ignore
+
+    @property
+    def active(self) -> bool:
+        """Whether there are upcoming chunks that have not been read yet."""
+        return bool(self._window) or self._next_key is not None
+
+    def _check_pid(self):
+        # worker threads do not survive a fork, forget everything inherited from the parent process
+        pid = os.getpid()
+        if pid != self._pid:
+            self._pid = pid
+            self._lock = threading.Lock()
+            self._window = OrderedDict()
+            self._plan = self._next_key = None
+
+    def start(self, keys: Iterable[str]):
+        """Cancels any ongoing prefetching and starts fetching ahead along ``keys``.
+
+        Args:
+            keys (Iterable[str]): Keys of the chunks that are going to be read, in order. Consumed lazily.
+        """
+        self._check_pid()
+        self.cancel()
+        self._plan = iter(keys)
+        self._advance_plan()
+        self._fill()
+
+    def cancel(self):
+        """Stops fetching ahead and drops the chunks that were fetched but not read."""
+        self._drop_window()
+        self._plan = self._next_key = None
+
+    def on_read(self, key: str):
+        """Notifies the prefetcher that the chunk at ``key`` is about to be read from the cache.
+
+        If the chunk was fetched ahead, waits for the fetch to finish and deposits the chunk in the cache.
+        If the chunk is not among the upcoming chunks, the prefetching is cancelled.
+
+        Args:
+            key (str): Key of the chunk being read.
+        """
+        if key == self._last_key:
+            return
+        self._check_pid()
+        self._last_key = key
+        if not self.active:
+            return
+        window = self._window
+        if key in window:
+            # chunks that were skipped by the reader will not be read anymore
+            while True:
+                k, future = window.popitem(last=False)
+                if k == key:
+                    break
+                self._discard(future)
+            value = self._result(future)
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._deposit(key, value)
+        elif key == self._next_key:
+            self._drop_window()
+            self.misses += 1
+            self._advance_plan()
+        elif self._in_cache(key):
+            return
+        else:
+            self.cancellations += 1
+            self.cancel()
+            return
+        self._fill()
+
+    def _advance_plan(self):
+        self._next_key = next(self._plan, None) if self._plan is not None else None  # type: ignore
+
+    def _in_cache(self, key: str) -> bool:
+        """Whether ``key`` is held by any of the cache layers, or is being written to the base storage."""
+        cache: Any = self.cache
+        while isinstance(cache, LRUCache):
+            if cache._holds(key):
+                return True
+            cache = cache.next_storage
+        return False
+
+    def _fill(self):
+        """Schedules upcoming chunks until the bytes ahead budget is used up."""
+        budget = min(self.max_bytes_ahead, self.cache.cache_size // 2)
+        used = sum(map(self._size, self._window.values()))
+        while self._next_key is not None:
+            key = self._next_key
+            if self._in_cache(key):
+                self._advance_plan()
+                continue
+            if self._window and used + self.chunk_size_estimate > budget:
+                break
+            if key not in self._window:
+                self._window[key] = get_prefetch_executor(self.num_workers).submit(
+                    self._fetch, key
+                )
+                used += self.chunk_size_estimate
+            self._advance_plan()
+
+    def _fetch(self, key: str) -> bytes:
+        if isinstance(self.storage, LRUCache):
+            # cache layers record their own statistics
+            return self.storage.get_view(key)
+        start = time.perf_counter()
+        value = self.storage.get_view(key)
+        self.storage.stats.record(
+            "read", time.perf_counter() - start, reads=1, bytes_read=len(value)
+        )
+        return value
+
+    def _size(self, future: Future) -> int:
+        if future.done():
+            value = self._result(future)
+            return 0 if value is None else len(value)
+        return self.chunk_size_estimate
+
+    @staticmethod
+    def _result(future: Future) -> Optional[bytes]:
+        try:
+            return future.result()
+        except Exception:
+            # errors are raised with context when the chunk is read from the cache
+            return None
+
+    def _drop_window(self):
+        for future in self._window.values():
+            self._discard(future)
+        self._window.clear()
+
+    def _discard(self, future: Future):
+        if not future.cancel():
+            future.add_done_callback(self._count_wasted)
+
+    def _count_wasted(self, future: Future):
+        # called from the fetching threads
+        value = self._result(future)
+        if value is not None:
+            with self._lock:
+                self.bytes_wasted += len(value)
+
+    def _deposit(self, key: str, value: bytes):
+        self.bytes_fetched += len(value)
+        if not self._in_cache(key) and len(value) <= self.cache.cache_size:
+            self.cache._insert_in_cache(key, value)
+            self.cache.stats.increment("prefetched")
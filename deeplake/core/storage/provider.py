@@ -1,8 +1,13 @@
+import asyncio
+import functools
+import os
 from abc import ABC, abstractmethod
 from collections.abc import MutableMapping
-from typing import Optional, Set, Sequence, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Set, Sequence, Tuple
 
 from deeplake.constants import BYTE_PADDING
+from deeplake.core.storage.stats import StorageStats
 from deeplake.util.assert_byte_indexes import assert_byte_indexes
 from deeplake.util.exceptions import ReadOnlyModeError
 from deeplake.util.keys import get_dataset_lock_key
@@ -11,6 +16,31 @@ import threading
 
 _STORAGES: Dict[str, "StorageProvider"] = {}
 
+ByteRange = Tuple[str, Optional[int], Optional[int]]
+
+_batch_read_executors: Dict[int, ThreadPoolExecutor] = {}
+_batch_read_executors_pid: Optional[int] = None
+_batch_read_executors_lock = threading.Lock()
+
+
+def get_batch_read_executor(num_workers: int) -> ThreadPoolExecutor:
+    """Returns the threads shared by all the providers of the process that issue ``num_workers`` concurrent requests
+    in :meth:`StorageProvider.get_items` and :meth:`StorageProvider.get_bytes_many`."""
+    global _batch_read_executors_pid
+    pid = os.getpid()
+    with _batch_read_executors_lock:
+        if _batch_read_executors_pid != pid:
+            # threads are not inherited by forked processes
+            _batch_read_executors.clear()
+            _batch_read_executors_pid = pid
+        executor = _batch_read_executors.get(num_workers)
+        if executor is None:
+            executor = ThreadPoolExecutor(
+                max_workers=num_workers, thread_name_prefix="deeplake_batch_read"
+            )
+            _batch_read_executors[num_workers] = executor
+        return executor
+
 
 def storage_factory(cls, root: str = "", *args, **kwargs) -> "StorageProvider":
     if cls.__name__ == "MemoryProvider":
@@ -29,12 +59,29 @@ class StorageProvider(ABC, MutableMapping):
     read_only = False
     root = ""
     _is_hub_path = False
+    # number of requests issued concurrently by `get_items` and `get_bytes_many`
+    batch_read_workers = 1
+    _stats: Optional[StorageStats] = None
 
     """An abstract base class for implementing a storage provider.
 
     To add a new provider using Provider, create a subclass and implement all 5 abstract methods below.
     """
 
+    @property
+    def supports_partial_reads(self) -> bool:
+        """Whether :meth:`get_bytes` reads only the requested bytes, so that chunks can be loaded header first and their
+        data paged in on demand, see :class:`PartialReader`. Providers may override it with a class attribute."""
+        return False
+
+    @property
+    def stats(self) -> StorageStats:
+        """Counters and latencies of the requests made to this provider by a cache chain, or of the cache layer itself
+        for :class:`LRUCache`. See :meth:`Dataset.storage_stats`."""
+        if self._stats is None:
+            self._stats = StorageStats()
+        return self._stats
+
     @abstractmethod
     def __getitem__(self, path: str):
         """Gets the object present at the path within the given byte range.
@@ -72,6 +119,58 @@ class StorageProvider(ABC, MutableMapping):
         assert_byte_indexes(start_byte, end_byte)
         return self[path][start_byte:end_byte]
 
+    def get_view(self, path: str):
+        """Gets the object present at the path as a read-only buffer. Providers may return a memoryview that shares
+        memory with the storage (e.g. a memory mapped file) instead of a copy of the object.
+
+        Args:
+            path (str): The path relative to the root of the provider.
+
+        Returns:
+            bytes or memoryview: The bytes of the object present at the path.
+
+        Raises:
+            KeyError: If an object is not found at the path.
+        """
+        return self[path]
+
+    def _map_batch(self, fn: Callable, args: Sequence) -> List:
+        """Applies ``fn`` to every element of ``args``, using up to ``batch_read_workers`` threads."""
+        if min(self.batch_read_workers, len(args)) <= 1:
+            return list(map(fn, args))
+        executor = get_batch_read_executor(self.batch_read_workers)
+        return list(executor.map(fn, args))
+
+    def get_items(self, paths: Sequence[str]) -> Dict[str, Any]:
+        """Gets the objects present at multiple paths. Providers backed by remote storage fetch them concurrently.
+
+        Args:
+            paths (Sequence[str]): The paths relative to the root of the provider.
+
+        Returns:
+            Dict[str, Any]: Mapping from each path to the object present at it.
+
+        Raises:
+            KeyError: If an object is not found at any of the paths.
+        """
+        paths = list(dict.fromkeys(paths))
+        return dict(zip(paths, self._map_batch(self.__getitem__, paths)))
+
+    def get_bytes_many(self, ranges: Sequence[ByteRange]) -> List[bytes]:
+        """Gets multiple byte ranges. Providers backed by remote storage fetch them concurrently.
+
+        Args:
+            ranges (Sequence[Tuple[str, Optional[int], Optional[int]]]): ``(path, start_byte, end_byte)`` tuples, with the same meaning as the
+                arguments of :meth:`get_bytes`.
+
+        Returns:
+            List[bytes]: The bytes for each range, in the same order as ``ranges``.
+
+        Raises:
+            KeyError: If an object is not found at any of the paths.
+        """
+        return self._map_batch(lambda r: self.get_bytes(*r), ranges)
+
     @abstractmethod
     def __setitem__(self, path: str, value: bytes):
         """Sets the object present at the path with the value
@@ -210,4 +309,68 @@ class StorageProvider(ABC, MutableMapping):
         raise NotImplementedError()
 
     def async_supported(self) -> bool:
+        """Whether the ``a*`` methods of the provider are native coroutines. Otherwise they run the synchronous methods
+        in the default executor of the event loop."""
         return False
+
+    async def _run_sync(self, fn: Callable, *args):
+        """Runs ``fn(*args)`` in the default executor of the running event loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(fn, *args))
+
+    async def aget(self, path: str):
+        """Asynchronous version of ``provider[path]``.
+
+        Raises:
+            KeyError: If an object is not found at the path.
+        """
+        return await self._run_sync(self.__getitem__, path)
+
+    async def aget_bytes(
+        self,
+        path: str,
+        start_byte: Optional[int] = None,
+        end_byte: Optional[int] = None,
+    ):
+        """Asynchronous version of :meth:`get_bytes`."""
+        return await self._run_sync(self.get_bytes, path, start_byte, end_byte)
+
+    async def aget_bytes_many(self, ranges: Sequence[ByteRange]) -> List[bytes]:
+        """Asynchronous version of :meth:`get_bytes_many`. All the ranges are requested concurrently.
+
+        Raises:
+            KeyError: If an object is not found at any of the paths.
+        """
+        return list(await asyncio.gather(*(self.aget_bytes(*r) for r in ranges)))
+
+    async def aset(self, path: str, value: bytes):
+        """Asynchronous version of ``provider[path] = value``.
+
+        Raises:
+            ReadOnlyModeError: If the provider is in read-only mode.
+        """
+        self.check_readonly()
+        await self._run_sync(self.__setitem__, path, value)
+
+    async def adelete(self, path: str):
+        """Asynchronous version of ``del provider[path]``.
+
+        Raises:
+            KeyError: If an object is not found at the path.
+            ReadOnlyModeError: If the provider is in read-only mode.
+        """
+        self.check_readonly()
+        await self._run_sync(self.__delitem__, path)
+
+    async def alist(self) -> List[str]:
+        """Asynchronously lists the keys of all the objects present at the root of the provider."""
+        return await self._run_sync(lambda: list(self._all_keys()))
+
+    async def _async_close(self):
+        """Releases what the ``a*`` methods of the provider hold for the running event loop, e.g. open clients."""
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self._async_close()
@@ -1,14 +1,20 @@
+import asyncio
 import deeplake
 from math import ceil
+import os
+import threading
 import time
+import weakref
 import boto3
 import botocore  # type: ignore
 import posixpath
-from typing import Dict, Optional, Tuple, Type
+from botocore.config import Config  # type: ignore
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type
 from datetime import datetime, timezone
 from botocore.session import ComponentLocator
 from deeplake.client.client import DeepLakeBackendClient
-from deeplake.core.storage.provider import StorageProvider
+from deeplake.constants import S3_MAX_POOL_CONNECTIONS, STORAGE_BATCH_READ_WORKERS
+from deeplake.core.storage.provider import ByteRange, StorageProvider
 from deeplake.util.exceptions import (
     S3GetAccessError,
     S3DeletionError,
@@ -45,13 +51,116 @@ except ImportError:
 
 try:
     import aioboto3  # type: ignore
-    import asyncio  # type: ignore
     import nest_asyncio  # type: ignore
 
     nest_asyncio.apply()  # needed to run asyncio in jupyter notebook
 except Exception:
     aioboto3 = None  # type: ignore
-    asyncio = None  # type: ignore
+
+
+# client arguments that are not part of the key of the clients of `S3ClientPool`
+_CREDENTIAL_ARGS = ("aws_access_key_id", "aws_secret_access_key", "aws_session_token")
+
+
+async def _close_async_client(task: "asyncio.Task"):
+    """Closes an async client opened by :meth:`S3Provider._async_client`."""
+    try:
+        _, context, _ = await task
+    except Exception:
+        return
+    await context.__aexit__(None, None, None)
+
+
+class S3ClientPool:
+    """Process wide pool of S3 clients and resources, shared by all the :class:`S3Provider` objects with the same
+    credentials, region, endpoint and client config, e.g. subdirectories of a provider, unpickled copies of it and providers
+    created for linked tensors. Each client keeps its connections alive and reuses them across requests, so sharing clients
+    bounds the number of open connections to ``max_pool_connections`` per profile and endpoint instead of per provider.
+
+    The pool holds one client per profile, region, endpoint and client config. When it is asked for a client with other
+    credentials, e.g. after they expired and were refreshed, the new client replaces the old one, so the pool does not grow
+    with every rotation of the credentials.
+
+    Clients can not be used across a fork, so the pool is emptied in child processes.
+    """
+
+    def __init__(self, max_pool_connections: int = S3_MAX_POOL_CONNECTIONS):
+        """Initializes the pool.
+
+        Args:
+            max_pool_connections (int): Maximum number of connections kept open by each client. Overrides the
+                ``max_pool_connections`` of the client config if larger.
+
+        Raises:
+            ValueError: If ``max_pool_connections`` is not positive.
+        """
+        if max_pool_connections <= 0:
+            raise ValueError(
+                f"`max_pool_connections` must be > 0. Got: {max_pool_connections}"
+            )
+        self.max_pool_connections = max_pool_connections
+        self.reset()
+
+    def reset(self):
+        """Drops all the clients. Providers that already have a client keep using it."""
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+        self._entries: Dict[Tuple, Tuple[Tuple, Any, Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _config(self, config: Optional[Config]) -> Config:
+        config = config or Config()
+        max_pool_connections = max(
+            config.max_pool_connections or 0, self.max_pool_connections  # type: ignore
+        )
+        return config.merge(
+            Config(max_pool_connections=max_pool_connections, tcp_keepalive=True)
+        )
+
+    def get(
+        self, profile_name: Optional[str], config: Optional[Config], **kwargs
+    ) -> Tuple[Any, Any]:
+        """Returns the client and resource for the given profile, client config and client arguments, creating them if needed.
+
+        Args:
+            profile_name (str, optional): The AWS profile of the session the client is created from.
+            config (Config, optional): The client config.
+            **kwargs: Arguments of the client, i.e. credentials, ``region_name`` and ``endpoint_url``.
+
+        Returns:
+            Tuple: The client and the resource.
+        """
+        if self._pid != os.getpid():
+            self.reset()
+        options = config._user_provided_options if config is not None else {}  # type: ignore
+        credentials = tuple(kwargs.get(arg) for arg in _CREDENTIAL_ARGS)
+        client_args = {k: v for k, v in kwargs.items() if k not in _CREDENTIAL_ARGS}
+        key = (
+            profile_name,
+            repr(sorted(options.items())),
+            tuple(sorted(client_args.items())),
+        )
+        entry = self._entries.get(key)
+        if entry is None or entry[0] != credentials:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is None or entry[0] != credentials:
+                    config = self._config(config)
+                    session = boto3.session.Session(profile_name=profile_name)
+                    entry = self._entries[key] = (
+                        credentials,
+                        session.client("s3", config=config, **kwargs),
+                        session.resource("s3", config=config, **kwargs),
+                    )
+        return entry[1], entry[2]
+
+
+s3_client_pool = S3ClientPool()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=s3_client_pool.reset)
 
 
 class S3ResetReloadCredentialsManager:
@@ -77,6 +186,9 @@ class S3ResetReloadCredentialsManager:
 class S3Provider(StorageProvider):
     """Provider class for using S3 storage."""
 
+    batch_read_workers = STORAGE_BATCH_READ_WORKERS
+    supports_partial_reads = True
+
     def __init__(
         self,
         root: str,
@@ -126,12 +238,13 @@ class S3Provider(StorageProvider):
         self.client_config = deeplake.config["s3"]
         self.start_time = time.time()
         self.profile_name = profile_name
+        self._async_clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
         self._initialize_s3_parameters()
         self._presigned_urls: Dict[str, Tuple[str, float]] = {}
         self.creds_used: Optional[str] = None
 
     def async_supported(self) -> bool:
-        return asyncio is not None
+        return aioboto3 is not None
 
     def subdir(self, path: str, read_only: bool = False):
         sd = self.__class__(
@@ -216,19 +329,22 @@ class S3Provider(StorageProvider):
         """
         return self.get_bytes(path)
 
-    def _get_bytes(
-        self, path, start_byte: Optional[int] = None, end_byte: Optional[int] = None
-    ):
+    @staticmethod
+    def _range_header(start_byte: Optional[int], end_byte: Optional[int]) -> str:
         if start_byte is not None and end_byte is not None:
-            if start_byte == end_byte:
-                return b""
-            range = f"bytes={start_byte}-{end_byte - 1}"
+            return f"bytes={start_byte}-{end_byte - 1}"
         elif start_byte is not None:
-            range = f"bytes={start_byte}-"
+            return f"bytes={start_byte}-"
         elif end_byte is not None:
-            range = f"bytes=0-{end_byte - 1}"
-        else:
-            range = ""
+            return f"bytes=0-{end_byte - 1}"
+        return ""
+
+    def _get_bytes(
+        self, path, start_byte: Optional[int] = None, end_byte: Optional[int] = None
+    ):
+        if start_byte is not None and start_byte == end_byte:
+            return b""
+        range = self._range_header(start_byte, end_byte)
         resp = self.client.get_object(Bucket=self.bucket, Key=path, Range=range)
         return resp["Body"].read()
 
@@ -325,23 +441,175 @@ class S3Provider(StorageProvider):
         except Exception as err:
             raise S3DeletionError(err) from err
 
+    async def _async_client(self):
+        """Returns the async client of the provider for the running event loop. The client, along with its connection
+        pool, is kept open across calls, until :meth:`_async_close` is called, e.g. by leaving ``async with provider:``,
+        or the credentials are rotated."""
+        self._check_update_creds()
+        loop = asyncio.get_running_loop()
+        session = self.async_session
+        task = self._async_clients.get(loop)
+        if task is not None and task.done():
+            if task.exception() is not None:
+                task = None
+            elif task.result()[0] is not session:
+                # credentials were rotated
+                await _close_async_client(task)
+                task = None
+        if task is None:
+            # concurrent callers wait for the same client
+            task = loop.create_task(self._open_async_client(session))
+            self._async_clients[loop] = task
+        return (await task)[2]
+
+    async def _open_async_client(self, session):
+        context = session.client("s3", **self.s3_kwargs)
+        return session, context, await context.__aenter__()
+
+    async def _async_close(self):
+        """Closes the async client of the provider for the running event loop, if it has one."""
+        task = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if task is not None:
+            await _close_async_client(task)
+
+    def __del__(self):
+        # event loops can not be driven from a finalizer, which may run inside another loop or at interpreter shutdown
+        tasks = list(getattr(self, "_async_clients", {}).values())
+        if any(
+            not task.done() or (not task.cancelled() and task.exception() is None)
+            for task in tasks
+        ):
+            always_warn(
+                "S3Provider was deleted with an open async client. Use `async with provider:` or await "
+                "`provider._async_close()` in the event loop the provider was used in to close it.",
+                ResourceWarning,
+            )
+
+    async def _aget_bytes(
+        self,
+        client,
+        path: str,
+        start_byte: Optional[int] = None,
+        end_byte: Optional[int] = None,
+    ):
+        if start_byte is not None and start_byte == end_byte:
+            return b""
+        kwargs = {"Bucket": self.bucket, "Key": "".join((self.path, path))}
+        range = self._range_header(start_byte, end_byte)
+        if range:
+            kwargs["Range"] = range
+        try:
+            resp = await client.get_object(**kwargs)
+            async with resp["Body"] as body:
+                return await body.read()
+        except botocore.exceptions.ClientError as err:
+            if err.response["Error"]["Code"] == "NoSuchKey":
+                raise KeyError(err) from err
+        except Exception:
+            pass
+        # expired credentials and connection errors are handled by the synchronous implementation
+        return await super().aget_bytes(path, start_byte, end_byte)
+
+    async def aget(self, path: str):
+        return await self.aget_bytes(path)
+
+    async def aget_bytes(
+        self,
+        path: str,
+        start_byte: Optional[int] = None,
+        end_byte: Optional[int] = None,
+    ):
+        """Asynchronous version of :meth:`get_bytes`. Uses ``aioboto3`` if it is installed."""
+        if not self.async_supported():
+            return await super().aget_bytes(path, start_byte, end_byte)
+        client = await self._async_client()
+        return await self._aget_bytes(client, path, start_byte, end_byte)
+
+    async def aget_bytes_many(self, ranges: Sequence[ByteRange]) -> List[bytes]:
+        """Asynchronous version of :meth:`get_bytes_many`. With ``aioboto3``, all the ranges are requested concurrently
+        over the connections of the async client of the provider."""
+        if not self.async_supported():
+            return await super().aget_bytes_many(ranges)
+        client = await self._async_client()
+        return list(
+            await asyncio.gather(*(self._aget_bytes(client, *r) for r in ranges))
+        )
+
+    async def aset(self, path: str, value: bytes):
+        """Asynchronous version of ``provider[path] = value``. Uses ``aioboto3`` if it is installed.
+
+        Raises:
+            S3SetError: Any S3 error encountered while setting the value at the path.
+            ReadOnlyError: If the provider is in read-only mode.
+        """
+        self.check_readonly()
+        if self.async_supported():
+            try:
+                client = await self._async_client()
+                await client.put_object(
+                    Bucket=self.bucket,
+                    Body=bytes(memoryview(value)),
+                    Key="".join((self.path, path)),
+                    ContentType="application/octet-stream",
+                )
+                return
+            except Exception:
+                pass
+        await super().aset(path, value)
+
+    async def adelete(self, path: str):
+        """Asynchronous version of ``del provider[path]``. Uses ``aioboto3`` if it is installed.
+
+        Raises:
+            S3DeletionError: Any S3 error encountered while deleting the object.
+            ReadOnlyError: If the provider is in read-only mode.
+        """
+        self.check_readonly()
+        if self.async_supported():
+            try:
+                client = await self._async_client()
+                await client.delete_object(
+                    Bucket=self.bucket, Key="".join((self.path, path))
+                )
+                return
+            except Exception:
+                pass
+        await super().adelete(path)
+
+    async def alist(self) -> List[str]:
+        """Asynchronously lists the keys of all the objects present at the root of the provider."""
+        if not self.async_supported():
+            return await super().alist()
+        client = await self._async_client()
+        paginator = client.get_paginator("list_objects_v2")
+        return [
+            self._relative_key(content["Key"])
+            async for page in paginator.paginate(**self._list_kwargs())
+            for content in page.get("Contents", ())
+        ]
+
     @property
     def num_tries(self):
         return min(ceil((time.time() - self.start_time) / 300), 5)
 
-    def _keys_iterator(self):
-        self._check_update_creds()
+    def _list_kwargs(self) -> Dict[str, str]:
         prefix = self.path
         start_after = ""
         prefix = prefix[1:] if prefix.startswith("/") else prefix
         start_after = (start_after or prefix) if prefix.endswith("/") else start_after
+        return {"Bucket": self.bucket, "Prefix": prefix, "StartAfter": start_after}
+
+    def _keys_iterator(self):
+        self._check_update_creds()
         paginator = self.client.get_paginator("list_objects_v2")
-        for page in paginator.paginate(
-            Bucket=self.bucket, Prefix=prefix, StartAfter=start_after
-        ):
+        for page in paginator.paginate(**self._list_kwargs()):
             for content in page.get("Contents", ()):
                 yield content["Key"]
 
+    def _relative_key(self, name: str) -> str:
+        len_path = len(self.path.split("/")) - 1
+        return "/".join(name.split("/")[len_path:])
+
     def _all_keys(self):
         """Helper function that lists all the objects present at the root of the S3Provider.
 
@@ -351,8 +619,7 @@ class S3Provider(StorageProvider):
         Raises:
             S3ListError: Any S3 error encountered while listing the objects.
         """
-        len_path = len(self.path.split("/")) - 1
-        return ("/".join(name.split("/")[len_path:]) for name in self._keys_iterator())
+        return map(self._relative_key, self._keys_iterator())
 
     def __len__(self):
         """Returns the number of files present at the root of the S3Provider.
@@ -459,6 +726,7 @@ class S3Provider(StorageProvider):
         assert set(state.keys()) == self._state_keys()
         self.__dict__.update(state)
         self.start_time = time.time()
+        self._async_clients = weakref.WeakKeyDictionary()
         self._initialize_s3_parameters()
 
     def _set_bucket_and_path(self):
@@ -548,9 +816,10 @@ class S3Provider(StorageProvider):
 
     def _set_s3_client_and_resource(self):
         kwargs = self.s3_kwargs
-        session = boto3.session.Session(profile_name=self.profile_name)
-        self.client = session.client("s3", **kwargs)
-        self.resource = session.resource("s3", **kwargs)
+        config = kwargs.pop("config")
+        self.client, self.resource = s3_client_pool.get(
+            self.profile_name, config, **kwargs
+        )
         if aioboto3 is not None:
             self.async_session = aioboto3.session.Session(
                 profile_name=self.profile_name
@@ -642,43 +911,3 @@ class S3Provider(StorageProvider):
             raise S3GetError(err) from err
         except Exception as err:
             raise S3GetError(err) from err
-
-    def _set_items(self, items: dict):
-        async def set_items_async(items):
-            async with self.async_session.client("s3", **self.s3_kwargs) as client:
-                tasks = []
-                for k, v in items.items():
-                    tasks.append(
-                        asyncio.ensure_future(
-                            client.put_object(
-                                Bucket=self.bucket, Key=self.path + k, Body=v
-                            )
-                        )
-                    )
-                await asyncio.gather(*tasks)
-
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        loop.run_until_complete(set_items_async(items))
-
-    def set_items(self, items: dict):
-        try:
-            self._set_items(items)
-        except botocore.exceptions.ClientError as err:
-            with S3ResetReloadCredentialsManager(self, S3SetError):
-                self._set_items(items)
-        except CONNECTION_ERRORS as err:
-            tries = self.num_tries
-            for i in range(1, tries + 1):
-                always_warn(f"Encountered connection error, retry {i} out of {tries}")
-                try:
-                    self._set_items(items)
-                    always_warn(
-                        f"Connection re-established after {i} {['retries', 'retry'][i==1]}."
-                    )
-                    return
-                except Exception:
-                    pass
-            raise S3SetError(err) from err
-        except Exception as err:
-            raise S3SetError(err) from err
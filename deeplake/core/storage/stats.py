@@ -0,0 +1,91 @@
+import threading
+from collections import deque
+from typing import Any, Deque, Dict
+
+import numpy as np
+
+from deeplake.constants import STORAGE_STATS_LATENCY_SAMPLES
+
+
+class StorageStats:
+    """Counters and latency samples collected by a storage provider or a cache layer.
+
+    Counters are arbitrary names mapped to integers, e.g. ``hits`` or ``bytes_read``. Latencies are recorded per operation
+    (e.g. ``read``, ``write``) and summarized as percentiles over the most recent ``max_samples`` operations.
+    Safe to update from multiple threads.
+    """
+
+    def __init__(self, max_samples: int = STORAGE_STATS_LATENCY_SAMPLES):
+        """Initializes the StorageStats.
+
+        Args:
+            max_samples (int): Number of latency samples kept per operation.
+
+        Raises:
+            ValueError: If ``max_samples`` is not positive.
+        """
+        if max_samples <= 0:
+            raise ValueError(f"`max_samples` must be > 0. Got: {max_samples}")
+        self.max_samples = max_samples
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Sets all counters to 0 and drops the latency samples."""
+        with self._lock:
+            self._counters: Dict[str, int] = {}
+            self._op_counts: Dict[str, int] = {}
+            self._latencies: Dict[str, Deque[float]] = {}
+
+    def increment(self, name: str, value: int = 1):
+        """Adds ``value`` to the counter ``name``."""
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def record(self, op: str, seconds: float, **counters: int):
+        """Records a latency sample for ``op`` and increments ``counters``.
+
+        Args:
+            op (str): Name of the operation.
+            seconds (float): Duration of the operation in seconds.
+            **counters (int): Counters to increment along with the sample, e.g. ``bytes_read=1024``.
+        """
+        with self._lock:
+            self._op_counts[op] = self._op_counts.get(op, 0) + 1
+            samples = self._latencies.get(op)
+            if samples is None:
+                samples = self._latencies[op] = deque(maxlen=self.max_samples)
+            samples.append(seconds)
+            for name, value in counters.items():
+                self._counters[name] = self._counters.get(name, 0) + value
+
+    def __getitem__(self, name: str) -> int:
+        return self._counters.get(name, 0)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns the counters, along with a ``latency`` entry mapping each operation to its count and
+        mean / p50 / p90 / p99 / max latency in milliseconds."""
+        with self._lock:
+            result: Dict[str, Any] = dict(self._counters)
+            latencies = {op: np.array(v) * 1000 for op, v in self._latencies.items()}
+            op_counts = dict(self._op_counts)
+        summary = {}
+        for op, samples in latencies.items():
+            p50, p90, p99 = np.percentile(samples, [50, 90, 99])
+            summary[op] = {
+                "count": op_counts[op],
+                "mean_ms": float(samples.mean()),
+                "p50_ms": float(p50),
+                "p90_ms": float(p90),
+                "p99_ms": float(p99),
+                "max_ms": float(samples.max()),
+            }
+        result["latency"] = summary
+        return result
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Statistics are not carried over when pickled."""
+        return {"max_samples": self.max_samples}
+
+    def __setstate__(self, state: Dict[str, Any]):
+        self.__init__(**state)  # type: ignore
@@ -1,4 +1,8 @@
+import asyncio
+import boto3
+import botocore  # type: ignore
 import json
+import gc
 from deeplake.tests.path_fixtures import gcs_creds
 from deeplake.tests.common import is_opt_true
 from deeplake.tests.storage_fixtures import (
@@ -9,14 +13,39 @@ from deeplake.tests.cache_fixtures import enabled_cache_chains
 from deeplake.core.storage.gcs import GCloudCredentials
 from deeplake.core.storage.google_drive import GDriveProvider
 from deeplake.core.storage.azure import AzureProvider
-from deeplake.util.exceptions import GCSDefaultCredsNotFoundError
+from deeplake.core.storage.disk_cache import DiskCache
+from deeplake.core.storage.eviction import get_eviction_policy
+from deeplake.core.storage.local import LocalProvider
+from deeplake.core.storage.lru_cache import LRUCache, _is_mapped
+from deeplake.core.storage.memory import MemoryProvider
+from deeplake.core.storage.s3 import S3Provider, s3_client_pool
+from deeplake.core.storage.prefetcher import ChunkPrefetcher
+from deeplake.core.storage.provider import get_batch_read_executor
+from deeplake.core.partial_reader import PartialReader, coalesce_ranges
+from deeplake.core.chunk_engine import ChunkEngine
+from deeplake.util.exceptions import GCSDefaultCredsNotFoundError, S3SetError
+from deeplake.util.keys import is_chunk_key
 from google.oauth2.credentials import Credentials  # type: ignore
+from contextlib import asynccontextmanager
+from unittest.mock import patch
+import numpy as np
+import deeplake
+import multiprocessing
 import os
 import pytest
-from deeplake.constants import MB, GCS_OPT, GDRIVE_OPT
+import shutil
+import threading
+import time
+from deeplake.constants import (
+    KB,
+    MB,
+    BENCHMARKS_OPT,
+    GCS_OPT,
+    GDRIVE_OPT,
+    S3_MAX_POOL_CONNECTIONS,
+)
 import pickle
 
-
 KEY = "file"
 
 
@@ -42,6 +71,16 @@ def check_storage_provider(storage):
     storage.set_bytes(FILE_2, b"new_text", overwrite=True)
     assert storage[FILE_2] == b"new_text"
 
+    assert storage.get_items([FILE_1, FILE_2, FILE_1]) == {
+        FILE_1: b"hello tuvwxyz",
+        FILE_2: b"new_text",
+    }
+    assert storage.get_bytes_many(
+        [(FILE_1, 0, 5), (FILE_2, 4, None), (FILE_1, None, 2)]
+    ) == [b"hello", b"text", b"he"]
+    with pytest.raises(KeyError):
+        storage.get_items([FILE_1, f"{KEY}_3"])
+
     assert len(storage) >= 1
 
     for _ in storage:
@@ -209,3 +248,978 @@ def test_read_from_full_url(storage, color_image_paths):
     storage["sample/samplejpg.jpg"] = byts
     data = storage.get_object_from_full_url(f"{storage.root}/sample/samplejpg.jpg")
     assert byts == data
+
+
+def test_cache_get_items():
+    base = MemoryProvider()
+    base.batch_read_workers = 4
+    for i in range(4):
+        base[f"{KEY}_{i}"] = bytes([i]) * KB
+    cache = LRUCache(MemoryProvider(), base, 3 * KB)
+    cache[f"{KEY}_4"] = b"hello"
+
+    keys = [f"{KEY}_{i}" for i in range(5)]
+    items = cache.get_items(keys)
+    assert list(items) == keys
+    assert items[f"{KEY}_4"] == b"hello"
+    assert all(items[f"{KEY}_{i}"] == bytes([i]) * KB for i in range(4))
+    # fetched items are cached, evicting the least recently used ones
+    assert set(cache.lru_sizes) == {f"{KEY}_1", f"{KEY}_2", f"{KEY}_3"}
+    assert f"{KEY}_4" in base
+
+    assert cache.get_bytes_many([(f"{KEY}_0", 0, 2), (f"{KEY}_3", 1, 3)]) == [
+        b"\x00\x00",
+        b"\x03\x03",
+    ]
+    # the threads of batch reads are reused by later calls
+    executor = get_batch_read_executor(4)
+    assert executor is get_batch_read_executor(4)
+    assert not executor._shutdown
+
+
+class SlowProvider(MemoryProvider):
+    """Memory provider with a fixed latency per write and read, a local stand-in for an object store."""
+
+    def __init__(self, root="", latency=0.01, read_latency=0):
+        super().__init__(root)
+        self.latency = latency
+        self.read_latency = read_latency
+        self.num_reads = 0
+        self.fail_keys = set()
+        self.in_flight_bytes = 0
+        self.max_in_flight_bytes = 0
+        self.in_flight_writes = 0
+        self.max_in_flight_writes = 0
+        self._lock = threading.Lock()
+
+    def __setitem__(self, path, value):
+        with self._lock:
+            self.in_flight_bytes += len(value)
+            self.max_in_flight_bytes = max(
+                self.max_in_flight_bytes, self.in_flight_bytes
+            )
+            self.in_flight_writes += 1
+            self.max_in_flight_writes = max(
+                self.max_in_flight_writes, self.in_flight_writes
+            )
+        try:
+            time.sleep(self.latency)
+            if path in self.fail_keys:
+                raise S3SetError(f"Failed to write {path}")
+            super().__setitem__(path, value)
+        finally:
+            with self._lock:
+                self.in_flight_bytes -= len(value)
+                self.in_flight_writes -= 1
+
+    def __getitem__(self, path):
+        with self._lock:
+            self.num_reads += 1
+        time.sleep(self.read_latency)
+        return super().__getitem__(path)
+
+
+def test_async_flush():
+    base = SlowProvider(latency=0.001)
+    cache = LRUCache(MemoryProvider(), base, 4 * KB, use_async=True)
+    values = {f"{KEY}_{i}": bytes([i]) * KB for i in range(20)}
+    for k, v in values.items():
+        cache[k] = v
+
+    # evicted items are readable while they are being written
+    for k, v in values.items():
+        assert cache[k] == v
+        assert cache.get_bytes(k, 1, 3) == v[1:3]
+    assert set(values) <= set(cache._all_keys())
+
+    cache.flush()
+    assert not cache.dirty_keys
+    assert base.dict == values
+
+    del cache[f"{KEY}_0"]
+    assert f"{KEY}_0" not in base.dict
+
+    unpickled = pickle.loads(pickle.dumps(cache))
+    assert unpickled.use_async and unpickled._uploader is not None
+
+
+def test_async_flush_errors():
+    base = SlowProvider(latency=0)
+    base.fail_keys.add(f"{KEY}_1")
+    cache = LRUCache(MemoryProvider(), base, 0, use_async=True)
+    cache[f"{KEY}_0"] = b"hello"
+    cache[f"{KEY}_1"] = b"world"
+
+    with pytest.raises(S3SetError):
+        cache.flush()
+    assert base.dict == {f"{KEY}_0": b"hello"}
+
+    # failed writes are held back and retried on the next flush
+    assert cache[f"{KEY}_1"] == b"world"
+    base.fail_keys.clear()
+    cache.flush()
+    assert base.dict == {f"{KEY}_0": b"hello", f"{KEY}_1": b"world"}
+
+
+def test_async_flush_backpressure():
+    base = SlowProvider(latency=0.005)
+    cache = LRUCache(
+        MemoryProvider(),
+        base,
+        0,
+        use_async=True,
+        async_max_in_flight_bytes=4 * KB,
+        async_num_workers=8,
+    )
+    for i in range(32):
+        cache[f"{KEY}_{i}"] = b"0" * KB
+    cache.flush()
+    assert len(base.dict) == 32
+    assert base.max_in_flight_bytes <= 4 * KB
+
+
+def test_async_flush_overlaps_writes():
+    chunk = b"0" * (MB // 4)
+    num_chunks = 16
+
+    def ingest(use_async):
+        base = SlowProvider(latency=0.01)
+        cache = LRUCache(MemoryProvider(), base, 2 * MB, use_async=use_async)
+        for i in range(num_chunks):
+            cache[f"chunks/{i}"] = chunk
+        cache.flush()
+        assert len(base.dict) == num_chunks
+        return base.max_in_flight_writes
+
+    # evicted chunks are written one at a time by the writer, or concurrently in the background
+    assert ingest(False) == 1
+    assert ingest(True) > 1
+
+
+def test_async_flush_ingest_benchmark(request):
+    """Ingest throughput with and without write-behind, against S3 mocked by moto with a simulated round trip time."""
+    if not is_opt_true(request, BENCHMARKS_OPT):
+        pytest.skip()
+    moto = pytest.importorskip("moto")
+    chunk = b"0" * (MB // 4)
+    num_chunks = 64
+
+    def round_trip(**kwargs):
+        time.sleep(0.02)
+
+    def ingest(s3, use_async):
+        cache = LRUCache(MemoryProvider(), s3, 2 * MB, use_async=use_async)
+        start = time.time()
+        for i in range(num_chunks):
+            cache[f"chunks/{use_async}/{i}"] = chunk
+        cache.flush()
+        elapsed = time.time() - start
+        return num_chunks * len(chunk) / MB / elapsed
+
+    with moto.mock_aws():
+        boto3.client("s3", region_name="us-east-1").create_bucket(Bucket="bucket")
+        s3 = S3Provider(
+            "s3://bucket/benchmark",
+            aws_access_key_id="key",
+            aws_secret_access_key="secret",
+            aws_region="us-east-1",
+        )
+        events = s3.client.meta.events
+        events.register("before-send.s3.PutObject", round_trip)
+        try:
+            sync_throughput = ingest(s3, False)
+            async_throughput = ingest(s3, True)
+        finally:
+            events.unregister("before-send.s3.PutObject", round_trip)
+        assert len(list(s3._all_keys())) == 2 * num_chunks
+    print(
+        f"Ingest throughput: {sync_throughput:.1f} MB/s (sync), {async_throughput:.1f} MB/s (async)"
+    )
+    assert async_throughput > 2 * sync_throughput
+
+
+@patch("deeplake.constants.ASYNC_FLUSH_ENABLED", True)
+def test_async_flush_dataset(memory_path):
+    ds = deeplake.dataset(memory_path, overwrite=True)
+    assert ds.storage.next_storage is not None
+    with ds:
+        ds.create_tensor("x", max_chunk_size=8 * KB)
+        ds.x.extend(np.arange(10000, dtype=np.int64).reshape(100, 100))
+    ds.storage.clear_cache()
+    np.testing.assert_array_equal(
+        ds.x.numpy(), np.arange(10000, dtype=np.int64).reshape(100, 100)
+    )
+
+
+def test_chunk_prefetcher():
+    base = SlowProvider(read_latency=0.01)
+    keys = [f"chunks/{i}" for i in range(20)]
+    for i, k in enumerate(keys):
+        base.dict[k] = bytes([i]) * KB
+    cache = LRUCache(MemoryProvider(), base, 64 * KB)
+    prefetcher = ChunkPrefetcher(
+        cache, max_bytes_ahead=4 * KB, num_workers=4, chunk_size_estimate=KB
+    )
+
+    prefetcher.start(keys)
+    assert len(prefetcher._window) == 4
+    for i, k in enumerate(keys[:10]):
+        prefetcher.on_read(k)
+        assert k in cache.lru_sizes
+        assert cache[k] == bytes([i]) * KB
+    assert prefetcher.hits == 10 and prefetcher.misses == 0
+    assert len(prefetcher._window) == 4
+
+    # random access cancels the prefetching
+    prefetcher.on_read("chunks/5")  # cached, not a random access
+    assert prefetcher.active and prefetcher.cancellations == 0
+    prefetcher.on_read("other")
+    assert not prefetcher.active and prefetcher.cancellations == 1
+    assert prefetcher.stats["bytes_fetched"] == 10 * KB
+
+    # chunks that are already cached are not fetched again
+    num_reads = base.num_reads
+    prefetcher.start(keys[:10])
+    assert not prefetcher.active
+    assert base.num_reads == num_reads
+
+
+@patch("deeplake.constants.CHUNK_PREFETCH_LOCAL", True)
+def test_chunk_prefetcher_dataset(local_ds):
+    with local_ds as ds:
+        ds.create_tensor("x", max_chunk_size=4 * KB)
+        ds.x.extend(np.arange(20000, dtype=np.int32).reshape(200, 100))
+    ds.storage.clear_cache()
+
+    for i, sample in enumerate(ds):
+        np.testing.assert_array_equal(
+            sample.x.numpy(), np.arange(i * 100, (i + 1) * 100, dtype=np.int32)
+        )
+    prefetcher = ds.x.chunk_engine.prefetcher
+    num_chunks = ds.x.chunk_engine.num_chunks
+    assert prefetcher.hits >= num_chunks - 2
+    assert prefetcher.misses <= 1
+    assert prefetcher.cancellations == 0
+
+    ds.storage.clear_cache()
+    prefetcher.reset_stats()
+    np.testing.assert_array_equal(
+        ds.x[::3].numpy(), np.arange(20000, dtype=np.int32).reshape(200, 100)[::3]
+    )
+    assert prefetcher.hits >= num_chunks - 1
+
+    # tensors are pickled along with the dataset, e.g. for dataloader workers
+    ds = pickle.loads(pickle.dumps(ds))
+    np.testing.assert_array_equal(
+        ds.x[:3].numpy(), np.arange(300, dtype=np.int32).reshape(3, 100)
+    )
+
+    # all the prefetchers share the same threads
+    ds.create_tensor("y", max_chunk_size=4 * KB)
+    ds.y.extend(np.arange(20000, dtype=np.int32).reshape(200, 100))
+    ds.storage.clear_cache()
+    for sample in ds:
+        sample.x.numpy(), sample.y.numpy()
+    assert ds.y.chunk_engine.prefetcher.hits > 0
+    prefetch_threads = [
+        t for t in threading.enumerate() if t.name.startswith("deeplake_prefetch")
+    ]
+    assert len(prefetch_threads) <= deeplake.constants.CHUNK_PREFETCH_NUM_WORKERS
+
+    with patch("deeplake.constants.CHUNK_PREFETCH_BYTES_AHEAD", 0):
+        ds = deeplake.load(ds.path)
+        assert ds.x.chunk_engine.prefetcher is None
+
+    with patch("deeplake.constants.CHUNK_PREFETCH_LOCAL", False):
+        ds = deeplake.load(ds.path)
+        assert ds.x.chunk_engine.prefetcher is None
+
+
+def _fill_cache(cache, keys, size=KB):
+    for k in keys:
+        cache[k] = b"0" * size
+
+
+@pytest.mark.parametrize(
+    "policy,evicted",
+    [("lru", "b"), ("lfu", "c"), ("2q", "a"), ("gdsf", "c")],
+)
+def test_cache_eviction_policies(policy, evicted):
+    cache = LRUCache(MemoryProvider(), MemoryProvider(), 3 * KB, eviction_policy=policy)
+    _fill_cache(cache, ["a", "b", "c"])
+    for k in ["b", "b", "c", "a"]:
+        cache[k]
+    cache["d"] = b"0" * KB
+    assert set(cache.lru_sizes) == {"a", "b", "c", "d"} - {evicted}
+    assert cache.cache_used == 3 * KB
+    assert evicted in cache.next_storage
+
+    with pytest.raises(ValueError):
+        LRUCache(MemoryProvider(), MemoryProvider(), KB, eviction_policy="mru")
+
+
+def test_cache_eviction_size_updates():
+    cache = LRUCache(MemoryProvider(), MemoryProvider(), 3 * KB)
+    _fill_cache(cache, ["a", "b", "c"])
+    # updating the size of a key does not make it recently used
+    cache.update_used_cache_for_path("a", KB)
+    cache["d"] = b"0" * KB
+    assert set(cache.lru_sizes) == {"b", "c", "d"}
+
+
+def test_lfu_policy_min_frequency():
+    policy = get_eviction_policy("lfu", 3 * KB)
+    for key in "abc":
+        policy.on_insert(key, KB)
+    for key in "aab":
+        policy.on_access(key)
+    assert policy.victim() == "c"
+    policy.pin("c")
+    assert policy.victim() == "b"
+    policy.on_remove("c")
+    assert policy.victim() == "b"
+    policy.on_access("b")
+    policy.on_access("b")
+    assert policy.victim() == "a"
+    policy.on_evict("a")
+    policy.on_evict("b")
+    assert policy.victim() is None
+    policy.on_insert("d", KB)
+    assert policy.victim() == "d"
+
+
+def test_cache_eviction_scan_resistance():
+    cache = LRUCache(MemoryProvider(), MemoryProvider(), 8 * KB, eviction_policy="2q")
+    hot = [f"hot_{i}" for i in range(4)]
+    _fill_cache(cache, hot)
+    _fill_cache(cache, [f"scan_{i}" for i in range(8)])
+    # hot keys were evicted once, reading them again moves them to the protected queue
+    for k in hot:
+        cache[k]
+    _fill_cache(cache, [f"scan_{i}" for i in range(8, 100)])
+    assert set(hot) <= set(cache.lru_sizes)
+
+    lru = LRUCache(MemoryProvider(), MemoryProvider(), 8 * KB)
+    _fill_cache(lru, hot)
+    _fill_cache(lru, [f"scan_{i}" for i in range(100)])
+    assert not set(hot) & set(lru.lru_sizes)
+
+
+def test_cache_eviction_size_aware():
+    cache = LRUCache(
+        MemoryProvider(), MemoryProvider(), 10 * KB, eviction_policy="gdsf"
+    )
+    _fill_cache(cache, [f"meta_{i}" for i in range(8)], size=100)
+    _fill_cache(cache, [f"chunk_{i}" for i in range(20)], size=2 * KB)
+    assert all(f"meta_{i}" in cache.lru_sizes for i in range(8))
+    assert cache.cache_used <= 10 * KB
+
+
+def test_cache_pinned_objects():
+    cache = LRUCache(
+        MemoryProvider(), MemoryProvider(), 3 * KB, pin_deeplake_objects=True
+    )
+    _fill_cache(cache, ["meta"])
+    cache.register_deeplake_object("meta", None)
+    _fill_cache(cache, [f"chunk_{i}" for i in range(10)])
+    assert "meta" in cache.lru_sizes
+    assert set(cache.lru_sizes) == {"meta", "chunk_8", "chunk_9"}
+
+    cache.remove_deeplake_object("meta")
+    _fill_cache(cache, ["chunk_10"])
+    assert "meta" not in cache.lru_sizes
+
+
+def test_cache_eviction_policy_dataset(local_ds):
+    with local_ds as ds:
+        ds.create_tensor("x", max_chunk_size=4 * KB)
+        ds.x.extend(np.arange(20000, dtype=np.int32).reshape(200, 100))
+
+    ds = deeplake.load(local_ds.path, cache_eviction_policy="2q")
+    assert ds.storage.eviction_policy == "2q"
+    np.testing.assert_array_equal(
+        ds.x.numpy(), np.arange(20000, dtype=np.int32).reshape(200, 100)
+    )
+    ds = pickle.loads(pickle.dumps(ds))
+    assert ds.storage.eviction_policy == "2q"
+
+    with pytest.raises(ValueError):
+        deeplake.load(local_ds.path, cache_eviction_policy="mru")
+
+
+def test_cache_stats():
+    base = SlowProvider(latency=0.001, read_latency=0.001)
+    cache = LRUCache(MemoryProvider(), base, 2 * KB)
+    for i in range(3):
+        cache[f"{KEY}_{i}"] = bytes([i]) * KB
+    cache[f"{KEY}_2"]
+    cache[f"{KEY}_0"]
+    cache.get_bytes(f"{KEY}_1", 0, 10)
+    cache.flush()
+
+    stats = cache.stats.to_dict()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+    assert stats["evictions"] == 2
+    assert stats["bytes_in"] == KB + 10
+    assert stats["bytes_out"] == 3 * KB
+    assert stats["latency"]["read"]["count"] == 2
+    assert stats["latency"]["read"]["p50_ms"] >= 1
+    assert base.stats["reads"] == 2 and base.stats["bytes_written"] == 3 * KB
+
+    cache.stats.reset()
+    assert cache.stats.to_dict() == {"latency": {}}
+
+
+def test_dataset_storage_stats(local_path):
+    ds = deeplake.empty(local_path, overwrite=True)
+    with ds:
+        ds.create_tensor("x", max_chunk_size=4 * KB)
+        ds.x.extend(np.arange(20000, dtype=np.int32).reshape(200, 100))
+    num_chunks = ds.x.chunk_engine.num_chunks
+
+    with patch("deeplake.constants.CHUNK_PREFETCH_BYTES_AHEAD", 0):
+        ds = deeplake.load(local_path, local_cache_size=1)
+        ds.storage_stats(reset=True)
+        ds.x.numpy()
+    stats = ds.storage_stats(reset=True)
+    assert list(stats) == ["memory_cache", "local_cache", "storage"]
+    assert stats["memory_cache"]["misses"] == num_chunks
+    assert stats["local_cache"]["misses"] == num_chunks
+    assert stats["storage"]["provider"] == "LocalProvider"
+    assert stats["storage"]["reads"] == num_chunks
+    assert stats["storage"]["bytes_read"] >= 80000
+    assert stats["storage"]["latency"]["read"]["count"] == num_chunks
+
+    ds.x.numpy()
+    stats = ds.storage_stats()
+    assert stats["memory_cache"]["hit_rate"] == 1
+    assert "reads" not in stats["storage"]
+    ds.clear_cache()
+
+    # chunks read ahead by the prefetcher go directly to the memory cache
+    with patch("deeplake.constants.CHUNK_PREFETCH_LOCAL", True):
+        ds = deeplake.load(local_path)
+        ds.storage_stats(reset=True)
+        ds.x.numpy()
+    stats = ds.storage_stats()
+    assert stats["memory_cache"]["prefetched"] >= num_chunks - 1
+    assert stats["storage"]["reads"] == num_chunks
+
+
+@pytest.mark.skipif(os.name == "nt", reason="Files are not memory mapped on Windows")
+@patch("deeplake.constants.LOCAL_MMAP_MIN_SIZE", KB)
+def test_local_mmap(local_path):
+    storage = LocalProvider(local_path)
+    storage.clear()
+    storage["small"] = b"abc"
+    storage["big"] = b"1" * 2 * KB
+    assert storage.get_view("small") == b"abc"
+
+    view = storage.get_view("big")
+    assert _is_mapped(view) and view.readonly
+    # overwriting a mapped file does not change or invalidate the mapping
+    storage["big"] = b"2" * 4 * KB
+    assert bytes(view) == b"1" * 2 * KB
+    assert bytes(storage.get_view("big")) == b"2" * 4 * KB
+    assert storage._all_keys(refresh=True) == {"small", "big"}
+
+    # files that are not mapped are overwritten in place
+    small_path = storage._check_is_file("small")
+    inode = os.stat(small_path).st_ino
+    storage["small"] = b"def"
+    assert os.stat(small_path).st_ino == inode
+
+    big_path = storage._check_is_file("big")
+    del view
+    gc.collect()
+    inode = os.stat(big_path).st_ino
+    storage["big"] = b"3" * 2 * KB
+    assert os.stat(big_path).st_ino == inode
+
+    with pytest.raises(KeyError):
+        storage.get_view("missing")
+
+
+@pytest.mark.skipif(os.name == "nt", reason="Files are not memory mapped on Windows")
+@patch("deeplake.constants.LOCAL_MMAP_MIN_SIZE", KB)
+def test_local_mmap_dataset(local_ds):
+    arr = np.arange(20000, dtype=np.int32).reshape(200, 100)
+    with local_ds as ds:
+        ds.create_tensor("x", max_chunk_size=16 * KB)
+        ds.x.extend(arr)
+    ds = deeplake.load(local_ds.path, local_cache_size=1)
+
+    np.testing.assert_array_equal(ds.x.numpy(), arr)
+    chunk = ds.x.chunk_engine.get_chunks_for_sample(0)[0]
+    assert _is_mapped(chunk.data_bytes)
+    np.testing.assert_array_equal(ds.x[57].numpy(), arr[57])
+    np.testing.assert_array_equal(ds.x[[3, 199]].numpy(), arr[[3, 199]])
+
+    # updated chunks are copied out of the mapping
+    ds.x[0] = np.ones(100, dtype=np.int32)
+    ds.clear_cache()
+    arr[0] = 1
+    np.testing.assert_array_equal(ds.x.numpy(), arr)
+    np.testing.assert_array_equal(ds.x.numpy(aslist=True), list(arr))
+
+
+def test_coalesce_ranges():
+    ranges = [(30, 40), (0, 10), (12, 20), (15, 18), (100, 110)]
+    assert coalesce_ranges(ranges, 0) == [(0, 10), (12, 20), (30, 40), (100, 110)]
+    assert coalesce_ranges(ranges, 2) == [(0, 20), (30, 40), (100, 110)]
+    assert coalesce_ranges(ranges, 10) == [(0, 40), (100, 110)]
+    assert coalesce_ranges([], 10) == []
+
+
+def test_partial_reader_prefetch():
+    base = SlowProvider(latency=0)
+    data = bytes(range(256)) * 4
+    base[KEY] = data
+    cache = LRUCache(MemoryProvider(), base, 0)
+    reader = PartialReader(cache, KEY, header_offset=24)
+    ranges = [(0, 10), (20, 30), (500, 520), (40, 50)]
+    with patch("deeplake.constants.PARTIAL_READ_COALESCE_GAP", 16):
+        reader.prefetch(ranges)
+    assert base.num_reads == 2
+    for start, stop in ranges:
+        assert bytes(reader[start:stop]) == data[start + 24 : stop + 24]
+    assert base.num_reads == 2
+
+    # already fetched ranges are not requested again
+    reader.prefetch([(2, 8), (600, 610)])
+    assert base.num_reads == 3
+    assert bytes(reader[600:610]) == data[624:634]
+
+
+def test_partial_reader_pages():
+    base = SlowProvider(latency=0)
+    data = bytes(range(256)) * 4
+    base[KEY] = data
+    cache = LRUCache(MemoryProvider(), base, 0)
+    reader = PartialReader(cache, KEY, header_offset=24)
+    with patch("deeplake.constants.PARTIAL_READ_PAGE_SIZE", 256):
+        assert bytes(reader[10:20]) == data[34:44]
+        assert base.num_reads == 1
+        # samples in the same page are not requested again
+        assert bytes(reader[100:200]) == data[124:224]
+        assert base.num_reads == 1
+        # a sample spanning two pages fetches both
+        assert bytes(reader[500:600]) == data[524:624]
+        assert base.num_reads == 2
+        assert bytes(reader[700:720]) == data[724:744]
+        assert base.num_reads == 2
+        # the last page is shorter than the page size
+        assert bytes(reader[990:1000]) == data[1014:1024]
+        assert bytes(reader[995:1000]) == data[1019:1024]
+        assert base.num_reads == 3
+        reader.prefetch([(0, 10), (240, 250)])
+        assert base.num_reads == 4
+        assert bytes(reader[240:250]) == data[264:274]
+        assert base.num_reads == 4
+
+
+def test_shapes_read_from_chunk_headers(local_ds):
+    with local_ds as ds:
+        ds.create_tensor(
+            "x",
+            chunk_compression="lz4",
+            max_chunk_size=16 * KB,
+            create_shape_tensor=False,
+        )
+        arrs = [
+            np.random.randint(0, 1 << 30, (i % 7 + 1, 100), dtype=np.int32)
+            for i in range(100)
+        ]
+        ds.x.extend(arrs)
+    shapes = [arr.shape for arr in arrs]
+
+    ds = deeplake.load(local_ds.path)
+    engine = ds.x.chunk_engine
+    base = engine.base_storage
+    with patch.object(type(base), "supports_partial_reads", True):
+        base.stats.reset()
+        np.testing.assert_array_equal(ds.x.shapes(), shapes)
+        np.testing.assert_array_equal(ds.x[3:50:4].shapes(), shapes[3:50:4])
+        assert ds.x[42].shape == shapes[42]
+        assert engine.num_chunks > 4
+        assert base.stats["bytes_read"] < engine.num_chunks * KB
+        # chunks are not loaded to read their headers
+        assert not any(is_chunk_key(key) for key in engine.cache.lru_sizes)
+        np.testing.assert_array_equal(ds.x[42].numpy(), arrs[42])
+
+        # headers of chunks in the cache are not read from storage
+        base.stats.reset()
+        assert ds.x[42].shape == shapes[42]
+        assert base.stats["reads"] == 0
+
+
+def test_partial_reads_coalesced_dataset(local_ds):
+    arr = np.arange(20000, dtype=np.int32).reshape(200, 100)
+    with local_ds as ds:
+        ds.create_tensor("x", max_chunk_size=64 * KB)
+        ds.x.extend(arr)
+    indices = [3, 5, 8, 40, 41, 150, 199]
+
+    def count_reads(ds):
+        stats = ds.x.chunk_engine.base_storage.stats
+        stats.reset()
+        np.testing.assert_array_equal(ds.x[indices].numpy(), arr[indices])
+        return stats["reads"]
+
+    # partial reads are only used for cloud storage
+    with patch.object(ChunkEngine, "_reads_full_chunks", return_value=False):
+        with patch.object(ChunkEngine, "_prefetch_sample_ranges"):
+            uncoalesced = count_reads(deeplake.load(local_ds.path))
+        ds = deeplake.load(local_ds.path)
+        coalesced = count_reads(ds)
+        # one read for the header and one for the samples of each chunk
+        assert coalesced == 2 * ds.x.chunk_engine.num_chunks
+        assert coalesced < uncoalesced
+        np.testing.assert_array_equal(ds.x[10:20].numpy(), arr[10:20])
+
+
+def test_disk_cache(local_path):
+    cache = DiskCache(local_path, 3 * KB, namespace="ds1")
+    for i in range(3):
+        cache[f"{KEY}_{i}"] = bytes([i]) * KB
+    assert cache[f"{KEY}_0"] == b"\x00" * KB
+    assert cache.get_bytes(f"{KEY}_1", 10, 15) == b"\x01" * 5
+    assert cache.cache_used == 3 * KB
+
+    # the least recently read object is evicted
+    cache[f"{KEY}_3"] = b"\x03" * KB
+    assert f"{KEY}_2" not in cache
+    assert set(cache) == {f"{KEY}_0", f"{KEY}_1", f"{KEY}_3"}
+    assert cache.cache_used == 3 * KB
+    cache[f"{KEY}_big"] = bytes(4 * KB)
+    assert f"{KEY}_big" not in cache
+
+    # namespaces are isolated, but share the size of the cache
+    other = DiskCache(local_path, 3 * KB, namespace="ds2")
+    assert f"{KEY}_0" not in other
+    del cache[f"{KEY}_3"]
+    with pytest.raises(KeyError):
+        cache[f"{KEY}_3"]
+    other[f"{KEY}_0"] = b"other"
+    assert cache[f"{KEY}_0"] == b"\x00" * KB
+    assert len(cache) == 2 and len(other) == 1
+
+    # a failed write leaves the object it was replacing in place
+    with patch("deeplake.core.storage.disk_cache.os.replace", side_effect=OSError):
+        with pytest.raises(OSError):
+            cache[f"{KEY}_1"] = b"new"
+    assert cache[f"{KEY}_1"] == b"\x01" * KB
+    assert not [f for _, _, files in os.walk(local_path) for f in files if ".tmp" in f]
+
+    # reads are written to the index in batches
+    with patch("deeplake.constants.SHARED_CACHE_ACCESS_UPDATE_INTERVAL", 3600):
+        query = "SELECT last_access FROM entries WHERE key = ?"
+        last_access = cache.conn.execute(query, (f"{KEY}_0",)).fetchone()
+        cache[f"{KEY}_0"]
+        assert cache.conn.execute(query, (f"{KEY}_0",)).fetchone() == last_access
+    with patch("deeplake.constants.SHARED_CACHE_ACCESS_UPDATE_INTERVAL", 0):
+        cache[f"{KEY}_1"]
+        assert cache.conn.execute(query, (f"{KEY}_0",)).fetchone() > last_access
+
+    # the cache persists across instances and processes
+    cache = pickle.loads(pickle.dumps(cache))
+    assert cache[f"{KEY}_1"] == b"\x01" * KB
+    cache.clear()
+    assert len(cache) == 0 and other[f"{KEY}_0"] == b"other"
+
+
+def _write_to_disk_cache(args):
+    root, worker = args
+    cache = DiskCache(root, 20 * KB)
+    for i in range(30):
+        key = f"{KEY}_{(worker + i) % 40}"
+        cache[key] = bytes([worker]) * KB
+        try:
+            assert len(cache[key]) == KB
+        except KeyError:
+            # evicted by another process
+            pass
+
+
+def test_disk_cache_multiprocess(local_path):
+    ctx = multiprocessing.get_context("spawn")
+    with ctx.Pool(4) as pool:
+        pool.map(_write_to_disk_cache, [(local_path, i) for i in range(4)])
+    cache = DiskCache(local_path, 20 * KB)
+    assert cache.cache_used <= 20 * KB
+    for key in cache:
+        assert len(cache[key]) == KB
+    assert sum(map(cache.get_object_size, cache)) == cache.cache_used
+
+
+def test_shared_cache_dataset(local_path, monkeypatch):
+    cache_path = f"{local_path}_shared_cache"
+    monkeypatch.setenv("SHARED_CACHE_PREFIX", cache_path)
+    arr = np.arange(20000, dtype=np.int32).reshape(200, 100)
+    try:
+        with deeplake.empty(local_path, overwrite=True) as ds:
+            ds.create_tensor("x", max_chunk_size=16 * KB)
+            ds.x.extend(arr)
+        ds.commit()
+
+        def chunk_reads(ds):
+            ds.storage_stats(reset=True)
+            np.testing.assert_array_equal(ds.x.numpy(), arr)
+            stats = ds.storage_stats()
+            return stats["storage"].get("reads", 0), stats["shared_cache"].get(
+                "hits", 0
+            )
+
+        ds = deeplake.load(local_path, shared_cache_size=1)
+        reads, hits = chunk_reads(ds)
+        num_chunks = ds.x.chunk_engine.num_chunks
+        assert reads >= num_chunks and hits == 0
+        # a new dataset object reads the chunks from the shared cache
+        ds = deeplake.load(local_path, shared_cache_size=1)
+        reads, hits = chunk_reads(ds)
+        assert hits == num_chunks and reads < num_chunks
+
+        # chunks of other versions are not served from the cache
+        ds.x[0] = np.ones(100, dtype=np.int32)
+        ds.flush()
+        arr[0] = 1
+        ds = deeplake.load(local_path, shared_cache_size=1)
+        chunk_reads(ds)
+        ds.checkout(ds.commit_id)
+        np.testing.assert_array_equal(ds.x[0].numpy(), np.arange(100))
+    finally:
+        shutil.rmtree(cache_path, ignore_errors=True)
+
+
+def _rewrite_dataset(path, value, recreate):
+    if recreate:
+        with deeplake.empty(path, overwrite=True) as ds:
+            ds.create_tensor("x", max_chunk_size=16 * KB)
+            ds.x.extend(np.full((200, 100), value, dtype=np.int32))
+        ds.commit()
+    else:
+        # e.g. a process on another machine, that does not drop the chunk from the cache
+        with deeplake.load(path) as ds:
+            ds.x[0] = np.full(100, value, dtype=np.int32)
+
+
+def test_shared_cache_rewritten_by_other_process(local_path, monkeypatch):
+    cache_path = f"{local_path}_shared_cache"
+    monkeypatch.setenv("SHARED_CACHE_PREFIX", cache_path)
+    arr = np.arange(20000, dtype=np.int32).reshape(200, 100)
+    ctx = multiprocessing.get_context("spawn")
+
+    def rewrite(value, recreate=False):
+        process = ctx.Process(
+            target=_rewrite_dataset, args=(local_path, value, recreate)
+        )
+        process.start()
+        process.join()
+        assert process.exitcode == 0
+
+    try:
+        with deeplake.empty(local_path, overwrite=True) as ds:
+            ds.create_tensor("x", max_chunk_size=16 * KB)
+            ds.x.extend(arr)
+        ds = deeplake.load(local_path, shared_cache_size=1)
+        np.testing.assert_array_equal(ds.x.numpy(), arr)
+
+        # chunks of the head commit are rewritten by another process
+        rewrite(1)
+        arr[0] = 1
+        ds = deeplake.load(local_path, shared_cache_size=1)
+        np.testing.assert_array_equal(ds.x.numpy(), arr)
+
+        ds.commit()
+        ds = deeplake.load(local_path, shared_cache_size=1)
+        np.testing.assert_array_equal(ds.x.numpy(), arr)
+        ds = deeplake.load(local_path, shared_cache_size=1)
+        ds.storage_stats(reset=True)
+        np.testing.assert_array_equal(ds.x.numpy(), arr)
+        assert ds.storage_stats()["shared_cache"]["hits"] > 0
+
+        # the dataset is deleted and recreated at the same path by another process
+        rewrite(2, recreate=True)
+        ds = deeplake.load(local_path, shared_cache_size=1)
+        np.testing.assert_array_equal(ds.x.numpy(), np.full((200, 100), 2))
+    finally:
+        shutil.rmtree(cache_path, ignore_errors=True)
+
+
+def _s3_client_pool_size(_):
+    return len(s3_client_pool)
+
+
+def test_s3_client_pool():
+    creds = {
+        "aws_access_key_id": "key",
+        "aws_secret_access_key": "secret",
+        "endpoint_url": "http://localhost:9000",
+    }
+    s3 = S3Provider("s3://bucket/dataset", **creds)
+    client = s3.client
+    config = client.meta.config
+    assert config.max_pool_connections >= S3_MAX_POOL_CONNECTIONS
+    assert config.tcp_keepalive
+
+    # providers with the same credentials share the client
+    assert s3.subdir("sub").client is client
+    assert pickle.loads(pickle.dumps(s3)).client is client
+    assert S3Provider("s3://other_bucket", **creds).client is client
+    num_clients = len(s3_client_pool)
+    # other credentials for the same endpoint, e.g. refreshed ones, replace the client
+    other = S3Provider("s3://bucket/dataset", **{**creds, "aws_secret_access_key": "x"})
+    assert other.client is not client
+    assert len(s3_client_pool) == num_clients
+    assert s3.client is client
+    assert S3Provider("s3://bucket/dataset", **creds).client is not client
+
+    if os.name != "nt":
+        # clients are not inherited by forked processes
+        assert len(s3_client_pool) > 0
+        with multiprocessing.get_context("fork").Pool(1) as pool:
+            assert pool.map(_s3_client_pool_size, [0]) == [0]
+
+
+@enabled_storages
+def test_async_storage(storage):
+    async def run():
+        await storage.aset("a", b"hello world")
+        await storage.aset("b/c", b"0123456789")
+        assert await storage.aget("a") == b"hello world"
+        assert await storage.aget_bytes("b/c", 2, 5) == b"234"
+        assert await storage.aget_bytes_many(
+            [("a", None, 5), ("b/c", 8, None), ("a", 6, 6)]
+        ) == [b"hello", b"89", b""]
+        assert set(await storage.alist()) >= {"a", "b/c"}
+        await storage.adelete("a")
+        with pytest.raises(KeyError):
+            await storage.aget("a")
+
+    asyncio.run(run())
+    assert storage["b/c"] == b"0123456789"
+    storage.clear()
+
+
+class _AsyncBody:
+    def __init__(self, data):
+        self.data = data
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+    async def read(self):
+        return self.data
+
+
+class _AsyncS3Client:
+    """Minimal stand-in for an aioboto3 S3 client, backed by a dict."""
+
+    def __init__(self):
+        self.objects = {}
+        self.num_clients = self.num_closed = 0
+        self.in_flight = self.max_in_flight = 0
+
+    async def get_object(self, Bucket, Key, Range=""):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        if Key not in self.objects:
+            raise botocore.exceptions.ClientError(
+                {"Error": {"Code": "NoSuchKey"}}, "GetObject"
+            )
+        data = self.objects[Key]
+        if Range:
+            start, end = Range[len("bytes=") :].split("-")
+            data = data[int(start) : int(end) + 1 if end else None]
+        return {"Body": _AsyncBody(data)}
+
+    async def put_object(self, Bucket, Body, Key, ContentType):
+        self.objects[Key] = Body
+
+    async def delete_object(self, Bucket, Key):
+        self.objects.pop(Key, None)
+
+    def get_paginator(self, name):
+        return self
+
+    async def paginate(self, Bucket, Prefix, StartAfter):
+        yield {"Contents": [{"Key": k} for k in self.objects if k.startswith(Prefix)]}
+
+    @asynccontextmanager
+    async def client(self, service_name, **kwargs):
+        self.num_clients += 1
+        try:
+            yield self
+        finally:
+            self.num_closed += 1
+
+
+def test_s3_async_native():
+    s3 = S3Provider(
+        "s3://bucket/dataset",
+        aws_access_key_id="key",
+        aws_secret_access_key="secret",
+        endpoint_url="http://localhost:9000",
+    )
+    fake = _AsyncS3Client()
+    s3.async_session = fake
+
+    async def run():
+        await s3.aset("a", b"hello world")
+        await s3.aset("b/c", bytearray(b"0123456789"))
+        assert fake.objects.keys() == {"dataset/a", "dataset/b/c"}
+        assert await s3.aget("a") == b"hello world"
+        assert await s3.aget_bytes("b/c", 2, 5) == b"234"
+        assert await s3.aget_bytes("b/c", 8) == b"89"
+        assert sorted(await s3.alist()) == ["a", "b/c"]
+
+        ranges = [("b/c", i, i + 1) for i in range(10)] * 10
+        assert await s3.aget_bytes_many(ranges) == [
+            b"0123456789"[start:end] for _, start, end in ranges
+        ]
+        # all requests in flight at once
+        assert fake.max_in_flight == len(ranges)
+
+        await s3.adelete("a")
+        with pytest.raises(KeyError):
+            await s3.aget("a")
+        # one long lived client for all the calls
+        assert fake.num_clients == 1 and fake.num_closed == 0
+
+        # rotated credentials come with a new session, the old client is closed
+        s3.async_session = rotated
+        rotated.objects = fake.objects
+        assert await s3.aget("b/c") == b"0123456789"
+        assert fake.num_closed == 1 and rotated.num_clients == 1
+
+        await s3._async_close()
+        assert rotated.num_closed == 1
+
+    rotated = _AsyncS3Client()
+    with patch("deeplake.core.storage.s3.aioboto3", object()):
+        assert s3.async_supported()
+        asyncio.run(run())
+
+        async def read_in_context():
+            async with s3:
+                assert await s3.aget("b/c") == b"0123456789"
+
+        # the client is closed when leaving the context
+        asyncio.run(read_in_context())
+        assert rotated.num_clients == 2 and rotated.num_closed == 2
+
+        # clients left open are not closed from the finalizer, which only warns
+        loop = asyncio.new_event_loop()
+        loop.run_until_complete(s3.aget("b/c"))
+        assert rotated.num_clients == 3
+        with pytest.warns(ResourceWarning):
+            del s3
+            gc.collect()
+        assert rotated.num_closed == 2
+        loop.close()
@@ -0,0 +1,165 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Set
+
+from deeplake.core.storage.provider import StorageProvider
+
+
+class WriteBehindUploader:
+    """Writes values to a storage provider from a pool of background threads.
+
+    The uploader holds at most ``max_in_flight_bytes`` worth of values at a time. :meth:`submit` blocks until enough of the
+    earlier writes have finished (backpressure), so that a large ``extend`` can not buffer an unbounded amount of data in memory.
+    A single value larger than the budget is still accepted once nothing else is in flight.
+
+    Values that are in flight, or whose write failed, can be read back with :meth:`get` until they reach the storage.
+    """
+
+    def __init__(
+        self,
+        storage: StorageProvider,
+        num_workers: int,
+        max_in_flight_bytes: int,
+        on_write: Optional[Callable[[int, float], None]] = None,
+    ):
+        """Initializes the WriteBehindUploader.
+
+        Args:
+            storage (StorageProvider): The storage provider the values are written to. Must be safe to write to from multiple threads.
+            num_workers (int): Number of threads used for writing.
+            max_in_flight_bytes (int): Maximum number of bytes held by the uploader at any point in time.
+            on_write (Callable, optional): Called from the worker threads with the number of bytes and the duration in seconds
+                of every successful write.
+
+        Raises:
+            ValueError: If ``num_workers`` or ``max_in_flight_bytes`` is not positive.
+        """
+        if num_workers <= 0:
+            raise ValueError(f"`num_workers` must be > 0. Got: {num_workers}")
+        if max_in_flight_bytes <= 0:
+            raise ValueError(
+                f"`max_in_flight_bytes` must be > 0. Got: {max_in_flight_bytes}"
+            )
+        self.storage = storage
+        self.num_workers = num_workers
+        self.max_in_flight_bytes = max_in_flight_bytes
+        self.on_write = on_write
+
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._cond = threading.Condition()
+        self._in_flight: Dict[str, bytes] = {}
+        self._in_flight_bytes = 0
+        self._failed: Dict[str, bytes] = {}
+        self._errors: List[Exception] = []
+
+    @property
+    def in_flight_bytes(self) -> int:
+        return self._in_flight_bytes
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.num_workers, thread_name_prefix="deeplake_upload"
+            )
+        return self._executor
+
+    def submit(self, path: str, value: bytes):
+        """Schedules ``value`` to be written at ``path``. Blocks while the in-flight byte budget is exhausted.
+
+        If a write to the same path is already in flight, waits for it to finish first so that writes to a path land in order.
+
+        Args:
+            path (str): The path relative to the root of the storage.
+            value (bytes): The value to be written.
+        """
+        nbytes = len(value)
+        with self._cond:
+            while path in self._in_flight or (
+                self._in_flight_bytes
+                and self._in_flight_bytes + nbytes > self.max_in_flight_bytes
+            ):
+                self._cond.wait()
+            self._failed.pop(path, None)
+            self._in_flight[path] = value
+            self._in_flight_bytes += nbytes
+        self._get_executor().submit(self._write, path, value, nbytes)
+
+    def _write(self, path: str, value: bytes, nbytes: int):
+        error = None
+        start = time.perf_counter()
+        try:
+            self.storage[path] = value
+        except Exception as e:
+            error = e
+        else:
+            if self.on_write is not None:
+                self.on_write(nbytes, time.perf_counter() - start)
+        with self._cond:
+            del self._in_flight[path]
+            self._in_flight_bytes -= nbytes
+            if error is not None:
+                self._failed[path] = value
+                self._errors.append(error)
+            self._cond.notify_all()
+
+    def get(self, path: str) -> Optional[bytes]:
+        """Returns the value for ``path`` if it has not reached the storage yet, else ``None``."""
+        with self._cond:
+            value = self._in_flight.get(path)
+            if value is None:
+                value = self._failed.get(path)
+            return value
+
+    def keys(self) -> Set[str]:
+        """Returns the paths that have not reached the storage yet."""
+        with self._cond:
+            return set(self._in_flight).union(self._failed)
+
+    def retry_failed(self):
+        """Resubmits the values whose previous write failed."""
+        with self._cond:
+            failed = self._failed
+            self._failed = {}
+        for path, value in failed.items():
+            self.submit(path, value)
+
+    def wait(self, path: Optional[str] = None, raise_errors: bool = True):
+        """Blocks until the write to ``path`` (or all writes, if ``path`` is ``None``) has finished.
+
+        Args:
+            path (str, optional): Path to wait for. Waits for all writes if ``None``.
+            raise_errors (bool): If ``True`` and ``path`` is ``None``, re-raises the first error encountered by the writes since the last call.
+
+        Raises:
+            Exception: The first error encountered by a failed write, if ``raise_errors`` is ``True``.
+        """
+        with self._cond:
+            while (path in self._in_flight) if path else self._in_flight:
+                self._cond.wait()
+            if path is not None or not self._errors:
+                return
+            errors = self._errors
+            self._errors = []
+        if raise_errors:
+            raise errors[0]
+
+    def discard(self, path: str):
+        """Waits for any write to ``path`` to finish and forgets it if it failed."""
+        self.wait(path)
+        with self._cond:
+            self._failed.pop(path, None)
+
+    def clear(self):
+        """Waits for all writes to finish and forgets any failed writes and errors."""
+        self.wait(raise_errors=False)
+        with self._cond:
+            self._failed.clear()
+            self._errors.clear()
+
+    def shutdown(self):
+        """Waits for all writes to finish and releases the worker threads."""
+        self.wait(raise_errors=False)
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
@@ -29,6 +29,7 @@ from deeplake.util.keys import (
     get_tensor_meta_key,
     get_tensor_tile_encoder_key,
     get_sequence_encoder_key,
+    get_tensor_shape_index_key,
     tensor_exists,
     get_tensor_info_key,
     get_sample_id_tensor_key,
@@ -181,6 +182,12 @@ def delete_tensor(key: str, dataset):
     except KeyError:
         pass
 
+    shape_index_key = get_tensor_shape_index_key(key, commit_id)
+    try:
+        del storage[shape_index_key]
+    except KeyError:
+        pass
+
 
 def _inplace_op(f):
     op = f.__name__
@@ -498,10 +505,16 @@ class Tensor:
             if sample_shape_tensor
             else None
         )
+        batched_sample_shape_provider = (
+            self._batched_sample_shape_provider(sample_shape_tensor)
+            if sample_shape_tensor and not self.is_sequence
+            else None
+        )
         return self.chunk_engine.shapes(
             self.index,
             sample_shape_provider=sample_shape_provider,
             pad_tensor=self.pad_tensor,
+            batched_sample_shape_provider=batched_sample_shape_provider,
         )
 
     @property
@@ -761,7 +774,7 @@ class Tensor:
         return len(self.meta.max_shape) == 0
 
     def numpy(
-        self, aslist=False, fetch_chunks=False
+        self, aslist=False, fetch_chunks=False, copy=True
     ) -> Union[np.ndarray, List[np.ndarray]]:
         """Computes the contents of the tensor in numpy format.
 
@@ -774,6 +787,9 @@ class Tensor:
 
                 - The tensor is ChunkCompressed.
                 - The chunk which is being accessed has more than 128 samples.
+            copy (bool): If ``False``, the data is returned without copying it from the chunk buffer when possible, i.e. for
+                consecutive samples of a single chunk of a fixed shape tensor that is uncompressed or has small samples.
+                Such arrays are read-only. Defaults to ``True``.
 
         Raises:
             DynamicTensorNumpyError: If reading a dynamically-shaped array slice without ``aslist=True``.
@@ -790,6 +806,7 @@ class Tensor:
             aslist=aslist,
             fetch_chunks=fetch_chunks or self.is_iteration,
             pad_tensor=self.pad_tensor,
+            copy=copy,
         )
         if self.htype == "point_cloud":  # TODO: refactor
             if isinstance(ret, list):
@@ -1163,6 +1180,12 @@ class Tensor:
 
         return get_sample_shape
 
+    def _batched_sample_shape_provider(self, sample_shape_tensor) -> Callable:
+        def get_sample_shapes(index_entry: IndexEntry) -> np.ndarray:
+            return sample_shape_tensor[Index([index_entry])].numpy(fetch_chunks=True)
+
+        return get_sample_shapes
+
     def _get_sample_info_at_index(self, global_sample_index: int, sample_info_tensor):
         if self.is_sequence:
             return [
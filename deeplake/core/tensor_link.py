@@ -154,6 +154,15 @@ def extend_shape(samples, link_creds=None, tensor_meta=None):
             return np.tile(np.array([samples_shape[1:]]), (samples_shape[0], 1))
     if samples is None:
         return np.array([], dtype=np.int64)
+    first = samples[0] if len(samples) else None
+    if isinstance(first, np.ndarray) and first.dtype != object and first.ndim:
+        # arrays of the same shape, e.g. embeddings, have the same shape entry
+        shape = first.shape
+        if all(isinstance(s, np.ndarray) and s.shape == shape for s in samples):
+            first_shape = update_shape.f(
+                first, link_creds=link_creds, tensor_meta=tensor_meta
+            )
+            return np.tile(first_shape, (len(samples), 1))
     shapes = [
         update_shape.f(sample, link_creds=link_creds, tensor_meta=tensor_meta)
         for sample in samples
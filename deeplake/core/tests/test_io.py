@@ -1,11 +1,24 @@
 from typing import Iterator
+from unittest.mock import patch
+import shutil
 
+import numpy as np
+
+import deeplake
+from deeplake.constants import KB
+from deeplake.core.chunk.sample_compressed_chunk import SampleCompressedChunk
+from deeplake.core.chunk_engine import ChunkEngine
+from deeplake.util.storage import get_pytorch_local_storage
 from deeplake.util.testing import assert_array_equal
 from deeplake.core.io import (
+    BucketingScheduler,
+    ChunkPoolShufflingScheduler,
     IOBlock,
+    SampleStreaming,
     Streaming,
     Schedule,
     SequentialMultithreadScheduler,
+    SingleThreadScheduler,
 )
 
 
@@ -28,3 +41,165 @@ def test_sequential_scheduler():
     assert_array_equal([b.indices() for b in result[1]._blocks], [[2, 6, 10]])
     assert_array_equal([b.indices() for b in result[2]._blocks], [[3, 7], [11]])
     assert_array_equal([b.indices() for b in result[3]._blocks], [[4, 8], [12]])
+
+
+def test_chunk_pool_scheduler():
+    def blocks():
+        return [
+            IOBlock([[f"c{i}"]], list(range(10 * i, 10 * i + 10))) for i in range(10)
+        ]
+
+    def chunk_switches(schedule):
+        chunks = [b.chunks()[0][0] for b in schedule for _ in b.indices()]
+        return sum(a != b for a, b in zip(chunks, chunks[1:]))
+
+    mixing = []
+    for pool_size in (1, 3, 10):
+        under_test = ChunkPoolShufflingScheduler(
+            SingleThreadScheduler(), pool_size=pool_size, seed=0
+        )
+        schedule = under_test.schedule(blocks())[0]
+        indices = [i for b in schedule for i in b.indices()]
+        assert sorted(indices) == list(range(100))
+        assert len(schedule) == 100
+        if pool_size == 1:
+            # one chunk at a time
+            assert chunk_switches(schedule) == 9
+        else:
+            assert chunk_switches(schedule) > 9
+        # a chunk is not read again once its samples ran out
+        first = {}
+        last = {}
+        for position, b in enumerate(schedule):
+            first.setdefault(b.chunks()[0][0], position)
+            last[b.chunks()[0][0]] = position
+        open_chunks = max(
+            sum(first[c] <= position <= last[c] for c in first)
+            for position in range(len(list(schedule)))
+        )
+        assert open_chunks <= pool_size
+        stats = schedule.mixing()
+        assert stats["pool_size"] == pool_size
+        mixing.append(stats["mixing"])
+
+        schedule.shuffle()
+        assert sorted(i for b in schedule for i in b.indices()) == list(range(100))
+
+    assert mixing[0] < mixing[1] < mixing[2] == 1.0
+
+    same_seed = ChunkPoolShufflingScheduler(SingleThreadScheduler(), 3, seed=0)
+    schedule = same_seed.schedule(blocks())[0]
+    other = same_seed.schedule(blocks())[0]
+    assert [b.indices() for b in schedule] == [b.indices() for b in other]
+
+    under_test = ChunkPoolShufflingScheduler.from_memory_budget(
+        SingleThreadScheduler(), 100 * KB, 16 * KB
+    )
+    assert under_test.pool_size == 6
+
+
+def test_bucketing_scheduler():
+    blocks = [IOBlock([[f"c{i}"]], list(range(10 * i, 10 * i + 10))) for i in range(4)]
+    sizes = {i: i % 7 for i in range(40)}
+
+    under_test = BucketingScheduler(
+        SingleThreadScheduler(), sizes, batch_size=4, boundaries=[2, 5]
+    )
+    schedule = under_test.schedule(blocks)[0]
+    indices = [i for b in schedule for i in b.indices()]
+    assert sorted(indices) == list(range(40))
+    assert len(schedule) == 40
+    batches = [indices[i : i + 4] for i in range(0, 40, 4)]
+    buckets = [{under_test.buckets[i] for i in batch} for batch in batches]
+    # only the last batches mix buckets
+    assert all(len(b) == 1 for b in buckets[:-2])
+    assert batches[0] == [0, 1, 7, 8]
+    # consecutive samples of a chunk are read together
+    assert schedule._order[0].chunks() == [["c0"]]
+    assert schedule._order[0].indices()[:4] == [0, 1, 7, 8]
+
+    shuffling = BucketingScheduler(
+        ChunkPoolShufflingScheduler(SingleThreadScheduler(), 2), sizes, batch_size=4
+    )
+    schedule = shuffling.schedule(blocks)[0]
+    schedule.shuffle(seed=0)
+    shuffled = [i for b in schedule for i in b.indices()]
+    assert sorted(shuffled) == list(range(40)) and shuffled != indices
+    schedule.shuffle(seed=0)
+    assert [i for b in schedule for i in b.indices()] == shuffled
+
+    default = BucketingScheduler(SingleThreadScheduler(), sizes, batch_size=4)
+    assert default.boundaries == sorted(set(default.boundaries))
+    assert len(set(default.buckets.values())) == 7
+
+
+def test_sample_sizes(local_path):
+    lengths = [(7 * i) % 15 + 1 for i in range(60)]
+    with deeplake.empty(local_path, overwrite=True) as ds:
+        ds.create_tensor("tokens", dtype="int64", max_chunk_size=2 * KB)
+        ds.tokens.extend([np.full((n, 2), i) for i, n in enumerate(lengths)])
+    assert ds.tokens.chunk_engine.shape_index is not None
+
+    # sizes are looked up in the shape index, not in the chunk headers
+    with patch.object(
+        ChunkEngine, "get_chunk", side_effect=AssertionError("chunk read")
+    ):
+        sizes = SampleStreaming(ds, tensors=["tokens"]).sample_sizes("tokens")
+        assert sizes == {i: 2 * n for i, n in enumerate(lengths)}
+        view = ds[10:20]
+        sizes = SampleStreaming(view, tensors=["tokens"]).sample_sizes("tokens")
+        assert sizes == {i: 2 * lengths[i] for i in range(10, 20)}
+
+
+def test_sample_streaming_local_cache(local_path, monkeypatch):
+    cache_path = f"{local_path}_shared_cache"
+    monkeypatch.setenv("SHARED_CACHE_PREFIX", cache_path)
+    arr = np.arange(2000, dtype=np.int32).reshape(200, 10)
+    try:
+        with deeplake.empty(local_path, overwrite=True) as ds:
+            ds.create_tensor("x", max_chunk_size=2 * KB)
+            ds.x.extend(arr)
+
+        def stream():
+            streaming = SampleStreaming(ds, tensors=["x"], use_local_cache=True)
+            schedule = Schedule(streaming.list_blocks())
+            return np.stack([sample["x"] for sample in streaming.read(schedule)])
+
+        # chunks of the head commit can still be rewritten, so they are not cached
+        assert_array_equal(stream(), arr)
+        local_storage = get_pytorch_local_storage(ds)
+        assert len(local_storage) == 0
+
+        ds.commit()
+        assert_array_equal(stream(), arr)
+        num_chunks = ds.x.chunk_engine.num_chunks
+        assert len(local_storage) == num_chunks
+        # later runs read the chunks from the shared cache
+        with patch.object(
+            ChunkEngine, "get_chunk", side_effect=AssertionError("chunk read")
+        ):
+            assert_array_equal(stream(), arr)
+    finally:
+        shutil.rmtree(cache_path, ignore_errors=True)
+
+
+def test_sample_streaming_parallel_decode(local_path, monkeypatch):
+    arrs = [np.full((10, 10, 3), i, dtype="uint8") for i in range(50)]
+    with deeplake.empty(local_path, overwrite=True) as ds:
+        ds.create_tensor("image", htype="image", sample_compression="png")
+        ds.create_tensor("label")
+        ds.image.extend(arrs)
+        ds.label.extend(np.arange(50))
+    monkeypatch.setattr(deeplake.constants, "DECODE_WORKERS", 4)
+
+    streaming = SampleStreaming(ds, tensors=["image", "label"])
+    schedule = Schedule(streaming.list_blocks())
+    with patch.object(
+        SampleCompressedChunk,
+        "read_sample",
+        side_effect=AssertionError("decoded serially"),
+    ):
+        samples = list(streaming.read(schedule))
+    assert [s["label"].item() for s in samples] == list(range(50))
+    for s in samples:
+        assert_array_equal(s["image"], arrs[s["label"].item()])
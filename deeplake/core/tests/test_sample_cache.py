@@ -0,0 +1,35 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from deeplake.core.sample_cache import DecodedSampleCache
+
+
+def test_decoded_sample_cache():
+    cache = DecodedSampleCache(100)
+    a, b = np.zeros(40, dtype=np.uint8), np.ones(40, dtype=np.uint8)
+
+    cache.put(("chunk", 0), a)
+    cache.put(("chunk", 1), b)
+    assert cache.nbytes == 80
+    assert cache.get(("chunk", 0)) is a  # ("chunk", 1) is now the least recently used
+
+    cache.put(("chunk", None), np.ones(30, dtype=np.uint8))
+    assert ("chunk", 1) not in cache
+    assert len(cache) == 2 and cache.nbytes == 70
+    assert cache.get(("chunk", 1)) is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # arrays larger than the cache are not stored
+    cache = DecodedSampleCache(100)
+    cache.put(("chunk", 0), a)
+    cache.put(("chunk", 0), np.zeros(200, dtype=np.uint8))
+    assert len(cache) == 0 and cache.nbytes == 0
+
+    cache.put(("chunk", 0), a)
+    cache = pickle.loads(pickle.dumps(cache))
+    assert cache.max_bytes == 100 and len(cache) == 0
+
+    with pytest.raises(ValueError):
+        DecodedSampleCache(-1)
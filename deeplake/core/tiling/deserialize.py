@@ -1,9 +1,38 @@
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 import numpy as np
-from typing import List, Tuple, Union, Optional
+from typing import Callable, List, Sequence, Tuple, Union, Optional
+import deeplake
 from deeplake.core.chunk.base_chunk import BaseChunk
 from deeplake.core.meta.encode.tile import TileEncoder
 
 
+_tile_executor: Optional[ThreadPoolExecutor] = None
+_tile_executor_key: Optional[Tuple[int, int]] = None
+_tile_executor_lock = threading.Lock()
+
+
+def get_tile_executor() -> Optional[ThreadPoolExecutor]:
+    """Returns the shared threads that decode the tiles of tiled samples, or ``None`` if tiles are read one by one.
+    See ``deeplake.constants.TILE_READ_NUM_WORKERS``."""
+    global _tile_executor, _tile_executor_key
+    num_workers = deeplake.constants.TILE_READ_NUM_WORKERS
+    if num_workers <= 0:
+        return None
+    key = (os.getpid(), num_workers)
+    with _tile_executor_lock:
+        if _tile_executor_key != key:
+            # threads are not inherited by forked processes
+            if _tile_executor is not None and _tile_executor_key[0] == key[0]:  # type: ignore
+                _tile_executor.shutdown(wait=False)
+            _tile_executor = ThreadPoolExecutor(
+                max_workers=num_workers, thread_name_prefix="deeplake_tiles"
+            )
+            _tile_executor_key = key
+        return _tile_executor
+
+
 def coalesce_tiles(
     tiles: np.ndarray,
     tile_shape: Tuple[int, ...],
@@ -54,9 +83,83 @@ def combine_chunks(
     tile_shape = tile_encoder.get_tile_shape(sample_index)
     layout_shape = tile_encoder.get_tile_layout_shape(sample_index)
 
-    # index is always 0 within a chunk for tiled samples
-    tiled_arrays = [chunk.read_sample(0, is_tile=True) for chunk in chunks]
-    return np_list_to_sample(tiled_arrays, shape, tile_shape, layout_shape, dtype)
+    tiles = np.empty((len(chunks),), dtype=object)
+    tiles[:] = chunks
+    return read_tiles(
+        tiles.reshape(layout_shape), lambda x: x, shape, tile_shape, dtype
+    )
+
+
+def read_tiles(
+    tile_ids: np.ndarray,
+    get_chunks: Callable[[List], Sequence[BaseChunk]],
+    sample_shape: Tuple[int, ...],
+    tile_shape: Tuple[int, ...],
+    dtype: Union[str, np.dtype],
+    first_tile: Optional[Tuple[int, ...]] = None,
+) -> np.ndarray:
+    """Reads tiles of a tiled sample and assembles them into a single array.
+
+    Tiles are fetched in batches of at most ``deeplake.constants.TILE_READ_MAX_BYTES_IN_FLIGHT`` bytes. While the tiles
+    of a batch are decoded and copied into the output by the threads of :func:`get_tile_executor`, the next batch is
+    fetched by the calling thread, so that storage access stays on a single thread.
+
+    Args:
+        tile_ids (np.ndarray): Grid of the ids of the chunks of the tiles to read.
+        get_chunks (Callable[[List], Sequence[BaseChunk]]): Fetches the chunks of a list of ids.
+        sample_shape (Tuple[int, ...]): Shape of the whole sample.
+        tile_shape (Tuple[int, ...]): Tile shape. Corner tiles may be smaller than this.
+        dtype (Union[str, np.dtype]): Dtype of the sample.
+        first_tile (Tuple[int, ...], optional): Coordinates of ``tile_ids[0, ..., 0]`` in the tile layout of the sample.
+            Defaults to the first tile of the sample.
+
+    Returns:
+        np.ndarray: The part of the sample covered by the tiles.
+    """
+    first_tile = tuple(first_tile or ())
+    first_tile += (0,) * (len(sample_shape) - len(first_tile))
+    low = np.multiply(first_tile, tile_shape)
+    high = np.minimum(low + np.multiply(tile_ids.shape, tile_shape), sample_shape)
+    out = np.empty(tuple(high - low), dtype=dtype)
+    if tile_ids.size == 0:
+        return out
+
+    def read_tile(chunk: BaseChunk, tile_coords: Tuple[int, ...]):
+        # index is always 0 within a chunk for tiled samples
+        tile = chunk.read_sample(0, is_tile=True)
+        start = np.multiply(tile_coords, tile_shape)
+        out[tuple(slice(l, l + n) for l, n in zip(start, tile.shape))] = tile
+
+    coords = list(np.ndindex(*tile_ids.shape))
+    executor = get_tile_executor() if len(coords) > 1 else None
+    if executor is None:
+        for tile_coords, chunk in zip(coords, get_chunks(list(tile_ids.flat))):
+            read_tile(chunk, tile_coords)
+        return out
+
+    tile_nbytes = int(np.prod(tile_shape)) * np.dtype(dtype).itemsize
+    # up to two batches are in memory at once, the one being decoded and the one being fetched
+    batch_size = max(
+        1,
+        deeplake.constants.TILE_READ_MAX_BYTES_IN_FLIGHT // max(2 * tile_nbytes, 1),
+    )
+    pending: List[Future] = []
+    try:
+        for start in range(0, len(coords), batch_size):
+            batch = coords[start : start + batch_size]
+            chunks = get_chunks([tile_ids[tile_coords] for tile_coords in batch])
+            for future in pending:
+                future.result()
+            pending = [
+                executor.submit(read_tile, chunk, tile_coords)
+                for chunk, tile_coords in zip(chunks, batch)
+            ]
+        for future in pending:
+            future.result()
+    finally:
+        for future in pending:
+            future.cancel()
+    return out
 
 
 def np_list_to_sample(
@@ -2,6 +2,7 @@ from typing import Optional, Tuple, Union
 import numpy as np
 
 from deeplake.core.compression import compress_array
+from deeplake.core.encode_pool import get_encode_pool
 from deeplake.core.tiling.optimizer import get_tile_shape
 from deeplake.core.tiling.serialize import (
     break_into_tiles,
@@ -64,7 +65,20 @@ class SampleTiles:
         )
         self.tile_shape = tile_shape
         tiles = break_into_tiles(arr, tile_shape)
-        self.tiles = serialize_tiles(tiles, lambda x: compress_array(x, compression))
+        pool = get_encode_pool() if compression else None
+        if pool is None:
+            self.tiles = serialize_tiles(
+                tiles, lambda x: compress_array(x, compression)
+            )
+        else:
+            # tiles are compressed concurrently, see `deeplake.constants.ENCODE_WORKERS`
+            futures = {
+                index: pool.submit((tiles[index], compression))
+                for index in np.ndindex(*tiles.shape)
+            }
+            self.tiles = np.empty(tiles.shape, dtype=object)
+            for index, future in futures.items():
+                self.tiles[index] = future.result()
         tile_shapes = np.vectorize(lambda x: x.shape, otypes=[object])(tiles)
 
         self.shapes_enumerator = np.ndenumerate(tile_shapes)
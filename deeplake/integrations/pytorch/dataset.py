@@ -1,4 +1,7 @@
-from typing import Optional, Sequence, List, Dict
+from math import ceil, floor
+from random import randrange
+from typing import Any, Iterator, Optional, Sequence, List, Dict, Tuple
+import deeplake
 from deeplake.constants import MB
 from deeplake.integrations.pytorch.common import PytorchTransformFunction
 from deeplake.util.exceptions import TransformFailedError
@@ -6,17 +9,22 @@ from deeplake.util.exceptions import TransformFailedError
 from deeplake.util.iterable_ordered_dict import IterableOrderedDict
 from deeplake.util.warnings import always_warn
 from deeplake.core.io import (
+    BucketingScheduler,
     DistributedScheduler,
+    IOBlock,
     SampleStreaming,
     Schedule,
     SequentialMultithreadScheduler,
-    ShufflingSchedulerWrapper,
+    ChunkPoolShufflingScheduler,
     SingleThreadScheduler,
     MultiThreadedNaiveScheduler,
 )
 from deeplake.core.sample import Sample
 from deeplake.core.polygon import Polygons
-from deeplake.integrations.pytorch.shuffle_buffer import ShuffleBuffer
+from deeplake.integrations.pytorch.shuffle_buffer import (
+    ArrayShuffleBuffer,
+    ShuffleBuffer,
+)
 
 import torch
 import torch.utils.data
@@ -92,6 +100,33 @@ def _process(sample, transform: Optional[PytorchTransformFunction], return_index
     return sample
 
 
+def _cast_batch(batch: np.ndarray):
+    # batches are read into new arrays, they only need to be copied to be casted
+    cast = cast_type(batch)
+    return batch if cast is None else cast
+
+
+def _process_batch(
+    batch, transform: Optional[PytorchTransformFunction], return_index: bool
+):
+    batch = IterableOrderedDict(
+        (
+            k,
+            [copy_tensor(x) for x in v] if isinstance(v, list) else _cast_batch(v),
+        )
+        for k, v in batch.items()
+    )
+    index = batch["index"][0, 0]
+    if not return_index:
+        del batch["index"]
+    if transform:
+        try:
+            return transform(batch)
+        except Exception as e:
+            raise TransformFailedError(index) from e
+    return batch
+
+
 class TorchDataset(torch.utils.data.IterableDataset):
     def __init__(
         self,
@@ -107,6 +142,12 @@ class TorchDataset(torch.utils.data.IterableDataset):
         decode_method: Optional[Dict[str, str]] = None,
         batch_size: int = 1,
         cache_size: int = 32 * MB,
+        stream_batches: bool = False,
+        drop_last: bool = False,
+        seed: Optional[int] = None,
+        bucket_by: Optional[str] = None,
+        bucket_boundaries: Optional[Sequence[int]] = None,
+        shuffle_pool_size: int = 1,
     ) -> None:
         super().__init__()
 
@@ -120,6 +161,14 @@ class TorchDataset(torch.utils.data.IterableDataset):
         self.decode_method = decode_method
         self.batch_size = batch_size
         self.cache_size = cache_size
+        self.stream_batches = stream_batches
+        self.drop_last = drop_last
+        self.seed: int = seed if seed is not None else randrange(2**32)
+        self.epoch = 0
+        self.skip_batches = 0
+        # number of iterations since the last call to `set_iteration_state`, epochs of persistent workers
+        self._iterations = 0
+        self.yield_indices = False
 
         self.use_local_cache = use_local_cache
         self.scheduler = use_scheduler(num_workers, shuffle, batch_size)
@@ -127,9 +176,6 @@ class TorchDataset(torch.utils.data.IterableDataset):
         if dist.is_initialized():
             self.scheduler = DistributedScheduler(num_workers)
 
-        if shuffle:
-            self.scheduler = ShufflingSchedulerWrapper(self.scheduler)
-
         streaming = SampleStreaming(
             dataset,
             tensors=self.tensors,  # type: ignore
@@ -140,34 +186,129 @@ class TorchDataset(torch.utils.data.IterableDataset):
             cache_size=cache_size,
         )
 
+        if shuffle:
+            if shuffle_pool_size > streaming.max_chunks_in_cache():
+                always_warn(
+                    f"`shuffle_pool_size` ({shuffle_pool_size}) is larger than the number of chunks that fit in "
+                    f"`cache_size` ({streaming.max_chunks_in_cache()}), chunks may be read more than once."
+                )
+            # samples are mixed across `shuffle_pool_size` chunks at a time
+            self.scheduler = ChunkPoolShufflingScheduler(
+                self.scheduler, shuffle_pool_size, seed=self.seed
+            )
+
+        if bucket_by is not None:
+            # batches of samples of similar size, looked up in the shapes of the tensor
+            self.scheduler = BucketingScheduler(
+                self.scheduler,
+                streaming.sample_sizes(bucket_by),
+                batch_size or 1,
+                bucket_boundaries,
+            )
+
         self.schedules: List[Schedule] = self.scheduler.schedule(
             streaming.list_blocks()
         )
 
-    def __iter__(self):
-        worker_info = torch.utils.data.get_worker_info()
-        schedule: Schedule = self.schedules[0]
-
-        if worker_info is not None:
-            schedule = self.schedules[worker_info.id]
-
-        streaming = SampleStreaming(
+    def set_iteration_state(self, epoch: int, num_batches: int = 0):
+        """Sets the epoch of the next iteration, which seeds the shuffling of the samples, and the number of its batches
+        already consumed by the loader. The samples of these batches are skipped without reading their chunks.
+        """
+        self.epoch = epoch
+        self.skip_batches = num_batches
+        self._iterations = 0
+
+    def _resume_position(self) -> Tuple[int, List[int]]:
+        """Returns the schedule of the worker that produces the next batch, and the number of samples of each schedule
+        that were consumed, after the first ``skip_batches`` batches of the epoch."""
+        # the loader takes batches from the workers in turn, skipping the workers that are done
+        batch_size = self.batch_size or 1
+        round_fn = floor if self.drop_last else ceil
+        num_batches = [
+            round_fn(len(schedule) / batch_size) for schedule in self.schedules
+        ]
+        consumed = [0] * len(num_batches)
+        worker = 0
+        remaining = self.skip_batches
+        while remaining and consumed != num_batches:
+            if consumed[worker] < num_batches[worker]:
+                consumed[worker] += 1
+                remaining -= 1
+            worker = (worker + 1) % len(num_batches)
+        skip = [
+            min(batches * batch_size, len(schedule))
+            for batches, schedule in zip(consumed, self.schedules)
+        ]
+        return worker, skip
+
+    def _streaming(self) -> SampleStreaming:
+        return SampleStreaming(
             self.dataset,
             tensors=self.tensors,
             use_local_cache=self.use_local_cache,
             pad_tensors=self.pad_tensors,
             decode_method=self.decode_method,
+            cache_size=self.cache_size,
         )
 
+    def read_samples(self, indices: Sequence[int]) -> Iterator[Tuple[int, Any]]:
+        """Reads and processes the samples at ``indices`` of the dataset, returns pairs of index and sample."""
+        streaming = self._streaming()
+        blocks: List[IOBlock] = [
+            streaming._get_block_for_single_sample(index) for index in indices
+        ]
+        for data in streaming.read(Schedule(blocks)):
+            yield int(data["index"][0]), _process(
+                data, self.transform, self.return_index
+            )
+
+    def __iter__(self):
+        worker_info = torch.utils.data.get_worker_info()
+        worker_id = 0 if worker_info is None else worker_info.id
+
+        # persistent workers keep their copy of the dataset, they count their epochs
+        epoch = self.epoch + self._iterations
+        skip = 0
+        if self._iterations == 0 and self.skip_batches:
+            # the loader starts with its first worker, schedules are rotated so that it takes the next batch
+            first, skips = self._resume_position()
+            worker_id = (worker_id + first) % len(self.schedules)
+            skip = skips[worker_id]
+        self._iterations += 1
+        schedule: Schedule = self.schedules[worker_id]
+
+        streaming = self._streaming()
+
         if self.shuffle:
-            schedule.shuffle()
+            schedule.shuffle(seed=f"{self.seed}-{epoch}-{worker_id}")
+
+        if skip:
+            schedule = schedule.skip(skip)
+
+        if self.stream_batches:
+            for batch in streaming.read_batches(
+                schedule, self.batch_size, self.drop_last
+            ):
+                yield _process_batch(batch, self.transform, self.return_index)
+            return
 
         stream = streaming.read(schedule)
 
         for data in stream:
-            yield _process(data, self.transform, self.return_index)
+            if self.yield_indices:
+                yield int(data["index"][0]), _process(
+                    data, self.transform, self.return_index
+                )
+            else:
+                yield _process(data, self.transform, self.return_index)
 
     def __len__(self):
+        if self.stream_batches:
+            # number of batches
+            round_fn = floor if self.drop_last else ceil
+            return sum(
+                round_fn(len(schedule) / self.batch_size) for schedule in self.schedules
+            )
         return sum(map(len, self.schedules))
 
 
@@ -185,6 +326,8 @@ class SubIterableDataset(torch.utils.data.IterableDataset):
         pad_tensors: bool = False,
         decode_method: Optional[Dict[str, str]] = None,
         cache_size: int = 32 * MB,
+        seed: Optional[int] = None,
+        shuffle_pool_size: int = 1,
     ) -> None:
         super().__init__()
 
@@ -198,18 +341,63 @@ class SubIterableDataset(torch.utils.data.IterableDataset):
             return_index=return_index,
             pad_tensors=pad_tensors,
             decode_method=decode_method,
+            batch_size=batch_size,
             cache_size=cache_size,
+            seed=seed,
+            shuffle_pool_size=shuffle_pool_size,
         )
+        # indices of the samples are kept in the shuffle buffer to save its state
+        self.torch_datset.yield_indices = True
         if buffer_size:
             self.transform = transform
         self.num_workers = num_workers
         self.batch_size = batch_size
         self.buffer_size = buffer_size * MB
         self.return_index = return_index
+        self.seed = self.torch_datset.seed
+        self.epoch = 0
+        # progress of the current iteration, number of batches read from the sub loader and samples of the next one
+        self._sub_batches = 0
+        self._sub_position = 0
+        self._buffer: Optional[ShuffleBuffer] = None
+        self._resume_state: Optional[Dict[str, Any]] = None
         if self.buffer_size == 0:
             warn("setting buffer_size = 0 will result in poor shuffling distribution")
 
+    def set_iteration_state(self, epoch: int, num_batches: int = 0):
+        """Sets the epoch of the next iteration. The progress within the epoch is restored from
+        :meth:`load_state_dict`, since the samples in the shuffle buffer have to be read again.
+        """
+        self.epoch = epoch
+
+    def state_dict(self) -> Dict[str, Any]:
+        """Returns the progress of the current iteration: the number of samples read from the sub loader, the
+        indices of the samples in the shuffle buffer and the state of its random number generator.
+        """
+        buffer = self._buffer
+        return {
+            "sub_batches": self._sub_batches,
+            "sub_position": self._sub_position,
+            "buffer_indices": [] if buffer is None else buffer.buffered_tags(),
+            "buffer_rng": None if buffer is None else buffer.rng_state(),
+        }
+
+    def load_state_dict(self, state: Dict[str, Any]):
+        """Resumes the next iteration from a state returned by :meth:`state_dict`."""
+        self._resume_state = state
+
+    def _new_buffer(self) -> ShuffleBuffer:
+        if deeplake.constants.USE_ARRAY_SHUFFLE_BUFFER:
+            return ArrayShuffleBuffer(self.buffer_size, seed=[self.seed, self.epoch])
+        return ShuffleBuffer(self.buffer_size, seed=f"{self.seed}-{self.epoch}")
+
     def __iter__(self):
+        state = self._resume_state
+        self._resume_state = None
+        self._sub_batches = state["sub_batches"] if state else 0
+        self._sub_position = 0
+        skip_position = state["sub_position"] if state else 0
+        self.torch_datset.set_iteration_state(self.epoch, self._sub_batches)
         sub_loader = DataLoader(
             self.torch_datset,
             batch_size=self.batch_size,
@@ -218,15 +406,29 @@ class SubIterableDataset(torch.utils.data.IterableDataset):
         )
         buffer_size = self.buffer_size
         if buffer_size:
-            buffer = ShuffleBuffer(buffer_size)
+            buffer = self._new_buffer()
+            self._buffer = buffer
+            if state:
+                # samples that were in the buffer are read again, in the order of their slots
+                for index, val in self.torch_datset.read_samples(
+                    state["buffer_indices"]
+                ):
+                    buffer.exchange(val, index)
+                buffer.set_rng_state(state["buffer_rng"])
             it = iter(sub_loader)
             try:
                 while True:
                     next_batch = next(it)
-                    for val in next_batch:
-                        result = buffer.exchange(val)
+                    for position, (index, val) in enumerate(next_batch):
+                        if position < skip_position:
+                            continue
+                        self._sub_position = position + 1
+                        result = buffer.exchange(val, index)
                         if result is not None:
                             yield result
+                    skip_position = 0
+                    self._sub_batches += 1
+                    self._sub_position = 0
                     del next_batch
             except StopIteration:
                 pass
@@ -235,8 +437,86 @@ class SubIterableDataset(torch.utils.data.IterableDataset):
             del it
         else:
             for batch in sub_loader:
-                yield from batch
+                for position, (_, val) in enumerate(batch):
+                    if position < skip_position:
+                        continue
+                    self._sub_position = position + 1
+                    yield val
+                skip_position = 0
+                self._sub_batches += 1
+                self._sub_position = 0
         del sub_loader
+        # the next iteration starts a new epoch
+        self._sub_batches = 0
+        self._buffer = None
 
     def __len__(self):
         return len(self.torch_datset)
+
+
+class ResumableDataLoader(DataLoader):
+    """DataLoader over a :class:`TorchDataset` or a :class:`SubIterableDataset` that keeps track of the epoch and of
+    the batches consumed, so that the iteration can be resumed from :meth:`state_dict`.
+
+    Samples are shuffled with a seed that is saved in the state, the order of the samples of an epoch only depends on
+    the seed, the epoch and the number of workers. When resuming, the loader has to be created with the same arguments.
+
+    Args:
+        dataset: :class:`TorchDataset` or :class:`SubIterableDataset`
+        *args: arguments of :class:`torch.utils.data.DataLoader`
+        resume_state (dict, optional): state returned by :meth:`state_dict`
+        **kwargs: keyword arguments of :class:`torch.utils.data.DataLoader`
+    """
+
+    def __init__(self, dataset, *args, resume_state: Optional[Dict] = None, **kwargs):
+        super().__init__(dataset, *args, **kwargs)
+        self._seed: int = dataset.seed
+        self._epoch = 0
+        self._num_batches = 0
+        self._started = False
+        self._resuming = False
+        if resume_state is not None:
+            self.load_state_dict(resume_state)
+
+    def state_dict(self) -> Dict[str, Any]:
+        """Returns the state of the iteration, which can be saved along with a model checkpoint and passed to
+        ``ds.pytorch(..., resume_state=...)``."""
+        state = {
+            "seed": self._seed,
+            "epoch": self._epoch,
+            "num_batches": self._num_batches,
+        }
+        if isinstance(self.dataset, SubIterableDataset):
+            state.update(self.dataset.state_dict())
+        return state
+
+    def load_state_dict(self, state: Dict[str, Any]):
+        """Resumes the next iteration from a state returned by :meth:`state_dict`."""
+        if state["seed"] != self._seed:
+            raise ValueError(
+                "The seed of the state does not match the seed of the dataset, pass the state to `ds.pytorch`."
+            )
+        self._epoch = state["epoch"]
+        self._num_batches = state["num_batches"]
+        self._resuming = True
+        if isinstance(self.dataset, SubIterableDataset):
+            self.dataset.load_state_dict(state)
+
+    def __iter__(self):
+        if self._resuming:
+            self._resuming = False
+        elif self._started:
+            # the previous iteration was interrupted
+            self._epoch += 1
+            self._num_batches = 0
+        self._started = True
+        self.dataset.set_iteration_state(self._epoch, self._num_batches)
+        return self._iterate()
+
+    def _iterate(self):
+        for batch in super().__iter__():
+            self._num_batches += 1
+            yield batch
+        self._epoch += 1
+        self._num_batches = 0
+        self._started = False
@@ -25,12 +25,18 @@ def create_dataloader(
     decode_method,
     persistent_workers,
     cache_size,
+    resume_state,
+    shuffle_pool_size,
+    seed,
 ):
     import torch
     import torch.utils.data
-    from deeplake.integrations.pytorch.dataset import SubIterableDataset
+    from deeplake.integrations.pytorch.dataset import (
+        ResumableDataLoader,
+        SubIterableDataset,
+    )
 
-    return torch.utils.data.DataLoader(
+    return ResumableDataLoader(
         # this data set is more efficient also shuffles
         # using threads race conditions as source of entropy
         SubIterableDataset(
@@ -45,12 +51,15 @@ def create_dataloader(
             pad_tensors=pad_tensors,
             decode_method=decode_method,
             cache_size=cache_size,
+            seed=seed,
+            shuffle_pool_size=shuffle_pool_size,
         ),
         batch_size=batch_size,
         collate_fn=collate_fn,
         pin_memory=pin_memory,
         drop_last=drop_last,
         persistent_workers=persistent_workers,
+        resume_state=resume_state,
     )
 
 
@@ -72,17 +81,36 @@ def dataset_to_pytorch(
     decode_method: Optional[Dict[str, str]] = None,
     persistent_workers: bool = False,
     cache_size: int = 32 * MB,
+    stream_batches: bool = False,
+    resume_state: Optional[Dict] = None,
+    bucket_by: Optional[str] = None,
+    bucket_boundaries: Optional[Sequence[int]] = None,
+    shuffle_pool_size: int = 1,
+    seed: Optional[int] = None,
     **kwargs,
 ):
     import torch
-    from deeplake.integrations.pytorch.dataset import TorchDataset
+    from deeplake.integrations.pytorch.dataset import ResumableDataLoader, TorchDataset
 
     try_flushing(dataset)
 
     torch.multiprocessing.set_sharing_strategy("file_system")
 
+    if stream_batches and batch_size is None:
+        raise ValueError("`stream_batches` requires a `batch_size`.")
+
+    if bucket_by is not None and batch_size is None:
+        raise ValueError("`bucket_by` requires a `batch_size`.")
+
+    if shuffle_pool_size < 1:
+        raise ValueError(f"`shuffle_pool_size` must be >= 1. Got: {shuffle_pool_size}")
+
     if collate_fn is None:
-        collate_fn = default_convert_fn if batch_size is None else default_collate_fn
+        collate_fn = (
+            default_convert_fn
+            if batch_size is None or stream_batches
+            else default_collate_fn
+        )
 
     if tensors is not None and "index" in tensors:
         raise ValueError("index is not a tensor, to get index, pass return_index=True")
@@ -104,7 +132,40 @@ def dataset_to_pytorch(
 
     tensors = map_tensor_keys(dataset, tensors)
 
-    if shuffle and num_workers > 0:
+    if seed is None and resume_state:
+        seed = resume_state["seed"]
+
+    if stream_batches:
+        # batches are stacked by the dataset, the loader only converts them to torch tensors
+        return ResumableDataLoader(
+            TorchDataset(
+                dataset,
+                tensors=tensors,
+                use_local_cache=use_local_cache,
+                transform=transform,
+                num_workers=num_workers,
+                shuffle=shuffle,
+                return_index=return_index,
+                pad_tensors=pad_tensors,
+                decode_method=decode_method,
+                batch_size=batch_size,
+                cache_size=cache_size,
+                stream_batches=True,
+                drop_last=drop_last,
+                seed=seed,
+                bucket_by=bucket_by,
+                bucket_boundaries=bucket_boundaries,
+                shuffle_pool_size=shuffle_pool_size,
+            ),
+            batch_size=None,
+            collate_fn=collate_fn,
+            pin_memory=pin_memory,
+            num_workers=num_workers,
+            persistent_workers=persistent_workers,
+            resume_state=resume_state,
+        )
+    elif shuffle and num_workers > 0 and bucket_by is None:
+        # the shuffle buffer would mix the batches of the buckets
         return create_dataloader(
             dataset,
             tensors,
@@ -121,9 +182,12 @@ def dataset_to_pytorch(
             decode_method,
             persistent_workers,
             cache_size,
+            resume_state,
+            shuffle_pool_size,
+            seed,
         )
     else:
-        return torch.utils.data.DataLoader(
+        return ResumableDataLoader(
             TorchDataset(
                 dataset,
                 tensors=tensors,
@@ -137,6 +201,11 @@ def dataset_to_pytorch(
                 decode_method=decode_method,
                 batch_size=batch_size,
                 cache_size=cache_size,
+                drop_last=drop_last,
+                seed=seed,
+                bucket_by=bucket_by,
+                bucket_boundaries=bucket_boundaries,
+                shuffle_pool_size=shuffle_pool_size,
             ),
             batch_size=batch_size,
             collate_fn=collate_fn,
@@ -144,4 +213,5 @@ def dataset_to_pytorch(
             num_workers=num_workers,
             drop_last=drop_last,
             persistent_workers=persistent_workers,
+            resume_state=resume_state,
         )
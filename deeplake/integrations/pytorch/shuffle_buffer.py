@@ -1,5 +1,5 @@
-from typing import List, Any, Sequence
-from random import randrange
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+from random import Random
 from functools import reduce
 from operator import mul
 import numpy as np
@@ -23,16 +23,19 @@ class ShuffleBuffer:
 
     Args:
         size(int):  size of the buffer in bytes
+        seed(int or str, optional): seed of the random numbers used to pick samples
     Raises:
         ValueError if buffer size is not set
     """
 
-    def __init__(self, size: int) -> None:
+    def __init__(self, size: int, seed: Optional[Union[int, str]] = None) -> None:
         if size <= 0:
             raise ValueError("Buffer size should be positive value more than zero")
 
         self.size = size
+        self.random = Random(seed)
         self.buffer: List[Any] = list()
+        self.tags: List[Any] = list()
         self.buffer_used = 0
         self.num_torch_tensors = 0
         self.pbar = tqdm(
@@ -44,11 +47,12 @@ class ShuffleBuffer:
         )
         self.pbar_closed = False
 
-    def exchange(self, sample):
+    def exchange(self, sample, tag=None):
         """Shuffle with existing elements in a buffer and return value if buffer is full or if `None` is provided as argument.
 
         Args:
             sample: new sample to add or None
+            tag: value kept along with the sample while it is in the buffer, see :meth:`buffered_tags`
 
         Returns:
             random sample or None,
@@ -68,6 +72,7 @@ class ShuffleBuffer:
                 self.num_torch_tensors += num_torch_tensors
                 self.pbar.update(sample_size)
                 self.buffer.append(sample)
+                self.tags.append(tag)
                 return None
             elif not self.pbar_closed:
                 if max_tensors_reached:
@@ -83,9 +88,10 @@ class ShuffleBuffer:
                 return sample
 
             # exchange samples with shuffle buffer
-            selected = randrange(buffer_len)
+            selected = self.random.randrange(buffer_len)
             val = self.buffer[selected]
             self.buffer[selected] = sample
+            self.tags[selected] = tag
 
             self.buffer_used += sample_size
             self.buffer_used -= self._sample_size(val)
@@ -97,8 +103,9 @@ class ShuffleBuffer:
                 self.close_buffer_pbar()
             if buffer_len > 0:
                 # return random selection
-                selected = randrange(buffer_len)
+                selected = self.random.randrange(buffer_len)
                 val = self.buffer.pop(selected)
+                self.tags.pop(selected)
                 self.buffer_used -= self._sample_size(val)
 
                 return val
@@ -108,6 +115,20 @@ class ShuffleBuffer:
     def emtpy(self) -> bool:
         return len(self.buffer) == 0
 
+    def buffered_tags(self) -> List[Any]:
+        """Returns the tags of the samples in the buffer, in the order of their slots."""
+        return list(self.tags)
+
+    def rng_state(self) -> Optional[Dict[str, Any]]:
+        """Returns the state of the random number generator used to pick samples."""
+        return {"random": self.random.getstate()}
+
+    def set_rng_state(self, state: Optional[Dict[str, Any]]):
+        """Restores the state of the random number generator returned by :meth:`rng_state`."""
+        if state is None:
+            return
+        self.random.setstate(state["random"])
+
     def _num_torch_tensors(self, sample):
         try:
             if sys.modules.get("torch"):
@@ -188,3 +209,397 @@ class ShuffleBuffer:
             self.pbar.close()
             self.pbar_closed = True
             print("Shuffle buffer filling is complete.")
+
+
+def _torch_tensor_class():
+    if sys.modules.get("torch"):
+        from torch import Tensor as TorchTensor
+
+        return TorchTensor
+    return None
+
+
+class _ObjectColumn:
+    """Stores the values of a key of the samples as Python objects."""
+
+    is_array = False
+
+    def __init__(self):
+        self.values: List[Any] = []
+
+    def accepts(self, value) -> bool:
+        return True
+
+    def put(self, slot: int, value):
+        if slot == len(self.values):
+            self.values.append(value)
+        else:
+            self.values[slot] = value
+
+    def get(self, slot: int):
+        return self.values[slot]
+
+    def move(self, src: int, dst: int):
+        self.values[dst] = self.values[src]
+
+    def pop(self):
+        self.values.pop()
+
+
+class _FixedColumn:
+    """Stores arrays of the same shape and dtype in a contiguous slab, one row per slot. The slab grows by doubling up
+    to ``max_rows``."""
+
+    is_array = True
+
+    def __init__(self, shape: Tuple[int, ...], dtype: np.dtype, max_rows: int):
+        self.shape = shape
+        self.dtype = dtype
+        self.max_rows = max(max_rows, 1)
+        self.slab = np.empty((0,) + shape, dtype=dtype)
+
+    def accepts(self, value: np.ndarray) -> bool:
+        return value.shape == self.shape and value.dtype == self.dtype
+
+    def put(self, slot: int, value: np.ndarray):
+        if slot == len(self.slab):
+            rows = min(max(2 * slot, 16), self.max_rows)
+            slab = np.empty((max(rows, slot + 1),) + self.shape, dtype=self.dtype)
+            slab[:slot] = self.slab[:slot]
+            self.slab = slab
+        self.slab[slot] = value
+
+    def get(self, slot: int) -> np.ndarray:
+        return self.slab[slot].copy()
+
+    def move(self, src: int, dst: int):
+        self.slab[dst] = self.slab[src]
+
+    def pop(self):
+        pass
+
+
+class _VarColumn:
+    """Stores arrays of any shape in a byte arena, with a table of the offset, shape and dtype of the array of each slot.
+    Bytes freed by replaced samples are reclaimed when the arena is full, by copying the live arrays to a new arena.
+    """
+
+    is_array = True
+
+    def __init__(self):
+        self.arena = np.empty(0, dtype=np.uint8)
+        self.end = 0
+        self.live = 0
+        self.offsets: List[int] = []
+        self.shapes: List[Tuple[int, ...]] = []
+        self.dtypes: List[np.dtype] = []
+
+    def accepts(self, value: np.ndarray) -> bool:
+        return True
+
+    def _nbytes(self, slot: int) -> int:
+        return int(np.prod(self.shapes[slot])) * self.dtypes[slot].itemsize
+
+    def _view(self, slot: int) -> np.ndarray:
+        offset = self.offsets[slot]
+        return (
+            self.arena[offset : offset + self._nbytes(slot)]
+            .view(self.dtypes[slot])
+            .reshape(self.shapes[slot])
+        )
+
+    def _alloc(self, nbytes: int) -> int:
+        if self.end + nbytes > len(self.arena):
+            arena = np.empty(
+                max(len(self.arena), 2 * (self.live + nbytes)), dtype=np.uint8
+            )
+            end = 0
+            for slot, offset in enumerate(self.offsets):
+                size = self._nbytes(slot)
+                arena[end : end + size] = self.arena[offset : offset + size]
+                self.offsets[slot] = end
+                end += size
+            self.arena = arena
+            self.end = end
+        offset = self.end
+        self.end += nbytes
+        self.live += nbytes
+        return offset
+
+    def put(self, slot: int, value: np.ndarray):
+        value = np.ascontiguousarray(value)
+        if slot == len(self.offsets):
+            self.offsets.append(0)
+            self.shapes.append((0,))
+            self.dtypes.append(np.dtype(np.uint8))
+        else:
+            self.live -= self._nbytes(slot)
+            # the old array is not copied if the arena is compacted
+            self.shapes[slot] = (0,)
+        offset = self._alloc(value.nbytes)
+        self.offsets[slot] = offset
+        self.shapes[slot] = value.shape
+        self.dtypes[slot] = value.dtype
+        self.arena[offset : offset + value.nbytes] = value.reshape(-1).view(np.uint8)
+
+    def get(self, slot: int) -> np.ndarray:
+        return self._view(slot).copy()
+
+    def move(self, src: int, dst: int):
+        self.live -= self._nbytes(dst)
+        self.offsets[dst] = self.offsets[src]
+        self.shapes[dst] = self.shapes[src]
+        self.dtypes[dst] = self.dtypes[src]
+        # the entries of src are dropped by `pop`, without freeing its bytes
+        self.live += self._nbytes(dst)
+
+    def pop(self):
+        self.live -= self._nbytes(len(self.offsets) - 1)
+        self.offsets.pop()
+        self.shapes.pop()
+        self.dtypes.pop()
+        if not self.offsets:
+            self.end = 0
+
+
+class ArrayShuffleBuffer(ShuffleBuffer):
+    """Shuffling buffer with the same rule as :class:`ShuffleBuffer`, that stores samples in preallocated arrays
+    instead of a list of Python objects.
+
+    Samples are split into their values (dict values, or tuple / list elements). Values that are arrays or torch
+    tensors with the same shape and dtype in every sample are stored in a contiguous slab per key, arrays of varying
+    shape in a byte arena per key, and anything else as Python objects. The number of bytes of each sample is computed
+    once when it is added, and samples are removed in O(1) by moving the last sample into their slot. Tensors are copied
+    into the buffer, so ``deeplake.constants.MAX_TENSORS_IN_SHUFFLE_BUFFER`` does not apply.
+
+    Slots are picked with random numbers drawn in blocks, scaled to the number of samples in the buffer, which is
+    uniform up to floating point rounding.
+
+    Args:
+        size (int): size of the buffer in bytes
+        seed (int or Sequence[int], optional): seed of the random numbers used to pick samples
+    Raises:
+        ValueError if buffer size is not set
+    """
+
+    _RANDOM_BLOCK_SIZE = 4096
+
+    def __init__(
+        self, size: int, seed: Optional[Union[int, Sequence[int]]] = None
+    ) -> None:
+        super().__init__(size)
+        self.rng = np.random.default_rng(seed)
+        self._random = np.empty(0)
+        self._random_pos = 0
+        # state of the generator before drawing the current block of random numbers
+        self._block_state = self.rng.bit_generator.state
+        self.num_samples = 0
+        self.slot_sizes = np.empty(0, dtype=np.int64)
+        self.slot_tags: List[Any] = []
+        self.columns: Optional[List[Any]] = None
+        self.is_torch: List[bool] = []
+        self.keys: Optional[List[Any]] = None
+        self.sample_type: Optional[type] = None
+
+    def _next_slot(self) -> int:
+        if self._random_pos == len(self._random):
+            self._block_state = self.rng.bit_generator.state
+            self._random = self.rng.random(self._RANDOM_BLOCK_SIZE)
+            self._random_pos = 0
+        slot = int(self._random[self._random_pos] * self.num_samples)
+        self._random_pos += 1
+        return min(slot, self.num_samples - 1)
+
+    def _split(self, sample) -> Tuple[Optional[List[Any]], List[Any]]:
+        if isinstance(sample, dict):
+            keys = list(sample.keys())
+            return keys, [sample[key] for key in keys]
+        if isinstance(sample, (tuple, list)):
+            return None, list(sample)
+        return None, [sample]
+
+    def _join(self, values: List[Any]):
+        if self.keys is not None:
+            return self.sample_type(zip(self.keys, values))  # type: ignore
+        if issubclass(self.sample_type, (tuple, list)):  # type: ignore
+            return self.sample_type(values)  # type: ignore
+        return values[0]
+
+    def _to_array(self, value) -> Optional[np.ndarray]:
+        if isinstance(value, np.ndarray):
+            return None if value.dtype.hasobject else value
+        torch_tensor = _torch_tensor_class()
+        if torch_tensor is not None and isinstance(value, torch_tensor):
+            if value.device.type != "cpu" or value.requires_grad:
+                return None
+            return value.numpy()
+        return None
+
+    def _new_column(self, value, array: Optional[np.ndarray]):
+        if array is None:
+            return _ObjectColumn()
+        return _FixedColumn(array.shape, array.dtype, self.size // max(array.nbytes, 1))
+
+    def _matches_layout(self, keys, values) -> bool:
+        return keys == self.keys and len(values) == len(self.columns)  # type: ignore
+
+    def _store(self, slot: int, values: List[Any]):
+        columns = self.columns
+        is_torch = self.is_torch
+        torch_tensor = _torch_tensor_class()
+        for i, value in enumerate(values):
+            column = columns[i]  # type: ignore
+            if not column.is_array:
+                column.put(slot, value)
+                continue
+            array = self._to_array(value)
+            if array is None or is_torch[i] != (
+                torch_tensor is not None and isinstance(value, torch_tensor)
+            ):
+                self._convert(i, _ObjectColumn()).put(slot, value)
+                continue
+            if not column.accepts(array):
+                column = self._convert(i, _VarColumn())
+            column.put(slot, array)
+
+    def _convert(self, i: int, column):
+        """Moves the values of a column to a column of another kind."""
+        for slot in range(self.num_samples):
+            value = self._get_value(i, slot)
+            column.put(slot, value if not column.is_array else self._to_array(value))
+        self.columns[i] = column  # type: ignore
+        return column
+
+    def _get_value(self, i: int, slot: int):
+        column = self.columns[i]  # type: ignore
+        value = column.get(slot)
+        if column.is_array and self.is_torch[i]:
+            import torch
+
+            return torch.from_numpy(value)
+        return value
+
+    def _get(self, slot: int):
+        return self._join([self._get_value(i, slot) for i in range(len(self.columns))])  # type: ignore
+
+    def _init_layout(self, sample):
+        keys, values = self._split(sample)
+        self.keys = keys
+        self.sample_type = type(sample)
+        torch_tensor = _torch_tensor_class()
+        self.is_torch = [
+            torch_tensor is not None and isinstance(value, torch_tensor)
+            for value in values
+        ]
+        self.columns = [
+            self._new_column(value, self._to_array(value)) for value in values
+        ]
+
+    def _values_size(self, values: List[Any]) -> int:
+        size = 0
+        for value in values:
+            array = self._to_array(value)
+            size += array.nbytes if array is not None else self._sample_size(value)
+        return size
+
+    def _append(self, values: List[Any], sample_size: int, tag):
+        slot = self.num_samples
+        self._store(slot, values)
+        self.slot_tags.append(tag)
+        if slot == len(self.slot_sizes):
+            slot_sizes = np.zeros(max(2 * slot, 16), dtype=np.int64)
+            slot_sizes[:slot] = self.slot_sizes
+            self.slot_sizes = slot_sizes
+        self.slot_sizes[slot] = sample_size
+        self.num_samples += 1
+        self.buffer_used += sample_size
+
+    def _remove(self, slot: int):
+        last = self.num_samples - 1
+        self.buffer_used -= int(self.slot_sizes[slot])
+        if slot != last:
+            for column in self.columns:  # type: ignore
+                column.move(last, slot)
+            self.slot_sizes[slot] = self.slot_sizes[last]
+            self.slot_tags[slot] = self.slot_tags[last]
+        self.slot_tags.pop()
+        for column in self.columns:  # type: ignore
+            column.pop()
+        self.num_samples -= 1
+
+    def exchange(self, sample, tag=None):
+        """Shuffle with existing elements in a buffer and return value if buffer is full or if `None` is provided as argument.
+
+        Args:
+            sample: new sample to add or None
+            tag: value kept along with the sample while it is in the buffer, see :meth:`buffered_tags`
+
+        Returns:
+            random sample or None,
+            same sample if buffer is empty and sample doesn't fit
+        """
+        if sample is None:
+            if not self.pbar_closed:
+                self.close_buffer_pbar()
+            if not self.num_samples:
+                return None
+            slot = self._next_slot()
+            val = self._get(slot)
+            self._remove(slot)
+            return val
+
+        if self.columns is None:
+            self._init_layout(sample)
+        keys, values = self._split(sample)
+        if not self._matches_layout(keys, values) or type(sample) != self.sample_type:
+            raise ValueError(
+                "All the samples added to an `ArrayShuffleBuffer` must have the same keys."
+            )
+        sample_size = self._values_size(values)
+        if self.buffer_used + sample_size <= self.size:
+            self._append(values, sample_size, tag)
+            self.pbar.update(sample_size)
+            return None
+        if not self.pbar_closed:
+            self.close_buffer_pbar()
+
+        if not self.num_samples:
+            warnings.warn(
+                f"Buffer size is too small. Sample with size {sample_size} does not fit in buffer of size {self.size}"
+            )
+            return sample
+
+        # exchange samples with shuffle buffer
+        slot = self._next_slot()
+        val = self._get(slot)
+        self.buffer_used += sample_size - int(self.slot_sizes[slot])
+        self.slot_sizes[slot] = sample_size
+        self.slot_tags[slot] = tag
+        self._store(slot, values)
+        return val
+
+    def emtpy(self) -> bool:
+        return self.num_samples == 0
+
+    def buffered_tags(self) -> List[Any]:
+        """Returns the tags of the samples in the buffer, in the order of their slots."""
+        return list(self.slot_tags)
+
+    def rng_state(self) -> Optional[Dict[str, Any]]:
+        """Returns the state of the random number generator used to pick samples."""
+        return {"bit_generator": self._block_state, "position": self._random_pos}
+
+    def set_rng_state(self, state: Optional[Dict[str, Any]]):
+        """Restores the state of the random number generator returned by :meth:`rng_state`."""
+        if state is None:
+            return
+        self.rng.bit_generator.state = state["bit_generator"]
+        self._block_state = state["bit_generator"]
+        self._random = self.rng.random(self._RANDOM_BLOCK_SIZE)
+        self._random_pos = state["position"]
+
+    def __len__(self):
+        return self.num_samples
+
+    def __str__(self) -> str:
+        return f"ArrayShuffleBuffer(size = {self.size}, buffer_used = {self.buffer_used}, samples = {self.num_samples})"
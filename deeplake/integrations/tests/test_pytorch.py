@@ -776,6 +776,186 @@ def test_indexes(local_ds, shuffle, num_workers):
             np.testing.assert_array_equal(batch["index"][i], batch["xyz"][i][0, 0])
 
 
+@requires_torch
+@pytest.mark.parametrize("shuffle", [True, False])
+@pytest.mark.parametrize("num_workers", [0, 2])
+def test_pytorch_stream_batches(local_ds, shuffle, num_workers):
+    import torch
+
+    images = [
+        np.random.randint(0, 255, (10 + i % 3, 10, 3), dtype=np.uint8)
+        for i in range(50)
+    ]
+    with local_ds as ds:
+        ds.create_tensor("label", max_chunk_size=PYTORCH_TESTS_MAX_CHUNK_SIZE)
+        ds.label.extend(np.arange(50, dtype=np.uint32))
+        ds.create_tensor(
+            "emb", dtype="float32", max_chunk_size=PYTORCH_TESTS_MAX_CHUNK_SIZE
+        )
+        ds.emb.extend(np.arange(50 * 8, dtype=np.float32).reshape(50, 8))
+        ds.create_tensor("image", htype="image", sample_compression="png")
+        ds.image.extend(images)
+
+    ptds = ds.pytorch(
+        batch_size=8,
+        shuffle=shuffle,
+        num_workers=num_workers,
+        stream_batches=True,
+    )
+    assert len(ptds) == 7
+    seen = []
+    for batch in ptds:
+        assert batch.keys() == {"label", "emb", "image", "index"}
+        index = batch["index"].numpy()[:, 0]
+        assert batch["index"].shape == (len(index), 1)
+        assert batch["label"].dtype == torch.int64
+        np.testing.assert_array_equal(batch["label"].numpy()[:, 0], index)
+        np.testing.assert_array_equal(
+            batch["emb"].numpy(), np.arange(400).reshape(50, 8)[index]
+        )
+        for i, image in zip(index, batch["image"]):
+            np.testing.assert_array_equal(image.numpy(), images[i])
+        seen.extend(index.tolist())
+    assert sorted(seen) == list(range(50))
+
+    ptds = ds[[3, 1, 4, 1, 5]].pytorch(
+        batch_size=2,
+        tensors=["label"],
+        transform={"label": double},
+        drop_last=True,
+        return_index=False,
+        stream_batches=True,
+    )
+    batches = [batch["label"].numpy()[:, 0].tolist() for batch in ptds]
+    assert batches == [[6, 2], [8, 2]]
+
+
+@requires_torch
+@pytest.mark.parametrize(
+    "shuffle, num_workers, stream_batches",
+    [(True, 0, False), (True, 2, False), (False, 2, False), (True, 2, True)],
+)
+def test_pytorch_resume_state(local_ds, shuffle, num_workers, stream_batches):
+    with local_ds as ds:
+        ds.create_tensor("label", max_chunk_size=PYTORCH_TESTS_MAX_CHUNK_SIZE)
+        ds.label.extend(np.arange(50 * 20, dtype=np.int64).reshape(50, 20))
+        # the shuffle buffer of 1 MB holds 6 of these samples
+        ds.create_tensor("emb", dtype="float32")
+        ds.emb.extend(np.zeros((50, 40000), dtype=np.float32))
+
+    def indices(batches):
+        return [batch["index"].numpy()[:, 0].tolist() for batch in batches]
+
+    kwargs = dict(
+        batch_size=4,
+        shuffle=shuffle,
+        num_workers=num_workers,
+        buffer_size=1,
+        stream_batches=stream_batches,
+    )
+    ptds = ds.pytorch(**kwargs)
+    it = iter(ptds)
+    first = indices(next(it) for _ in range(3))
+    state = pickle.loads(pickle.dumps(ptds.state_dict()))
+    assert state["epoch"] == 0
+    rest = indices(it)
+    second_epoch = indices(ptds)
+    assert sorted(sum(first + rest, [])) == list(range(50))
+    assert sorted(sum(second_epoch, [])) == list(range(50))
+    if shuffle:
+        assert first + rest != second_epoch
+
+    resumed = ds.pytorch(resume_state=state, **kwargs)
+    assert indices(resumed) == rest
+    assert resumed.state_dict()["epoch"] == 1
+    assert indices(resumed) == second_epoch
+
+    state = ptds.state_dict()
+    assert (state["epoch"], state["num_batches"]) == (2, 0)
+    assert indices(ds.pytorch(resume_state=state, **kwargs)) == indices(ptds)
+
+
+@requires_torch
+@pytest.mark.parametrize("num_workers", [0, 2])
+def test_pytorch_seed(local_ds, num_workers):
+    with local_ds as ds:
+        ds.create_tensor("label", max_chunk_size=PYTORCH_TESTS_MAX_CHUNK_SIZE)
+        ds.label.extend(np.arange(50 * 20, dtype=np.int64).reshape(50, 20))
+
+    def indices(ptds):
+        return [batch["index"].numpy()[:, 0].tolist() for batch in ptds]
+
+    kwargs = dict(batch_size=4, shuffle=True, num_workers=num_workers, buffer_size=1)
+    ptds = ds.pytorch(seed=42, **kwargs)
+    assert ptds.state_dict()["seed"] == 42
+    first = indices(ptds)
+    assert sorted(sum(first, [])) == list(range(50))
+    assert indices(ds.pytorch(seed=42, **kwargs)) == first
+    assert indices(ds.pytorch(seed=43, **kwargs)) != first
+
+
+@requires_torch
+def test_pytorch_shuffle_pool_size(local_ds):
+    with local_ds as ds:
+        ds.create_tensor("label", max_chunk_size=PYTORCH_TESTS_MAX_CHUNK_SIZE)
+        ds.label.extend(np.arange(50 * 20, dtype=np.int64).reshape(50, 20))
+    encoder = ds.label.chunk_engine.chunk_id_encoder
+
+    def chunk_runs(ptds):
+        indices = [int(batch["index"][0, 0]) for batch in ptds]
+        assert sorted(indices) == list(range(50))
+        chunks = [int(encoder[i][0]) for i in indices]
+        return sum(a != b for a, b in zip(chunks, chunks[1:])) + 1
+
+    num_chunks = len({int(encoder[i][0]) for i in range(50)})
+    assert num_chunks > 2
+    # by default, the samples of a chunk are read before the next chunk
+    assert chunk_runs(ds.pytorch(shuffle=True, num_workers=0)) == num_chunks
+    mixed = ds.pytorch(shuffle=True, num_workers=0, shuffle_pool_size=num_chunks)
+    assert chunk_runs(mixed) > num_chunks
+
+    with pytest.raises(ValueError):
+        ds.pytorch(shuffle=True, shuffle_pool_size=0)
+
+
+def list_collate(batch):
+    return batch
+
+
+@requires_torch
+@pytest.mark.parametrize("shuffle", [True, False])
+@pytest.mark.parametrize("num_workers", [0, 2])
+def test_pytorch_bucket_by(local_ds, shuffle, num_workers):
+    lengths = [(7 * i) % 15 + 1 for i in range(60)]
+    with local_ds as ds:
+        ds.create_tensor(
+            "tokens", dtype="int64", max_chunk_size=PYTORCH_TESTS_MAX_CHUNK_SIZE
+        )
+        ds.tokens.extend([np.full(n, i) for i, n in enumerate(lengths)])
+
+    ptds = ds.pytorch(
+        batch_size=4,
+        shuffle=shuffle,
+        num_workers=num_workers,
+        collate_fn=list_collate,
+        bucket_by="tokens",
+        bucket_boundaries=[6, 11],
+    )
+    seen = []
+    mixed = 0
+    for batch in ptds:
+        buckets = set()
+        for sample in batch:
+            index = int(sample["index"][0])
+            assert len(sample["tokens"]) == lengths[index]
+            buckets.add(np.searchsorted([6, 11], lengths[index], side="right"))
+            seen.append(index)
+        mixed += len(buckets) > 1
+    assert sorted(seen) == list(range(60))
+    # only the last batches of the buckets of each worker may be mixed
+    assert mixed <= 2 * max(num_workers, 1)
+
+
 def index_transform(sample):
     return sample["index"], sample["xyz"]
 
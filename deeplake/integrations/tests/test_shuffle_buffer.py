@@ -41,3 +41,72 @@ def test_constant_tensor():
     result = buffer.exchange(tensor)
 
     assert result == tensor
+
+
+def test_array_buffer():
+    import numpy as np
+    from deeplake.integrations.pytorch.shuffle_buffer import ArrayShuffleBuffer
+    from deeplake.util.iterable_ordered_dict import IterableOrderedDict
+
+    buffer = ArrayShuffleBuffer(1000, seed=0)
+    samples = [
+        IterableOrderedDict(
+            label=np.array([i]),
+            image=np.full((i % 3 + 1, 2), i, dtype=np.uint8),
+            emb=torch.full((4,), float(i)),
+            text=str(i),
+        )
+        for i in range(200)
+    ]
+    results = []
+    for sample in samples:
+        result = buffer.exchange(sample)
+        if result is not None:
+            results.append(result)
+    assert 0 < len(buffer) < 200
+    while not buffer.emtpy():
+        results.append(buffer.exchange(None))
+    assert buffer.buffer_used == 0
+
+    assert sorted(int(r["label"][0]) for r in results) == list(range(200))
+    assert [int(r["label"][0]) for r in results] != list(range(200))
+    for r in results:
+        i = int(r["label"][0])
+        assert isinstance(r, IterableOrderedDict)
+        np.testing.assert_array_equal(r["image"], samples[i]["image"])
+        assert isinstance(r["emb"], torch.Tensor)
+        assert torch.equal(r["emb"], samples[i]["emb"])
+        assert r["text"] == str(i)
+
+
+def test_array_buffer_tuples():
+    import numpy as np
+    from deeplake.integrations.pytorch.shuffle_buffer import ArrayShuffleBuffer
+
+    buffer = ArrayShuffleBuffer(64)
+    assert buffer.exchange((np.ones(4), 1)) is None
+    # a sample that is not an array where there were arrays before
+    assert buffer.exchange(("a", 2)) is None
+    results = [buffer.exchange(None), buffer.exchange(None)]
+    assert buffer.exchange(None) is None
+    assert sorted(r[1] for r in results) == [1, 2]
+
+    with pytest.raises(ValueError):
+        buffer.exchange({"a": np.ones(2)})
+
+
+def test_seeded_buffer():
+    def run(buffer, samples):
+        results = [buffer.exchange(sample) for sample in samples]
+        return [r["val"].item() for r in results if r is not None]
+
+    samples = [{"val": torch.tensor(i)} for i in range(100)]
+    first = ShuffleBuffer(80, seed="0-0")
+    assert run(first, samples[:50]) == run(ShuffleBuffer(80, seed="0-0"), samples[:50])
+
+    # the buffer is resumed from its samples and the state of its random numbers
+    resumed = ShuffleBuffer(80)
+    for tag, sample in zip(first.buffered_tags(), first.buffer):
+        resumed.exchange(sample, tag)
+    resumed.set_rng_state(first.rng_state())
+    assert run(resumed, samples[50:]) == run(first, samples[50:])
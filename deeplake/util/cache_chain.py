@@ -1,5 +1,10 @@
-from deeplake.constants import LOCAL_CACHE_PREFIX
-from typing import List, Optional
+import deeplake
+from deeplake.constants import (
+    DEFAULT_CACHE_EVICTION_POLICY,
+    LOCAL_CACHE_PREFIX,
+    SHARED_CACHE_PREFIX,
+)
+from typing import Any, Dict, List, Optional
 from uuid import uuid1
 import os
 from deeplake.core.storage import (
@@ -7,11 +12,18 @@ from deeplake.core.storage import (
     MemoryProvider,
     LocalProvider,
 )
+from deeplake.core.storage.disk_cache import DiskCache, SharedCache
 from deeplake.core.storage.lru_cache import LRUCache
 from deeplake.util.exceptions import ProviderSizeListMismatch, ProviderListEmptyError
 
 
-def get_cache_chain(storage_list: List[StorageProvider], size_list: List[int]):
+def get_cache_chain(
+    storage_list: List[StorageProvider],
+    size_list: List[int],
+    use_async: bool = False,
+    eviction_policy: str = DEFAULT_CACHE_EVICTION_POLICY,
+    pin_deeplake_objects: bool = False,
+):
     """Returns a chain of storage providers as a cache
 
     Args:
@@ -21,6 +33,10 @@ def get_cache_chain(storage_list: List[StorageProvider], size_list: List[int]):
         size_list (List[int]): The list of sizes of the caches in bytes.
             Should have size 1 less than provider_list and specifies size of cache for all providers except the last
             one. The last one is the primary storage and is assumed to have infinite space.
+        use_async (bool): If True, the cache layer in front of the primary storage writes to it in the background.
+            See :class:`LRUCache` for details.
+        eviction_policy (str): The eviction policy used by all the cache layers. See :class:`LRUCache` for the supported policies.
+        pin_deeplake_objects (bool): If True, objects registered with the cache layers are never evicted.
 
     Returns:
         StorageProvider: Returns a cache containing all the storage providers in cache_list if cache_list has 2 or more
@@ -39,7 +55,14 @@ def get_cache_chain(storage_list: List[StorageProvider], size_list: List[int]):
         raise ProviderSizeListMismatch
     store = storage_list[-1]
     for size, cache in zip(reversed(size_list), reversed(storage_list[:-1])):
-        store = LRUCache(cache, store, size)
+        store = LRUCache(
+            cache,
+            store,
+            size,
+            use_async=use_async,
+            eviction_policy=eviction_policy,
+            pin_deeplake_objects=pin_deeplake_objects,
+        )
     return store
 
 
@@ -48,6 +71,10 @@ def generate_chain(
     memory_cache_size: int,
     local_cache_size: int,
     path: Optional[str] = None,
+    use_async: Optional[bool] = None,
+    eviction_policy: Optional[str] = None,
+    pin_deeplake_objects: Optional[bool] = None,
+    shared_cache_size: int = 0,
 ) -> StorageProvider:
     """Internal function to be used by Dataset, to generate a cache_chain using a base_storage and sizes of memory and
         local caches.
@@ -58,10 +85,18 @@ def generate_chain(
         local_cache_size (int): The size of the local filesystem cache to be used in bytes.
         path (str, optional): The path to the dataset. If not None, it is used to figure out the folder name where the local
             cache is stored.
+        use_async (bool, optional): Whether writes to the base_storage happen in the background.
+            Defaults to ``deeplake.constants.ASYNC_FLUSH_ENABLED`` if not specified.
+        eviction_policy (str, optional): The eviction policy of the caches, one of "lru", "lfu", "2q" and "gdsf".
+            Defaults to ``deeplake.constants.DEFAULT_CACHE_EVICTION_POLICY`` if not specified.
+        pin_deeplake_objects (bool, optional): Whether metadata and other objects registered with the caches are protected from eviction.
+            Defaults to ``deeplake.constants.PIN_DEEPLAKE_OBJECTS_IN_CACHE`` if not specified.
+        shared_cache_size (int): The size of the persistent chunk cache shared by all processes on the machine, in bytes.
+            Only used if ``path`` is specified, as the cached chunks are looked up by the path of the dataset. See :class:`SharedCache`.
 
     Returns:
         StorageProvider: Returns a cache containing the base_storage along with memory cache,
-            and local cache if a positive size has been specified for it.
+            and local and shared caches if positive sizes have been specified for them.
     """
 
     if path:
@@ -84,5 +119,73 @@ def generate_chain(
             LocalProvider(f"{local_cache_prefix}/{cached_dataset_name}")
         )
         size_list.append(local_cache_size)
+    if use_async is None:
+        use_async = deeplake.constants.ASYNC_FLUSH_ENABLED
+    if shared_cache_size > 0 and path:
+        shared_cache_prefix = os.getenv(
+            "SHARED_CACHE_PREFIX", default=SHARED_CACHE_PREFIX
+        )
+        base_storage = SharedCache(
+            DiskCache(shared_cache_prefix, shared_cache_size, namespace=path),
+            base_storage,
+            use_async=use_async,
+        )
     storage_list.append(base_storage)
-    return get_cache_chain(storage_list, size_list)
+    if eviction_policy is None:
+        eviction_policy = deeplake.constants.DEFAULT_CACHE_EVICTION_POLICY
+    if pin_deeplake_objects is None:
+        pin_deeplake_objects = deeplake.constants.PIN_DEEPLAKE_OBJECTS_IN_CACHE
+    return get_cache_chain(
+        storage_list,
+        size_list,
+        use_async=use_async,
+        eviction_policy=eviction_policy,
+        pin_deeplake_objects=pin_deeplake_objects,
+    )
+
+
+def get_cache_chain_stats(
+    storage: StorageProvider, reset: bool = False
+) -> Dict[str, Dict[str, Any]]:
+    """Collects the statistics of every layer of a cache chain.
+
+    Args:
+        storage (StorageProvider): The first layer of the chain.
+        reset (bool): If True, the statistics of all layers are reset after they are collected.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: Statistics of each layer, from the first cache layer to the primary storage.
+            Cache layers are named after their cache storage (``memory_cache``, ``local_cache``, ``shared_cache``), the primary storage is ``storage``.
+    """
+    layers: Dict[str, StorageProvider] = {}
+    layer: Optional[StorageProvider] = storage
+    while isinstance(layer, LRUCache):
+        if isinstance(layer.cache_storage, MemoryProvider):
+            name = "memory_cache"
+        elif isinstance(layer.cache_storage, LocalProvider):
+            name = "local_cache"
+        elif isinstance(layer.cache_storage, DiskCache):
+            name = "shared_cache"
+        else:
+            name = f"{type(layer.cache_storage).__name__}_cache"
+        if name in layers:
+            name = f"{name}_{len(layers)}"
+        layers[name] = layer
+        layer = layer.next_storage
+    if layer is not None:
+        layers["storage"] = layer
+
+    result = {}
+    for name, provider in layers.items():
+        stats = provider.stats.to_dict()
+        stats["provider"] = type(provider).__name__
+        if isinstance(provider, LRUCache):
+            stats["provider"] = type(provider.cache_storage).__name__
+            stats["cache_size"] = provider.cache_size
+            stats["cache_used"] = provider.cache_used
+            hits, misses = provider.stats["hits"], provider.stats["misses"]
+            stats["hit_rate"] = hits / (hits + misses) if hits + misses else 0.0
+        if reset:
+            provider.stats.reset()
+        result[name] = stats
+    return result
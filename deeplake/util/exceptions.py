@@ -391,6 +391,14 @@ class SampleDecompressionError(CompressionError):
         super().__init__(message)
 
 
+class DecodePoolError(Exception):
+    """Raised when samples can not be decoded by the decode pool because of the pool itself, as opposed to
+    :class:`SampleDecompressionError`, raised for corrupt samples."""
+
+    def __init__(self, message: str):
+        super().__init__(f"Could not decode samples in the decode pool: {message}")
+
+
 class InvalidImageDimensions(Exception):
     def __init__(self, actual_dims, expected_dims):
         super().__init__(
@@ -12,6 +12,7 @@ from deeplake.constants import (
     ENCODED_SEQUENCE_NAMES_FOLDER,
     ENCODED_TILE_NAMES_FOLDER,
     ENCODED_PAD_NAMES_FOLDER,
+    ENCODED_SHAPES_FOLDER,
     FIRST_COMMIT_ID,
     DATASET_META_FILENAME,
     TENSOR_INFO_FILENAME,
@@ -39,6 +40,19 @@ def get_chunk_key(key: str, chunk_name: str, commit_id: str) -> str:
     return "/".join(("versions", commit_id, key, CHUNKS_FOLDER, f"{chunk_name}"))
 
 
+def is_chunk_key(path: str) -> bool:
+    """Whether ``path`` is a key returned by :func:`get_chunk_key`."""
+    parts = path.rsplit("/", 2)
+    return len(parts) == 3 and parts[1] == CHUNKS_FOLDER and "." not in parts[2]
+
+
+def get_chunk_key_commit_id(chunk_key: str) -> str:
+    """Returns the commit id of a key returned by :func:`get_chunk_key`."""
+    if chunk_key.startswith("versions/"):
+        return chunk_key.split("/", 2)[1]
+    return FIRST_COMMIT_ID
+
+
 def get_dataset_meta_key(commit_id: str) -> str:
     # dataset meta is always relative to the `StorageProvider`'s root
     if commit_id == FIRST_COMMIT_ID:
@@ -265,3 +279,17 @@ def get_pad_encoder_key(key: str, commit_id: str) -> str:
             UNSHARDED_ENCODER_FILENAME,
         )
     )
+
+
+def get_tensor_shape_index_key(key: str, commit_id: str) -> str:
+    if commit_id == FIRST_COMMIT_ID:
+        return "/".join((key, ENCODED_SHAPES_FOLDER, UNSHARDED_ENCODER_FILENAME))
+    return "/".join(
+        (
+            "versions",
+            commit_id,
+            key,
+            ENCODED_SHAPES_FOLDER,
+            UNSHARDED_ENCODER_FILENAME,
+        )
+    )
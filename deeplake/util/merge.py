@@ -32,6 +32,7 @@ from deeplake.util.keys import (
     get_tensor_commit_diff_key,
     get_chunk_id_encoder_key,
     get_sequence_encoder_key,
+    get_tensor_shape_index_key,
     get_dataset_meta_key,
 )
 
@@ -577,6 +578,7 @@ def _get_meta_files_for_tensor(tensor_name, commit_id):
         get_tensor_tile_encoder_key,
         get_creds_encoder_key,
         get_sequence_encoder_key,
+        get_tensor_shape_index_key,
     ]
     return [fn(tensor_name, commit_id) for fn in fns]
 
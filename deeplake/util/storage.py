@@ -1,6 +1,10 @@
 from deeplake.util.agreement import handle_dataset_agreements
 from deeplake.util.cache_chain import generate_chain
-from deeplake.constants import LOCAL_CACHE_PREFIX, MB
+from deeplake.constants import (
+    MB,
+    PYTORCH_LOCAL_CACHE_SIZE,
+    SHARED_CACHE_PREFIX,
+)
 from deeplake.util.exceptions import AgreementNotAcceptedError
 from deeplake.util.tag import process_hub_path
 from deeplake.util.path import get_path_type
@@ -8,6 +12,7 @@ from typing import Dict, Optional, Union
 from deeplake.core.storage.provider import StorageProvider
 import os
 from deeplake.core.storage import (
+    DiskCache,
     LocalProvider,
     S3Provider,
     GCSProvider,
@@ -199,6 +204,8 @@ def get_storage_and_cache_chain(
     memory_cache_size,
     local_cache_size,
     db_engine=False,
+    cache_eviction_policy=None,
+    shared_cache_size=0,
 ):
     """
     Returns storage provider and cache chain for a given path, according to arguments passed.
@@ -212,6 +219,8 @@ def get_storage_and_cache_chain(
         memory_cache_size (int): The size of the in-memory cache to use.
         local_cache_size (int): The size of the local cache to use.
         db_engine (bool): Whether to use Activeloop DB Engine, only applicable for hub:// paths.
+        cache_eviction_policy (str, optional): The eviction policy of the caches. Uses the default policy if not specified.
+        shared_cache_size (int): The size of the persistent chunk cache shared by all processes on the machine.
 
     Returns:
         A tuple of the storage provider and the storage chain.
@@ -227,7 +236,12 @@ def get_storage_and_cache_chain(
     memory_cache_size_bytes = memory_cache_size * MB
     local_cache_size_bytes = local_cache_size * MB
     storage_chain = generate_chain(
-        storage, memory_cache_size_bytes, local_cache_size_bytes, path
+        storage,
+        memory_cache_size_bytes,
+        local_cache_size_bytes,
+        path,
+        eviction_policy=cache_eviction_policy,
+        shared_cache_size=shared_cache_size * MB,
     )
     if storage.read_only:
         storage_chain.enable_readonly()
@@ -242,8 +256,10 @@ def get_local_storage_path(path: str, prefix: str):
 
 
 def get_pytorch_local_storage(dataset):
-    """Returns a local storage provider for a given dataset to be used for Pytorch iteration"""
-    local_cache_name: str = f"{dataset.path}_pytorch"
-    local_cache_prefix = os.getenv("LOCAL_CACHE_PREFIX", default=LOCAL_CACHE_PREFIX)
-    local_cache_path = get_local_storage_path(local_cache_name, local_cache_prefix)
-    return LocalProvider(local_cache_path)
+    """Returns a local storage provider for a given dataset to be used for Pytorch iteration.
+    The chunks are kept in the shared cache, so that they are read once by all the workers and all the runs on the machine.
+    """
+    shared_cache_prefix = os.getenv("SHARED_CACHE_PREFIX", default=SHARED_CACHE_PREFIX)
+    return DiskCache(
+        shared_cache_prefix, PYTORCH_LOCAL_CACHE_SIZE, namespace=dataset.path
+    )
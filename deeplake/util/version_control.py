@@ -2,7 +2,7 @@ import random
 import time
 import hashlib
 import pickle
-from typing import Any, Dict, Optional, List
+from typing import Any, Dict, Optional, List, Set
 import warnings
 
 from deeplake.core.meta.encode.chunk_id import ChunkIdEncoder
@@ -31,6 +31,7 @@ from deeplake.util.keys import (
     get_chunk_id_encoder_key,
     get_creds_encoder_key,
     get_sequence_encoder_key,
+    get_tensor_shape_index_key,
     get_dataset_diff_key,
     get_dataset_info_key,
     get_dataset_meta_key,
@@ -342,6 +343,7 @@ def _squash_main(
                 get_chunk_id_encoder_key,
                 get_pad_encoder_key,
                 get_sequence_encoder_key,
+                get_tensor_shape_index_key,
                 get_tensor_tile_encoder_key,
             ]:
                 try:
@@ -599,6 +601,15 @@ def copy_metas(
         except KeyError:
             pass
 
+        try:
+            src_shape_index_key = get_tensor_shape_index_key(tensor, src_commit_id)
+            dest_shape_index_key = get_tensor_shape_index_key(tensor, dest_commit_id)
+            src_shape_index = storage[src_shape_index_key]
+            dest_shape_index = convert_to_bytes(src_shape_index)
+            storage[dest_shape_index_key] = dest_shape_index
+        except KeyError:
+            pass
+
         try:
             src_creds_encoder_key = get_creds_encoder_key(tensor, src_commit_id)
             dest_creds_encoder_key = get_creds_encoder_key(tensor, dest_commit_id)
@@ -664,12 +675,12 @@ def discard_old_metas(
     for key in all_src_keys:
         storage.dirty_keys.pop(key, None)
         if key in storage.lru_sizes:
-            size = storage.lru_sizes.pop(key)
-            storage.cache_used -= size
-        try:
-            del storage.cache_storage[key]
-        except KeyError:
-            pass
+            storage._remove_from_cache(key)
+        else:
+            try:
+                del storage.cache_storage[key]
+            except KeyError:
+                pass
 
 
 def reset_and_checkout(ds, address, err, verbose=True):
@@ -997,6 +1008,16 @@ def auto_commit(dataset, message: str, flush_version_control_info: bool = True)
     checkout(dataset, original_commit_id)
 
 
+def get_committed_ids(version_state: Dict[str, Any]) -> Set[str]:
+    """Returns the ids of the commits that can no longer be modified, i.e. all commits but the head nodes of branches.
+    Their chunks can be kept in caches that outlive the process, see :class:`SharedCache`."""
+    return {
+        commit_id
+        for commit_id, node in version_state["commit_node_map"].items()
+        if not node.is_head_node
+    }
+
+
 def current_commit_has_change(version_state: Dict[str, Any], storage: LRUCache) -> bool:
     return (
         version_state["commit_id"] == FIRST_COMMIT_ID